@@ -0,0 +1,63 @@
+"""
+Benchmark for the import time of the package modules.
+
+Each module is imported in a fresh interpreter, so that the measurement includes everything the import pulls in. The
+calculation modules are expected to be importable without loading Rich, which is only needed by `modules.rendering`.
+
+Usage:
+    python -m benchmarks.import_time [--repeat N]
+"""
+
+import argparse
+import subprocess
+import sys
+from statistics import median
+
+
+_MODULES: list[str] = [
+    "modules.building",
+    "modules.city",
+    "modules.kingdom",
+    "modules.scenario",
+    "modules.rendering",
+]
+
+_SCRIPT: str = """
+import sys
+import time
+
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(elapsed, "rich" in sys.modules)
+"""
+
+
+def _time_import(module: str) -> tuple[float, bool]:
+    result: subprocess.CompletedProcess[str] = subprocess.run(
+        args = [sys.executable, "-c", _SCRIPT.format(module = module)],
+        capture_output = True,
+        check = True,
+        text = True,
+    )
+    elapsed, rich_loaded = result.stdout.split()
+    return float(elapsed), rich_loaded == "True"
+
+
+def main() -> None:
+    """Print the median import time of each module and whether the import loads Rich."""
+    
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Measure the import time of the modules.")
+    parser.add_argument("--repeat", type = int, default = 5, help = "Number of imports per module.")
+    args: argparse.Namespace = parser.parse_args()
+    
+    print(f"{"module":<20} {"median (ms)":>12} {"loads rich":>11}")
+    for module in _MODULES:
+        timings: list[tuple[float, bool]] = [_time_import(module = module) for _ in range(args.repeat)]
+        elapsed: float = median(timing[0] for timing in timings) * 1_000
+        rich_loaded: bool = timings[0][1]
+        print(f"{module:<20} {elapsed:>12.1f} {rich_loaded!s:>11}")
+
+
+if __name__ == "__main__":
+    main()
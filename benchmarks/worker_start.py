@@ -0,0 +1,59 @@
+"""
+Benchmark for the start-up time of a pool of worker processes that need the catalog data.
+
+Compares workers that load the data themselves (from the snapshot or the YAML files) with workers that attach to the
+data published by the parent in a shared memory block.
+
+Usage:
+    python -m benchmarks.worker_start [--processes N]
+"""
+
+import argparse
+import multiprocessing
+from time import perf_counter
+
+from modules.catalog import CATALOG, attach_shared_catalog
+
+
+def _load_catalog() -> None:
+    CATALOG.load()
+
+
+def _describe_worker_catalog(_: int) -> str | None:
+    return CATALOG.loaded_from
+
+
+def _time_pool(processes: int, shared: bool) -> tuple[float, set[str | None]]:
+    context = multiprocessing.get_context(method = "spawn")
+    start: float = perf_counter()
+    
+    if shared:
+        with CATALOG.share() as shared_catalog, context.Pool(
+            processes = processes,
+            initializer = attach_shared_catalog,
+            initargs = (shared_catalog.handle,),
+        ) as pool:
+            sources: list[str | None] = pool.map(_describe_worker_catalog, range(processes))
+    else:
+        with context.Pool(processes = processes, initializer = _load_catalog) as pool:
+            sources = pool.map(_describe_worker_catalog, range(processes))
+    
+    return perf_counter() - start, set(sources)
+
+
+def main() -> None:
+    """Print the time it takes a pool of workers to start with the catalog data loaded."""
+    
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Measure the start-up time of workers.")
+    parser.add_argument("--processes", type = int, default = 4, help = "Number of worker processes.")
+    args: argparse.Namespace = parser.parse_args()
+    
+    CATALOG.load()
+    
+    for shared in (False, True):
+        elapsed, sources = _time_pool(processes = args.processes, shared = shared)
+        print(f"shared = {shared!s:<5} {elapsed * 1_000:>10.1f} ms   loaded from: {", ".join(map(str, sources))}")
+
+
+if __name__ == "__main__":
+    main()
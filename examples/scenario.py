@@ -1,3 +1,4 @@
+from modules.optimization import find_city_frontier
 from modules.scenario import Scenario
 
 
@@ -161,3 +162,22 @@ scenario: Scenario = Scenario.from_list(
 
 scenario.display_scenario()
 print()
+
+# The best trade-offs between ore and troop training in Reate, computed instead of picked by hand.
+frontier = find_city_frontier(
+    campaign = "Unification of Italy",
+    name = "Reate",
+    metrics = ["production.balance.ore", "effects.total.troop_training"],
+)
+
+frontier.to_scenario(
+    configuration = {
+        "storage": {
+            "include": False,
+        },
+        "defenses": {
+            "include": False,
+        },
+    },
+).display_scenario()
+print()
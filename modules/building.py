@@ -7,28 +7,26 @@ public API for working with buildings in a city, including building instances, t
 Public API:
 - BuildingsCount (TypeAlias): Mapping of building identifiers to their counts in a city. Keys are building IDs (e.g.,
     "farm", "mine"), values are integers representing how many of that building should be created in the city.
-- Building (dataclass): Represents a specific building instance, with runtime attributes such as costs, bonuses,
-    storage capacity, worker assignment, and construction requirements.
+- BuildingSpec (dataclass): Immutable definition of a building (costs, bonuses, storage capacity, and construction
+    requirements). One spec exists per building ID and it is shared by all buildings of that type.
+- Building (class): Represents a specific building instance. It references the spec of the building and tracks its
+    worker assignment.
+- get_building_spec(building_id): Get the spec of a building.
+- get_building_specs(): Get the specs of all buildings.
 
 Internal objects (not part of the public API):
-- _BUILDINGS: Dictionary of all building definitions loaded from `./data/buildings.yaml`.
+- _BUILDINGS: Dictionary of all building definitions loaded from the buildings data. It is resolved lazily through
+    the catalog (see `modules.catalog`), so the file is only parsed on first access.
 - _BuildingData (TypedDict): Helper for type annotations when reading building data from YAML/JSON files.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, Literal, TypedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict
 
-import yaml
-from rich.align import Align
-from rich.console import Console
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.text import Text
-
-from .effects import EffectBonuses
+from .catalog import CATALOG
+from .effects import FrozenEffectBonuses
 from .exceptions import (
     InsufficientNumberOfWorkersError,
     NegativeNumberOfWorkersError,
@@ -36,15 +34,18 @@ from .exceptions import (
     UnknownBuildingError,
 )
 from .geo_features import GeoFeature
-from .resources import Resource, ResourceCollection
+from .resources import FrozenResourceCollection, Resource
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    
+    from .catalog import Catalog
     from .effects import EffectBonusesData
     from .resources import ResourceCollectionData
 
 
-__all__: list[str] = ["BuildingsCount", "Building"]
+__all__: list[str] = ["BuildingsCount", "BuildingSpec", "Building"]
 
 
 """
@@ -86,17 +87,133 @@ class _BuildingData(TypedDict):
     replaces: str | None
 
 
-with Path("./data/buildings.yaml").open(mode = "r", encoding = "utf-8") as file:
-    _buildings_data: dict[Literal["buildings"], list[_BuildingData]] = yaml.safe_load(stream = file)
+def __getattr__(name: str) -> Any:
+    # `_BUILDINGS` is kept as a module attribute for backwards compatibility, but it is resolved through the catalog so
+    # that importing this module does not parse the buildings file.
+    if name == "_BUILDINGS":
+        return CATALOG.buildings
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# * ************* * #
+# * BUILDING SPEC * #
+# * ************* * #
+
+@dataclass(frozen = True, slots = True, kw_only = True)
+class BuildingSpec:
+    """
+    Immutable definition of a building, as read from the buildings data.
+    
+    There is exactly one spec per building ID (per load of the catalog). It is built once and shared by all `Building`
+    instances with that ID, so creating a building does not need to re-read or copy its definition. Specs must never be
+    modified. The resources and effects they hold are frozen, so they can be shared by every building of the same type
+    (and by the cities built from them) without copying.
+    
+    Attributes:
+        See the attributes of the `Building` class. The only differences are that the list attributes are stored as
+        tuples, and that specs do not track workers.
+    """
+    
+    id: str
+    name: str
+    building_cost: FrozenResourceCollection
+    maintenance_cost: FrozenResourceCollection
+    productivity_bonuses: FrozenResourceCollection
+    productivity_per_worker: FrozenResourceCollection
+    effect_bonuses: FrozenEffectBonuses
+    effect_bonuses_per_worker: FrozenEffectBonuses
+    storage_capacity: FrozenResourceCollection
+    max_workers: int
+    is_buildable: bool
+    is_deletable: bool
+    is_upgradeable: bool
+    required_geo: GeoFeature | None
+    required_rss: tuple[Resource, ...]
+    required_hall: str | None
+    required_building: tuple[str, ...]
+    blocked_by_building: tuple[str, ...]
+    replaces: str | None
+    
+    @classmethod
+    def from_data(cls, building_data: _BuildingData) -> BuildingSpec:
+        """
+        Build the spec of a building from its raw data.
+        
+        Args:
+            building_data (_BuildingData): The raw data of the building, as read from the buildings data.
+        
+        Returns:
+            BuildingSpec: The spec of the building.
+        """
+        
+        return cls(
+            id = building_data["id"],
+            name = building_data["name"],
+            building_cost = FrozenResourceCollection(**building_data["building_cost"]),
+            maintenance_cost = FrozenResourceCollection(**building_data["maintenance_cost"]),
+            productivity_bonuses = FrozenResourceCollection(**building_data["productivity_bonuses"]),
+            productivity_per_worker = FrozenResourceCollection(**building_data["productivity_per_worker"]),
+            effect_bonuses = FrozenEffectBonuses(**building_data["effect_bonuses"]),
+            effect_bonuses_per_worker = FrozenEffectBonuses(**building_data["effect_bonuses_per_worker"]),
+            storage_capacity = FrozenResourceCollection(**building_data["storage_capacity"]),
+            max_workers = building_data["max_workers"],
+            is_buildable = building_data["is_buildable"],
+            is_deletable = building_data["is_deletable"],
+            is_upgradeable = building_data["is_upgradeable"],
+            required_geo = GeoFeature(value = building_data["required_geo"]) if building_data["required_geo"] else None,
+            required_rss = tuple(Resource(value = rss) for rss in building_data["required_rss"]),
+            required_hall = building_data["required_hall"],
+            required_building = tuple(building_data["required_building"]),
+            blocked_by_building = tuple(building_data["blocked_by_building"]),
+            replaces = building_data["replaces"],
+        )
+
+
+def _build_building_specs(catalog: Catalog) -> dict[str, BuildingSpec]:
+    return {
+        building_id: BuildingSpec.from_data(building_data = building_data)
+        for building_id, building_data in catalog.buildings.items()
+    }
+
 
-_BUILDINGS: dict[str, _BuildingData] = {building["id"]: building for building in _buildings_data["buildings"]}
+def get_building_specs() -> dict[str, BuildingSpec]:
+    """
+    Get the specs of all buildings, keyed by building ID. The specs are built once per load of the catalog.
+    
+    Returns:
+        dict[str, BuildingSpec]: The specs of all buildings. The dictionary is shared and must not be modified.
+    """
+    
+    return CATALOG.get_derived(name = "building_specs", factory = _build_building_specs)
+
+
+def get_building_spec(building_id: str) -> BuildingSpec:
+    """
+    Get the spec of a building.
+    
+    Args:
+        building_id (str): The ID of the building.
+    
+    Raises:
+        UnknownBuildingError: If the building does not exist.
+    
+    Returns:
+        BuildingSpec: The spec of the building.
+    """
+    
+    spec: BuildingSpec | None = get_building_specs().get(building_id)
+    
+    if spec is None:
+        raise UnknownBuildingError(f"Building {building_id} does not exist.")
+    
+    return spec
 
 
 # * ******** * #
 # * BUILDING * #
 # * ******** * #
 
-@dataclass(match_args = False, kw_only = True)
 class Building:
     """
     Represents a building in the game.
@@ -108,24 +225,30 @@ class Building:
     
     If a nonexistent building ID is supplied and exception will be raised.
     
+    Instances only hold a reference to the (shared) `BuildingSpec` of the building and the number of workers assigned to
+    it. All other attributes are read-only views of the spec. Every change of the workers is reported to the function
+    registered with `on_workers_change`, which is how the city that owns the building keeps its totals up to date.
+    
     Attributes:
+        spec (BuildingSpec): The shared, immutable definition of the building.
         id (str): Unique identifier of the building. This is unique amongst all buildings, not amongst all building
             instances in a city. For example, if 2 Farms are built in a city, both of them will have `id = "farm"`.
         workers (int): Current number of assigned workers.
         name (str): Display name of the building.
-        building_cost (ResourceCollection): Resources required to build.
-        maintenance_cost (ResourceCollection): Ongoing resource costs.
-        productivity_bonuses (ResourceCollection): Productivity bonuses gained by having this building in the city.
-        productivity_per_worker (ResourceCollection): Productivity per worker. Only relevant for resource-producing
-            buildings.
-        effect_bonuses (EffectBonuses): Effect bonuses produced by having the building in the city. There are three
-            bonuses in the game
+        building_cost (FrozenResourceCollection): Resources required to build.
+        maintenance_cost (FrozenResourceCollection): Ongoing resource costs.
+        productivity_bonuses (FrozenResourceCollection): Productivity bonuses gained by having this building in the
+            city.
+        productivity_per_worker (FrozenResourceCollection): Productivity per worker. Only relevant for
+            resource-producing buildings.
+        effect_bonuses (FrozenEffectBonuses): Effect bonuses produced by having the building in the city. There are
+            three bonuses in the game
                 - Troop training: the experience new troops have when trained in the city.
                 - Population growth: multipliers for how fast the population grows.
                 - Intelligence: spying ability.
-        effect_bonuses_per_worker (EffectBonuses): Effect bonuses produced by staffing the buildings of the city. For
-            example, having a Basilica given +50 Population growth if the Basilica is staffed.
-        storage_capacity (ResourceCollection): Storage space provided by the building.
+        effect_bonuses_per_worker (FrozenEffectBonuses): Effect bonuses produced by staffing the buildings of the city.
+            For example, having a Basilica given +50 Population growth if the Basilica is staffed.
+        storage_capacity (FrozenResourceCollection): Storage space provided by the building.
         max_workers (int): Maximum assignable workers.
         is_buildable (bool): Whether the building can be constructed. Some buildings, e.g. Supply dump, cannot be built
             by the player. THey are either present in the city at the start or they are not.
@@ -146,70 +269,166 @@ class Building:
         replaces (str | None): Identifier of the building this one replaces.
     """
     
-    id: str = field(init = True, repr = True, compare = True, hash = True)
-    workers: int = field(init = True, default = 0, repr = False, compare = False, hash = False)
-    
-    name: str = field(init = False, repr = False, compare = False, hash = False)
-    building_cost: ResourceCollection = field(init = False, repr = False, compare = False, hash = False)
-    maintenance_cost: ResourceCollection = field(init = False, repr = False, compare = False, hash = False)
-    productivity_bonuses: ResourceCollection = field(init = False, repr = False, compare = False, hash = False)
-    productivity_per_worker: ResourceCollection = field(init = False, repr = False, compare = False, hash = False)
-    effect_bonuses: EffectBonuses = field(init = False, repr = False, compare = False, hash = False)
-    effect_bonuses_per_worker: EffectBonuses = field(init = False, repr = False, compare = False, hash = False)
-    storage_capacity: ResourceCollection = field(init = False, repr = False, compare = False, hash = False)
-    max_workers: int = field(init = False, repr = False, compare = False, hash = False)
-    is_buildable: bool = field(init = False, repr = False, compare = False, hash = False)
-    is_deletable: bool = field(init = False, repr = False, compare = False, hash = False)
-    is_upgradeable: bool = field(init = False, repr = False, compare = False, hash = False)
-    required_geo: GeoFeature | None = field(init = False, default = None, repr = False, compare = False, hash = False)
-    required_rss: list[Resource] = field(init = False, default_factory = list, repr = False, compare = False, hash = False)  # noqa: E501
-    required_hall: str | None = field(init = False, default = None, repr = False, compare = False, hash = False)
+    __slots__: ClassVar[tuple[str, ...]] = ("spec", "_workers", "_workers_callback")
+    __match_args__: ClassVar[str] = ("id")
+    
+    # Instances compare equal by ID, but they are mutable (workers), so they are not hashable.
+    __hash__: ClassVar[None] = None # pyright: ignore[reportIncompatibleMethodOverride]
+    
+    
+    def __init__(self, *, id: str, workers: int = 0) -> None: # noqa: A002
+        self.spec: BuildingSpec = get_building_spec(building_id = id)
+        self._workers: int = workers
+        self._workers_callback: Callable[[Building, int], object] | None = None
+        
+        self._validate_initial_number_of_workers()
+    
+    def __eq__(self, other: object) -> bool:
+        
+        if not isinstance(other, Building):
+            return NotImplemented
+        
+        return self.spec.id == other.spec.id
+    
+    def __repr__(self) -> str:
+        return f"Building(id={self.spec.id!r})"
+    
+    
+    #* Workers
+    @property
+    def workers(self) -> int:
+        """Current number of assigned workers."""
+        return self._workers
+    
+    @workers.setter
+    def workers(self, qty: int) -> None:
+        
+        change: int = qty - self._workers
+        self._workers = qty
+        
+        if change and self._workers_callback is not None:
+            self._workers_callback(self, change)
+    
+    def on_workers_change(self, callback: Callable[[Building, int], object] | None) -> None:
+        """
+        Register the function to be called every time the workers of the building change, replacing the previous one.
+        Cities register one for each of their buildings, so that changing the workers of a building directly keeps the
+        city up to date.
+        
+        Args:
+            callback (Callable[[Building, int], object] | None): A function that takes the building and the change in
+                its workers (negative if workers were removed). Its return value is ignored. None stops the calls.
+        """
+        
+        self._workers_callback = callback
+    
+    
+    #* Spec attributes
+    @property
+    def id(self) -> str:
+        """Unique identifier of the building."""
+        return self.spec.id
+    
+    @property
+    def name(self) -> str:
+        """Display name of the building."""
+        return self.spec.name
+    
+    @property
+    def building_cost(self) -> FrozenResourceCollection:
+        """Resources required to build."""
+        return self.spec.building_cost
+    
+    @property
+    def maintenance_cost(self) -> FrozenResourceCollection:
+        """Ongoing resource costs."""
+        return self.spec.maintenance_cost
+    
+    @property
+    def productivity_bonuses(self) -> FrozenResourceCollection:
+        """Productivity bonuses gained by having this building in the city."""
+        return self.spec.productivity_bonuses
+    
+    @property
+    def productivity_per_worker(self) -> FrozenResourceCollection:
+        """Productivity per worker."""
+        return self.spec.productivity_per_worker
+    
+    @property
+    def effect_bonuses(self) -> FrozenEffectBonuses:
+        """Effect bonuses produced by having the building in the city."""
+        return self.spec.effect_bonuses
+    
+    @property
+    def effect_bonuses_per_worker(self) -> FrozenEffectBonuses:
+        """Effect bonuses produced per worker assigned to the building."""
+        return self.spec.effect_bonuses_per_worker
+    
+    @property
+    def storage_capacity(self) -> FrozenResourceCollection:
+        """Storage space provided by the building."""
+        return self.spec.storage_capacity
+    
+    @property
+    def max_workers(self) -> int:
+        """Maximum assignable workers."""
+        return self.spec.max_workers
+    
+    @property
+    def is_buildable(self) -> bool:
+        """Whether the building can be constructed."""
+        return self.spec.is_buildable
+    
+    @property
+    def is_deletable(self) -> bool:
+        """Whether the building can be removed."""
+        return self.spec.is_deletable
+    
+    @property
+    def is_upgradeable(self) -> bool:
+        """Whether the building can be upgraded."""
+        return self.spec.is_upgradeable
+    
+    @property
+    def required_geo(self) -> GeoFeature | None:
+        """Required geographic feature, if any."""
+        return self.spec.required_geo
+    
+    @property
+    def required_rss(self) -> list[Resource]:
+        """Required resources. Empty if the building does not require any."""
+        return list(self.spec.required_rss)
+    
+    @property
+    def required_hall(self) -> str | None:
+        """The building ID of the hall required to build this building."""
+        return self.spec.required_hall
+    
     # Dependencies here need to be interpreted as OR conditions. Any of the listed buildings unblocks the building.
     # For example, a Stable requires either a Farm, or a Large Farm, or a Vineyard, or a Fishing Village. If the city
     # has any one of them it can build a Stable. Similarly, a Blacksmith requires either a Mine, or a Large Mine, or a
     # Mountain Mine, or an Outcrop Mine. If a building has no dependencies the list will be empty.
-    required_building: list[str] = field(init = False, default_factory = list, repr = False, compare = False, hash = False) # noqa: E501
-    blocked_by_building: list[str] = field(init = False, default_factory = list, repr = False, compare = False, hash = False) # noqa: E501
-    replaces: str | None = field(init = False, default = None, repr = False, compare = False, hash = False)
+    @property
+    def required_building(self) -> list[str]:
+        """Possible pre-requisite buildings (OR conditions)."""
+        return list(self.spec.required_building)
     
+    @property
+    def blocked_by_building(self) -> list[str]:
+        """Buildings that, if present in a city, block the construction of this building."""
+        return list(self.spec.blocked_by_building)
     
-    __match_args__: ClassVar[str] = ("id")
+    @property
+    def replaces(self) -> str | None:
+        """Identifier of the building this one replaces."""
+        return self.spec.replaces
     
     
-    def _validate_building_exists(self) -> None:
-        if self.id not in _BUILDINGS:
-            raise UnknownBuildingError(f"Building {self.id} does not exist.")
-    
     def _validate_initial_number_of_workers(self) -> None:
         if self.workers > self.max_workers:
             raise TooManyWorkersError(f"Too many workers. Max is {self.max_workers} for {self.name}.")
     
     
-    def __post_init__(self) -> None:
-        self._validate_building_exists()
-        
-        self.name = _BUILDINGS[self.id]["name"]
-        self.building_cost = ResourceCollection(**_BUILDINGS[self.id]["building_cost"])
-        self.maintenance_cost = ResourceCollection(**_BUILDINGS[self.id]["maintenance_cost"])
-        self.productivity_bonuses = ResourceCollection(**_BUILDINGS[self.id]["productivity_bonuses"])
-        self.productivity_per_worker = ResourceCollection(**_BUILDINGS[self.id]["productivity_per_worker"])
-        self.effect_bonuses = EffectBonuses(**_BUILDINGS[self.id]["effect_bonuses"])
-        self.effect_bonuses_per_worker = EffectBonuses(**_BUILDINGS[self.id]["effect_bonuses_per_worker"])
-        self.storage_capacity = ResourceCollection(**_BUILDINGS[self.id]["storage_capacity"])
-        self.max_workers = _BUILDINGS[self.id]["max_workers"]
-        self.is_buildable = _BUILDINGS[self.id]["is_buildable"]
-        self.is_deletable = _BUILDINGS[self.id]["is_deletable"]
-        self.is_upgradeable = _BUILDINGS[self.id]["is_upgradeable"]
-        self.required_geo = GeoFeature(value = _BUILDINGS[self.id]["required_geo"]) if _BUILDINGS[self.id]["required_geo"] else None # noqa: E501
-        self.required_rss = [Resource(value = rss) for rss in _BUILDINGS[self.id]["required_rss"]]
-        self.required_hall = _BUILDINGS[self.id]["required_hall"]
-        self.required_building = _BUILDINGS[self.id]["required_building"]
-        self.blocked_by_building = _BUILDINGS[self.id]["blocked_by_building"]
-        self.replaces = _BUILDINGS[self.id]["replaces"]
-        
-        self._validate_initial_number_of_workers()
-    
-    
     def add_workers(self, qty: int) -> None:
         """
         Assigns additional workers to the building.
@@ -273,435 +492,13 @@ class Building:
         self.workers = qty
     
     
-    #* Formatters
-    @staticmethod
-    def _format_building(text: str) -> str:
-        return (
-            f"[italic bold bright_cyan]Building[/italic bold bright_cyan]("
-            f"[italic dim]id = [/italic dim][yellow]\"{text}\"[/yellow])"
-        )
-    
-    @staticmethod
-    def _format_string(text: str) -> str:
-        return f"[yellow]{text}[/yellow]"
-    
-    @staticmethod
-    def _format_rss(text: str) -> str:
-        return f"[italic bold bright_cyan]Resource[/italic bold bright_cyan].{text}"
-    
-    @staticmethod
-    def _format_geo(text: str) -> str:
-        return f"[italic bold bright_cyan]GeoFeature[/italic bold bright_cyan].{text}"
-    
-    @staticmethod
-    def _format_resource_collection(collection: ResourceCollection) -> str:
-        return (
-            f"[italic bold bright_cyan]ResourceCollection[/italic bold bright_cyan]("
-            f"[italic dim]food = [/italic dim]{collection.food}, "
-            f"[italic dim]ore = [/italic dim]{collection.ore}, "
-            f"[italic dim]wood = [/italic dim]{collection.wood}"
-            f")"
-        )
-    
-    @staticmethod
-    def _format_effect_bonuses(bonuses: EffectBonuses) -> str:
-        return (
-            f"[italic bold bright_cyan]EffectBonuses[/italic bold bright_cyan]("
-            f"[italic dim]troop_training = [/italic dim]{bonuses.troop_training}, "
-            f"[italic dim]population_growth = [/italic dim]{bonuses.population_growth}, "
-            f"[italic dim]intelligence = [/italic dim]{bonuses.intelligence}"
-            f")"
-        )
-    
-    @staticmethod
-    def _format_scalar(scalar: float | bool) -> str:
-        return f"[dark_magenta]{scalar}[/dark_magenta]"
-    
-    @staticmethod
-    def _format_none() -> str:
-        return f"[italic dim dark_magenta]None[/italic dim dark_magenta]"
-    
-    
     #* Display building
-    def _building_information(self) -> Text:
-        text: Text = Text(
-            text = f" Building(id = \"{self.id}\") ",
-            style = "bold black on white",
-            justify = "center",
-        )
-        return text
-    
-    def _building_name(self) -> str:
-        return f"[bold]Name:[/bold] {Building._format_string(text = self.name)}"
-    
-    def _building_building_costs(self) -> str:
-        return (
-            f"[bold]Building costs:[/bold] "
-            f"{Building._format_resource_collection(collection = self.building_cost)}"
-        )
-    
-    def _building_maintenance_costs(self) -> str:
-        return (
-            f"[bold]Maintenance costs:[/bold] "
-            f"{Building._format_resource_collection(collection = self.maintenance_cost)}"
-        )
-    
-    def _building_productivity_bonuses(self) -> str:
-        return (
-            f"[bold]Productivity bonuses:[/bold] "
-            f"{Building._format_resource_collection(collection = self.productivity_bonuses)}"
-        )
-    
-    def _building_productivity_per_worker(self) -> str:
-        return (
-            f"[bold]Productivity per worker:[/bold] "
-            f"{Building._format_resource_collection(collection = self.productivity_per_worker)}"
-        )
-    
-    def _building_effect_bonuses(self) -> str:
-        return (
-            f"[bold]Effect bonuses:[/bold] "
-            f"{Building._format_effect_bonuses(self.effect_bonuses)}"
-        )
-    
-    def _building_effect_bonuses_per_worker(self) -> str:
-        return (
-            f"[bold]Effect bonuses per worker:[/bold] "
-            f"{Building._format_effect_bonuses(self.effect_bonuses_per_worker)}"
-        )
-    
-    def _building_storage_capacity(self) -> str:
-        return (
-            f"[bold]Storage capacity:[/bold] "
-            f"{Building._format_resource_collection(collection = self.storage_capacity)}"
-        )
-    
-    def _building_max_workers(self) -> str:
-        return f"[bold]Max. workers:[/bold] {Building._format_scalar(scalar = self.max_workers)}"
-    
-    def _building_current_workers(self) -> str:
-        return f"[bold]Current workers:[/bold] {Building._format_scalar(scalar = self.workers)}"
-    
-    def _building_is_buildable(self) -> str:
-        return f"[bold]Is buildable:[/bold] {Building._format_scalar(scalar = self.is_buildable)}"
-    
-    def _building_is_deletable(self) -> str:
-        return f"[bold]Is deletable:[/bold] {Building._format_scalar(scalar = self.is_deletable)}"
-    
-    def _building_is_upgradeable(self) -> str:
-        return f"[bold]Is upgradeable:[/bold] {Building._format_scalar(scalar = self.is_upgradeable)}"
-    
-    def _building_required_geo(self) -> str:
-        text: str = f"[bold]Required geo. feature:[/bold] "
-        
-        if self.required_geo:
-            text += f"{Building._format_geo(text = self.required_geo.name)}"
-        else:
-            text += Building._format_none()
-        
-        return text
-    
-    def _building_required_rss(self) -> str:
-        text: str = f"[bold]Required resource:[/bold] "
-        
-        if len(self.required_rss) == 0:
-            return text + Building._format_none()
-        
-        lines: list[str] = []
-        
-        for idx, rss in enumerate(self.required_rss):
-            transformed: str = Building._format_rss(text = rss.name)
-            line: str = transformed if idx == 0 else f"[italic dim]AND[/italic dim] {transformed}"
-            lines.append(line)
-        
-        text += " ".join(lines)
-        
-        return text
-    
-    def _building_required_hall(self) -> str:
-        text: str = f"[bold]Required hall:[/bold] "
-        
-        if self.required_hall:
-            text += f"{Building._format_building(text = self.required_hall)}"
-        else:
-            text += Building._format_none()
-        return text
-    
-    def _building_required_building(self) -> str:
-        text: str = f"[bold]Required building:[/bold] "
-        
-        if len(self.required_building) == 0:
-            return text + Building._format_none()
-        
-        lines: list[str] = []
-        
-        for index, building in enumerate(self.required_building):
-            formatted: str = Building._format_building(text = building)
-            conjunction: str = "" if index == 0 else "                [italic dim]OR[/italic dim] "
-            line: str = conjunction + formatted
-            lines.append(line)
-        
-        text += "\n".join(lines)
-        
-        return text
-    
-    def _building_blocked_by_building(self) -> str:
-        text: str = f"[bold]Blocked by building:[/bold] "
-        
-        if len(self.blocked_by_building) == 0:
-            return text + Building._format_none()
-        
-        lines: list[str] = []
-        
-        for index, building in enumerate(self.blocked_by_building):
-            formatted: str = Building._format_building(text = building)
-            conjunction: str = "" if index == 0 else " [italic dim]OR[/italic dim] "
-            line: str = conjunction + formatted
-            lines.append(line)
-        
-        text += "".join(lines)
-        
-        return text
-    
-    def _building_replaces(self) -> str:
-        text: str = f"[bold]Replaces:[/bold] "
-        return text + (Building._format_building(text = self.replaces) if self.replaces else Building._format_none())
-    
-    def _build_building_display(self) -> Panel:
-        #* Heights
-        padding: int = 2
-        title_height: int = 2
-        
-        required_building_height: int = max(len(self.required_building), 1)
-        number_of_other_properties_to_print: int = 18
-        main_height: int = number_of_other_properties_to_print + required_building_height
-        
-        total_height: int = title_height + main_height
-        
-        #* Layout building
-        layout: Layout = Layout()
-        
-        layout.split(
-            Layout(
-                name = "header",
-                size = title_height,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "main",
-                size = main_height,
-                ratio = 0,
-                visible = True,
-            ),
-        )
-        
-        layout["header"].update(
-            renderable = Align(renderable = self._building_information(), align = "center"),
-        )
-        
-        layout["main"].split(
-            Layout(
-                name = "building_name",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "building_costs",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "maintenance_cost",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "productivity_bonuses",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "productivity_per_worker",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "effect_bonuses",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "effect_bonuses_per_worker",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "storage_capacity",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "max_workers",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "current_workers",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "is_buildable",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "is_deletable",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "is_upgradeable",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "required_geo",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "required_rss",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "required_hall",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "required_building",
-                size = required_building_height,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "blocked_by_building",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-            Layout(
-                name = "replaces",
-                size = 1,
-                ratio = 0,
-                visible = True,
-            ),
-        )
-        
-        layout["building_name"].update(
-            renderable = Align(renderable = self._building_name(), align = "left"),
-        )
-        
-        layout["building_costs"].update(
-            renderable = Align(renderable = self._building_building_costs(), align = "left"),
-        )
-        
-        layout["maintenance_cost"].update(
-            renderable = Align(renderable = self._building_maintenance_costs(), align = "left"),
-        )
-        
-        layout["productivity_bonuses"].update(
-            renderable = Align(renderable = self._building_productivity_bonuses(), align = "left"),
-        )
-        
-        layout["productivity_per_worker"].update(
-            renderable = Align(renderable = self._building_productivity_per_worker(), align = "left"),
-        )
-        
-        layout["effect_bonuses"].update(
-            renderable = Align(renderable = self._building_effect_bonuses(), align = "left"),
-        )
-        
-        layout["effect_bonuses_per_worker"].update(
-            renderable = Align(renderable = self._building_effect_bonuses_per_worker(), align = "left"),
-        )
-        
-        layout["storage_capacity"].update(
-            renderable = Align(renderable = self._building_storage_capacity(), align = "left"),
-        )
-        
-        layout["max_workers"].update(
-            renderable = Align(renderable = self._building_max_workers(), align = "left"),
-        )
-        
-        layout["current_workers"].update(
-            renderable = Align(renderable = self._building_current_workers(), align = "left"),
-        )
-        
-        layout["is_buildable"].update(
-            renderable = Align(renderable = self._building_is_buildable(), align = "left"),
-        )
-        
-        layout["is_deletable"].update(
-            renderable = Align(renderable = self._building_is_deletable(), align = "left"),
-        )
-        
-        layout["is_upgradeable"].update(
-            renderable = Align(renderable = self._building_is_upgradeable(), align = "left"),
-        )
-        
-        layout["required_geo"].update(
-            renderable = Align(renderable = self._building_required_geo(), align = "left"),
-        )
-        
-        layout["required_rss"].update(
-            renderable = Align(renderable = self._building_required_rss(), align = "left"),
-        )
-        
-        layout["required_hall"].update(
-            renderable = Align(renderable = self._building_required_hall(), align = "left"),
-        )
-        
-        layout["required_building"].update(
-            renderable = Align(renderable = self._building_required_building(), align = "left"),
-        )
-        
-        layout["blocked_by_building"].update(
-            renderable = Align(renderable = self._building_blocked_by_building(), align = "left"),
-        )
-        
-        layout["replaces"].update(
-            renderable = Align(renderable = self._building_replaces(), align = "left"),
-        )
-        
-        return Panel(
-            renderable = layout,
-            height = total_height + padding,
-            width = 105,
-        )
-    
     def display_building(self) -> None:
         """
         Render the building's information and current state to the console using the Rich library.
         """
-        console: Console = Console()
-        console.print(self._build_building_display())
+        
+        # Rendering is imported lazily so that the calculation API can be used without loading Rich.
+        from .rendering import _BuildingDisplay  # noqa: PLC0415
+        
+        _BuildingDisplay(building = self).display_building()
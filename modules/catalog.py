@@ -0,0 +1,862 @@
+"""
+Module for loading the game data catalogs.
+
+This module owns the building and city definitions. They are read through a data source (see `modules.sources`), which
+by default reads the `buildings.yaml` and `cities.yaml` files of the package data directory. The data is not read at
+import time. Instead, it is read the first time any of it is requested, so that processes that only need a subset of the
+package (e.g. the resources or display types) never pay for it.
+
+Parsing YAML is slow, so the catalog can also keep a binary snapshot of the data (`catalog.snapshot` in the package data
+directory). The snapshot is keyed by a hash of the contents of the files behind the data source. When the hash matches,
+the data is read from the snapshot. When it does not (or the snapshot is missing or corrupt), the data is read from the
+source and the snapshot is rebuilt. The snapshot can also be built ahead of time with:
+
+```shell
+python -m modules.catalog
+```
+
+When the data is needed by a pool of worker processes, the parent can publish it once in a shared memory block and the
+workers can attach to it instead of reading and parsing the files themselves. The block is only a hand-off of the
+serialized data: each worker deserializes its own copy, so the memory of the pool still grows with its size.
+
+```python
+with CATALOG.share() as shared:
+    with Pool(initializer = attach_shared_catalog, initargs = (shared.handle,)) as pool:
+        ...
+```
+
+Long-running processes can pick up changes to the data files without restarting. `Catalog.reload` re-reads the files
+and swaps the data atomically, and a `CatalogWatcher` polls the files in a background thread and reloads the catalog
+whenever they change:
+
+```python
+with CatalogWatcher(catalog = CATALOG, interval = 1.0):
+    ...
+```
+
+Public API:
+
+- Catalog (class): Lazily loads and exposes the building and city definitions. It also records how long it took to
+    load each of them, which can be used to measure cold-start latency, and indexes the cities so that they can be
+    looked up by campaign and name in constant time.
+- SharedCatalog (class): Owner of a shared memory block holding the serialized catalog data.
+- SharedCatalogHandle (dataclass): Picklable reference to a `SharedCatalog` that can be sent to worker processes.
+- CatalogWatcher (class): Polls the data files of a catalog and reloads it when they change.
+- attach_shared_catalog(handle): Load the data of `CATALOG` from a shared memory block. Meant to be used as the
+    initializer of a process pool.
+
+Assets shared with other modules:
+
+- CATALOG (Catalog): The catalog instance used by all other modules.
+"""
+
+from __future__ import annotations
+
+import pickle
+import sqlite3
+from dataclasses import dataclass, field
+from hashlib import sha256
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Event, Lock, Thread
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Literal, Self, TypedDict
+
+import yaml
+
+from .sources import DATA_DIRECTORY, YamlDataSource
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from os import stat_result
+    from types import TracebackType
+    
+    from .building import _BuildingData
+    from .city import _CityData
+    from .sources import DataSource
+
+
+__all__: list[str] = ["Catalog", "CatalogWatcher", "SharedCatalog", "SharedCatalogHandle", "attach_shared_catalog"]
+
+
+# Bump this value whenever the layout of the snapshot changes. It is part of the snapshot key, so old snapshots are
+# rebuilt automatically.
+_SNAPSHOT_FORMAT_VERSION: int = 1
+
+
+class _Snapshot(TypedDict):
+    """
+    This is a helper class to provide type annotations for the content of the snapshot file.
+    """
+    
+    key: str
+    buildings: dict[str, _BuildingData]
+    cities: list[_CityData]
+
+
+@dataclass(frozen = True, slots = True)
+class _CityIndex:
+    """
+    Indexes over the list of cities. Built once per load of the cities data set. Should not be used outside this module.
+    
+    Attributes:
+        by_key (dict[tuple[str, str], _CityData]): Cities keyed by (campaign, name).
+        by_campaign (dict[str, list[_CityData]]): Cities of each campaign, in file order.
+        forts (list[_CityData]): Cities that are forts, in file order.
+        non_forts (list[_CityData]): Cities that are not forts, in file order.
+        with_supply_dump (list[_CityData]): Cities that have a supply dump, in file order.
+        without_supply_dump (list[_CityData]): Cities that do not have a supply dump, in file order.
+    """
+    
+    by_key: dict[tuple[str, str], _CityData] = field(default_factory = dict)
+    by_campaign: dict[str, list[_CityData]] = field(default_factory = dict)
+    forts: list[_CityData] = field(default_factory = list)
+    non_forts: list[_CityData] = field(default_factory = list)
+    with_supply_dump: list[_CityData] = field(default_factory = list)
+    without_supply_dump: list[_CityData] = field(default_factory = list)
+    
+    @classmethod
+    def from_cities(cls, cities: list[_CityData]) -> _CityIndex:
+        
+        index: _CityIndex = cls()
+        
+        for city in cities:
+            index.by_key[city["campaign"], city["name"]] = city
+            index.by_campaign.setdefault(city["campaign"], []).append(city)
+            (index.forts if city["is_fort"] else index.non_forts).append(city)
+            (index.with_supply_dump if city["has_supply_dump"] else index.without_supply_dump).append(city)
+        
+        return index
+
+
+@dataclass(frozen = True, slots = True)
+class SharedCatalogHandle:
+    """
+    Picklable reference to the shared memory block of a `SharedCatalog`. It is cheap to send to worker processes.
+    
+    Attributes:
+        name (str): Name of the shared memory block.
+        size (int): Number of bytes of the serialized data inside the block (the block itself may be larger).
+        key (str): Snapshot key of the data, i.e. the hash of the data files it was built from.
+    """
+    
+    name: str
+    size: int
+    key: str
+
+
+class Catalog:
+    """
+    Lazily loads the building and city definitions.
+    
+    Each of the two data sets is loaded independently, on first access, and cached for the lifetime of the catalog.
+    Loading is thread-safe: if several threads request the data at the same time only one of them reads it.
+    
+    If a `snapshot_path` is given, both data sets are loaded together from the snapshot on first access, as long as the
+    snapshot was built from the current content of the data files. Otherwise, they are read from the data source and
+    the snapshot is rebuilt. Failing to write the snapshot (e.g. because the data directory is read-only) is not an
+    error, the catalog simply keeps working from the data source.
+    
+    If the data source is indexed (e.g. a SQLite database), city lookups are delegated to it until all the cities are
+    loaded, so looking up a city does not require loading all of them.
+    
+    Args:
+        source (DataSource): Where to read the data from (see `modules.sources`).
+        snapshot_path (Path | None): Path to the binary snapshot of the data. Defaults to None, meaning that no
+            snapshot is used.
+    
+    Attributes:
+        load_times (dict[str, float]): Seconds it took to load each data set, keyed by data set name ("buildings",
+            "cities", "snapshot" when both were read from the snapshot, "shared_memory" when both were attached from a
+            shared memory block, or "reload" for the last reload). Data sets that have not been loaded yet are not
+            present.
+        loaded_from (str | None): Where the data was loaded from: "snapshot", "source", "shared_memory", or None if
+            nothing has been loaded yet.
+        version (int): Version of the data. Starts at zero and increases every time the data is replaced. Values
+            computed from the data can be tagged with it to detect that they are stale.
+    
+    Public methods:
+        buildings: Dictionary of building definitions, keyed by building ID.
+        cities: List of city definitions.
+        is_loaded(name): Whether a data set has been loaded already.
+        load(): Eagerly load all data sets.
+        build_snapshot(): Read the data source and (re)write the snapshot.
+        campaigns: Names of all campaigns, in file order.
+        find_city(campaign, name): Look up a city by campaign and name.
+        get_cities(campaign, is_fort, has_supply_dump): List the cities that match all the given filters.
+        count_cities(campaign): Number of cities in a campaign.
+        get_derived(name, factory): Get a value derived from the catalog data, building it on first request.
+        share(): Publish the catalog data in a shared memory block.
+        attach(handle): Load the catalog data from a shared memory block.
+        reload(): Re-read the data and replace the current one atomically.
+        use_source(source, snapshot_path): Switch the catalog to another data source.
+        on_reload(callback): Register a function to be called whenever the data is replaced.
+    """
+    
+    def __init__(self, source: DataSource, snapshot_path: Path | None = None) -> None:
+        self.source: DataSource = source
+        self.snapshot_path: Path | None = snapshot_path
+        self.load_times: dict[str, float] = {}
+        self.loaded_from: str | None = None
+        self.version: int = 0
+        
+        self._buildings: dict[str, _BuildingData] | None = None
+        self._cities: list[_CityData] | None = None
+        self._city_index: _CityIndex | None = None
+        self._derived: dict[str, Any] = {}
+        self._reload_callbacks: list[Callable[[Catalog], object]] = []
+        self._lock: Lock = Lock()
+    
+    def __repr__(self) -> str:
+        return (
+            f"Catalog("
+            f"source = {self.source!r}, "
+            f"snapshot_path = \"{self.snapshot_path}\""
+            f")"
+        )
+    
+    
+    def _load_buildings(self) -> dict[str, _BuildingData]:
+        
+        start: float = perf_counter()
+        buildings: dict[str, _BuildingData] = self.source.load_buildings()
+        self.load_times["buildings"] = perf_counter() - start
+        
+        return buildings
+    
+    def _load_cities(self) -> list[_CityData]:
+        
+        start: float = perf_counter()
+        cities: list[_CityData] = self.source.load_cities()
+        self.load_times["cities"] = perf_counter() - start
+        
+        return cities
+    
+    
+    #* Snapshot
+    def _calculate_snapshot_key(self) -> str:
+        # The key covers the format of the snapshot, the type of the source, and the exact bytes of the files behind the
+        # source. Any change to any of them invalidates the snapshot.
+        digest = sha256(f"legion-catalog-v{_SNAPSHOT_FORMAT_VERSION}-{type(self.source).__name__}".encode())
+        for path in self.source.paths:
+            digest.update(path.read_bytes())
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def _read_snapshot(self, key: str) -> _Snapshot | None:
+        
+        if self.snapshot_path is None or not self.snapshot_path.is_file():
+            return None
+        
+        # The snapshot is only a cache, so any error reading it (a corrupt file, or one written by another version that
+        # references missing modules) falls back to the source.
+        try:
+            with self.snapshot_path.open(mode = "rb") as file:
+                snapshot: _Snapshot = pickle.load(file)
+        except Exception:
+            return None
+        
+        if not isinstance(snapshot, dict) or snapshot.get("key") != key:
+            return None
+        
+        return snapshot
+    
+    def _write_snapshot(self, snapshot: _Snapshot) -> bool:
+        
+        if self.snapshot_path is None:
+            return False
+        
+        # Write to a temporary file in the same directory and then move it into place, so that concurrent readers never
+        # see a half-written snapshot.
+        temporary_path: Path | None = None
+        
+        try:
+            with NamedTemporaryFile(mode = "wb", dir = self.snapshot_path.parent, delete = False) as file:
+                temporary_path = Path(file.name)
+                pickle.dump(snapshot, file, protocol = pickle.HIGHEST_PROTOCOL)
+            temporary_path.replace(self.snapshot_path)
+        except OSError:
+            if temporary_path is not None:
+                temporary_path.unlink(missing_ok = True)
+            return False
+        
+        return True
+    
+    def _load_all(self) -> None:
+        # Must be called while holding the lock.
+        
+        start: float = perf_counter()
+        key: str = self._calculate_snapshot_key()
+        snapshot: _Snapshot | None = self._read_snapshot(key = key)
+        
+        if snapshot is not None:
+            self._buildings = snapshot["buildings"]
+            self._cities = snapshot["cities"]
+            self.load_times["snapshot"] = perf_counter() - start
+            self.loaded_from = "snapshot"
+            return
+        
+        self._buildings = self._load_buildings()
+        self._cities = self._load_cities()
+        self.loaded_from = "source"
+        
+        self._write_snapshot(snapshot = {"key": key, "buildings": self._buildings, "cities": self._cities})
+    
+    def _swap(self, buildings: dict[str, _BuildingData], cities: list[_CityData], loaded_from: str) -> None:
+        # Replace all the data of the catalog at once. Must be called while holding the lock. Readers that already hold
+        # a reference to the old data (or to values derived from it) keep using it, so they see a consistent version.
+        self._buildings = buildings
+        self._cities = cities
+        self._city_index = None
+        self._derived = {}
+        self.loaded_from = loaded_from
+        self.version += 1
+    
+    def _notify_reload(self) -> None:
+        for callback in list(self._reload_callbacks):
+            callback(self)
+    
+    def build_snapshot(self) -> Path:
+        """
+        Read the data source and (re)write the snapshot, regardless of whether the current one is valid. The data of
+        the catalog is replaced by the freshly read one.
+        
+        Raises:
+            ValueError: If the catalog has no `snapshot_path`.
+            OSError: If the snapshot could not be written.
+        
+        Returns:
+            Path: The path of the written snapshot.
+        """
+        
+        if self.snapshot_path is None:
+            raise ValueError("This catalog has no snapshot path.")
+        
+        with self._lock:
+            key: str = self._calculate_snapshot_key()
+            buildings: dict[str, _BuildingData] = self._load_buildings()
+            cities: list[_CityData] = self._load_cities()
+            self._swap(buildings = buildings, cities = cities, loaded_from = "source")
+            written: bool = self._write_snapshot(snapshot = {"key": key, "buildings": buildings, "cities": cities})
+        
+        self._notify_reload()
+        
+        if not written:
+            raise OSError(f"Could not write the snapshot to {self.snapshot_path}.")
+        
+        return self.snapshot_path
+    
+    def reload(self) -> int:
+        """
+        Re-read the building and city data and replace the data of the catalog with it.
+        
+        The files are parsed (or the snapshot is read, if it matches the files) without holding the lock, so readers are
+        never blocked by the parsing. The new data then replaces the old one in a single step: buildings, cities, city
+        indexes, and derived values always belong to the same version. Objects created from the old data (e.g. buildings
+        and cities) keep referencing it. Once the data has been replaced, all the callbacks registered with `on_reload`
+        are called.
+        
+        If reading or parsing fails, the exception is raised and the catalog keeps its current data.
+        
+        Returns:
+            int: The new version of the data.
+        """
+        
+        start: float = perf_counter()
+        loaded_from: str = "source"
+        snapshot: _Snapshot | None = None
+        key: str | None = None
+        
+        if self.snapshot_path is not None:
+            key = self._calculate_snapshot_key()
+            snapshot = self._read_snapshot(key = key)
+        
+        if snapshot is not None:
+            buildings, cities, loaded_from = snapshot["buildings"], snapshot["cities"], "snapshot"
+        else:
+            buildings = self._load_buildings()
+            cities = self._load_cities()
+            
+            if key is not None:
+                self._write_snapshot(snapshot = {"key": key, "buildings": buildings, "cities": cities})
+        
+        with self._lock:
+            self._swap(buildings = buildings, cities = cities, loaded_from = loaded_from)
+            self.load_times["reload"] = perf_counter() - start
+            version: int = self.version
+        
+        self._notify_reload()
+        
+        return version
+    
+    def use_source(self, source: DataSource, snapshot_path: Path | None = None) -> None:
+        """
+        Switch the catalog to another data source. The current data is discarded and the data of the new source is
+        loaded lazily, as with a new catalog. The callbacks registered with `on_reload` are called.
+        
+        Args:
+            source (DataSource): The new data source.
+            snapshot_path (Path | None): Path to the binary snapshot of the new source. Defaults to None, meaning that
+                no snapshot is used.
+        """
+        
+        with self._lock:
+            self.source = source
+            self.snapshot_path = snapshot_path
+            self._buildings = None
+            self._cities = None
+            self._city_index = None
+            self._derived = {}
+            self.loaded_from = None
+            self.version += 1
+        
+        self._notify_reload()
+    
+    def on_reload(self, callback: Callable[[Catalog], object]) -> None:
+        """
+        Register a function to be called every time the data of the catalog is replaced (by `reload`, `build_snapshot`,
+        `attach`, or `use_source`). Use it to invalidate caches of values computed from the old data.
+        
+        Args:
+            callback (Callable[[Catalog], object]): A function that takes the catalog. Its return value is ignored.
+        """
+        
+        self._reload_callbacks.append(callback)
+    
+    
+    @property
+    def buildings(self) -> dict[str, _BuildingData]:
+        """
+        Dictionary of all building definitions, keyed by building ID. Loaded on first access.
+        """
+        
+        if self._buildings is None:
+            with self._lock:
+                if self._buildings is None and self.snapshot_path is not None:
+                    self._load_all()
+                
+                if self._buildings is None:
+                    self._buildings = self._load_buildings()
+                    self.loaded_from = "source"
+        
+        return self._buildings
+    
+    @property
+    def cities(self) -> list[_CityData]:
+        """
+        List of all city definitions. Loaded on first access.
+        """
+        
+        if self._cities is None:
+            with self._lock:
+                if self._cities is None and self.snapshot_path is not None:
+                    self._load_all()
+                
+                if self._cities is None:
+                    self._cities = self._load_cities()
+                    self.loaded_from = "source"
+        
+        return self._cities
+    
+    def is_loaded(self, name: Literal["buildings", "cities"]) -> bool:
+        """
+        Check whether a data set has already been loaded.
+        
+        Args:
+            name (Literal["buildings", "cities"]): The name of the data set.
+        
+        Raises:
+            ValueError: If `name` is not "buildings" or "cities".
+        
+        Returns:
+            bool: True if the data set has been loaded, False otherwise.
+        """
+        
+        if name == "buildings":
+            return self._buildings is not None
+        
+        if name == "cities":
+            return self._cities is not None
+        
+        raise ValueError("Possible values for `name` are \"buildings\" or \"cities\".")
+    
+    def load(self) -> None:
+        """
+        Eagerly load all data sets. Useful for warming up long-running processes before forking them.
+        """
+        
+        _ = self.buildings
+        _ = self.cities
+    
+    
+    #* City lookups
+    def _uses_source_queries(self) -> bool:
+        # Indexed sources answer the city lookups themselves, so the cities do not need to be loaded. Once they are
+        # loaded (e.g. because all of them were requested) the in-memory indexes are faster.
+        return self.source.is_indexed and self._cities is None
+    
+    def _get_city_index(self) -> _CityIndex:
+        
+        if self._city_index is None:
+            cities: list[_CityData] = self.cities
+            
+            with self._lock:
+                if self._city_index is None:
+                    self._city_index = _CityIndex.from_cities(cities = cities)
+        
+        return self._city_index
+    
+    @property
+    def campaigns(self) -> list[str]:
+        """
+        Names of all campaigns, in the order in which they first appear in the cities file.
+        """
+        
+        if self._uses_source_queries():
+            return self.source.get_campaigns()
+        
+        return list(self._get_city_index().by_campaign)
+    
+    def find_city(self, campaign: str, name: str) -> _CityData | None:
+        """
+        Look up a city by campaign and name.
+        
+        Args:
+            campaign (str): The campaign the city belongs to.
+            name (str): The name of the city.
+        
+        Returns:
+            _CityData | None: The city definition, or None if there is no such city.
+        """
+        
+        if self._uses_source_queries():
+            return self.source.find_city(campaign = campaign, name = name)
+        
+        return self._get_city_index().by_key.get((campaign, name))
+    
+    def get_cities(
+            self,
+            campaign: str | None = None,
+            is_fort: bool | None = None,
+            has_supply_dump: bool | None = None,
+        ) -> list[_CityData]:
+        """
+        List the cities that match all the given filters. Filters that are None are ignored.
+        
+        Args:
+            campaign (str | None): Only return cities of this campaign. Defaults to None.
+            is_fort (bool | None): Only return forts (True) or non-forts (False). Defaults to None.
+            has_supply_dump (bool | None): Only return cities with (True) or without (False) a supply dump. Defaults to
+                None.
+        
+        Returns:
+            list[_CityData]: The matching cities, in file order. The list is a new list and can be modified freely.
+        """
+        
+        if self._uses_source_queries():
+            return self.source.get_cities(campaign = campaign, is_fort = is_fort, has_supply_dump = has_supply_dump)
+        
+        index: _CityIndex = self._get_city_index()
+        candidates: list[list[_CityData]] = []
+        
+        if campaign is not None:
+            candidates.append(index.by_campaign.get(campaign, []))
+        
+        if is_fort is not None:
+            candidates.append(index.forts if is_fort else index.non_forts)
+        
+        if has_supply_dump is not None:
+            candidates.append(index.with_supply_dump if has_supply_dump else index.without_supply_dump)
+        
+        if not candidates:
+            return list(self.cities)
+        
+        # Start from the smallest candidate list and keep the cities that are present in all the others.
+        candidates.sort(key = len)
+        other_ids: list[set[int]] = [{id(city) for city in cities} for cities in candidates[1:]]
+        
+        return [city for city in candidates[0] if all(id(city) in ids for ids in other_ids)]
+    
+    def count_cities(self, campaign: str) -> int:
+        """
+        Number of cities in a campaign.
+        
+        Args:
+            campaign (str): The name of the campaign.
+        
+        Returns:
+            int: The number of cities in the campaign (zero if the campaign does not exist).
+        """
+        
+        if self._uses_source_queries():
+            return self.source.count_cities(campaign = campaign)
+        
+        return len(self._get_city_index().by_campaign.get(campaign, []))
+    
+    
+    #* Shared memory
+    def share(self) -> SharedCatalog:
+        """
+        Publish the serialized catalog data in a shared memory block, loading it first if needed. Worker processes can
+        then load their own copy of the data with `attach` (or `attach_shared_catalog`) without reading or parsing any
+        file.
+        
+        The caller owns the block and must release it with `SharedCatalog.close` (or by using the returned object as a
+        context manager) once the workers are done.
+        
+        Returns:
+            SharedCatalog: The owner of the shared memory block.
+        """
+        
+        self.load()
+        key: str = self._calculate_snapshot_key()
+        snapshot: _Snapshot = {"key": key, "buildings": self.buildings, "cities": self.cities}
+        
+        return SharedCatalog(payload = pickle.dumps(snapshot, protocol = pickle.HIGHEST_PROTOCOL), key = key)
+    
+    def attach(self, handle: SharedCatalogHandle) -> None:
+        """
+        Replace the data of the catalog with the one published in a shared memory block by `share`.
+        
+        The data is deserialized from the shared buffer into a private copy owned by this process, so no file is read
+        or parsed, but each process that attaches holds the whole data. Attaching to a block that no longer exists (e.g.
+        because it was already closed) raises `FileNotFoundError`.
+        
+        Args:
+            handle (SharedCatalogHandle): The handle of the shared memory block.
+        """
+        
+        start: float = perf_counter()
+        # The block is owned by the process that created it. Tracking it here would make the resource tracker of this
+        # process unlink it when this process exits.
+        memory: SharedMemory = SharedMemory(name = handle.name, track = False)
+        
+        try:
+            snapshot: _Snapshot = pickle.loads(memory.buf[:handle.size])
+        finally:
+            memory.close()
+        
+        with self._lock:
+            self._swap(buildings = snapshot["buildings"], cities = snapshot["cities"], loaded_from = "shared_memory")
+            self.load_times["shared_memory"] = perf_counter() - start
+        
+        self._notify_reload()
+    
+    
+    #* Derived data
+    def get_derived[T](self, name: str, factory: Callable[[Catalog], T]) -> T:
+        """
+        Get a value derived from the catalog data (e.g. a table of precomputed building specs), building it on first
+        request. Derived values are cached per catalog and discarded whenever the catalog data is replaced, so they
+        never outlive the data they were built from.
+        
+        Args:
+            name (str): A unique name for the derived value.
+            factory (Callable[[Catalog], T]): A function that builds the value from this catalog.
+        
+        Returns:
+            T: The derived value.
+        """
+        
+        derived: dict[str, Any] = self._derived
+        
+        if name not in derived:
+            value: T = factory(self)
+            # If another thread built the value in the meantime, keep the first one so all callers share it.
+            return derived.setdefault(name, value)
+        
+        return derived[name]
+
+
+
+class SharedCatalog:
+    """
+    Owner of a shared memory block holding the serialized catalog data. Created by `Catalog.share`.
+    
+    The block is created once by the parent process. Worker processes only need the (picklable) `handle` to load a copy
+    of the data from it. The block must be released with `close` once no worker needs it anymore. Using the object as
+    a context manager does so automatically.
+    
+    Args:
+        payload (bytes): The serialized catalog data.
+        key (str): Snapshot key of the data.
+    
+    Attributes:
+        handle (SharedCatalogHandle): The reference to the block to send to the workers.
+    
+    Public methods:
+        close(): Release the shared memory block.
+    """
+    
+    def __init__(self, payload: bytes, key: str) -> None:
+        self._memory: SharedMemory | None = SharedMemory(create = True, size = max(len(payload), 1))
+        self._memory.buf[:len(payload)] = payload
+        self.handle: SharedCatalogHandle = SharedCatalogHandle(name = self._memory.name, size = len(payload), key = key)
+    
+    def __repr__(self) -> str:
+        return f"SharedCatalog(name = \"{self.handle.name}\", size = {self.handle.size})"
+    
+    def __enter__(self) -> Self:
+        return self
+    
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_value: BaseException | None,
+            traceback: TracebackType | None,
+        ) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Release the shared memory block. Processes that already attached to it keep their data. Calling it more than
+        once has no effect.
+        """
+        
+        if self._memory is None:
+            return
+        
+        self._memory.close()
+        self._memory.unlink()
+        self._memory = None
+
+
+
+type _FileSignature = tuple[int, int] | None
+
+
+class CatalogWatcher:
+    """
+    Polls the data files of a catalog and reloads the catalog when any of them changes.
+    
+    The files are checked every `interval` seconds in a background (daemon) thread, comparing their modification time
+    and size. When they change, the catalog is reloaded from that thread, so the parsing never blocks the threads that
+    use the catalog. If the reload fails (e.g. because a file is being written or contains invalid YAML) the catalog
+    keeps its current data, the error is stored in `last_error`, and the reload is attempted again on the next change.
+    
+    Args:
+        catalog (Catalog): The catalog to watch.
+        interval (float): Seconds between checks. Defaults to 1.0.
+    
+    Attributes:
+        last_error (Exception | None): The error of the last failed reload, or None if the last reload succeeded.
+        reload_count (int): Number of successful reloads.
+    
+    Public methods:
+        check(): Check the files once and reload the catalog if they changed.
+        start(): Start polling in a background thread.
+        stop(): Stop polling and wait for the background thread to finish.
+    """
+    
+    def __init__(self, catalog: Catalog, interval: float = 1.0) -> None:
+        self.catalog: Catalog = catalog
+        self.interval: float = interval
+        self.last_error: Exception | None = None
+        self.reload_count: int = 0
+        
+        self._signature: tuple[_FileSignature, ...] = self._calculate_signature()
+        self._stop_event: Event = Event()
+        self._thread: Thread | None = None
+    
+    def __repr__(self) -> str:
+        return f"CatalogWatcher(catalog = {self.catalog!r}, interval = {self.interval})"
+    
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+    
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc_value: BaseException | None,
+            traceback: TracebackType | None,
+        ) -> None:
+        self.stop()
+    
+    @staticmethod
+    def _stat(path: Path) -> _FileSignature:
+        try:
+            stat: stat_result = path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _calculate_signature(self) -> tuple[_FileSignature, ...]:
+        return tuple(CatalogWatcher._stat(path = path) for path in self.catalog.source.paths)
+    
+    def check(self) -> bool:
+        """
+        Check the files once and reload the catalog if any of them changed since the last check.
+        
+        Returns:
+            bool: True if the catalog was reloaded, False otherwise (including when the reload failed).
+        """
+        
+        signature: tuple[_FileSignature, ...] = self._calculate_signature()
+        
+        if signature == self._signature:
+            return False
+        
+        self._signature = signature
+        
+        try:
+            self.catalog.reload()
+        except (OSError, yaml.YAMLError, sqlite3.Error, KeyError, TypeError, ValueError) as error:
+            self.last_error = error
+            return False
+        
+        self.last_error = None
+        self.reload_count += 1
+        
+        return True
+    
+    def _run(self) -> None:
+        while not self._stop_event.wait(timeout = self.interval):
+            self.check()
+    
+    def start(self) -> None:
+        """
+        Start polling the files in a background thread. Calling it while the watcher is running has no effect.
+        """
+        
+        if self._thread is not None and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = Thread(target = self._run, name = "catalog-watcher", daemon = True)
+        self._thread.start()
+    
+    def stop(self) -> None:
+        """
+        Stop polling and wait for the background thread to finish. Calling it while the watcher is stopped has no
+        effect.
+        """
+        
+        if self._thread is None:
+            return
+        
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+
+CATALOG: Catalog = Catalog(source = YamlDataSource(), snapshot_path = DATA_DIRECTORY / "catalog.snapshot")
+
+
+
+def attach_shared_catalog(handle: SharedCatalogHandle) -> None:
+    """
+    Load a copy of the data of `CATALOG` from a shared memory block published with `Catalog.share`. Meant to be used
+    as the initializer of a process pool, so that workers never read or parse the data files.
+    
+    Args:
+        handle (SharedCatalogHandle): The handle of the shared memory block.
+    """
+    
+    CATALOG.attach(handle = handle)
+
+
+if __name__ == "__main__":
+    print(f"Snapshot written to {CATALOG.build_snapshot()}")
@@ -9,67 +9,92 @@ Public API:
 
 - City (dataclass): Represents a city within a campaign. Handles city validation, calculates production, storage,
     defenses, effect bonuses, and city focus.
+- evaluate_city (function): Evaluates a city from a count of buildings, reusing previous identical evaluations from a
+    bounded LRU cache. Returns a `CityEvaluation` (frozen dataclass).
+- get_city_evaluation_stats, clear_city_evaluations (functions): Inspect and clear that cache.
+- CityVerdict, CityViolation (dataclasses): The result of `City.check`, which checks a count of buildings against the
+    rules of a city without creating it.
+- iter_city_configurations (function): Lazily iterate over every valid count of buildings of a city with a given
+    hall.
+- get_allowed_buildings (function): Get what a city can build with a given hall, as an `AllowedBuildings` (frozen
+    dataclass). The table of all cities and halls is built once per load of the catalog.
 
 Assets shared with other modules:
 
 - CityDict (TypedDict): Helper type for defining cities via dictionaries.
-- CITIES (list[_CityData]): List of all city definitions loaded from `./data/cities.yaml`.
+- CITIES (list[_CityData]): List of all city definitions loaded from the cities data. It is resolved lazily
+    through the catalog (see `modules.catalog`), so the file is only parsed on first access.
 
 Internal objects (not part of the public API):
-- `_CityDisplay`: Display functionality for an object of `City` class. It displays the object into a
-    terminal-friendly layout, showing various aspects of the city such as buildings, effects, production, storage, and
-    defenses.
+- `_CityDisplay`: Display functionality for an object of `City` class. It lives in `modules.rendering` (the only module
+    that depends on Rich) and is imported lazily when a city is displayed.
 - _CityData (TypedDict): Type for internal use when reading city data from YAML/JSON.
 - _CityEffectBonuses, _CityProduction, _CityStorage, _CityDefenses: helper dataclasses for modeling city internals.
 """
 
 from __future__ import annotations
 
+from array import array
 from collections import Counter
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from math import floor
-from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar, Literal, TypedDict
-
-import yaml
-from rich import box
-from rich.align import Align
-from rich.console import Console
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.style import Style
-from rich.table import Table
-from rich.text import Text
-
-from .building import _BUILDINGS, Building
-from .display import DEFAULT_SECTION_COLORS
-from .effects import EffectBonuses
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Literal, NamedTuple, TypedDict
+
+from .building import Building, get_building_spec, get_building_specs
+from .catalog import CATALOG
+from .effects import FrozenEffectBonuses
 from .exceptions import (
     BuildingError,
+    CityError,
     CityNotFoundError,
     FortsCannotHaveBuildingsError,
     InvalidBuidlingConfigurationError,
     MoreThanOneGuildTypeError,
     MoreThanOneHallTypeError,
+    NegativeNumberOfWorkersError,
     NoCityHallError,
     TooManyBuildingsError,
     TooManyGuildsError,
     TooManyHallsError,
+    TooManyWorkersError,
+    UnknownBuildingError,
     UnknownBuildingStaffingStrategyError,
 )
-from .geo_features import GeoFeatures
-from .resources import Resource, ResourceCollection
+from .geo_features import FrozenGeoFeatures
+from .resources import FrozenResourceCollection, Resource, ResourceCollection
+from .tables import get_building_table
 
 
 if TYPE_CHECKING:
-    from .building import BuildingsCount
-    from .display import DisplayConfiguration, DisplaySectionConfiguration
+    from collections.abc import Callable, Iterable, Iterator
+    from functools import _CacheInfo
+    
+    from .building import BuildingsCount, BuildingSpec
+    from .catalog import Catalog
+    from .display import DisplayConfiguration
     from .effects import EffectBonusesData
+    from .exceptions import LegionError
     from .geo_features import GeoFeaturesData
+    from .rendering import _CityDisplay
     from .resources import ResourceCollectionData
+    from .tables import BuildingTable
 
 
-__all__: list[str] = ["City"]
+__all__: list[str] = [
+    "CITY_EVALUATION_CACHE_SIZE",
+    "AllowedBuildings",
+    "City",
+    "CityEvaluation",
+    "CityVerdict",
+    "CityViolation",
+    "clear_city_evaluations",
+    "evaluate_city",
+    "get_allowed_buildings",
+    "get_city_evaluation_stats",
+    "iter_city_configurations",
+]
 
 
 class CityDict(TypedDict):
@@ -103,10 +128,20 @@ class _CityData(TypedDict):
     garrison: str
 
 
-with Path("./data/cities.yaml").open(mode = "r", encoding = "utf-8") as file:
-    _cities_data: dict[Literal["cities"], list[_CityData]] = yaml.safe_load(stream = file)
-
-CITIES: list[_CityData] = _cities_data["cities"]
+def __getattr__(name: str) -> Any:
+    # `CITIES` is kept as a module attribute for backwards compatibility, but it is resolved through the catalog so that
+    # importing this module does not parse the cities file.
+    if name == "CITIES":
+        return CATALOG.cities
+    
+    # `_CityDisplay` lives in the rendering module. It is resolved lazily so that importing this module does not load
+    # Rich.
+    if name == "_CityDisplay":
+        from .rendering import _CityDisplay  # noqa: PLC0415
+        
+        return _CityDisplay
+    
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # * **** * #
@@ -114,38 +149,78 @@ CITIES: list[_CityData] = _cities_data["cities"]
 # * **** * #
 
 @dataclass(kw_only = True)
+class _CityComposition:
+    """
+    A helper class with what the city needs to know about its buildings: how many there are of each ID, which one is the
+    hall, and how many workers they had when the city was created. It is collected in a single pass over a list of
+    buildings (with `add`), or directly from a count of buildings (with `add_count`), and it is all the city needs to
+    validate and evaluate itself. It must be updated every time a building is added to the city. Should not be used
+    outside this module.
+    """
+    
+    counts: Counter[str] = field(default_factory = Counter)
+    hall: Building | None = None
+    workers: int = 0
+    
+    def add(self, building: Building) -> None:
+        """Account for a building that is part of the city."""
+        
+        self.counts[building.id] += 1
+        self.workers += building.workers
+        
+        if self.hall is None and building.id in City.POSSIBLE_HALLS:
+            self.hall = building
+    
+    def add_count(self, building_id: str, qty: int) -> None:
+        """Account for `qty` unstaffed buildings with the given ID. Only the hall is created as a `Building`."""
+        
+        self.counts[building_id] += qty
+        
+        if self.hall is None and building_id in City.POSSIBLE_HALLS:
+            self.hall = Building(id = building_id)
+    
+    def remove_count(self, building_id: str, qty: int) -> None:
+        """Stop accounting for `qty` buildings with the given ID. IDs without buildings are removed from `counts`."""
+        
+        self.counts[building_id] -= qty
+        
+        if self.counts[building_id] <= 0:
+            del self.counts[building_id]
+
+
+@dataclass(kw_only = True, frozen = True)
 class _CityEffectBonuses:
     """A helper class to model the city's effect bonuses. Should not be used outside this module."""
     
-    city: EffectBonuses = field(default_factory = EffectBonuses)
-    buildings: EffectBonuses = field(default_factory = EffectBonuses)
-    workers: EffectBonuses = field(default_factory = EffectBonuses)
-    total: EffectBonuses = field(default_factory = EffectBonuses)
+    city: FrozenEffectBonuses = field(default_factory = FrozenEffectBonuses)
+    buildings: FrozenEffectBonuses = field(default_factory = FrozenEffectBonuses)
+    workers: FrozenEffectBonuses = field(default_factory = FrozenEffectBonuses)
+    total: FrozenEffectBonuses = field(default_factory = FrozenEffectBonuses)
 
 
-@dataclass(kw_only = True)
+@dataclass(kw_only = True, frozen = True)
 class _CityProduction:
     """A helper class to model the city's production. Should not be used outside this module."""
     
-    base: ResourceCollection = field(default_factory = ResourceCollection)
-    productivity_bonuses: ResourceCollection = field(default_factory = ResourceCollection)
-    total: ResourceCollection = field(default_factory = ResourceCollection)
-    maintenance_costs: ResourceCollection = field(default_factory = ResourceCollection)
-    balance: ResourceCollection = field(default_factory = ResourceCollection)
+    base: FrozenResourceCollection = field(default_factory = FrozenResourceCollection)
+    productivity_bonuses: FrozenResourceCollection = field(default_factory = FrozenResourceCollection)
+    total: FrozenResourceCollection = field(default_factory = FrozenResourceCollection)
+    maintenance_costs: FrozenResourceCollection = field(default_factory = FrozenResourceCollection)
+    balance: FrozenResourceCollection = field(default_factory = FrozenResourceCollection)
 
 
-@dataclass(kw_only = True)
+@dataclass(kw_only = True, frozen = True)
 class _CityStorage:
     """A helper class to model the city's storage capacity. Should not be used outside this module."""
     
-    city: ResourceCollection = field(default_factory = ResourceCollection)
-    buildings: ResourceCollection = field(default_factory = ResourceCollection)
-    warehouse: ResourceCollection = field(default_factory = ResourceCollection)
-    supply_dump: ResourceCollection = field(default_factory = ResourceCollection)
-    total: ResourceCollection = field(default_factory = ResourceCollection)
+    city: FrozenResourceCollection = field(default_factory = FrozenResourceCollection)
+    buildings: FrozenResourceCollection = field(default_factory = FrozenResourceCollection)
+    warehouse: FrozenResourceCollection = field(default_factory = FrozenResourceCollection)
+    supply_dump: FrozenResourceCollection = field(default_factory = FrozenResourceCollection)
+    total: FrozenResourceCollection = field(default_factory = FrozenResourceCollection)
 
 
-@dataclass(kw_only = True)
+@dataclass(kw_only = True, frozen = True)
 class _CityDefenses:
     """
     A helper class to model the city's defenses. Should not be used outside this module.
@@ -172,6 +247,8 @@ class City:
         non-hall buildings it can support.
         - MAX_WORKERS (ClassVar[BuildingsCount]): A dictionary mapping each hall type to the maximum number of workers
         it can support.
+        - RULES (ClassVar[tuple[str, ...]]): The names of the rules checked by `check()`, in the order they are
+        checked.
     
     Args:
         campaign (str): The identifier of the campaign the city belongs to.
@@ -227,6 +304,17 @@ class City:
     POSSIBLE_HALLS: ClassVar[set[str]] = {"fort", "village_hall", "town_hall", "city_hall"}
     POSSIBLE_GUILDS: ClassVar[set[str]] = {"farmers_guild", "carpenters_guild", "miners_guild"}
     
+    # The rules checked by `check`, in order. The ones after "city" only depend on the count of buildings.
+    _COUNT_RULES: ClassVar[tuple[str, ...]] = (
+        "halls",
+        "forts",
+        "total_buildings",
+        "building_counts",
+        "guilds",
+        "empty_building_spots",
+    )
+    RULES: ClassVar[tuple[str, ...]] = ("buildings", "city", *_COUNT_RULES)
+    
     # The maximum number of buildings a city can have, not counting the hall itself.
     MAX_BUILDINGS: ClassVar[BuildingsCount] = {
         "fort": 0,
@@ -243,6 +331,37 @@ class City:
         "city_hall": 18,
     }
     
+    # Production buildings sorted by productivity levels. The prod. level of each building is determined by the total
+    # sum of all produced rss. For most buildings, this is equal to the product of the one rss it produces times the
+    # number of workers. The only exception is the HL which produces all 3 rss. Worker productivity is calculated based
+    # on 100 prod. pot.
+    _PRODUCTION_PRIORITIES: ClassVar[dict[str, int]] = {
+        "large_farm": 36, # 12 * 3 = 36
+        "large_mine": 36, # 12 * 3 = 36
+        "large_lumber_mill": 36, # 12 * 3 = 36
+        "vineyard": 30, # 10 * 3 = 30
+        "fishing_village": 27, # 9 * 3 = 27
+        "outcrop_mine": 26, # 13 * 2 = 26
+        "farm": 21, # 7 * 3 = 21
+        "mine": 21, # 7 * 3 = 21
+        "lumber_mill": 21, # 7 * 3 = 21
+        "mountain_mine": 20, # 20 * 1 = 20
+        "hunters_lodge": 18, # (2 * 3) * 3 = 18
+    }
+    
+    # Staffing order of each strategy, as (rank by building ID, rank of any other building). Buildings are staffed by
+    # ascending rank, keeping their order in the city on ties, and buildings ranked `None` are not staffed. Ranking
+    # production buildings by their negated priority staffs them by descending productivity.
+    _STAFFING_RANKS: ClassVar[dict[str, tuple[dict[str, int | None], int | None]]] = {
+        "production_first": ({building_id: -priority for building_id, priority in _PRODUCTION_PRIORITIES.items()}, 0),
+        "production_only": ({building_id: -priority for building_id, priority in _PRODUCTION_PRIORITIES.items()}, None),
+        "effects_first": (
+            {building_id: -priority for building_id, priority in _PRODUCTION_PRIORITIES.items()},
+            -max(_PRODUCTION_PRIORITIES.values()) - 1,
+        ),
+        "effects_only": (dict.fromkeys(_PRODUCTION_PRIORITIES), 0),
+    }
+    
     __match_args__: ClassVar[tuple[str, str]] = ("campaign", "name")
     
     
@@ -254,20 +373,18 @@ class City:
             staffing_strategy: str = "production_first",
         ) -> None:
         
-        self._city_data: _CityData = self._get_city_data(campaign = campaign, name = name)
-        self.campaign: str = self._get_campaign()
-        self.name: str = self._get_city_name()
-        
-        self.resource_potentials: ResourceCollection = self._get_rss_potentials()
-        self.geo_features: GeoFeatures = self._get_geo_features()
+        # Buildings are only ever added through the city, which keeps `_composition` in sync with the list.
+        self._buildings: list[Building] | None = buildings
+        self._buildings_by_id: dict[str, list[Building]] | None = None
+        self._composition: _CityComposition = self._scan_buildings(buildings = buildings)
         
-        self.buildings: list[Building] = buildings
-        
-        self.is_fort: bool = self._is_fort()
-        self._add_fort_to_buildings()
+        self._evaluate(campaign = campaign, name = name, staffing_strategy = staffing_strategy)
+    
+    def _evaluate(self, campaign: str, name: str, staffing_strategy: str) -> None:
+        # Validates and evaluates the city from `_composition`. When the city was created from a count of buildings,
+        # `_buildings` is None and no `Building` objects (other than the hall) are created.
         
-        self.has_supply_dump: bool = self._has_supply_dump()
-        self._add_supply_dump_to_buildings()
+        self._load_city_data(campaign = campaign, name = name)
         
         self._validate_halls()
         self.hall: Building = self._get_hall()
@@ -282,40 +399,36 @@ class City:
         self._validate_staffing_strategy(staffing_strategy = staffing_strategy)
         self.staffing_strategy: str = staffing_strategy
         self.available_workers: int = City.MAX_WORKERS[self.hall.id]
-        self.assigned_workers: int = self._updated_assigned_workers()
-        self._staff_buildings()
-        
-        #* Calculate effects
-        self.effects: _CityEffectBonuses = _CityEffectBonuses()
-        self.effects.city = self._get_city_effects()
-        self.effects.buildings = self._calculate_building_effects()
-        self.effects.workers = self._calculate_worker_effects()
-        self.effects.total = self._calculate_total_effects()
-        
-        #* Calculate production
-        self.production: _CityProduction = _CityProduction()
-        self.production.base = self._calculate_base_production()
-        self.production.productivity_bonuses = self._calculate_productivity_bonuses()
-        self.production.total = self._calculate_total_production()
-        self.production.maintenance_costs = self._calculate_maintenance_costs()
-        self.production.balance = self._calculate_production_balance()
-        
-        #* Calculate storage capacity
-        self.storage: _CityStorage = _CityStorage()
-        self.storage.city = self._calculate_city_storage()
-        self.storage.buildings = self._calculate_buildings_storage()
-        self.storage.warehouse = self._calculate_warehouse_storage()
-        self.storage.supply_dump = self._calculate_supply_dump_storage()
-        self.storage.total = self._calculate_total_storage_capacity()
-        
-        #* City defenses
-        self.defenses: _CityDefenses = _CityDefenses()
-        self.defenses.garrison = self._get_garrison()
-        self.defenses.squadrons = self._calculate_garrison_size()
-        self.defenses.squadron_size = self._calculate_squadron_size()
-        
-        #* City focus
-        self.focus: Resource | None = self._find_city_focus()
+        self.assigned_workers: int = self._composition.workers
+        if self._buildings is None:
+            self._workers_by_id: BuildingsCount = self._staff_building_counts()
+        else:
+            self._staff_buildings()
+            self._workers_by_id = self._count_workers_by_id()
+            self._watch_buildings(buildings = self._buildings)
+        
+        #* Effects, production, storage and defenses
+        # They are calculated the first time they are used, and calculated again after the city changes.
+        self._effects: _CityEffectBonuses | None = None
+        self._production: _CityProduction | None = None
+        self._storage: _CityStorage | None = None
+        self._defenses: _CityDefenses | None = None
+    
+    def _load_city_data(self, campaign: str, name: str) -> None:
+        # Reads the data of the city, and adds the buildings every city with that data has (the fort and supply dump).
+        
+        self._city_data: _CityData = self._get_city_data(campaign = campaign, name = name)
+        self.campaign: str = self._get_campaign()
+        self.name: str = self._get_city_name()
+        
+        self.resource_potentials: FrozenResourceCollection = self._get_rss_potentials()
+        self.geo_features: FrozenGeoFeatures = self._get_geo_features()
+        
+        self.is_fort: bool = self._is_fort()
+        self._add_fort_to_buildings()
+        
+        self.has_supply_dump: bool = self._has_supply_dump()
+        self._add_supply_dump_to_buildings()
     
     
     def __hash__(self) -> int:
@@ -325,12 +438,7 @@ class City:
         return True
     
     def __contains__(self, building_id: str) -> bool:
-        
-        for building in self.buildings:
-            if building.id == building_id:
-                return True
-        
-        return False
+        return building_id in self._composition.counts
     
     def __eq__(self, other: object) -> bool:
         
@@ -350,12 +458,10 @@ class City:
     @staticmethod
     def _get_city_data(campaign: str, name: str) -> _CityData:
         
-        for city in CITIES:
-            if (
-                city["campaign"] == campaign
-                and city["name"] == name
-            ):
-                return city
+        city: _CityData | None = CATALOG.find_city(campaign = campaign, name = name)
+        
+        if city is not None:
+            return city
         
         raise CityNotFoundError(f"No city found for campaing = \"{campaign}\" and name = \"{name}\"")
     
@@ -365,11 +471,11 @@ class City:
     def _get_city_name(self) -> str:
         return self._city_data["name"]
     
-    def _get_rss_potentials(self) -> ResourceCollection:
-        return ResourceCollection(**self._city_data["resource_potentials"])
+    def _get_rss_potentials(self) -> FrozenResourceCollection:
+        return FrozenResourceCollection(**self._city_data["resource_potentials"])
     
-    def _get_geo_features(self) -> GeoFeatures:
-        return GeoFeatures(**self._city_data["geo_features"])
+    def _get_geo_features(self) -> FrozenGeoFeatures:
+        return FrozenGeoFeatures(**self._city_data["geo_features"])
     
     def _is_fort(self) -> bool:
         return self._city_data["is_fort"]
@@ -379,10 +485,16 @@ class City:
         if not self.is_fort:
             return
         
-        if self.has_building(building_id = "fort"):
+        if "fort" in self._composition.counts:
+            return
+        
+        if self._buildings is None:
+            self._composition.add_count(building_id = "fort", qty = 1)
             return
         
-        self.buildings.append(Building(id = "fort"))
+        fort: Building = Building(id = "fort")
+        self._buildings.append(fort)
+        self._composition.add(building = fort)
     
     def _has_supply_dump(self) -> bool:
         return self._city_data["has_supply_dump"]
@@ -392,257 +504,92 @@ class City:
         if not self.has_supply_dump:
             return
         
-        if self.has_building(building_id = "supply_dump"):
+        if "supply_dump" in self._composition.counts:
+            return
+        
+        if self._buildings is None:
+            self._composition.add_count(building_id = "supply_dump", qty = 1)
             return
         
-        self.buildings.append(Building(id = "supply_dump"))
+        supply_dump: Building = Building(id = "supply_dump")
+        self._buildings.append(supply_dump)
+        self._composition.add(building = supply_dump)
     
     def _validate_halls(self) -> None:
         
-        halls: BuildingsCount = {}
-        
-        for building in self.buildings:
-            if building.id not in City.POSSIBLE_HALLS:
-                continue
-            
-            if building.id in halls:
-                halls[building.id] += 1
-            else:
-                halls[building.id] = 1
-        
-        if not halls:
-            raise NoCityHallError("City must include a hall (Village, Town, or City).")
-        
-        if len(halls) > 1:
-            raise MoreThanOneHallTypeError(
-                f"Only one hall per city is allowed. Found {", ".join(halls.keys())}.",
-            )
+        error: CityError | None = City._check_halls(counts = self._composition.counts)
         
-        if next(iter(halls.values())) != 1:
-            raise TooManyHallsError("Too many halls for this city.")
+        if error is not None:
+            raise error
     
     def _get_hall(self) -> Building:
         
-        for building in self.buildings:
-            if building.id not in City.POSSIBLE_HALLS:
-                continue
-            
-            return building
+        if self._composition.hall is not None:
+            return self._composition.hall
         
         raise NoCityHallError("City must include a hall (Village, Town, or City).")
     
+    def _get_allowed_buildings(self) -> AllowedBuildings:
+        return get_allowed_buildings(campaign = self.campaign, name = self.name, hall_id = self.hall.id)
+    
     def _calculate_allowed_building_counts(self) -> BuildingsCount:
-        
-        if self.is_fort:
-            allowed_counts: BuildingsCount = dict.fromkeys(_BUILDINGS, 0)
-            allowed_counts["fort"] = 1
-            return allowed_counts
-        
-        basic_production_buildings: set[str] = {
-            "farm",
-            "large_farm",
-            "mine",
-            "large_mine",
-            "lumber_mill",
-            "large_lumber_mill",
-        }
-        
-        buildings_that_require_town_hall: set[str] = {
-            "city_hall",
-            "bath_house",
-            "hospital",
-            "vineyard",
-            "training_ground",
-            "bordello",
-            "gladiator_school",
-            "medium_fort",
-            "barracks",
-            "temple",
-        }
-        
-        buildings_that_require_city_hall: set[str] = {
-            "large_fort",
-            "quartermaster",
-            "basilica",
-            "imperial_residence",
-            "farmers_guild",
-            "carpenters_guild",
-            "miners_guild",
-        }
-        
-        allowed_counts: BuildingsCount = dict.fromkeys(_BUILDINGS, 1)
-        
-        total_spots: int = City.MAX_BUILDINGS[self.hall.id]
-        
-        pre_occupied_spots: int = self.geo_features.lakes \
-            + self.geo_features.rock_outcrops \
-            + self.geo_features.mountains
-        
-        if self.has_supply_dump:
-            pre_occupied_spots += 1
-        
-        for building_id in _BUILDINGS:
-            
-            # Cities that are not forts, cannot build the fort, they have it from the start.
-            if building_id == "fort":
-                allowed_counts[building_id] = 0
-                continue
-            
-            # Hunters' lodges are special buildings. They require all rss to be present in the city, but can only
-            # be built in cities with town and village halls. Once the city hall is built, the city loses the availity
-            # to build hunters' lodges.
-            if building_id == "hunters_lodge":
-                
-                if not (
-                    self.resource_potentials.food > 0
-                    and self.resource_potentials.ore > 0
-                    and self.resource_potentials.wood > 0
-                ):
-                    allowed_counts[building_id] = 0
-                    continue
-                
-                if self.hall.id == "city_hall":
-                    allowed_counts[building_id] = City.MAX_BUILDINGS["town_hall"] - pre_occupied_spots
-                    continue
-                
-                allowed_counts[building_id] = total_spots - pre_occupied_spots
-            
-            # Supply dumps are available in only three cities. There's only one per city and they are either there from
-            # the start or they are not. They cannot be deleted.
-            if building_id == "supply_dump":
-                if not self.has_supply_dump:
-                    allowed_counts[building_id] = 0
-            
-            # We start by assuming that basic production buildings can build as many as there are building slots
-            # available in that city. This is determined by the hall minus the pre_occupied_spots.
-            if building_id in basic_production_buildings:
-                allowed_counts[building_id] = total_spots - pre_occupied_spots
-            
-            # Adjustments for geo features
-            if building_id == "fishing_village":
-                allowed_counts[building_id] = self.geo_features.lakes
-            
-            if building_id == "outcrop_mine":
-                allowed_counts[building_id] = self.geo_features.rock_outcrops
-            
-            if building_id == "mountain_mine":
-                allowed_counts[building_id] = self.geo_features.mountains
-            
-            if building_id in {"forest", "hidden_grove"}:
-                allowed_counts[building_id] = self.geo_features.forests
-            
-            # Adjustments for resource production potentials
-            if building_id in {"farm", "large_farm", "vineyard", "fishing_village", "farmers_guild", "stables"}:
-                if self.resource_potentials.food == 0:
-                    allowed_counts[building_id] = 0
-            
-            if building_id in {"mine", "large_mine", "outcrop_mine", "mountain_mine", "miners_guild", "blacksmith"}:
-                if self.resource_potentials.ore == 0:
-                    allowed_counts[building_id] = 0
-            
-            if building_id in {"lumber_mill", "large_lumber_mill", "carpenters_guild", "fletcher"}:
-                if self.resource_potentials.wood == 0:
-                    allowed_counts[building_id] = 0
-            
-            # Adjustments for hall level
-            if (
-                building_id in buildings_that_require_town_hall
-                or building_id in buildings_that_require_city_hall
-            ):
-                if self.hall.id in {"fort", "village_hall"}:
-                    allowed_counts[building_id] = 0
-            
-            if building_id in buildings_that_require_city_hall:
-                if self.hall.id in {"fort", "village_hall", "town_hall"}:
-                    allowed_counts[building_id] = 0
-        
-        return allowed_counts
+        return self._get_allowed_buildings().counts
     
     def _validate_forts_have_no_other_buildings(self) -> None:
         
-        if self.is_fort:
-            if len(self.buildings) > 1:
-                raise FortsCannotHaveBuildingsError("Forts cannot have buildings.")
+        error: CityError | None = City._check_forts(counts = self._composition.counts, is_fort = self.is_fort)
+        
+        if error is not None:
+            raise error
     
     def _validate_total_number_of_buildings(self) -> None:
         
-        number_of_declared_buildings: int = len(self.buildings)
-        max_number_of_buildings_in_city: int = City.MAX_BUILDINGS[self.hall.id]
+        error: CityError | None = City._check_total_number_of_buildings(
+            counts = self._composition.counts,
+            hall_id = self.hall.id,
+        )
         
-        if number_of_declared_buildings > max_number_of_buildings_in_city + 1:
-            
-            raise TooManyBuildingsError(
-                f"Too many buildings for this city: "
-                f"{number_of_declared_buildings} provided, "
-                f"max of {max_number_of_buildings_in_city + 1} possible ({max_number_of_buildings_in_city} + hall).",
-            )
+        if error is not None:
+            raise error
     
     def _validate_building_counts(self) -> None:
         
-        allowed_building_counts: BuildingsCount = self._calculate_allowed_building_counts()
-        current_building_counts: BuildingsCount = self.get_buildings_count(by = "id")
+        error: CityError | None = City._check_building_counts(
+            counts = self._composition.counts,
+            allowed_counts = self._calculate_allowed_building_counts(),
+        )
         
-        for building_id, current_count in current_building_counts.items():
-            if current_count > allowed_building_counts[building_id]:
-                raise TooManyBuildingsError(
-                    f"Too many buildings of type \"{building_id}\". "
-                    f"Allowed {allowed_building_counts[building_id]}, but found {current_count}.",
-                )
+        if error is not None:
+            raise error
     
-    def _validate_guilds(self) -> None:
+    def _validate_building_count(self, building_id: str, allowed_count: int) -> None:
         
-        guilds: BuildingsCount = {}
+        error: CityError | None = City._check_building_count(
+            building_id = building_id,
+            count = self._composition.counts[building_id],
+            allowed_count = allowed_count,
+        )
         
-        for building in self.buildings:
-            if building.id not in City.POSSIBLE_GUILDS:
-                continue
-            
-            if building.id in guilds:
-                guilds[building.id] += 1
-            else:
-                guilds[building.id] = 1
-        
-        if len(guilds) > 1:
-            raise MoreThanOneGuildTypeError(
-                f"Only one guild per city is allowed. Found {", ".join(guilds.keys())}.",
-            )
+        if error is not None:
+            raise error
+    
+    def _validate_guilds(self) -> None:
         
-        if len(guilds) == 1:
-            if next(iter(guilds.values())) != 1:
-                raise TooManyGuildsError("Too many guilds for this city.")
+        error: CityError | None = City._check_guilds(counts = self._composition.counts)
+        
+        if error is not None:
+            raise error
     
     def _validate_empty_building_spots(self) -> None:
-        # Throughout this method the concept of an "empty building spot" reflects more of an actual or potential
-        # characteristic of a building spot. A more appropriate name would probably be "empty or emptyable building
-        # spot" but I will keep it as "empty" for simplicity and brevity.
         
-        qty_buildings_that_require_empty_spot: int = 0
-        
-        for building in self.buildings:
-            if all([
-                # Non-buildable buildings cannot be built. The city either starts with them, or it will never have them.
-                # The only non-buildable "building" that is deletable is the forest. But those validations are already
-                # considered elsewhere.
-                building.is_buildable,
-                # Buildings that require geo features can only be built in geo-feature spots.
-                building.required_geo is None,
-                # The hall has its own dedicated "building" spot.
-                building.id != self.hall.id,
-            ]):
-                qty_buildings_that_require_empty_spot += 1
-        
-        supply_dump_spot: int = 1 if self.has_supply_dump else 0
-        qty_geo_building_spots: int = (
-            self.geo_features.lakes
-            + self.geo_features.rock_outcrops
-            + self.geo_features.mountains
+        error: CityError | None = City._check_empty_building_spots(
+            counts = self._composition.counts,
+            allowed_buildings = self._get_allowed_buildings(),
+            city_name = self.name,
         )
-        qty_empty_building_spots: int = City.MAX_BUILDINGS[self.hall.id] - supply_dump_spot - qty_geo_building_spots
         
-        if qty_buildings_that_require_empty_spot > qty_empty_building_spots:
-            raise InvalidBuidlingConfigurationError(
-                f"Building configuration is not possible for {self.name}. ",
-            )
+        if error is not None:
+            raise error
     
     @staticmethod
     def _validate_staffing_strategy(staffing_strategy: str) -> None:
@@ -668,12 +615,29 @@ class City:
     
     def _staff_building(self, building: Building) -> None:
         
-        while (
-            self.assigned_workers < self.available_workers
-            and building.workers < building.max_workers
-        ):
-            building.add_workers(qty = 1)
-            self.assigned_workers += 1
+        qty: int = min(building.max_workers - building.workers, self.available_workers - self.assigned_workers)
+        
+        if qty > 0:
+            building.set_workers(qty = building.workers + qty)
+            self.assigned_workers += qty
+    
+    def _order_for_staffing[T](self, items: list[T], get_id: Callable[[T], str]) -> list[T]:
+        # Returns the buildings (or building IDs) that the staffing strategy staffs, in the order it staffs them.
+        
+        if self.staffing_strategy not in City._STAFFING_RANKS:
+            return []
+        
+        ranks, default_rank = City._STAFFING_RANKS[self.staffing_strategy]
+        ranked_items: list[tuple[int, T]] = []
+        
+        for item in items:
+            rank: int | None = ranks.get(get_id(item), default_rank)
+            if rank is not None:
+                ranked_items.append((rank, item))
+        
+        ranked_items.sort(key = itemgetter(0))  # Stable, so ties keep their order in the city.
+        
+        return [item for _, item in ranked_items]
     
     def _staff_buildings(self) -> None:
         
@@ -688,274 +652,516 @@ class City:
             
             return
         
-        # Production buildings sorted by productivity levels. The prod. level of each building is determined by the
-        # total sum of all produced rss. For most buildings, this is equal to the product of the one rss it produces
-        # times the number of workers. The only exception is the HL which produces all 3 rss. Worker productivity is
-        # calculated based on 100 prod. pot.
-        production_buildings: dict[str, int] = {
-            "large_farm": 36, # 12 * 3 = 36
-            "large_mine": 36, # 12 * 3 = 36
-            "large_lumber_mill": 36, # 12 * 3 = 36
-            "vineyard": 30, # 10 * 3 = 30
-            "fishing_village": 27, # 9 * 3 = 27
-            "outcrop_mine": 26, # 13 * 2 = 26
-            "farm": 21, # 7 * 3 = 21
-            "mine": 21, # 7 * 3 = 21
-            "lumber_mill": 21, # 7 * 3 = 21
-            "mountain_mine": 20, # 20 * 1 = 20
-            "hunters_lodge": 18, # (2 * 3) * 3 = 18
-        }
+        for building in self._order_for_staffing(items = self.buildings, get_id = lambda building: building.id):
+            self._staff_building(building = building)
+    
+    def _staff_building_counts(self) -> BuildingsCount:
+        # Count-native version of `_staff_buildings`, for cities created from a count of buildings. Those buildings
+        # start without workers and the buildings of each type are next to each other, so staffing them one by one fills
+        # one type after the other: it is enough to staff whole types. Returns the workers assigned to each type.
         
-        production_buildings_in_city: list[Building] = sorted(
-            [building for building in self.buildings if building.id in production_buildings],
-            key = lambda building: production_buildings[building.id],
-            reverse = True,
-        )
-        non_production_buildings_in_city: list[Building] = [
-            building for building in self.buildings if building.id not in production_buildings
-        ]
+        workers_by_id: BuildingsCount = {}
         
-        if self.staffing_strategy in {"production_first", "production_only"}:
-            for building in production_buildings_in_city:
-                self._staff_building(building = building)
-            
-            if self.staffing_strategy == "production_first":
-                for building in non_production_buildings_in_city:
-                    self._staff_building(building = building)
+        if self.staffing_strategy in {"none", "zero"}:
+            return workers_by_id
         
-        if self.staffing_strategy in {"effects_first", "effects_only"}:
-            for building in non_production_buildings_in_city:
-                self._staff_building(building = building)
+        specs: dict[str, BuildingSpec] = get_building_specs()
+        building_ids: list[str] = list(self._composition.counts)
+        
+        for building_id in self._order_for_staffing(items = building_ids, get_id = lambda building_id: building_id):
+            qty: int = min(
+                self._composition.counts[building_id] * specs[building_id].max_workers,
+                self.available_workers - self.assigned_workers,
+            )
             
-            if self.staffing_strategy == "effects_first":
-                for building in production_buildings_in_city:
-                    self._staff_building(building = building)
-    
+            if qty > 0:
+                workers_by_id[building_id] = qty
+                self.assigned_workers += qty
+        
+        return workers_by_id
     
-    #* Effect bonuses
-    def _get_city_effects(self) -> EffectBonuses:
-        return EffectBonuses(**self._city_data["effects"])
     
-    def _calculate_building_effects(self) -> EffectBonuses:
-        
-        building_effects: EffectBonuses = EffectBonuses()
+    #* Rules
+    # Each rule returns the error that a city breaking it raises (without raising it), or None. They only read a count
+    # of buildings, so `check` can use them without creating a city.
+    @staticmethod
+    def _find_hall_id(counts: BuildingsCount) -> str | None:
+        # The hall a city with the count of buildings would have: the first one in the count.
         
-        for building in self.buildings:
-            building_effects.troop_training += building.effect_bonuses.troop_training
-            building_effects.population_growth += building.effect_bonuses.population_growth
-            building_effects.intelligence += building.effect_bonuses.intelligence
+        for building_id in counts:
+            if building_id in City.POSSIBLE_HALLS:
+                return building_id
         
-        return building_effects
+        return None
     
-    def _calculate_worker_effects(self) -> EffectBonuses:
-        
-        worker_effects: EffectBonuses = EffectBonuses()
+    @staticmethod
+    def _check_halls(counts: BuildingsCount) -> CityError | None:
         
-        for building in self.buildings:
-            worker_effects.troop_training += building.effect_bonuses_per_worker.troop_training * building.workers
-            worker_effects.population_growth += building.effect_bonuses_per_worker.population_growth * building.workers
-            worker_effects.intelligence += building.effect_bonuses_per_worker.intelligence * building.workers
+        hall_id: str | None = None
         
-        return worker_effects
-    
-    def _calculate_total_effects(self) -> EffectBonuses:
+        for building_id in counts:
+            if building_id not in City.POSSIBLE_HALLS:
+                continue
+            if hall_id is not None:
+                halls: list[str] = [building_id for building_id in counts if building_id in City.POSSIBLE_HALLS]
+                return MoreThanOneHallTypeError(f"Only one hall per city is allowed. Found {", ".join(halls)}.")
+            hall_id = building_id
         
-        total_effects: EffectBonuses = EffectBonuses()
+        if hall_id is None:
+            return NoCityHallError("City must include a hall (Village, Town, or City).")
         
-        total_effects.troop_training = (
-            self.effects.city.troop_training
-            + self.effects.buildings.troop_training
-            + self.effects.workers.troop_training
-        )
-        total_effects.population_growth = (
-            self.effects.city.population_growth
-            + self.effects.buildings.population_growth
-            + self.effects.workers.population_growth
-        )
-        total_effects.intelligence = (
-            self.effects.city.intelligence
-            + self.effects.buildings.intelligence
-            + self.effects.workers.intelligence
-        )
+        if counts[hall_id] != 1:
+            return TooManyHallsError("Too many halls for this city.")
         
-        return total_effects
+        return None
     
+    @staticmethod
+    def _check_forts(counts: BuildingsCount, is_fort: bool) -> CityError | None:
+        
+        if is_fort and sum(counts.values()) > 1:
+            return FortsCannotHaveBuildingsError("Forts cannot have buildings.")
+        
+        return None
     
-    #* Production
-    def _calculate_base_production(self) -> ResourceCollection:
+    @staticmethod
+    def _check_total_number_of_buildings(counts: BuildingsCount, hall_id: str) -> CityError | None:
         
-        base_production: ResourceCollection = ResourceCollection()
+        number_of_declared_buildings: int = sum(counts.values())
+        max_number_of_buildings_in_city: int = City.MAX_BUILDINGS[hall_id]
         
-        for building in self.buildings:
-            
-            productivity_per_worker: ResourceCollection = building.productivity_per_worker
-            
-            # Production per worker
-            prod_per_worker_food: int = floor(productivity_per_worker.food * self.resource_potentials.food / 100.0)
-            prod_per_worker_ore: int = floor(productivity_per_worker.ore * self.resource_potentials.ore / 100.0)
-            prod_per_worker_wood: int = floor(productivity_per_worker.wood * self.resource_potentials.wood / 100.0)
-            
-            # Base production
-            base_production_food: int = prod_per_worker_food * building.workers
-            base_production_ore: int = prod_per_worker_ore * building.workers
-            base_production_wood: int = prod_per_worker_wood * building.workers
-            
-            base_production.food += base_production_food
-            base_production.ore += base_production_ore
-            base_production.wood += base_production_wood
+        if number_of_declared_buildings > max_number_of_buildings_in_city + 1:
+            return TooManyBuildingsError(
+                f"Too many buildings for this city: "
+                f"{number_of_declared_buildings} provided, "
+                f"max of {max_number_of_buildings_in_city + 1} possible ({max_number_of_buildings_in_city} + hall).",
+            )
         
-        return base_production
+        return None
     
-    def _calculate_productivity_bonuses(self) -> ResourceCollection:
-        
-        productivity_bonuses: ResourceCollection = ResourceCollection()
+    @staticmethod
+    def _check_building_counts(counts: BuildingsCount, allowed_counts: BuildingsCount) -> CityError | None:
         
-        for building in self.buildings:
-            productivity_bonuses.food += building.productivity_bonuses.food
-            productivity_bonuses.ore += building.productivity_bonuses.ore
-            productivity_bonuses.wood += building.productivity_bonuses.wood
+        for building_id, count in counts.items():
+            error: CityError | None = City._check_building_count(
+                building_id = building_id,
+                count = count,
+                allowed_count = allowed_counts[building_id],
+            )
+            if error is not None:
+                return error
         
-        return productivity_bonuses
+        return None
     
-    def _calculate_total_production(self) -> ResourceCollection:
+    @staticmethod
+    def _check_building_count(building_id: str, count: int, allowed_count: int) -> CityError | None:
         
-        total_food: int = floor(self.production.base.food * (1 + self.production.productivity_bonuses.food / 100))
-        total_ore: int = floor(self.production.base.ore * (1 + self.production.productivity_bonuses.ore / 100))
-        total_wood: int = floor(self.production.base.wood * (1 + self.production.productivity_bonuses.wood / 100))
+        if count > allowed_count:
+            return TooManyBuildingsError(
+                f"Too many buildings of type \"{building_id}\". "
+                f"Allowed {allowed_count}, but found {count}.",
+            )
         
-        return ResourceCollection(food = total_food, ore = total_ore, wood = total_wood)
+        return None
     
-    def _calculate_maintenance_costs(self) -> ResourceCollection:
+    @staticmethod
+    def _check_guilds(counts: BuildingsCount) -> CityError | None:
         
-        maintenance_costs: ResourceCollection = ResourceCollection()
+        guild_id: str | None = None
         
-        for building in self.buildings:
-            maintenance_costs.food += building.maintenance_cost.food
-            maintenance_costs.ore += building.maintenance_cost.ore
-            maintenance_costs.wood += building.maintenance_cost.wood
+        for building_id in counts:
+            if building_id not in City.POSSIBLE_GUILDS:
+                continue
+            if guild_id is not None:
+                guilds: list[str] = [building_id for building_id in counts if building_id in City.POSSIBLE_GUILDS]
+                return MoreThanOneGuildTypeError(f"Only one guild per city is allowed. Found {", ".join(guilds)}.")
+            guild_id = building_id
+        
+        if guild_id is not None and counts[guild_id] != 1:
+            return TooManyGuildsError("Too many guilds for this city.")
         
-        return maintenance_costs
+        return None
     
-    def _calculate_production_balance(self) -> ResourceCollection:
+    @staticmethod
+    def _check_empty_building_spots(
+            counts: BuildingsCount,
+            allowed_buildings: AllowedBuildings,
+            city_name: str,
+        ) -> CityError | None:
+        # Throughout this method the concept of an "empty building spot" reflects more of an actual or potential
+        # characteristic of a building spot. A more appropriate name would probably be "empty or emptyable building
+        # spot" but I will keep it as "empty" for simplicity and brevity.
         
-        balance_food: int = self.production.total.food - self.production.maintenance_costs.food
-        balance_ore: int = self.production.total.ore - self.production.maintenance_costs.ore
-        balance_wood: int = self.production.total.wood - self.production.maintenance_costs.wood
+        # The buildings that take an empty spot are buildable (non-buildable buildings cannot be built: the city either
+        # starts with them, or it will never have them), do not require geo features (those can only be built in
+        # geo-feature spots), and are not the hall (which has its own dedicated "building" spot).
         
-        return ResourceCollection(food = balance_food, ore = balance_ore, wood = balance_wood)
-    
-    
-    #* Storage capacity
-    def _calculate_city_storage(self) -> ResourceCollection:
-        return self.hall.storage_capacity
-    
-    def _calculate_buildings_storage(self) -> ResourceCollection:
+        qty_buildings_that_require_empty_spot: int = 0
         
-        buildings_storage: ResourceCollection = ResourceCollection()
+        for building_id, count in counts.items():
+            if building_id in allowed_buildings.empty_spot_buildings:
+                qty_buildings_that_require_empty_spot += count
         
-        for building in self.buildings:
-            if (
-                building.id not in City.POSSIBLE_HALLS
-                and building.id not in {"warehouse", "supply_dump"}
-            ):
-                buildings_storage.food += building.storage_capacity.food
-                buildings_storage.ore += building.storage_capacity.ore
-                buildings_storage.wood += building.storage_capacity.wood
+        if qty_buildings_that_require_empty_spot > allowed_buildings.empty_spots:
+            return InvalidBuidlingConfigurationError(f"Building configuration is not possible for {city_name}. ")
         
-        return buildings_storage
+        return None
     
-    def _calculate_warehouse_storage(self) -> ResourceCollection:
+    @staticmethod
+    def _check_rule(rule: str, counts: BuildingsCount, city: _CityData, hall_id: str | None) -> CityError | None:
+        # Checks one of `City.RULES` that only depend on the count of buildings.
         
-        if self.has_building(building_id = "warehouse"):
-            return self.get_building(building_id = "warehouse").storage_capacity
+        if rule == "halls":
+            return City._check_halls(counts = counts)
         
-        return ResourceCollection()
-    
-    def _calculate_supply_dump_storage(self) -> ResourceCollection:
+        if rule == "forts":
+            return City._check_forts(counts = counts, is_fort = city["is_fort"])
         
-        if self.has_supply_dump:
-            return self.get_building(building_id = "supply_dump").storage_capacity
+        # The other rules depend on the hall, so they cannot be checked without one.
+        if hall_id is None:
+            return None
         
-        return ResourceCollection()
-    
-    def _calculate_total_storage_capacity(self) -> ResourceCollection:
+        if rule == "total_buildings":
+            return City._check_total_number_of_buildings(counts = counts, hall_id = hall_id)
         
-        total_storage: ResourceCollection = ResourceCollection()
+        if rule == "guilds":
+            return City._check_guilds(counts = counts)
         
-        total_storage.food = (
-            self.storage.city.food
-            + self.storage.buildings.food
-            + self.storage.warehouse.food
-            + self.storage.supply_dump.food
-        )
-        total_storage.ore = (
-            self.storage.city.ore
-            + self.storage.buildings.ore
-            + self.storage.warehouse.ore
-            + self.storage.supply_dump.ore
-        )
-        total_storage.wood = (
-            self.storage.city.wood
-            + self.storage.buildings.wood
-            + self.storage.warehouse.wood
-            + self.storage.supply_dump.wood
+        allowed_buildings: AllowedBuildings = get_allowed_buildings(
+            campaign = city["campaign"],
+            name = city["name"],
+            hall_id = hall_id,
         )
         
-        return total_storage
+        if rule == "building_counts":
+            return City._check_building_counts(counts = counts, allowed_counts = allowed_buildings.counts)
+        
+        return City._check_empty_building_spots(
+            counts = counts,
+            allowed_buildings = allowed_buildings,
+            city_name = city["name"],
+        )
     
+    @staticmethod
+    def _complete_buildings_count(buildings: BuildingsCount, city: _CityData) -> BuildingsCount:
+        # The count of buildings of a city created from `buildings`: without zero counts, and with the fort and the
+        # supply dump that the city data adds. It is `buildings` itself when there is nothing to complete.
+        
+        missing_fort: bool = city["is_fort"] and buildings.get("fort", 0) <= 0
+        missing_supply_dump: bool = city["has_supply_dump"] and buildings.get("supply_dump", 0) <= 0
+        
+        if not missing_fort and not missing_supply_dump and min(buildings.values(), default = 1) > 0:
+            return buildings
+        
+        counts: BuildingsCount = {building_id: qty for building_id, qty in buildings.items() if qty > 0}
+        
+        if missing_fort:
+            counts["fort"] = 1
+        
+        if missing_supply_dump:
+            counts["supply_dump"] = 1
+        
+        return counts
     
-    #* City defenses
-    def _get_garrison(self) -> str:
-        return self._city_data["garrison"]
     
-    def _calculate_garrison_size(self) -> int:
+    #* Aggregation
+    # The list of buildings is walked once before staffing, to count the buildings (see `_CityComposition`), and once
+    # after staffing, to count the workers. Everything else is derived from those counts: sums over the buildings are
+    # gathered from the columnar building table, with one (index, count) pair per building type instead of one
+    # attribute update per building and key.
+    @staticmethod
+    def _scan_buildings(buildings: list[Building]) -> _CityComposition:
         
-        if self.is_fort:
-            return 3
+        composition: _CityComposition = _CityComposition()
         
-        if self.has_building(building_id = "large_fort"):
-            return 4
+        for building in buildings:
+            composition.add(building = building)
         
-        if self.has_building(building_id = "medium_fort"):
-            return 3
+        return composition
+    
+    @staticmethod
+    def _count_buildings(buildings: BuildingsCount) -> _CityComposition:
         
-        if self.has_building(building_id = "small_fort"):
-            return 2
+        composition: _CityComposition = _CityComposition()
         
-        return 1
+        for building_id, qty in buildings.items():
+            if qty > 0:
+                get_building_spec(building_id = building_id)  # Raises UnknownBuildingError, like `Building` does.
+                composition.add_count(building_id = building_id, qty = qty)
+        
+        return composition
     
-    def _calculate_squadron_size(self) -> str:
+    def _count_workers_by_id(self) -> BuildingsCount:
         
-        if self.is_fort:
-            return "Medium"
+        workers_by_id: BuildingsCount = {}
         
-        if self.has_building(building_id = "quartermaster"):
-            return "Huge"
+        for building in self.buildings:
+            if building.workers:
+                workers_by_id[building.id] = workers_by_id.get(building.id, 0) + building.workers
         
-        if self.has_building(building_id = "barracks"):
-            return "Large"
+        return workers_by_id
+    
+    def _count_buildings_by_index(self, table: BuildingTable) -> list[tuple[int, int]]:
+        return [(table.index[building_id], count) for building_id, count in self._composition.counts.items()]
+    
+    
+    #* Buildings
+    def _create_buildings(self) -> list[Building]:
+        # Creates the buildings of a city that was created from a count of buildings. The result is the same list (with
+        # the same workers) as expanding the count into buildings and staffing them one by one.
         
-        if any([
-            self.has_building(building_id = "small_fort"),
-            self.has_building(building_id = "medium_fort"),
-            self.has_building(building_id = "large_fort"),
-        ]):
-            return "Medium"
+        specs: dict[str, BuildingSpec] = get_building_specs()
+        buildings: list[Building] = []
         
-        return "Small"
+        for building_id, count in self._composition.counts.items():
+            
+            unassigned_workers: int = self._workers_by_id.get(building_id, 0)
+            max_workers: int = specs[building_id].max_workers
+            
+            for _ in range(count):
+                workers: int = min(max_workers, unassigned_workers)
+                unassigned_workers -= workers
+                
+                if building_id == self.hall.id:
+                    self.hall.set_workers(qty = workers)
+                    buildings.append(self.hall)
+                else:
+                    buildings.append(Building(id = building_id, workers = workers))
+        
+        return buildings
     
+    def _watch_buildings(self, buildings: list[Building]) -> None:
+        # From now on, changing the workers of the buildings directly updates the city (see `_change_building_workers`).
+        
+        for building in buildings:
+            building.on_workers_change(callback = self._change_building_workers)
     
-    #* City focus
-    def _find_city_focus(self) -> Resource | None:
+    def _change_building_workers(self, building: Building, change: int) -> None:
         
-        highest_balance: int = max(
-            self.production.balance.food,
-            self.production.balance.ore,
-            self.production.balance.wood,
+        self._update_workers_by_id(
+            building_id = building.id,
+            workers = self._workers_by_id.get(building.id, 0) + change,
         )
+        self._apply_change(building_id = building.id, buildings = 0, workers = change)
+    
+    def _get_buildings_by_id(self) -> dict[str, list[Building]]:
         
-        if highest_balance < 0:
-            return None
+        if self._buildings_by_id is None:
+            buildings_by_id: dict[str, list[Building]] = {}
+            for building in self.buildings:
+                buildings_by_id.setdefault(building.id, []).append(building)
+            self._buildings_by_id = buildings_by_id
+        
+        return self._buildings_by_id
+    
+    
+    #* Effect bonuses
+    def _get_city_effects(self) -> FrozenEffectBonuses:
+        return FrozenEffectBonuses(**self._city_data["effects"])
+    
+    def _calculate_building_effects(self) -> FrozenEffectBonuses:
+        
+        table: BuildingTable = get_building_table()
+        
+        return table.packed(field = "effect_bonuses").gather_sum(counts = self._count_buildings_by_index(table = table))
+    
+    def _calculate_worker_effects(self) -> FrozenEffectBonuses:
+        
+        table: BuildingTable = get_building_table()
+        
+        return table.packed(field = "effect_bonuses_per_worker").gather_sum(
+            counts = [(table.index[building_id], workers) for building_id, workers in self._workers_by_id.items()],
+        )
+    
+    @staticmethod
+    def _calculate_total_effects(effects: _CityEffectBonuses) -> FrozenEffectBonuses:
+        return effects.city + effects.buildings + effects.workers
+    
+    def _calculate_effects(self) -> _CityEffectBonuses:
+        
+        effects: _CityEffectBonuses = _CityEffectBonuses(
+            city = self._get_city_effects(),
+            buildings = self._calculate_building_effects(),
+            workers = self._calculate_worker_effects(),
+        )
+        
+        return replace(effects, total = self._calculate_total_effects(effects = effects))
+    
+    
+    #* Production
+    def _calculate_base_production(self) -> FrozenResourceCollection:
+        
+        base_production: ResourceCollection = ResourceCollection()
+        specs: dict[str, BuildingSpec] = get_building_specs()
+        
+        for building_id, workers in self._workers_by_id.items():
+            base_production += self._calculate_production_per_worker(spec = specs[building_id]) * workers
+        
+        return base_production.freeze()
+    
+    def _calculate_production_per_worker(self, spec: BuildingSpec) -> FrozenResourceCollection:
+        
+        productivity_per_worker: FrozenResourceCollection = spec.productivity_per_worker
+        
+        return FrozenResourceCollection(
+            food = floor(productivity_per_worker.food * self.resource_potentials.food / 100.0),
+            ore = floor(productivity_per_worker.ore * self.resource_potentials.ore / 100.0),
+            wood = floor(productivity_per_worker.wood * self.resource_potentials.wood / 100.0),
+        )
+    
+    def _calculate_productivity_bonuses(self) -> FrozenResourceCollection:
+        
+        table: BuildingTable = get_building_table()
+        
+        return table.packed(field = "productivity_bonuses").gather_sum(
+            counts = self._count_buildings_by_index(table = table),
+        )
+    
+    @staticmethod
+    def _calculate_total_production(production: _CityProduction) -> FrozenResourceCollection:
+        
+        total_food: int = floor(production.base.food * (1 + production.productivity_bonuses.food / 100))
+        total_ore: int = floor(production.base.ore * (1 + production.productivity_bonuses.ore / 100))
+        total_wood: int = floor(production.base.wood * (1 + production.productivity_bonuses.wood / 100))
+        
+        return FrozenResourceCollection(food = total_food, ore = total_ore, wood = total_wood)
+    
+    def _calculate_maintenance_costs(self) -> FrozenResourceCollection:
+        
+        table: BuildingTable = get_building_table()
+        
+        return table.packed(field = "maintenance_cost").gather_sum(
+            counts = self._count_buildings_by_index(table = table),
+        )
+    
+    @staticmethod
+    def _calculate_production_balance(production: _CityProduction) -> FrozenResourceCollection:
+        return production.total - production.maintenance_costs
+    
+    def _calculate_production(self) -> _CityProduction:
+        
+        production: _CityProduction = _CityProduction(
+            base = self._calculate_base_production(),
+            productivity_bonuses = self._calculate_productivity_bonuses(),
+            maintenance_costs = self._calculate_maintenance_costs(),
+        )
+        
+        return self._complete_production(production = production)
+    
+    @staticmethod
+    def _complete_production(production: _CityProduction) -> _CityProduction:
+        # Adds the total and the balance, which are calculated from the other parts of the production.
+        
+        production = replace(production, total = City._calculate_total_production(production = production))
+        
+        return replace(production, balance = City._calculate_production_balance(production = production))
+    
+    
+    #* Storage capacity
+    # The storage capacities of the buildings are frozen, so they are shared with the building specs instead of copied.
+    def _calculate_city_storage(self) -> FrozenResourceCollection:
+        return self.hall.storage_capacity
+    
+    def _calculate_buildings_storage(self) -> FrozenResourceCollection:
+        
+        table: BuildingTable = get_building_table()
+        
+        return table.packed(field = "storage_capacity").gather_sum(
+            counts = [
+                (table.index[building_id], count)
+                for building_id, count in self._composition.counts.items()
+                if building_id not in City.POSSIBLE_HALLS and building_id not in {"warehouse", "supply_dump"}
+            ],
+        )
+    
+    def _calculate_warehouse_storage(self) -> FrozenResourceCollection:
+        
+        if "warehouse" in self._composition.counts:
+            return get_building_spec(building_id = "warehouse").storage_capacity
+        
+        return FrozenResourceCollection()
+    
+    def _calculate_supply_dump_storage(self) -> FrozenResourceCollection:
+        
+        if self.has_supply_dump:
+            return get_building_spec(building_id = "supply_dump").storage_capacity
+        
+        return FrozenResourceCollection()
+    
+    @staticmethod
+    def _calculate_total_storage_capacity(storage: _CityStorage) -> FrozenResourceCollection:
+        return storage.city + storage.buildings + storage.warehouse + storage.supply_dump
+    
+    def _calculate_storage(self) -> _CityStorage:
+        
+        storage: _CityStorage = _CityStorage(
+            city = self._calculate_city_storage(),
+            buildings = self._calculate_buildings_storage(),
+            warehouse = self._calculate_warehouse_storage(),
+            supply_dump = self._calculate_supply_dump_storage(),
+        )
+        
+        return replace(storage, total = self._calculate_total_storage_capacity(storage = storage))
+    
+    
+    #* City defenses
+    def _get_garrison(self) -> str:
+        return self._city_data["garrison"]
+    
+    def _calculate_garrison_size(self) -> int:
+        
+        if self.is_fort:
+            return 3
+        
+        if "large_fort" in self._composition.counts:
+            return 4
+        
+        if "medium_fort" in self._composition.counts:
+            return 3
+        
+        if "small_fort" in self._composition.counts:
+            return 2
+        
+        return 1
+    
+    def _calculate_squadron_size(self) -> str:
+        
+        if self.is_fort:
+            return "Medium"
+        
+        if "quartermaster" in self._composition.counts:
+            return "Huge"
+        
+        if "barracks" in self._composition.counts:
+            return "Large"
+        
+        if any([
+            "small_fort" in self._composition.counts,
+            "medium_fort" in self._composition.counts,
+            "large_fort" in self._composition.counts,
+        ]):
+            return "Medium"
+        
+        return "Small"
+    
+    def _calculate_defenses(self) -> _CityDefenses:
+        return _CityDefenses(
+            garrison = self._get_garrison(),
+            squadrons = self._calculate_garrison_size(),
+            squadron_size = self._calculate_squadron_size(),
+        )
+    
+    
+    #* City focus
+    def _find_city_focus(self) -> Resource | None:
+        
+        highest_balance: int = max(
+            self.production.balance.food,
+            self.production.balance.ore,
+            self.production.balance.wood,
+        )
+        
+        if highest_balance < 0:
+            return None
         
         rss_with_highest_balance: list[str] = self.production.balance.find_fields_by_value(value = highest_balance)
         
@@ -965,6 +1171,126 @@ class City:
         return Resource(value = rss_with_highest_balance[0])
     
     
+    #* Changes
+    # A change only validates what it can break, and it updates the sections that have already been calculated with
+    # the contribution of the changed buildings. Every contribution is a sum of integers (or of floored values per
+    # worker), so the result is the same as calculating the sections again.
+    def _validate_building_can_be_changed(self, building_id: str) -> None:
+        
+        if building_id not in self._composition.counts:
+            raise KeyError(f"No building with ID = \"{building_id}\" found in {self.name}.")
+        
+        if building_id in City.POSSIBLE_HALLS:
+            raise NoCityHallError("The hall of a city cannot be removed or replaced.")
+        
+        if building_id == "supply_dump":
+            raise InvalidBuidlingConfigurationError("Supply dumps cannot be removed or replaced.")
+    
+    def _validate_added_building(self, building_id: str) -> None:
+        
+        if building_id in City.POSSIBLE_HALLS:
+            self._validate_halls()
+        
+        self._validate_forts_have_no_other_buildings()
+        self._validate_total_number_of_buildings()
+        
+        self._validate_building_count(
+            building_id = building_id,
+            allowed_count = self._calculate_allowed_building_counts()[building_id],
+        )
+        
+        if building_id in City.POSSIBLE_GUILDS:
+            self._validate_guilds()
+        
+        self._validate_empty_building_spots()
+    
+    def _commit_added_building(self, building_id: str) -> None:
+        # `_composition` has already been updated.
+        
+        if self._buildings is not None:
+            building: Building = Building(id = building_id)
+            self._watch_buildings(buildings = [building])
+            self._buildings.append(building)
+            if self._buildings_by_id is not None:
+                self._buildings_by_id.setdefault(building_id, []).append(building)
+        
+        self._apply_change(building_id = building_id, buildings = 1, workers = 0)
+    
+    def _commit_removed_building(self, building_id: str) -> None:
+        # `_composition` has already been updated. The last building with the ID is removed, which is the one with the
+        # fewest workers when the buildings have been staffed by the city.
+        
+        workers: int = self._workers_by_id.get(building_id, 0)
+        
+        if self._buildings is None:
+            max_workers: int = get_building_spec(building_id = building_id).max_workers
+            removed_workers: int = workers - min(workers, self._composition.counts[building_id] * max_workers)
+        else:
+            buildings_by_id: dict[str, list[Building]] = self._get_buildings_by_id()
+            building: Building = buildings_by_id[building_id].pop()
+            if not buildings_by_id[building_id]:
+                del buildings_by_id[building_id]
+            
+            for index in range(len(self._buildings) - 1, -1, -1):
+                if self._buildings[index] is building:
+                    del self._buildings[index]
+                    break
+            
+            building.on_workers_change(callback = None)
+            removed_workers = building.workers
+        
+        self._update_workers_by_id(building_id = building_id, workers = workers - removed_workers)
+        self._apply_change(building_id = building_id, buildings = -1, workers = -removed_workers)
+    
+    def _update_workers_by_id(self, building_id: str, workers: int) -> None:
+        
+        self.assigned_workers += workers - self._workers_by_id.get(building_id, 0)
+        
+        if workers > 0:
+            self._workers_by_id[building_id] = workers
+        else:
+            self._workers_by_id.pop(building_id, None)
+    
+    def _apply_change(self, building_id: str, buildings: int, workers: int) -> None:
+        # Applies the contribution of `buildings` buildings and `workers` workers with the given ID (either can be
+        # negative) to the sections that have already been calculated.
+        
+        spec: BuildingSpec = get_building_spec(building_id = building_id)
+        
+        if self._effects is not None:
+            effects: _CityEffectBonuses = replace(
+                self._effects,
+                buildings = self._effects.buildings + spec.effect_bonuses * buildings,
+                workers = self._effects.workers + spec.effect_bonuses_per_worker * workers,
+            )
+            self._effects = replace(effects, total = self._calculate_total_effects(effects = effects))
+        
+        if self._production is not None:
+            production: _CityProduction = self._production
+            self._production = self._complete_production(
+                production = replace(
+                    production,
+                    base = production.base + self._calculate_production_per_worker(spec = spec) * workers,
+                    productivity_bonuses = production.productivity_bonuses + spec.productivity_bonuses * buildings,
+                    maintenance_costs = production.maintenance_costs + spec.maintenance_cost * buildings,
+                ),
+            )
+        
+        if buildings == 0:
+            return
+        
+        if self._storage is not None:
+            storage: _CityStorage = self._storage
+            if building_id == "warehouse":
+                storage = replace(storage, warehouse = self._calculate_warehouse_storage())
+            elif building_id not in City.POSSIBLE_HALLS and building_id != "supply_dump":
+                storage = replace(storage, buildings = storage.buildings + spec.storage_capacity * buildings)
+            self._storage = replace(storage, total = self._calculate_total_storage_capacity(storage = storage))
+        
+        # The defenses depend on which buildings the city has, not on how many. They are cheap to calculate again.
+        self._defenses = None
+    
+    
     #* Alternative city creator methods
     @classmethod
     def from_buildings_count(
@@ -973,13 +1299,16 @@ class City:
             name: str,
             buildings: BuildingsCount,
             staffing_strategy: str = "production_first",
+            cached: bool = False,
         ) -> City:
         """
         Create a `City` instance from a count of buildings. The count must be a dictionary with building IDs as keys
         and the quantity of each building type as values.
         
-        This method expands the building counts into actual `Building` objects and initializes a new city with them.
-        This implies that you can pass 0-count buildings and they will automatically be ignored.
+        The city is validated and evaluated directly from the count, without creating a `Building` object per building
+        (only the hall is created). The buildings are created the first time `buildings` (or `get_building`) is used,
+        with the same workers they would have had if the city had been created from a list of unstaffed buildings. You
+        can pass 0-count buildings and they will automatically be ignored.
         
         You can not specify the number of workers for each building if you use this method for creating cities.
         
@@ -989,19 +1318,181 @@ class City:
             buildings (BuildingsCount): A dictionary mapping building IDs to quantities.
             staffing_strategy (str): The name of the staffing strategy to be used. Possible values are "none", "zero",
                 "production_first", "production_only", "effects_first", "effects_only". Defaults to "production_first".
+            cached (bool): Whether to reuse the evaluation of an identical city (see `evaluate_city`). The city skips
+                validation and staffing, and starts with the effects, production, storage and defenses already
+                calculated. Defaults to False.
         
         Returns:
             City: a new `City` instance populated with the given buildings and the given workers' distribution.
         """
         
-        return cls(
+        city: City = cls.__new__(cls)
+        city._buildings = None
+        city._buildings_by_id = None
+        city._composition = City._count_buildings(buildings = buildings)
+        
+        if not cached:
+            city._evaluate(campaign = campaign, name = name, staffing_strategy = staffing_strategy)
+            return city
+        
+        evaluation: CityEvaluation = evaluate_city(
             campaign = campaign,
             name = name,
-            buildings = [Building(id = building_id) for building_id, qty in buildings.items() for _ in range(qty)],
+            buildings = buildings,
             staffing_strategy = staffing_strategy,
         )
+        
+        city._load_city_data(campaign = campaign, name = name)
+        city.hall = city._get_hall()
+        city.staffing_strategy = staffing_strategy
+        city.available_workers = City.MAX_WORKERS[city.hall.id]
+        city.assigned_workers = evaluation.assigned_workers
+        city._workers_by_id = dict(evaluation.workers)
+        
+        # The sections are frozen, so they are shared with the evaluation. Changes to the city replace them.
+        city._effects = evaluation.effects
+        city._production = evaluation.production
+        city._storage = evaluation.storage
+        city._defenses = evaluation.defenses
+        
+        return city
+    
+    @staticmethod
+    def check(
+            campaign: str,
+            name: str,
+            buildings: BuildingsCount,
+            all_violations: bool = False,
+        ) -> CityVerdict:
+        """
+        Check a count of buildings against the rules of a city, without creating the city. The rules are the ones that
+        `from_buildings_count` validates, checked in the same order (see `City.RULES`), so the first violation is the
+        error that creating the city would raise. Nothing is raised, and a valid count allocates no verdict.
+        
+        The rules "buildings" (unknown building IDs) and "city" (unknown city) end the check, since the other rules
+        cannot be checked without them. The rules that depend on the hall are not checked when there is no hall.
+        
+        Args:
+            campaign (str): The campaign identifier the city belongs to.
+            name (str): The name of the city.
+            buildings (BuildingsCount): A dictionary mapping building IDs to quantities. Zero counts are ignored.
+            all_violations (bool): Whether to check every rule, instead of stopping at the first violation. Defaults
+                to False.
+        
+        Returns:
+            CityVerdict: The verdict. It is truthy if the count of buildings is valid for the city.
+        """
+        
+        violations: tuple[CityViolation, ...] = ()
+        specs: dict[str, BuildingSpec] = get_building_specs()
+        
+        for building_id, qty in buildings.items():
+            if qty <= 0 or building_id in specs:
+                continue
+            error: UnknownBuildingError = UnknownBuildingError(f"Building {building_id} does not exist.")
+            violations = (*violations, CityViolation(rule = "buildings", error = error))
+            if not all_violations:
+                return CityVerdict(violations = violations)
+        
+        try:
+            city: _CityData = City._get_city_data(campaign = campaign, name = name)
+        except CityNotFoundError as error:
+            return CityVerdict(violations = (*violations, CityViolation(rule = "city", error = error)))
+        
+        if violations:
+            return CityVerdict(violations = violations)
+        
+        counts: BuildingsCount = City._complete_buildings_count(buildings = buildings, city = city)
+        hall_id: str | None = City._find_hall_id(counts = counts)
+        
+        for rule in City._COUNT_RULES:
+            rule_error: CityError | None = City._check_rule(
+                rule = rule,
+                counts = counts,
+                city = city,
+                hall_id = hall_id,
+            )
+            if rule_error is None:
+                continue
+            violations = (*violations, CityViolation(rule = rule, error = rule_error))
+            if not all_violations:
+                break
+        
+        return CityVerdict(violations = violations) if violations else _VALID_CITY_VERDICT
     
     
+    @property
+    def effects(self) -> _CityEffectBonuses:
+        """The effect bonuses of the city: from the city itself, from its buildings, from its workers, and in total."""
+        
+        if self._effects is None:
+            self._effects = self._calculate_effects()
+        
+        return self._effects
+    
+    @property
+    def production(self) -> _CityProduction:
+        """The production of the city: base, productivity bonuses, total, maintenance costs and balance."""
+        
+        if self._production is None:
+            self._production = self._calculate_production()
+        
+        return self._production
+    
+    @property
+    def storage(self) -> _CityStorage:
+        """The storage capacity of the city: from the hall, buildings, warehouse and supply dump, and in total."""
+        
+        if self._storage is None:
+            self._storage = self._calculate_storage()
+        
+        return self._storage
+    
+    @property
+    def defenses(self) -> _CityDefenses:
+        """The defenses of the city: garrison, number of squadrons and squadron size."""
+        
+        if self._defenses is None:
+            self._defenses = self._calculate_defenses()
+        
+        return self._defenses
+    
+    @property
+    def focus(self) -> Resource | None:
+        """The resource with the highest production balance, or None if there is a tie or all balances are negative."""
+        return self._find_city_focus()
+    
+    def invalidate(self) -> None:
+        """
+        Recount the workers of the city's buildings and discard the calculated effects, production, storage and
+        defenses, so that they are calculated again the next time they are used.
+        
+        The city is notified when the workers of its buildings change (also when they are changed directly through
+        `buildings`), so this is only needed to force a full recalculation.
+        """
+        
+        if self._buildings is not None:
+            self.assigned_workers = self._updated_assigned_workers()
+            self._workers_by_id = self._count_workers_by_id()
+        
+        self._invalidate_sections()
+    
+    def _invalidate_sections(self) -> None:
+        self._effects = None
+        self._production = None
+        self._storage = None
+        self._defenses = None
+    
+    @property
+    def buildings(self) -> list[Building]:
+        """The buildings in the city. For cities created from a count of buildings they are created on first use."""
+        
+        if self._buildings is None:
+            self._buildings = self._create_buildings()
+            self._watch_buildings(buildings = self._buildings)
+        
+        return self._buildings
+    
     def get_building(self, building_id: str) -> Building:
         """
         Retrieve a building from the city by its ID. In case the city has more than one it will return the first one.
@@ -1016,9 +1507,10 @@ class City:
             KeyError: If no building with the given ID exists in the city.
         """
         
-        for building in self.buildings:
-            if building.id == building_id:
-                return building
+        buildings: list[Building] | None = self._get_buildings_by_id().get(building_id)
+        
+        if buildings:
+            return buildings[0]
         
         raise KeyError(f"No building with ID = \"{building_id}\" found in {self.name}.")
     
@@ -1033,11 +1525,7 @@ class City:
             bool: True if the building is present, False otherwise.
         """
         
-        for building in self.buildings:
-            if building.id == building_id:
-                return True
-        
-        return False
+        return building_id in self._composition.counts
     
     def get_buildings_count(self, by: Literal["name", "id"]) -> BuildingsCount:
         """
@@ -1058,463 +1546,772 @@ class City:
             raise ValueError("Possible values for `by` are \"name\" or \"id\".")
         
         if by == "name":
-            buildings_count: BuildingsCount = Counter([building.name for building in self.buildings])
+            specs: dict[str, BuildingSpec] = get_building_specs()
+            buildings_count: BuildingsCount = Counter()
+            for building_id, count in self._composition.counts.items():
+                buildings_count[specs[building_id].name] += count
             return buildings_count
         
         if by == "id":
-            buildings_count: BuildingsCount = Counter([building.id for building in self.buildings])
-            return buildings_count
+            return Counter(self._composition.counts)
         
         raise BuildingError("No buildings found.")
     
-    def build_city_displayer(self, configuration: DisplayConfiguration | None = None) -> _CityDisplay:
+    def get_workers_count(self) -> BuildingsCount:
         """
-        Creates a displayer for the City.
-        
-        Args:
-            configuration: An optional dictionary for customizing the display. This can be used to hide specific
-                sections or change their appearance.
+        Count the number of workers assigned to the buildings in the city grouped by ID.
         
         Returns:
-            _CityDisplay: An instance of the _CityDisplay class.
+            BuildingsCount: A dictionary mapping the IDs of the staffed buildings to their total workers.
         """
-        return _CityDisplay(city = self, configuration = configuration)
+        
+        return dict(self._workers_by_id)
     
-    def display_city(self, configuration: DisplayConfiguration | None = None) -> None:
+    def add_building(self, building_id: str) -> None:
         """
-        Renders and prints the city's statistics to the console.
+        Add a building without workers to the city.
         
-        This method acts as a facade, delegating the display logic to the `_CityDisplay` class.
+        The staffing strategy is not applied again, so the new building has no workers until `set_workers()` is used.
+        An unknown building ID raises `UnknownBuildingError`.
         
         Args:
-            configuration: An optional dictionary for customizing the display. This can be used to hide specific
-                sections or change their appearance.
+            building_id (str): The ID of the building to add.
+        
+        Raises:
+            CityError: If the city would no longer be valid (see the errors raised when creating a city). The city is
+                not changed.
         """
         
-        displayer: _CityDisplay = self.build_city_displayer(configuration = configuration)
-        displayer.display_city()
-
-
-# * ************ * #
-# * CITY DISPLAY * #
-# * ************ * #
-
-class _CityDisplay:
-    """
-    Handles the rendering and display of a `City` object in a structured, styled terminal layout using the Rich library.
-    
-    Each `_CityDisplay` instance takes a `City` object and an optional `DisplayConfiguration` that allows
-    customizing which sections are shown, their heights, and colors.
-    
-    Sections displayed:
+        get_building_spec(building_id = building_id)
         
-        - City information (campaign and name)
-        - Buildings list
-        - Effect bonuses (city, buildings, workers, total)
-        - Production (resource potentials, base production, bonuses, total, maintenance, balance)
-        - Storage capacity (city, buildings, warehouse, supply dump, total)
-        - Defenses (garrison, number of squadrons, squadron size)
-    
-    Public API:
-        build_city_display() -> Panel
-            Constructs a Rich Panel representing the city display layout.
-        display_city() -> None
-            Prints the city display to the console.
-    """
-    
-    def __init__(
-            self,
-            city: City,
-            configuration: DisplayConfiguration | None = None,
-        ) -> None:
+        self._composition.add_count(building_id = building_id, qty = 1)
+        try:
+            self._validate_added_building(building_id = building_id)
+        except CityError:
+            self._composition.remove_count(building_id = building_id, qty = 1)
+            raise
         
-        self.city: City = city
-        self._user_configuration: DisplayConfiguration = configuration or {}
-        self.configuration: DisplayConfiguration = self._build_configuration()
+        self._commit_added_building(building_id = building_id)
     
-    #* Display configuration
-    def _build_default_configuration(self) -> DisplayConfiguration:
+    def remove_building(self, building_id: str) -> None:
+        """
+        Remove a building from the city. If the city has more than one it will remove the last one.
         
-        sections: list[str] = [
-            "city",
-            "buildings",
-            "effects",
-            "production",
-            "storage",
-            "defenses",
-        ]
+        Removing a building that is not in the city raises `KeyError`. The hall (`NoCityHallError`) and the supply dump
+        (`InvalidBuidlingConfigurationError`) cannot be removed.
         
-        default_configuration: DisplayConfiguration = {}
-        for section in sections:
-            default_configuration[section] = {
-                "include": True,
-                "height": self._calculate_default_section_height(section = section),
-                "color": DEFAULT_SECTION_COLORS.get(section, "white"),
-            }
+        Args:
+            building_id (str): The ID of the building to remove.
+        """
+        
+        self._validate_building_can_be_changed(building_id = building_id)
         
-        return default_configuration
+        self._composition.remove_count(building_id = building_id, qty = 1)
+        self._commit_removed_building(building_id = building_id)
     
-    def _calculate_default_section_height(self, section: str) -> int:
+    def replace_building(self, building_id: str, new_building_id: str) -> None:
+        """
+        Replace a building in the city with a new building without workers. If the city has more than one building
+        with the given ID it will replace the last one.
         
-        match section:
-            case "city":
-                return 2
-            case "buildings":
-                return len(self.city.get_buildings_count(by = "id")) + 2
-            case "effects":
-                return 8
-            case "production":
-                return 8
-            case "storage":
-                return 8
-            case "defenses":
-                return 6
+        The replaced building must be one that `remove_building()` can remove, and it raises the same errors if it is
+        not. An unknown new building ID raises `UnknownBuildingError`.
         
-        return 0
-    
-    def _build_configuration(self) -> DisplayConfiguration:
+        Args:
+            building_id (str): The ID of the building to replace.
+            new_building_id (str): The ID of the building to add in its place.
+        
+        Raises:
+            CityError: If the city would no longer be valid (see the errors raised when creating a city). The city is
+                not changed.
+        """
         
-        display_configuration: DisplayConfiguration = self._build_default_configuration()
+        self._validate_building_can_be_changed(building_id = building_id)
+        get_building_spec(building_id = new_building_id)
         
-        for section in display_configuration:
-            section_config: DisplaySectionConfiguration = display_configuration[section]
-            if section in self._user_configuration:
-                display_configuration[section] = {**section_config, **self._user_configuration[section]}
+        self._composition.remove_count(building_id = building_id, qty = 1)
+        self._composition.add_count(building_id = new_building_id, qty = 1)
+        try:
+            self._validate_added_building(building_id = new_building_id)
+        except CityError:
+            self._composition.remove_count(building_id = new_building_id, qty = 1)
+            self._composition.add_count(building_id = building_id, qty = 1)
+            raise
         
-        return display_configuration
-    
+        self._commit_removed_building(building_id = building_id)
+        self._commit_added_building(building_id = new_building_id)
     
-    #* Display results
-    def _build_city_information(self) -> Text:
+    def set_workers(self, building_id: str, qty: int) -> None:
+        """
+        Set the total number of workers of the buildings with the given ID.
         
-        fort: str = f" (Fort)" if self.city.is_fort else ""
+        The workers are assigned to the buildings in the order they are in the city, filling each building before
+        moving to the next one.
         
-        city_information: Text = Text(
-            text = f" {self.city.campaign} --- {self.city.name}{fort} ",
-            style = "bold black on white",
-            justify = "center",
-        )
+        Args:
+            building_id (str): The ID of the buildings.
+            qty (int): The number of workers to assign to them.
         
-        return city_information
-    
-    def _build_city_buildings_list(self) -> Table:
+        Raises:
+            KeyError: If no building with the given ID exists in the city.
+            NegativeNumberOfWorkersError: If `qty` is negative.
+            TooManyWorkersError: If `qty` exceeds the maximum workers of the buildings, or the city does not have
+                enough available workers.
+        """
         
-        city_buildings_text: Text = Text()
+        if building_id not in self._composition.counts:
+            raise KeyError(f"No building with ID = \"{building_id}\" found in {self.name}.")
         
-        for building, qty in self.city.get_buildings_count(by = "name").items():
-            city_buildings_text.append(text = f"  - {building} ({qty})\n")
+        if qty < 0:
+            raise NegativeNumberOfWorkersError("Cannot set a negative number of workers.")
         
-        city_buildings_table: Table = Table(title = "Buildings", show_header = False, box = None, padding = (0, 1))
-        city_buildings_table.add_column()
-        city_buildings_table.add_row()
-        city_buildings_table.add_row(city_buildings_text)
+        spec: BuildingSpec = get_building_spec(building_id = building_id)
+        max_workers: int = self._composition.counts[building_id] * spec.max_workers
         
-        return city_buildings_table
-    
-    def _build_city_effects_table(self) -> Table:
+        if qty > max_workers:
+            raise TooManyWorkersError(f"Too many workers. Max is {max_workers} for {spec.name} in {self.name}.")
         
-        table_style: Style = Style(color = self.configuration.get("effects", {}).get("color", "#5f5fff"))
+        workers: int = self._workers_by_id.get(building_id, 0)
         
-        table: Table = Table(
-            title = Text(text = "Effects", style = table_style + Style(italic = True)),
-            style = table_style,
-            box = box.HEAVY,
-        )
+        if self.assigned_workers - workers + qty > self.available_workers:
+            raise TooManyWorkersError(
+                f"Not enough workers. {self.name} has {self.available_workers - self.assigned_workers + workers} "
+                f"available for {spec.name}.",
+            )
         
-        table.add_column(header = "Effect", header_style = "bold", justify = "center")
-        table.add_column(header = "City", header_style = "bold", justify = "right")
-        table.add_column(header = "Buildings", header_style = "bold", justify = "right")
-        table.add_column(header = "Workers", header_style = "bold", justify = "right")
-        table.add_column(header = "Total", header_style = "bold", justify = "right")
-        
-        table.add_row(
-            "Troop training",
-            f"{self.city.effects.city.troop_training}",
-            f"{self.city.effects.buildings.troop_training}",
-            f"{self.city.effects.workers.troop_training}",
-            Text(text = f"{self.city.effects.total.troop_training}", style = table_style + Style(bold = True)),
-        )
-        table.add_row(
-            "Pop. growth",
-            f"{self.city.effects.city.population_growth}",
-            f"{self.city.effects.buildings.population_growth}",
-            f"{self.city.effects.workers.population_growth}",
-            Text(text = f"{self.city.effects.total.population_growth}", style = table_style + Style(bold = True)),
-        )
-        table.add_row(
-            "Intelligence",
-            f"{self.city.effects.city.intelligence}",
-            f"{self.city.effects.buildings.intelligence}",
-            f"{self.city.effects.workers.intelligence}",
-            Text(text = f"{self.city.effects.total.intelligence}", style = table_style + Style(bold = True)),
-        )
+        if self._buildings is None:
+            self._update_workers_by_id(building_id = building_id, workers = qty)
+            self._apply_change(building_id = building_id, buildings = 0, workers = qty - workers)
+            return
         
-        return table
+        # Each building reports the change of its workers to the city (see `_change_building_workers`).
+        unassigned_workers: int = qty
+        for building in self._get_buildings_by_id()[building_id]:
+            building.set_workers(qty = min(building.max_workers, unassigned_workers))
+            unassigned_workers -= building.workers
     
-    def _build_city_production_table(self) -> Table:
+    def build_city_displayer(self, configuration: DisplayConfiguration | None = None) -> _CityDisplay:
+        """
+        Creates a displayer for the City.
         
-        table_style: Style = Style(color = self.configuration.get("production", {}).get("color", "#228b22"))
+        Args:
+            configuration: An optional dictionary for customizing the display. This can be used to hide specific
+                sections or change their appearance.
         
-        table: Table = Table(
-            title = Text(text = "Production", style = table_style + Style(italic = True)),
-            style = table_style,
-            box = box.HEAVY,
-        )
+        Returns:
+            _CityDisplay: An instance of the _CityDisplay class.
+        """
         
-        table.add_column(header = "Resource", header_style = "bold", justify = "left")
-        table.add_column(header = "Rss. pot.", header_style = "bold", justify = "right")
-        table.add_column(header = "Base prod.", header_style = "bold", justify = "right")
-        table.add_column(header = "Prod. bonus", header_style = "bold", justify = "right")
-        table.add_column(header = "Total prod", header_style = "bold", justify = "right")
-        table.add_column(header = "Maintenance", header_style = "bold", justify = "right")
-        table.add_column(header = "Balance", header_style = "bold", justify = "right")
-        
-        table.add_row(
-            f"Food",
-            f"{self.city.resource_potentials.food}",
-            f"{self.city.production.base.food}",
-            f"{self.city.production.productivity_bonuses.food}",
-            f"{self.city.production.total.food}",
-            f"{-1 * self.city.production.maintenance_costs.food}",
-            Text(text = f"{self.city.production.balance.food}", style = table_style + Style(bold = True)),
-        )
-        table.add_row(
-            f"Ore",
-            f"{self.city.resource_potentials.ore}",
-            f"{self.city.production.base.ore}",
-            f"{self.city.production.productivity_bonuses.ore}",
-            f"{self.city.production.total.ore}",
-            f"{-1 * self.city.production.maintenance_costs.ore}",
-            Text(text = f"{self.city.production.balance.ore}", style = table_style + Style(bold = True)),
-        )
-        table.add_row(
-            f"Wood",
-            f"{self.city.resource_potentials.wood}",
-            f"{self.city.production.base.wood}",
-            f"{self.city.production.productivity_bonuses.wood}",
-            f"{self.city.production.total.wood}",
-            f"{-1 * self.city.production.maintenance_costs.wood}",
-            Text(text = f"{self.city.production.balance.wood}", style = table_style + Style(bold = True)),
-        )
+        # Rendering is imported lazily so that the calculation API can be used without loading Rich.
+        from .rendering import _CityDisplay  # noqa: PLC0415
         
-        return table
+        return _CityDisplay(city = self, configuration = configuration)
     
-    def _build_city_storage_table(self) -> Table:
-        
-        table_style: Style = Style(color = self.configuration.get("storage", {}).get("color", "purple"))
+    def display_city(self, configuration: DisplayConfiguration | None = None) -> None:
+        """
+        Renders and prints the city's statistics to the console.
         
-        table: Table = Table(
-            title = Text(text = "Storage capacity", style = table_style + Style(italic = True)),
-            style = table_style,
-            box = box.HEAVY,
-        )
+        This method acts as a facade, delegating the display logic to the `_CityDisplay` class.
         
-        table.add_column(header = "Resource", header_style = "bold", justify = "left")
-        table.add_column(header = "City", header_style = "bold", justify = "right")
-        table.add_column(header = "Buildings", header_style = "bold", justify = "right")
-        table.add_column(header = "Warehouse", header_style = "bold", justify = "right")
-        table.add_column(header = "Supply dump", header_style = "bold", justify = "right")
-        table.add_column(header = "Total", header_style = "bold", justify = "right")
-        
-        table.add_row(
-            "Food",
-            f"{self.city.storage.city.food}",
-            f"{self.city.storage.buildings.food}",
-            f"{self.city.storage.warehouse.food}",
-            f"{self.city.storage.supply_dump.food}",
-            Text(text = f"{self.city.storage.total.food}", style = table_style + Style(bold = True)),
-        )
-        table.add_row(
-            "Ore",
-            f"{self.city.storage.city.ore}",
-            f"{self.city.storage.buildings.ore}",
-            f"{self.city.storage.warehouse.ore}",
-            f"{self.city.storage.supply_dump.ore}",
-            Text(text = f"{self.city.storage.total.ore}", style = table_style + Style(bold = True)),
-        )
-        table.add_row(
-            "Wood",
-            f"{self.city.storage.city.wood}",
-            f"{self.city.storage.buildings.wood}",
-            f"{self.city.storage.warehouse.wood}",
-            f"{self.city.storage.supply_dump.wood}",
-            Text(text = f"{self.city.storage.total.wood}", style = table_style + Style(bold = True)),
-        )
+        Args:
+            configuration: An optional dictionary for customizing the display. This can be used to hide specific
+                sections or change their appearance.
+        """
         
-        return table
+        displayer: _CityDisplay = self.build_city_displayer(configuration = configuration)
+        displayer.display_city()
+
+
+# * ***************** * #
+# * ALLOWED BUILDINGS * #
+# * ***************** * #
+
+_BASIC_PRODUCTION_BUILDINGS: frozenset[str] = frozenset({
+    "farm",
+    "large_farm",
+    "mine",
+    "large_mine",
+    "lumber_mill",
+    "large_lumber_mill",
+})
+
+_BUILDINGS_THAT_REQUIRE_TOWN_HALL: frozenset[str] = frozenset({
+    "city_hall",
+    "bath_house",
+    "hospital",
+    "vineyard",
+    "training_ground",
+    "bordello",
+    "gladiator_school",
+    "medium_fort",
+    "barracks",
+    "temple",
+})
+
+_BUILDINGS_THAT_REQUIRE_CITY_HALL: frozenset[str] = frozenset({
+    "large_fort",
+    "quartermaster",
+    "basilica",
+    "imperial_residence",
+    "farmers_guild",
+    "carpenters_guild",
+    "miners_guild",
+})
+
+
+def _calculate_allowed_building_counts(city: _CityData, hall_id: str, building_ids: Iterable[str]) -> BuildingsCount:
+    # The rules that limit how many buildings of each type a city can have. See `get_allowed_buildings`.
+    
+    resource_potentials: ResourceCollectionData = city["resource_potentials"]
+    geo_features: GeoFeaturesData = city["geo_features"]
+    
+    if city["is_fort"]:
+        allowed_counts: BuildingsCount = dict.fromkeys(building_ids, 0)
+        allowed_counts["fort"] = 1
+        return allowed_counts
+    
+    allowed_counts: BuildingsCount = dict.fromkeys(building_ids, 1)
+    
+    total_spots: int = City.MAX_BUILDINGS[hall_id]
     
-    def _build_defenses_table(self) -> Table:
+    pre_occupied_spots: int = geo_features["lakes"] \
+        + geo_features["rock_outcrops"] \
+        + geo_features["mountains"]
+    
+    if city["has_supply_dump"]:
+        pre_occupied_spots += 1
+    
+    for building_id in allowed_counts:
         
-        table_style: Style = Style(color = self.configuration.get("defenses", {}).get("color", "red"))
-        table: Table = Table(
-            title = Text(text = "Defenses", style = table_style + Style(italic = True)),
-            style = table_style,
-            box = box.HEAVY,
-        )
+        # Cities that are not forts, cannot build the fort, they have it from the start.
+        if building_id == "fort":
+            allowed_counts[building_id] = 0
+            continue
         
-        table.add_column(header = "Garrison", header_style = "bold", justify = "center")
-        table.add_column(header = "Squadrons", header_style = "bold", justify = "center")
-        table.add_column(header = "Squadron size", header_style = "bold", justify = "center")
+        # Hunters' lodges are special buildings. They require all rss to be present in the city, but can only
+        # be built in cities with town and village halls. Once the city hall is built, the city loses the availity
+        # to build hunters' lodges.
+        if building_id == "hunters_lodge":
+            
+            if not (
+                resource_potentials["food"] > 0
+                and resource_potentials["ore"] > 0
+                and resource_potentials["wood"] > 0
+            ):
+                allowed_counts[building_id] = 0
+                continue
+            
+            if hall_id == "city_hall":
+                allowed_counts[building_id] = City.MAX_BUILDINGS["town_hall"] - pre_occupied_spots
+                continue
+            
+            allowed_counts[building_id] = total_spots - pre_occupied_spots
         
-        table.add_row(
-            f"{self.city.defenses.garrison}",
-            f"{self.city.defenses.squadrons}",
-            f"{self.city.defenses.squadron_size}",
-        )
+        # Supply dumps are available in only three cities. There's only one per city and they are either there from
+        # the start or they are not. They cannot be deleted.
+        if building_id == "supply_dump":
+            if not city["has_supply_dump"]:
+                allowed_counts[building_id] = 0
         
-        return table
-    
-    def build_city_display(self) -> Panel:
-        """
-        Constructs a Rich Panel representing the city display layout.
+        # We start by assuming that basic production buildings can build as many as there are building slots
+        # available in that city. This is determined by the hall minus the pre_occupied_spots.
+        if building_id in _BASIC_PRODUCTION_BUILDINGS:
+            allowed_counts[building_id] = total_spots - pre_occupied_spots
         
-        This method assembles the various display components (tables, lists, etc.) into a single Rich Panel object,
-        which can then be rendered.
+        # Adjustments for geo features
+        if building_id == "fishing_village":
+            allowed_counts[building_id] = geo_features["lakes"]
         
-        Returns:
-            Panel: A `rich.panel.Panel` object ready for printing.
-        """
-        # Expected Layout
-        # |---------------------------|
-        # |      Campaign - City      |
-        # |- - - - - - - - - - - - - -|
-        # | List  |   Effects table   |
-        # | of                        |
-        # | build |                   |
-        # | ings                      |
-        # |- - - - - - - - - - - - - -|
-        # |     Production table      |
-        # |- - - - - - - - - - - - - -|
-        # |  Storage capacity table   |
-        # |- - - - - - - - - - - - - -|
-        # |      Defenses table       |
-        # |---------------------------|
-        
-        #* Include booleans
-        include_city: bool = self.configuration.get("city", {}).get("include", True)
-        include_buildings: bool = self.configuration.get("buildings", {}).get("include", True)
-        include_effects: bool = self.configuration.get("effects", {}).get("include", True)
-        include_production: bool = self.configuration.get("production", {}).get("include", True)
-        include_storage: bool = self.configuration.get("storage", {}).get("include", True)
-        include_defenses: bool = self.configuration.get("defenses", {}).get("include", True)
-        
-        #* Heights
-        city_height: int = self.configuration.get("city", {}).get("height", 0) if include_city else 0
-        buildings_height: int = self.configuration.get("buildings", {}).get("height", 0) if include_buildings else 0
-        effects_height: int = self.configuration.get("effects", {}).get("height", 0) if include_effects else 0
-        production_height: int = self.configuration.get("production", {}).get("height", 0) if include_production else 0
-        storage_height: int = self.configuration.get("storage", {}).get("height", 0) if include_storage else 0
-        defenses_height: int = self.configuration.get("defenses", {}).get("height", 0) if include_defenses else 0
-        
-        buildings_and_effects_height: int = max(buildings_height, effects_height)
-        main_height: int = buildings_and_effects_height + production_height + storage_height + defenses_height
-        
-        total_layout_height: int = city_height + main_height + 2
-        total_layout_width: int = 92
-        
-        #* Layout
-        layout: Layout = Layout()
-        
-        layout.split(
-            Layout(
-                name = "header",
-                size = city_height,
-                ratio = 0,
-                visible = include_city,
-            ),
-            Layout(
-                name = "main",
-                size = main_height,
-                ratio = 0,
-                visible = any([
-                    include_buildings,
-                    include_effects,
-                    include_production,
-                    include_storage,
-                    include_defenses,
-                ]),
-            ),
-        )
+        if building_id == "outcrop_mine":
+            allowed_counts[building_id] = geo_features["rock_outcrops"]
         
-        layout["header"].update(
-            renderable = Align(renderable = self._build_city_information(), align = "center"),
-        )
+        if building_id == "mountain_mine":
+            allowed_counts[building_id] = geo_features["mountains"]
         
-        layout["main"].split(
-            Layout(
-                name = "buildings_and_effects",
-                size = buildings_and_effects_height,
-                ratio = 0,
-                visible = any([include_buildings, include_effects]),
-            ),
-            Layout(
-                name = "production",
-                size = production_height,
-                ratio = 0,
-                visible = include_production,
-            ),
-            Layout(
-                name = "storage_capacity",
-                size = storage_height,
-                ratio = 0,
-                visible = include_storage,
-            ),
-            Layout(
-                name = "defenses",
-                size = defenses_height,
-                ratio = 0,
-                visible = include_defenses,
-            ),
-        )
+        if building_id in {"forest", "hidden_grove"}:
+            allowed_counts[building_id] = geo_features["forests"]
         
-        layout["buildings_and_effects"].split_row(
-            Layout(name = "buildings", ratio = 1),
-            Layout(name = "effects", ratio = 2),
-        )
+        # Adjustments for resource production potentials
+        if building_id in {"farm", "large_farm", "vineyard", "fishing_village", "farmers_guild", "stables"}:
+            if resource_potentials["food"] == 0:
+                allowed_counts[building_id] = 0
         
-        if include_buildings:
-            layout["buildings"].update(
-                renderable = Align(renderable = self._build_city_buildings_list(), align = "center"),
-            )
-        else:
-            layout["buildings"].update(
-                renderable = Align(renderable = "", align = "center"),
-            )
+        if building_id in {"mine", "large_mine", "outcrop_mine", "mountain_mine", "miners_guild", "blacksmith"}:
+            if resource_potentials["ore"] == 0:
+                allowed_counts[building_id] = 0
         
-        if include_effects:
-            layout["effects"].update(
-                renderable = Align(renderable = self._build_city_effects_table(), align = "center"),
-            )
-        else:
-            layout["effects"].update(
-                renderable = Align(renderable = "", align = "center"),
-            )
+        if building_id in {"lumber_mill", "large_lumber_mill", "carpenters_guild", "fletcher"}:
+            if resource_potentials["wood"] == 0:
+                allowed_counts[building_id] = 0
         
-        layout["production"].update(
-            renderable = Align(renderable = self._build_city_production_table(), align = "center"),
-        )
+        # Adjustments for hall level
+        if (
+            building_id in _BUILDINGS_THAT_REQUIRE_TOWN_HALL
+            or building_id in _BUILDINGS_THAT_REQUIRE_CITY_HALL
+        ):
+            if hall_id in {"fort", "village_hall"}:
+                allowed_counts[building_id] = 0
         
-        layout["storage_capacity"].update(
-            renderable = Align(renderable = self._build_city_storage_table(), align = "center"),
+        if building_id in _BUILDINGS_THAT_REQUIRE_CITY_HALL:
+            if hall_id in {"fort", "village_hall", "town_hall"}:
+                allowed_counts[building_id] = 0
+    
+    return allowed_counts
+
+
+@dataclass(frozen = True, slots = True)
+class AllowedBuildings:
+    """
+    What a city with a given hall can build. It only depends on the data of the city and on its hall, so it is
+    calculated once per city and hall (see `get_allowed_buildings`). It is shared and must not be modified.
+    
+    Attributes:
+        counts (BuildingsCount): The maximum number of buildings of each type, by building ID.
+        vector (array[int]): The same maximum counts, by building index (see `modules.tables.BuildingTable`).
+        empty_spots (int): The number of building spots that are not taken by geographic features or by the supply
+            dump. All the buildings without a required geographic feature are built in them.
+        geo_spots (int): The number of building spots taken by geographic features (lakes, rock outcrops and
+            mountains).
+        empty_spot_buildings (frozenset[str]): IDs of the buildings that take an empty spot: buildable, without a
+            required geographic feature, and other than the hall.
+    """
+    
+    counts: BuildingsCount
+    vector: array[int]
+    empty_spots: int
+    geo_spots: int
+    empty_spot_buildings: frozenset[str]
+
+
+def _find_buildings_taking_empty_spots(catalog: Catalog) -> frozenset[str]:
+    
+    return frozenset(
+        building_id
+        for building_id, building in catalog.buildings.items()
+        if building["is_buildable"] and building["required_geo"] is None
+    )
+
+
+def _calculate_allowed_buildings(catalog: Catalog, city: _CityData, hall_id: str) -> AllowedBuildings:
+    
+    geo_spots: int = (
+        city["geo_features"]["lakes"]
+        + city["geo_features"]["rock_outcrops"]
+        + city["geo_features"]["mountains"]
+    )
+    supply_dump_spot: int = 1 if city["has_supply_dump"] else 0
+    counts: BuildingsCount = _calculate_allowed_building_counts(
+        city = city,
+        hall_id = hall_id,
+        building_ids = catalog.buildings,
+    )
+    taking_empty_spots: frozenset[str] = catalog.get_derived(
+        name = "buildings_taking_empty_spots",
+        factory = _find_buildings_taking_empty_spots,
+    )
+    
+    return AllowedBuildings(
+        counts = counts,
+        vector = array("q", counts.values()),
+        empty_spots = City.MAX_BUILDINGS[hall_id] - supply_dump_spot - geo_spots,
+        geo_spots = geo_spots,
+        empty_spot_buildings = taking_empty_spots - {hall_id},
+    )
+
+
+def get_allowed_buildings(campaign: str, name: str, hall_id: str) -> AllowedBuildings:
+    """
+    Get what a city can build with a given hall. It is calculated the first time a city and hall are requested, from
+    the data of that city only, and kept until the catalog data is reloaded. Later requests are a dictionary lookup.
+    
+    Args:
+        campaign (str): The campaign of the city.
+        name (str): The name of the city.
+        hall_id (str): The ID of the hall ("fort", "village_hall", "town_hall" or "city_hall").
+    
+    Returns:
+        AllowedBuildings: What the city can build. It is shared and must not be modified.
+    
+    Raises:
+        CityNotFoundError: If there is no city with the given campaign and name, or the hall ID is not a hall.
+    """
+    
+    table: dict[tuple[str, str, str], AllowedBuildings] = CATALOG.get_derived(
+        name = "allowed_buildings",
+        factory = lambda _catalog: {},
+    )
+    allowed_buildings: AllowedBuildings | None = table.get((campaign, name, hall_id))
+    
+    if allowed_buildings is not None:
+        return allowed_buildings
+    
+    city: _CityData | None = CATALOG.find_city(campaign = campaign, name = name)
+    
+    if city is None or hall_id not in City.POSSIBLE_HALLS:
+        raise CityNotFoundError(
+            f"No city found for campaing = \"{campaign}\", name = \"{name}\" and hall = \"{hall_id}\"",
         )
+    
+    # If another thread calculated it in the meantime, keep the first one so all callers share it.
+    return table.setdefault(
+        (campaign, name, hall_id),
+        _calculate_allowed_buildings(catalog = CATALOG, city = city, hall_id = hall_id),
+    )
+
+
+# * ************* * #
+# * CITY VERDICTS * #
+# * ************* * #
+
+@dataclass(frozen = True, slots = True)
+class CityViolation:
+    """
+    A rule broken by a count of buildings (see `City.check`).
+    
+    Attributes:
+        rule (str): The name of the rule (see `City.RULES`).
+        error (LegionError): The error that creating a city from the count of buildings would raise. It is not raised.
+    """
+    
+    rule: str
+    error: LegionError
+
+
+@dataclass(frozen = True, slots = True)
+class CityVerdict:
+    """
+    Result of checking a count of buildings against the rules of a city (see `City.check`). It is truthy if the count
+    is valid.
+    
+    Attributes:
+        violations (tuple[CityViolation, ...]): The broken rules, in the order they were checked. Empty if the count is
+            valid.
+    """
+    
+    violations: tuple[CityViolation, ...] = ()
+    
+    def __bool__(self) -> bool:
+        return not self.violations
+    
+    @property
+    def is_valid(self) -> bool:
+        """Whether the count of buildings breaks no rule."""
         
-        layout["defenses"].update(
-            renderable = Align(renderable = self._build_defenses_table(), align = "center"),
-        )
+        return not self.violations
+    
+    @property
+    def rules(self) -> tuple[str, ...]:
+        """The names of the broken rules, in the order they were checked."""
         
-        return Panel(
-            renderable = layout,
-            width = total_layout_width,
-            height = total_layout_height,
-        )
+        return tuple(violation.rule for violation in self.violations)
     
-    def display_city(self) -> None:
+    def raise_first_violation(self) -> None:
         """
-        Prints the city display to the console.
-        
-        This method uses the `build_city_display` method to create the panel and then prints it to the terminal via a
-        `rich.console.Console` instance.
+        Raise the error of the first broken rule (a `LegionError`), like creating the city would. Does nothing if the
+        count is valid.
         """
         
-        console: Console = Console()
-        console.print(self.build_city_display())
+        if self.violations:
+            raise self.violations[0].error
+
+
+# The verdict of every valid count of buildings, so that checking one does not create a verdict.
+_VALID_CITY_VERDICT: CityVerdict = CityVerdict()
+
+
+# * ******************* * #
+# * CITY CONFIGURATIONS * #
+# * ******************* * #
+
+def iter_city_configurations(campaign: str, name: str, hall_id: str) -> Iterator[BuildingsCount]:
+    """
+    Iterate over every valid count of buildings of a city with a given hall.
+    
+    Every count is valid for `City.check` and `City.from_buildings_count`, and is yielded once, as a new dictionary
+    without zero counts that includes the hall (and the supply dump, if the city has one). The counts are generated
+    lazily and only one of them is kept at a time, so memory use does not depend on how many there are.
+    
+    The counts are built by adding building types in a fixed order, so the same count is never reached twice. A type is
+    only added up to its allowed count (see `get_allowed_buildings`), the building spots left and, if it takes an empty
+    spot, the empty spots left. Only one guild is added. Branches that break a rule are therefore never explored.
+    
+    An unknown city or hall raises `CityNotFoundError` when the function is called, not when the result is iterated.
+    A hall the city cannot have (for example, any hall but "fort" in a fort) yields no counts.
+    
+    Args:
+        campaign (str): The campaign of the city.
+        name (str): The name of the city.
+        hall_id (str): The ID of the hall ("fort", "village_hall", "town_hall" or "city_hall").
+    
+    Returns:
+        Iterator[BuildingsCount]: The valid counts of buildings, starting with the one with only the hall.
+    """
+    
+    space: _CityConfigurationSpace | None = _get_city_configuration_space(
+        campaign = campaign,
+        name = name,
+        hall_id = hall_id,
+    )
+    
+    if space is None:
+        return iter(())
+    
+    return _extend_city_configuration(
+        base = space.base,
+        choices = space.choices,
+        chosen = [],
+        start = 0,
+        building_spots = space.building_spots,
+        empty_spots = space.empty_spots,
+        has_guild = False,
+    )
+
+
+class _CityConfigurationChoice(NamedTuple):
+    """A building type that can be added to the base of a `_CityConfigurationSpace`."""
+    
+    building_id: str
+    allowed_count: int
+    takes_empty_spot: bool
+    is_guild: bool
+
+
+@dataclass(frozen = True, slots = True)
+class _CityConfigurationSpace:
+    """
+    The valid counts of buildings of a city with a given hall. They are `base` plus some buildings of the types in
+    `choices`: each type up to its allowed count, at most `building_spots` buildings, at most `empty_spots` of them in
+    empty spots, and at most one guild. Only the order of `choices` is free: every other rule is already in the limits.
+    """
+    
+    base: BuildingsCount
+    choices: tuple[_CityConfigurationChoice, ...]
+    building_spots: int
+    empty_spots: int
+
+
+def _get_city_configuration_space(campaign: str, name: str, hall_id: str) -> _CityConfigurationSpace | None:
+    # Returns None if the city cannot have the hall.
+    
+    allowed_buildings: AllowedBuildings = get_allowed_buildings(campaign = campaign, name = name, hall_id = hall_id)
+    
+    # Only the cities with a supply dump are allowed one, and they always have it.
+    base: BuildingsCount = {hall_id: 1}
+    if allowed_buildings.counts.get("supply_dump", 0) > 0:
+        base["supply_dump"] = 1
+    
+    if not City.check(campaign = campaign, name = name, buildings = base):
+        return None
+    
+    return _CityConfigurationSpace(
+        base = base,
+        choices = tuple(
+            _CityConfigurationChoice(
+                building_id = building_id,
+                allowed_count = allowed_count,
+                takes_empty_spot = building_id in allowed_buildings.empty_spot_buildings,
+                is_guild = building_id in City.POSSIBLE_GUILDS,
+            )
+            for building_id, allowed_count in allowed_buildings.counts.items()
+            if allowed_count > 0 and building_id not in base and building_id not in City.POSSIBLE_HALLS
+        ),
+        building_spots = City.MAX_BUILDINGS[hall_id] + 1 - sum(base.values()),
+        empty_spots = allowed_buildings.empty_spots,
+    )
+
+
+def _extend_city_configuration(
+        base: BuildingsCount,
+        choices: tuple[_CityConfigurationChoice, ...],
+        chosen: list[tuple[str, int]],
+        start: int,
+        building_spots: int,
+        empty_spots: int,
+        has_guild: bool,
+    ) -> Iterator[BuildingsCount]:
+    # Yields the current count, and then every count that adds some buildings of a type from `choices[start:]` (and
+    # maybe of later types). The recursion is at most one level deep per building spot.
+    
+    counts: BuildingsCount = dict(base)
+    counts.update(chosen)
+    yield counts
+    
+    if building_spots <= 0:
+        return
+    
+    for index in range(start, len(choices)):
+        
+        building_id, allowed_count, takes_empty_spot, is_guild = choices[index]
+        
+        if is_guild and has_guild:
+            continue
+        
+        max_qty: int = min(allowed_count, building_spots)
+        if takes_empty_spot:
+            max_qty = min(max_qty, empty_spots)
+        if is_guild:
+            max_qty = min(max_qty, 1)
+        
+        for qty in range(1, max_qty + 1):
+            chosen.append((building_id, qty))
+            yield from _extend_city_configuration(
+                base = base,
+                choices = choices,
+                chosen = chosen,
+                start = index + 1,
+                building_spots = building_spots - qty,
+                empty_spots = empty_spots - qty if takes_empty_spot else empty_spots,
+                has_guild = has_guild or is_guild,
+            )
+            chosen.pop()
+
+
+# * *************** * #
+# * CITY EVALUATION * #
+# * *************** * #
+
+# Maximum number of evaluations kept by `evaluate_city`. The least recently used ones are discarded first.
+CITY_EVALUATION_CACHE_SIZE: int = 4096
+
+
+@dataclass(frozen = True, slots = True)
+class CityEvaluation:
+    """
+    Immutable result of evaluating a city created from a count of buildings (see `evaluate_city`).
+    
+    Attributes:
+        campaign (str): The campaign of the city.
+        name (str): The name of the city.
+        buildings (tuple[tuple[str, int], ...]): The canonical count of buildings that was evaluated: (ID, count) pairs
+            in staffing order, without zero counts (see `evaluate_city`).
+        staffing_strategy (str): The staffing strategy used.
+        workers (tuple[tuple[str, int], ...]): (ID, workers) pairs sorted by ID, for the staffed buildings.
+        assigned_workers (int): The total number of workers assigned to buildings.
+        effects (_CityEffectBonuses): The effect bonuses of the city.
+        production (_CityProduction): The production of the city.
+        storage (_CityStorage): The storage capacity of the city.
+        defenses (_CityDefenses): The defenses of the city.
+        focus (Resource | None): The focus of the city.
+    """
+    
+    campaign: str
+    name: str
+    buildings: tuple[tuple[str, int], ...]
+    staffing_strategy: str
+    workers: tuple[tuple[str, int], ...]
+    assigned_workers: int
+    effects: _CityEffectBonuses
+    production: _CityProduction
+    storage: _CityStorage
+    defenses: _CityDefenses
+    focus: Resource | None
+
+
+def _get_staffing_rank(building_id: str, staffing_strategy: str) -> int | None:
+    # The rank of a building in the staffing order of a city created from a count of buildings, or None if the strategy
+    # does not staff it. Strategies without ranks ("none" and "zero") staff no building of those cities.
+    
+    ranks, default_rank = City._STAFFING_RANKS.get(staffing_strategy, ({}, None))  # noqa: SLF001
+    
+    return ranks.get(building_id, default_rank)
+
+
+def _canonicalize_buildings(buildings: BuildingsCount, staffing_strategy: str) -> tuple[tuple[str, int], ...]:
+    # Staffing ties are settled by the order of the buildings in the city, so the key keeps that order within each
+    # staffing rank. The buildings that are not staffed are sorted by ID after the others.
+    
+    def get_staffing_key(item: tuple[str, int]) -> tuple[int, int, str]:
+        rank: int | None = _get_staffing_rank(building_id = item[0], staffing_strategy = staffing_strategy)
+        return (0, rank, "") if rank is not None else (1, 0, item[0])
+    
+    counts: list[tuple[str, int]] = [(building_id, qty) for building_id, qty in buildings.items() if qty > 0]
+    
+    return tuple(sorted(counts, key = get_staffing_key))  # Stable, so ties keep their order in the count.
+
+
+@lru_cache(maxsize = CITY_EVALUATION_CACHE_SIZE)
+def _evaluate_canonical_city(
+        campaign: str,
+        name: str,
+        buildings: tuple[tuple[str, int], ...],
+        staffing_strategy: str,
+        version: int,  # noqa: ARG001
+    ) -> CityEvaluation:
+    # The catalog version is only part of the cache key, so that evaluations never outlive the data they were made from.
+    
+    city: City = City.from_buildings_count(
+        campaign = campaign,
+        name = name,
+        buildings = dict(buildings),
+        staffing_strategy = staffing_strategy,
+    )
+    
+    return CityEvaluation(
+        campaign = city.campaign,
+        name = city.name,
+        buildings = buildings,
+        staffing_strategy = staffing_strategy,
+        workers = tuple(sorted(city.get_workers_count().items())),
+        assigned_workers = city.assigned_workers,
+        effects = city.effects,
+        production = city.production,
+        storage = city.storage,
+        defenses = city.defenses,
+        focus = city.focus,
+    )
+
+
+def evaluate_city(
+        campaign: str,
+        name: str,
+        buildings: BuildingsCount,
+        staffing_strategy: str = "production_first",
+    ) -> CityEvaluation:
+    """
+    Evaluate a city created from a count of buildings, reusing the result of previous identical evaluations.
+    
+    The results are kept in a bounded LRU cache (see `CITY_EVALUATION_CACHE_SIZE`). The key is the campaign, the name,
+    the staffing strategy and the canonical count of buildings: zero counts are ignored, and so is the order of the
+    buildings, except between buildings that the staffing strategy ranks the same (ties are staffed in the order of the
+    count, as in `City.from_buildings_count`). The cache is cleared whenever the catalog data is reloaded. Errors are
+    raised as in `City.from_buildings_count` and are not cached.
+    
+    Args:
+        campaign (str): The campaign identifier the city belongs to.
+        name (str): The name of the city.
+        buildings (BuildingsCount): A dictionary mapping building IDs to quantities.
+        staffing_strategy (str): The name of the staffing strategy to be used. Defaults to "production_first".
+    
+    Returns:
+        CityEvaluation: The evaluation of the city. It is shared and immutable.
+    """
+    
+    return _evaluate_canonical_city(
+        campaign = campaign,
+        name = name,
+        buildings = _canonicalize_buildings(buildings = buildings, staffing_strategy = staffing_strategy),
+        staffing_strategy = staffing_strategy,
+        version = CATALOG.version,
+    )
+
+
+def get_city_evaluation_stats() -> _CacheInfo:
+    """
+    Get the statistics of the cache used by `evaluate_city`.
+    
+    Returns:
+        _CacheInfo: A named tuple with the `hits`, `misses`, `maxsize` and `currsize` of the cache.
+    """
+    
+    return _evaluate_canonical_city.cache_info()
+
+
+def clear_city_evaluations() -> None:
+    """
+    Discard all the evaluations cached by `evaluate_city` and reset its statistics.
+    """
+    
+    _evaluate_canonical_city.cache_clear()
+
+
+CATALOG.on_reload(lambda _catalog: clear_city_evaluations())
@@ -2,13 +2,15 @@
 Module for building Rich display configurationss.
 
 This module provides classes and types for building display configurations. These are used by the City and Scenario
-classes to control how information is displayed.
+classes to control how information is displayed. This module does not depend on Rich, so it can be safely imported by
+the calculation modules.
 
 Public API:
     - DisplaySection: Enum representing different display sections.
     - DisplayConfiguration: TypedDict for configuring the display of city sections.
     - DisplaySectionConfiguration: TypedDict for configuring individual sections.
     - DEFAULT_SECTION_COLORS: Default colors for sections.
+    - calculate_indentations: Number of spaces needed to right-align a formatted number inside a cell.
 
 Internal objects:
     - _DisplaySectionColors: Mapping of section names to their default colors.
@@ -87,3 +89,29 @@ DEFAULT_SECTION_COLORS: _DisplaySectionColors = {
     "storage": "purple",
     "defenses": "red",
 }
+
+
+def calculate_indentations(cell_value: int, width: int) -> int:
+    """
+    Calculate the number of spaces needed to right-align a number in a cell of a given width.
+    
+    The number is assumed to be formatted with thousand separators (e.g. `1_000`).
+    
+    Args:
+        cell_value (int): The number to be displayed in the cell.
+        width (int): The width of the cell.
+    
+    Returns:
+        int: The number of spaces to prepend to the formatted number. Zero if the number does not fit in the cell.
+    """
+    
+    chars_per_thousand_separator: int = 3
+    
+    digits_in_number: int = len(str(cell_value))
+    n_of_dashes: int = (digits_in_number - 1) // chars_per_thousand_separator
+    n_chars_in_number: int = digits_in_number + n_of_dashes
+    
+    if width <= n_chars_in_number:
+        return 0
+    
+    return width - n_chars_in_number
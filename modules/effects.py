@@ -16,14 +16,15 @@ Public API:
 - EffectBonus (Enum): Named constants for the three effect types.
 - EffectBonusesData (TypedDict): Helper for type hints when reading YAML/JSON. Although part of the public API (used by
     other modules), end users are not expected to interact with it directly.
-- EffectBonuses (dataclass): Stores effect values and provides dict-like access.
+- EffectBonuses (dataclass): Stores effect values and provides dict-like access and vector arithmetic.
+- FrozenEffectBonuses (dataclass): Immutable, hashable version of EffectBonuses.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, ClassVar, Self, TypedDict
 
 
 if TYPE_CHECKING:
@@ -59,27 +60,36 @@ class EffectBonusesData(TypedDict):
     intelligence: int
 
 
-@dataclass
-class EffectBonuses:
+class _EffectBonusesBase:
     """
-    Stores the values of effect bonuses and provides dictionary-like access.
+    Behaviour shared by `EffectBonuses` and `FrozenEffectBonuses`. Should not be used outside this module.
     
-    Each instance tracks the three effect types: troop training, population growth, and intelligence. Supports
-    iteration and retrieval like a dict.
-    
-    Public methods:
-        __iter__(): Iterate over effect names.
-        items(): Return (effect_name, value) pairs.
-        values(): Return values of all effects.
-        get(key): Get the value for a given effect name. Raises KeyError if the key is not found.
+    Equality compares values, so mutable and frozen bonuses with the same effects are equal (like `set` and
+    `frozenset`). Arithmetic accepts either variant and returns the type of the left operand.
     """
     
-    troop_training: int = 0
-    population_growth: int = 0
-    intelligence: int = 0
+    __slots__ = ()
+    
+    # Only the frozen variant is hashable.
+    __hash__: ClassVar[None] = None  # type: ignore[assignment]
+    
+    FIELDS: ClassVar[tuple[str, ...]] = ("troop_training", "population_growth", "intelligence")
+    
+    troop_training: int
+    population_growth: int
+    intelligence: int
     
     def __iter__(self) -> Iterator[str]:
-        return (field.name for field in fields(class_or_instance = self))
+        return iter(_EffectBonusesBase.FIELDS)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _EffectBonusesBase):
+            return NotImplemented
+        return (
+            self.troop_training == other.troop_training
+            and self.population_growth == other.population_growth
+            and self.intelligence == other.intelligence
+        )
     
     def items(self) -> Iterator[tuple[str, int]]:
         """
@@ -89,7 +99,11 @@ class EffectBonuses:
             Iterator[tuple[str, int]]: An iterator of (key, value) pairs
         """
         
-        return ((field.name, getattr(self, field.name)) for field in fields(class_or_instance = self))
+        return iter((
+            ("troop_training", self.troop_training),
+            ("population_growth", self.population_growth),
+            ("intelligence", self.intelligence),
+        ))
     
     def values(self) -> Iterator[int]:
         """
@@ -99,7 +113,7 @@ class EffectBonuses:
             Iterator[int]: An iterator of values.
         """
         
-        return (getattr(self, field.name) for field in fields(class_or_instance = self))
+        return iter((self.troop_training, self.population_growth, self.intelligence))
     
     def get(self, key: str) -> int:
         """
@@ -115,7 +129,173 @@ class EffectBonuses:
             int: The value for that key.
         """
         
-        if key not in (f.name for f in fields(class_or_instance = self)):
+        if key not in _EffectBonusesBase.FIELDS:
             raise KeyError(f"Invalid effect name: {key}")
         
         return getattr(self, key)
+    
+    def with_(self, **changes: int) -> Self:
+        """
+        Return a copy of the bonuses with some effects changed, like `dataclasses.replace()`.
+        
+        Args:
+            **changes (int): The new values, by effect name.
+        
+        Returns:
+            Self: New bonuses of the same type. The original is not modified.
+        """
+        
+        return replace(self, **changes)  # type: ignore[type-var]
+    
+    def freeze(self) -> FrozenEffectBonuses:
+        """
+        Return an immutable, hashable version of the bonuses.
+        
+        Returns:
+            FrozenEffectBonuses: The bonuses themselves if they are already frozen, otherwise a frozen copy.
+        """
+        
+        if isinstance(self, FrozenEffectBonuses):
+            return self
+        
+        return FrozenEffectBonuses(
+            troop_training = self.troop_training,
+            population_growth = self.population_growth,
+            intelligence = self.intelligence,
+        )
+    
+    def thaw(self) -> EffectBonuses:
+        """
+        Return a mutable copy of the bonuses.
+        
+        Returns:
+            EffectBonuses: New mutable bonuses with the same values.
+        """
+        
+        return EffectBonuses(
+            troop_training = self.troop_training,
+            population_growth = self.population_growth,
+            intelligence = self.intelligence,
+        )
+    
+    
+    #* Arithmetic
+    def __add__(self, other: object) -> Self:
+        if not isinstance(other, _EffectBonusesBase):
+            return NotImplemented
+        return type(self)(
+            troop_training = self.troop_training + other.troop_training,
+            population_growth = self.population_growth + other.population_growth,
+            intelligence = self.intelligence + other.intelligence,
+        )
+    
+    def __radd__(self, other: object) -> Self:
+        # `sum()` starts from the integer zero.
+        if isinstance(other, int) and other == 0:
+            return type(self)(
+                troop_training = self.troop_training,
+                population_growth = self.population_growth,
+                intelligence = self.intelligence,
+            )
+        return NotImplemented
+    
+    def __sub__(self, other: object) -> Self:
+        if not isinstance(other, _EffectBonusesBase):
+            return NotImplemented
+        return type(self)(
+            troop_training = self.troop_training - other.troop_training,
+            population_growth = self.population_growth - other.population_growth,
+            intelligence = self.intelligence - other.intelligence,
+        )
+    
+    def __mul__(self, other: object) -> Self:
+        if not isinstance(other, int):
+            return NotImplemented
+        return type(self)(
+            troop_training = self.troop_training * other,
+            population_growth = self.population_growth * other,
+            intelligence = self.intelligence * other,
+        )
+    
+    def __rmul__(self, other: object) -> Self:
+        return self.__mul__(other)
+
+
+@dataclass(slots = True, eq = False)
+class EffectBonuses(_EffectBonusesBase):
+    """
+    Stores the values of effect bonuses and provides dictionary-like access and vector arithmetic.
+    
+    Each instance tracks the three effect types: troop training, population growth, and intelligence. Supports
+    iteration and retrieval like a dict, and element-wise arithmetic like a vector:
+    
+    - `a + b` and `a - b` add or subtract two sets of bonuses.
+    - `a * n` and `n * a` multiply all effects by an integer.
+    - `+=`, `-=`, and `*=` do the same in place (mutating the left operand).
+    - `sum(bonuses)` adds a list of bonuses (it starts from `0`, which is treated as empty bonuses).
+    
+    Bonuses are mutable and therefore unhashable. Use `freeze()` to get `FrozenEffectBonuses`.
+    
+    Public methods:
+        __iter__(): Iterate over effect names.
+        items(): Return (effect_name, value) pairs.
+        values(): Return values of all effects.
+        get(key): Get the value for a given effect name. Raises KeyError if the key is not found.
+        with_(**changes): Return a copy with some effects changed.
+        freeze(): Return a frozen copy.
+        thaw(): Return a mutable copy.
+    
+    Attributes:
+        FIELDS (tuple[str, ...]): Names of the effects, in declaration order.
+    """
+    
+    troop_training: int = 0
+    population_growth: int = 0
+    intelligence: int = 0
+    
+    def __iadd__(self, other: object) -> Self:
+        if not isinstance(other, _EffectBonusesBase):
+            return NotImplemented
+        self.troop_training += other.troop_training
+        self.population_growth += other.population_growth
+        self.intelligence += other.intelligence
+        return self
+    
+    def __isub__(self, other: object) -> Self:
+        if not isinstance(other, _EffectBonusesBase):
+            return NotImplemented
+        self.troop_training -= other.troop_training
+        self.population_growth -= other.population_growth
+        self.intelligence -= other.intelligence
+        return self
+    
+    def __imul__(self, other: object) -> Self:
+        if not isinstance(other, int):
+            return NotImplemented
+        self.troop_training *= other
+        self.population_growth *= other
+        self.intelligence *= other
+        return self
+
+
+@dataclass(frozen = True, slots = True, eq = False)
+class FrozenEffectBonuses(_EffectBonusesBase):
+    """
+    Immutable, hashable version of `EffectBonuses`.
+    
+    It has the same dictionary-like access and arithmetic, but its effects cannot be changed. The in-place operators
+    rebind the name to new frozen bonuses instead of mutating them, and `with_()` returns an updated copy.
+    
+    Public methods:
+        See `EffectBonuses`. `freeze()` returns the bonuses themselves.
+    
+    Attributes:
+        FIELDS (tuple[str, ...]): Names of the effects, in declaration order.
+    """
+    
+    troop_training: int = 0
+    population_growth: int = 0
+    intelligence: int = 0
+    
+    def __hash__(self) -> int:
+        return hash((self.troop_training, self.population_growth, self.intelligence))
@@ -17,13 +17,14 @@ Public API:
 - GeoFeaturesData (TypedDict): Helper for type hints when reading YAML/JSON. While other modules may rely on this for
     typing, end users are not expected to interact with it directly.
 - GeoFeatures (dataclass): Stores feature counts and provides dict-like access.
+- FrozenGeoFeatures (dataclass): Immutable, hashable version of GeoFeatures.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, ClassVar, Self, TypedDict
 
 
 if TYPE_CHECKING:
@@ -62,28 +63,38 @@ class GeoFeaturesData(TypedDict):
     forests: int
 
 
-@dataclass
-class GeoFeatures:
+class _GeoFeaturesBase:
     """
-    Stores counts of geographic features and provides dictionary-like access.
-    
-    Each instance tracks the four geographic feature types: lakes, rock outcrops, mountains, and forests. Supports
-    iteration and retrieval like a dictionary.
+    Behaviour shared by `GeoFeatures` and `FrozenGeoFeatures`. Should not be used outside this module.
     
-    Public methods:
-        __iter__(): Iterate over feature names.
-        items(): Return (feature_name, value) pairs.
-        values(): Return counts of all features.
-        get(key): Get the count for a given feature name. Raises KeyError if the key is not found.
+    Equality compares values, so mutable and frozen features with the same counts are equal (like `set` and
+    `frozenset`).
     """
     
-    lakes: int = 0
-    rock_outcrops: int = 0
-    mountains: int = 0
-    forests: int = 0
+    __slots__ = ()
+    
+    # Only the frozen variant is hashable.
+    __hash__: ClassVar[None] = None  # type: ignore[assignment]
+    
+    FIELDS: ClassVar[tuple[str, ...]] = ("lakes", "rock_outcrops", "mountains", "forests")
+    
+    lakes: int
+    rock_outcrops: int
+    mountains: int
+    forests: int
     
     def __iter__(self) -> Iterator[str]:
-        return (field.name for field in fields(class_or_instance = self))
+        return iter(_GeoFeaturesBase.FIELDS)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _GeoFeaturesBase):
+            return NotImplemented
+        return (
+            self.lakes == other.lakes
+            and self.rock_outcrops == other.rock_outcrops
+            and self.mountains == other.mountains
+            and self.forests == other.forests
+        )
     
     def items(self) -> Iterator[tuple[str, int]]:
         """
@@ -93,7 +104,12 @@ class GeoFeatures:
             Iterator[tuple[str, int]]: An iterator of (key, value) pairs
         """
         
-        return ((field.name, getattr(self, field.name)) for field in fields(class_or_instance = self))
+        return iter((
+            ("lakes", self.lakes),
+            ("rock_outcrops", self.rock_outcrops),
+            ("mountains", self.mountains),
+            ("forests", self.forests),
+        ))
     
     def values(self) -> Iterator[int]:
         """
@@ -103,7 +119,7 @@ class GeoFeatures:
             Iterator[int]: An iterator of values.
         """
         
-        return (getattr(self, field.name) for field in fields(class_or_instance = self))
+        return iter((self.lakes, self.rock_outcrops, self.mountains, self.forests))
     
     def get(self, key: str) -> int:
         """
@@ -119,7 +135,102 @@ class GeoFeatures:
             int: The value for that key.
         """
         
-        if key not in (f.name for f in fields(class_or_instance = self)):
+        if key not in _GeoFeaturesBase.FIELDS:
             raise KeyError(f"Invalid geo feature name: {key}")
         
         return getattr(self, key)
+    
+    def with_(self, **changes: int) -> Self:
+        """
+        Return a copy of the features with some counts changed, like `dataclasses.replace()`.
+        
+        Args:
+            **changes (int): The new counts, by feature name.
+        
+        Returns:
+            Self: New features of the same type. The original is not modified.
+        """
+        
+        return replace(self, **changes)  # type: ignore[type-var]
+    
+    def freeze(self) -> FrozenGeoFeatures:
+        """
+        Return an immutable, hashable version of the features.
+        
+        Returns:
+            FrozenGeoFeatures: The features themselves if they are already frozen, otherwise a frozen copy.
+        """
+        
+        if isinstance(self, FrozenGeoFeatures):
+            return self
+        
+        return FrozenGeoFeatures(
+            lakes = self.lakes,
+            rock_outcrops = self.rock_outcrops,
+            mountains = self.mountains,
+            forests = self.forests,
+        )
+    
+    def thaw(self) -> GeoFeatures:
+        """
+        Return a mutable copy of the features.
+        
+        Returns:
+            GeoFeatures: New mutable features with the same counts.
+        """
+        
+        return GeoFeatures(
+            lakes = self.lakes,
+            rock_outcrops = self.rock_outcrops,
+            mountains = self.mountains,
+            forests = self.forests,
+        )
+
+
+@dataclass(slots = True, eq = False)
+class GeoFeatures(_GeoFeaturesBase):
+    """
+    Stores counts of geographic features and provides dictionary-like access.
+    
+    Each instance tracks the four geographic feature types: lakes, rock outcrops, mountains, and forests. Supports
+    iteration and retrieval like a dictionary. Features are mutable and therefore unhashable. Use `freeze()` to get
+    `FrozenGeoFeatures`.
+    
+    Public methods:
+        __iter__(): Iterate over feature names.
+        items(): Return (feature_name, value) pairs.
+        values(): Return counts of all features.
+        get(key): Get the count for a given feature name. Raises KeyError if the key is not found.
+        with_(**changes): Return a copy with some counts changed.
+        freeze(): Return a frozen copy.
+        thaw(): Return a mutable copy.
+    
+    Attributes:
+        FIELDS (tuple[str, ...]): Names of the features, in declaration order.
+    """
+    
+    lakes: int = 0
+    rock_outcrops: int = 0
+    mountains: int = 0
+    forests: int = 0
+
+
+@dataclass(frozen = True, slots = True, eq = False)
+class FrozenGeoFeatures(_GeoFeaturesBase):
+    """
+    Immutable, hashable version of `GeoFeatures`.
+    
+    Public methods:
+        See `GeoFeatures`. `freeze()` returns the features themselves.
+    
+    Attributes:
+        FIELDS (tuple[str, ...]): Names of the features, in declaration order.
+    """
+    
+    lakes: int = 0
+    rock_outcrops: int = 0
+    mountains: int = 0
+    forests: int = 0
+    
+    def __hash__(self) -> int:
+        return hash((self.lakes, self.rock_outcrops, self.mountains, self.forests))
@@ -18,18 +18,12 @@ from collections import Counter
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, ClassVar
 
-from rich import box
-from rich.align import Align
-from rich.console import Console
-from rich.layout import Layout
-from rich.panel import Panel
-from rich.style import Style
-from rich.table import Table
-from rich.text import Text
-
-from .city import CITIES, City
+from .catalog import CATALOG
+from .city import City
+from .display import calculate_indentations
 from .exceptions import CitiesFromMultipleCampaignsError, DuplicatedCityError
-from .resources import Resource, ResourceCollection
+from .resources import FrozenResourceCollection, Resource, ResourceCollection
+from .tables import PackedCollection
 
 
 if TYPE_CHECKING:
@@ -149,6 +143,7 @@ class Kingdom:
             cls,
             data: list[CityDict],
             sort_order: list[str | None] | None = None,
+            cached: bool = False,
         ) -> Kingdom:
         """
         Create a `Kingdom` instance from a list of raw city data dictionaries.
@@ -158,12 +153,14 @@ class Kingdom:
                 initializing a `City` instance.
             sort_order (list[str | None] | None): optional sort order for resources when arranging the cities. If
                 `None`, the default order is used.
+            cached (bool): whether to reuse the evaluations of identical cities (see `City.from_buildings_count`).
+                Defaults to False.
         
         Returns:
             Kingdom: a new `Kingdom` instance populated with the provided cities.
         """
         return cls(
-            cities = [City.from_buildings_count(**city) for city in data],
+            cities = [City.from_buildings_count(**city, cached = cached) for city in data],
             sort_order = sort_order,
         )
     
@@ -193,42 +190,32 @@ class Kingdom:
         return self.cities[0].campaign
     
     def _get_number_of_cities_in_campaign(self) -> int:
-        
-        number_of_cities_in_campaign: int = 0
-        
-        for city in CITIES:
-            if city.get("campaign") == self.campaign:
-                number_of_cities_in_campaign += 1
-        
-        return number_of_cities_in_campaign
+        return CATALOG.count_cities(campaign = self.campaign)
     
     
     #* Kingdom calculations
     def _calculate_total_production(self) -> ResourceCollection:
         
-        total_production: ResourceCollection = ResourceCollection()
-        
-        for city in self.cities:
-            total_production.food += city.production.balance.food
-            total_production.ore += city.production.balance.ore
-            total_production.wood += city.production.balance.wood
+        balances: PackedCollection[FrozenResourceCollection] = PackedCollection.from_records(
+            kind = FrozenResourceCollection,
+            records = (city.production.balance for city in self.cities),
+        )
         
-        return total_production
+        return balances.sum().thaw()
     
     def _calculate_total_storage(self) -> ResourceCollection:
         
-        total_storage: ResourceCollection = ResourceCollection(
+        base_storage: ResourceCollection = ResourceCollection(
             food = self.BASE_KINGDOM_STORAGE,
             ore = self.BASE_KINGDOM_STORAGE,
             wood = self.BASE_KINGDOM_STORAGE,
         )
+        storages: PackedCollection[FrozenResourceCollection] = PackedCollection.from_records(
+            kind = FrozenResourceCollection,
+            records = (city.storage.total for city in self.cities),
+        )
         
-        for city in self.cities:
-            total_storage.food += city.storage.total.food
-            total_storage.ore += city.storage.total.ore
-            total_storage.wood += city.storage.total.wood
-        
-        return total_storage
+        return base_storage + storages.sum()
     
     
     def __post_init__(self) -> None:
@@ -285,235 +272,7 @@ class Kingdom:
     #* Kingdom display
     @staticmethod
     def _calculate_indentations(cell_value: int, width: int) -> int:
-        
-        chars_per_thousand_separator: int = 3
-        
-        digits_in_number: int = len(str(cell_value))
-        n_of_dashes: int = (digits_in_number - 1) // chars_per_thousand_separator
-        n_chars_in_number: int = digits_in_number + n_of_dashes
-        
-        if width <= n_chars_in_number:
-            return 0
-        
-        return width - n_chars_in_number
-    
-    def _build_kingdom_information(self) -> Text:
-        
-        city_information: Text = Text(
-            text = f" {self.campaign} ",
-            style = "bold black on white",
-            justify = "center",
-        )
-        return city_information
-    
-    def _build_campaign_table(self) -> Table:
-        
-        percentage_conquered: float = round(
-            number = len(self.cities) / self.number_of_cities_in_campaign * 100,
-            ndigits = 2,
-        )
-        
-        table_style: Style = Style(color = "cyan")
-        table: Table = Table(
-            title = Text(text = "Campaign", style = table_style + Style(italic = True)),
-            style = table_style,
-            box = box.HEAVY,
-        )
-        
-        table.add_column(header = "Total cities", header_style = "bold", justify = "center")
-        table.add_column(header = "Player cities", header_style = "bold", justify = "center")
-        
-        table.add_row(
-            f"{self.number_of_cities_in_campaign}",
-            f"{len(self.cities)} [dim]({percentage_conquered}%)[/dim]",
-        )
-        
-        return table
-    
-    def _build_kingdom_production_table(self) -> Table:
-        
-        production_color: str = "#228b22"
-        table_style: Style = Style(color = production_color)
-        
-        table: Table = Table(
-            title = Text(text = "Production", style = table_style + Style(italic = True)),
-            style = table_style,
-            box = box.HEAVY,
-        )
-        
-        city_column_header: str = "City"
-        city_name_lengths: list[int] = [len(city.name) for city in self.cities]
-        max_city_name_length: int = max(city_name_lengths)
-        cell_length: int = max_city_name_length - len(city_column_header)
-        left_side_justification: int = cell_length // 2
-        
-        table.add_column(header = f"{" " * left_side_justification}{city_column_header}", header_style = "bold")
-        table.add_column(header = f"{" " * 3}Food", header_style = "bold", justify = "left")
-        table.add_column(header = f"{" " * 3}Ore", header_style = "bold", justify = "left")
-        table.add_column(header = f"{" " * 3}Wood", header_style = "bold", justify = "left")
-        
-        for city in self.cities:
-            
-            row_elements: list[str] = [f"{city.name}"]
-            
-            for rss in ["food", "ore", "wood"]:
-                
-                rss_potential: int = city.resource_potentials.get(key = rss)
-                indentation_rss_potential: int = Kingdom._calculate_indentations(cell_value = rss_potential, width = 3)
-                rss_potential_cell_value: str = f"{" " * indentation_rss_potential}[dim]({rss_potential})[/dim]"
-                
-                rss_balance: int = city.production.balance.get(key = rss)
-                rss_balance_indentation: int = Kingdom._calculate_indentations(cell_value = rss_balance, width = 3)
-                rss_balance_color: str = production_color if Resource(value = rss) == city.focus else "white"
-                rss_balance_cell_value: str = (
-                    f"{" " * (rss_balance_indentation)}"
-                    f"[{rss_balance_color}]"
-                    f"{rss_balance:_}"
-                    f"[/{rss_balance_color}]"
-                )
-                
-                row_element: str = f"{rss_potential_cell_value}{" " * 2}{rss_balance_cell_value}"
-                row_elements.append(row_element)
-            
-            table.add_row(*row_elements)
-        
-        table.add_section()
-        
-        i_t_food: int = Kingdom._calculate_indentations(cell_value = self.kingdom_total_production.food, width = 10)
-        i_t_ore: int = Kingdom._calculate_indentations(cell_value = self.kingdom_total_production.ore, width = 10)
-        i_t_wood: int = Kingdom._calculate_indentations(cell_value = self.kingdom_total_production.wood, width = 10)
-        
-        table.add_row(
-            f"Total",
-            f"{" " * i_t_food}{self.kingdom_total_production.food:_}",
-            f"{" " * i_t_ore}{self.kingdom_total_production.ore:_}",
-            f"{" " * i_t_wood}{self.kingdom_total_production.wood:_}",
-            style = table_style + Style(bold = True),
-        )
-        
-        return table
-    
-    def _build_kingdom_storage_table(self) -> Table:
-        
-        storage_color: str = "purple"
-        table_style: Style = Style(color = storage_color)
-        
-        table: Table = Table(
-            title = Text(text = "Storage", style = table_style + Style(italic = True)),
-            style = table_style,
-            box = box.HEAVY,
-        )
-        
-        city_column_header: str = "City"
-        city_name_lengths: list[int] = [len(city.name) for city in self.cities]
-        max_city_name_length: int = max(city_name_lengths)
-        cell_length: int = max_city_name_length - len(city_column_header)
-        left_side_justification: int = cell_length // 2
-        
-        table.add_column(header = f"{" " * left_side_justification}{city_column_header}", header_style = "bold")
-        table.add_column(header = f"{" " * 1}Food", header_style = "bold", justify = "left")
-        table.add_column(header = f"{" " * 2}Ore", header_style = "bold", justify = "left")
-        table.add_column(header = f"{" " * 1}Wood", header_style = "bold", justify = "left")
-        
-        for city in self.cities:
-            
-            row_elements: list[str] = [f"{city.name}"]
-            
-            for rss in ["food", "ore", "wood"]:
-                
-                rss_storage: int = city.storage.total.get(key = rss)
-                rss_storage_indentation: int = Kingdom._calculate_indentations(cell_value = rss_storage, width = 6)
-                rss_storage_color: str = storage_color if Resource(value = rss) == city.focus else "white"
-                rss_storage_cell_value: str = (
-                    f"{" " * (rss_storage_indentation)}"
-                    f"[{rss_storage_color}]"
-                    f"{rss_storage:_}"
-                    f"[/{rss_storage_color}]"
-                )
-                
-                row_element: str = f"{rss_storage_cell_value}"
-                row_elements.append(row_element)
-            
-            table.add_row(*row_elements)
-        
-        table.add_section()
-        
-        i_t_food: int = Kingdom._calculate_indentations(cell_value = self.kingdom_total_storage.food, width = 6)
-        i_t_ore: int = Kingdom._calculate_indentations(cell_value = self.kingdom_total_storage.ore, width = 6)
-        i_t_wood: int = Kingdom._calculate_indentations(cell_value = self.kingdom_total_storage.wood, width = 6)
-        
-        table.add_row(
-            f"Total",
-            f"{" " * i_t_food}{self.kingdom_total_storage.food:_}",
-            f"{" " * i_t_ore}{self.kingdom_total_storage.ore:_}",
-            f"{" " * i_t_wood}{self.kingdom_total_storage.wood:_}",
-            style = table_style + Style(bold = True),
-        )
-        
-        return table
-    
-    def _build_kingdom_display(self) -> Panel:
-        
-        header_height: int = 2
-        campaign_height: int = 7
-        production_and_storage_height: int = len(self.cities) + 9
-        main_height: int = campaign_height + production_and_storage_height
-        total_height: int = header_height + main_height
-        
-        layout: Layout = Layout()
-        
-        layout.split(
-            Layout(
-                name = "header",
-                size = header_height,
-                ratio = 0,
-            ),
-            Layout(
-                name = "main",
-                size = main_height,
-                ratio = 0,
-            ),
-        )
-        
-        layout["header"].update(
-            renderable = Align(renderable = self._build_kingdom_information(), align = "center"),
-        )
-        
-        layout["main"].split(
-            Layout(
-                name = "campaign",
-                size = campaign_height,
-                ratio = 0,
-            ),
-            Layout(
-                name = "production_and_storage",
-                size = production_and_storage_height,
-                ratio = 0,
-            ),
-        )
-        
-        layout["campaign"].update(
-            renderable = Align(renderable = self._build_campaign_table(), align = "center"),
-        )
-        
-        layout["production_and_storage"].split_row(
-            Layout(name = "production", ratio = 4),
-            Layout(name = "storage_capacity", ratio = 3),
-        )
-        
-        layout["production"].update(
-            renderable = Align(renderable = self._build_kingdom_production_table(), align = "center"),
-        )
-        
-        layout["storage_capacity"].update(
-            renderable = Align(renderable = self._build_kingdom_storage_table(), align = "center"),
-        )
-        
-        return Panel(
-            renderable = layout,
-            width = 110,
-            height = total_height,
-        )
+        return calculate_indentations(cell_value = cell_value, width = width)
     
     def display_kingdom(self) -> None:
         """
@@ -530,5 +289,7 @@ class Kingdom:
         resource potential values in parentheses.
         """
         
-        console: Console = Console()
-        console.print(self._build_kingdom_display())
+        # Rendering is imported lazily so that the calculation API can be used without loading Rich.
+        from .rendering import _KingdomDisplay  # noqa: PLC0415
+        
+        _KingdomDisplay(kingdom = self).display_kingdom()
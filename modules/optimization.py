@@ -0,0 +1,914 @@
+"""
+Module for finding the best configuration of buildings of a city.
+
+The configurations of a city with a given hall are searched depth first, like in
+`modules.city.iter_city_configurations`, with a branch-and-bound search. Before a branch is explored, the metrics of
+every configuration in it are bounded from the data of the buildings (`productivity_per_worker`,
+`productivity_bonuses`, maintenance costs, effect bonuses and storage capacity), the workers of the hall
+(`City.MAX_WORKERS`) and the order in which the staffing strategy staffs buildings, and the resource potentials of the
+city. Branches that cannot satisfy the constraints, or that
+cannot beat the best configuration found so far, are skipped. Every other configuration is evaluated as a `City`, so
+the result is the exact optimum.
+
+Metrics are named by their path from a city, like "production.balance.ore" or "effects.total.troop_training" (see
+`CITY_METRICS`).
+
+```python
+optimize_city(
+    campaign = "Unification of Italy",
+    name = "Reate",
+    objective = "production.balance.ore",
+    constraints = [CityConstraint(metric = "effects.total.troop_training", minimum = 50)],
+)
+find_city_frontier(
+    campaign = "Unification of Italy",
+    name = "Reate",
+    metrics = ["production.balance.ore", "effects.total.troop_training"],
+).to_scenario().display_scenario()
+```
+
+Public API:
+
+- CITY_METRICS (tuple[str, ...]): The metrics that objectives and constraints can use.
+- CityConstraint (dataclass): Inclusive lower and/or upper limit on a metric of a city.
+- CityOptimum (dataclass): The best configuration of a city, together with the city it builds.
+- optimize_city (function): Find the configuration of a city that maximizes (or minimizes) a metric, subject to
+    constraints.
+- CityFrontier (dataclass): The Pareto-optimal configurations of a city, as a table that can be displayed as a
+    `Scenario`.
+- find_city_frontier (function): Find the Pareto-optimal configurations of a city for several metrics, subject to
+    constraints.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from math import floor
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, NamedTuple
+
+from .building import get_building_specs
+from .city import City, _get_city_configuration_space, _get_staffing_rank
+from .scenario import Scenario
+from .tables import EFFECT_KEYS, RESOURCE_KEYS
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    
+    from .building import BuildingsCount, BuildingSpec
+    from .city import CityDict, _CityConfigurationChoice, _CityConfigurationSpace
+    from .display import DisplayConfiguration
+
+
+__all__: list[str] = [
+    "CITY_METRICS",
+    "CityConstraint",
+    "CityFrontier",
+    "CityOptimum",
+    "find_city_frontier",
+    "optimize_city",
+]
+
+
+CITY_METRICS: tuple[str, ...] = (
+    *(
+        f"production.{part}.{key}"
+        for part in ("base", "productivity_bonuses", "total", "maintenance_costs", "balance")
+        for key in RESOURCE_KEYS
+    ),
+    *(f"effects.{part}.{key}" for part in ("city", "buildings", "workers", "total") for key in EFFECT_KEYS),
+    *(f"storage.total.{key}" for key in RESOURCE_KEYS),
+    "defenses.squadrons",
+)
+
+
+@dataclass(frozen = True, slots = True)
+class CityConstraint:
+    """
+    Inclusive lower and/or upper limit on a metric of a city.
+    
+    Attributes:
+        metric (str): The name of the metric (see `CITY_METRICS`).
+        minimum (int | None): The lowest value allowed. Defaults to None (no lower limit).
+        maximum (int | None): The highest value allowed. Defaults to None (no upper limit).
+    """
+    
+    metric: str
+    minimum: int | None = None
+    maximum: int | None = None
+    
+    def allows(self, lowest: int, highest: int) -> bool:
+        """
+        Whether some value between `lowest` and `highest` (both included) is within the limits.
+        
+        Args:
+            lowest (int): The lowest value.
+            highest (int): The highest value. Pass the same value as `lowest` to check a single value.
+        
+        Returns:
+            bool: True if the limits allow at least one of the values.
+        """
+        
+        if self.minimum is not None and highest < self.minimum:
+            return False
+        
+        return self.maximum is None or lowest <= self.maximum
+
+
+@dataclass(frozen = True, slots = True)
+class CityOptimum:
+    """
+    The best configuration of a city found by `optimize_city`.
+    
+    Attributes:
+        buildings (BuildingsCount): The count of buildings, including the hall (and the supply dump, if the city has
+            one).
+        city (City): The city built from `buildings`, with the staffing strategy of the search.
+        value (int): The value of the objective for the city.
+        evaluated (int): The number of configurations that were evaluated as cities. The rest were pruned.
+    """
+    
+    buildings: BuildingsCount
+    city: City
+    value: int
+    evaluated: int
+
+
+@dataclass(frozen = True, slots = True)
+class CityFrontier:
+    """
+    The Pareto-optimal configurations of a city found by `find_city_frontier`, as a table with a row per configuration.
+    
+    No configuration of the city satisfies the constraints and is at least as good in every metric, and better in one,
+    than a row. Configurations with the same values as a row are not repeated. The rows are sorted from the best to the
+    worst value of the first metric (and of the next ones, on ties).
+    
+    Attributes:
+        campaign (str): The campaign of the city.
+        name (str): The name of the city.
+        staffing_strategy (str): The staffing strategy of the cities.
+        metrics (tuple[str, ...]): The metrics of the columns.
+        buildings (tuple[BuildingsCount, ...]): The count of buildings of each row.
+        values (tuple[tuple[int, ...], ...]): The values of the metrics of each row, in the order of `metrics`.
+        evaluated (int): The number of configurations that were evaluated as cities. The rest were pruned.
+    
+    Public methods:
+        to_city_dicts(): Get the rows as city dictionaries.
+        to_scenario(configuration): Get a `Scenario` with the city of each row.
+    """
+    
+    campaign: str
+    name: str
+    staffing_strategy: str
+    metrics: tuple[str, ...]
+    buildings: tuple[BuildingsCount, ...]
+    values: tuple[tuple[int, ...], ...]
+    evaluated: int
+    
+    def __len__(self) -> int:
+        return len(self.buildings)
+    
+    def to_city_dicts(self) -> list[CityDict]:
+        """
+        Get the rows as city dictionaries, like the ones `Scenario.from_list` and `Kingdom.from_list` take. The cities
+        they define use the default staffing strategy.
+        
+        Returns:
+            list[CityDict]: A dictionary per row, in order.
+        """
+        
+        return [
+            {"campaign": self.campaign, "name": self.name, "buildings": dict(buildings)}
+            for buildings in self.buildings
+        ]
+    
+    def to_scenario(self, configuration: DisplayConfiguration | None = None) -> Scenario:
+        """
+        Get a scenario that compares the cities of the rows, built with the staffing strategy of the frontier.
+        
+        Args:
+            configuration (DisplayConfiguration | None): The display configuration of the scenario (see `Scenario`).
+                Defaults to None.
+        
+        Returns:
+            Scenario: A scenario with a city per row, in order.
+        """
+        
+        return Scenario(
+            cities = [
+                City.from_buildings_count(
+                    campaign = self.campaign,
+                    name = self.name,
+                    buildings = buildings,
+                    staffing_strategy = self.staffing_strategy,
+                )
+                for buildings in self.buildings
+            ],
+            configuration = configuration,
+        )
+
+
+# A term is a sum over the buildings of a city: ("buildings", field, key) sums the `field` of every building,
+# ("workers", field, key) sums it for every worker ("production" is the production per worker, after the resource
+# potentials), and ("squadrons", "", "") is the number of squadrons, which is the highest of the forts.
+type _Term = tuple[str, str, str]
+
+_SQUADRONS: _Term = ("squadrons", "", "")
+_SQUADRONS_BY_FORT: dict[str, int] = {"small_fort": 2, "medium_fort": 3, "large_fort": 4}
+
+
+def _get_metric_terms(metric: str) -> tuple[_Term, ...]:
+    # The terms a metric is calculated from. The effects of the city itself are not a term, since they are constant.
+    
+    match metric.split("."):
+        case ["production", "base", key]:
+            return (("workers", "production", key),)
+        case ["production", "productivity_bonuses", key]:
+            return (("buildings", "productivity_bonuses", key),)
+        case ["production", "maintenance_costs", key]:
+            return (("buildings", "maintenance_cost", key),)
+        case ["production", "total", key]:
+            return (("workers", "production", key), ("buildings", "productivity_bonuses", key))
+        case ["production", "balance", key]:
+            return (
+                ("workers", "production", key),
+                ("buildings", "productivity_bonuses", key),
+                ("buildings", "maintenance_cost", key),
+            )
+        case ["effects", "city", _key]:
+            return ()
+        case ["effects", "buildings", key]:
+            return (("buildings", "effect_bonuses", key),)
+        case ["effects", "workers", key]:
+            return (("workers", "effect_bonuses_per_worker", key),)
+        case ["effects", "total", key]:
+            return (("buildings", "effect_bonuses", key), ("workers", "effect_bonuses_per_worker", key))
+        case ["storage", "total", key]:
+            return (("buildings", "storage_capacity", key),)
+        case _:
+            return (_SQUADRONS,)
+
+
+class _SearchNode(NamedTuple):
+    """A configuration, and the buildings that can still be added to it (see `_CitySearch.search`)."""
+    
+    counts: BuildingsCount
+    start: int
+    building_spots: int
+    empty_spots: int
+    has_guild: bool
+
+
+class _CitySearch(ABC):
+    """
+    Branch-and-bound search over the configurations of a city. Should not be used outside this module.
+    
+    Subclasses decide which branches could improve their result (`_can_improve`), and what to keep from each
+    configuration that satisfies the constraints (`_record`).
+    
+    The bounds of a branch relax the rules of the city: the buildings that can be added only share the building spots,
+    the empty spots and the single guild, and the workers of the hall can be assigned to any of them that the staffing
+    strategy staffs. Since those limits are nested, taking the best buildings first is the best choice under the
+    relaxed rules, so the bounds are never beaten by a configuration in the branch. The strategies staff buildings by
+    rank until the workers run out, so each building of a branch gets at least the workers that the buildings that
+    could be staffed before it leave, and at most the workers that the buildings of the branch staffed before it leave.
+    """
+    
+    def __init__(
+            self,
+            campaign: str,
+            name: str,
+            space: _CityConfigurationSpace,
+            metrics: tuple[str, ...],
+            constraints: tuple[CityConstraint, ...],
+            staffing_strategy: str,
+        ) -> None:
+        
+        self.campaign: str = campaign
+        self.name: str = name
+        self.metrics: tuple[str, ...] = metrics
+        self.constraints: tuple[CityConstraint, ...] = constraints
+        self.staffing_strategy: str = staffing_strategy
+        
+        self.base: City = City.from_buildings_count(campaign = campaign, name = name, buildings = space.base)
+        self.workers: int = City.MAX_WORKERS[self.base.hall.id]
+        self.specs: dict[str, BuildingSpec] = get_building_specs()
+        self.ranks: dict[str, int | None] = {
+            building_id: _get_staffing_rank(building_id = building_id, staffing_strategy = staffing_strategy)
+            for building_id in self.specs
+        }
+        
+        self.terms: tuple[_Term, ...] = tuple(dict.fromkeys(
+            term
+            for metric in (*metrics, *(constraint.metric for constraint in constraints))
+            for term in _get_metric_terms(metric = metric)
+        ))
+        self.values: dict[_Term, dict[str, int]] = {term: self._get_term_values(term = term) for term in self.terms}
+        
+        self.space: _CityConfigurationSpace = space
+        self.choices: tuple[_CityConfigurationChoice, ...] = tuple(
+            choice for choice in space.choices if not self._is_dominated(building_id = choice.building_id)
+        )
+        
+        # The choices with the highest (and lowest) values of each term, as (value, index) pairs.
+        self.highest: dict[_Term, list[tuple[int, int]]] = {}
+        self.lowest: dict[_Term, list[tuple[int, int]]] = {}
+        for term in self.terms:
+            values: list[tuple[int, int]] = [
+                (self.values[term][choice.building_id], index) for index, choice in enumerate(self.choices)
+            ]
+            self.highest[term] = sorted((item for item in values if item[0] > 0), key = lambda item: -item[0])
+            self.lowest[term] = sorted(item for item in values if item[0] < 0)
+        
+        self.evaluated: int = 0
+    
+    def _get_term_values(self, term: _Term) -> dict[str, int]:
+        # The value of the term for a building (or for a worker of it), by building ID.
+        
+        kind, field, key = term
+        
+        if kind == "squadrons":
+            return {building_id: _SQUADRONS_BY_FORT.get(building_id, 0) for building_id in self.specs}
+        
+        if field == "production":
+            # The same per-worker production as `City`, after the resource potentials.
+            potential: int = self.base.resource_potentials.get(key)
+            return {
+                building_id: floor(spec.productivity_per_worker.get(key) * potential / 100.0)
+                for building_id, spec in self.specs.items()
+            }
+        
+        return {building_id: getattr(spec, field).get(key) for building_id, spec in self.specs.items()}
+    
+    def _is_dominated(self, building_id: str) -> bool:
+        # A building that does not change any term is never needed: removing it from a configuration keeps it valid and
+        # keeps every metric. Buildings with workers change the staffing, so they only qualify if no term has workers.
+        
+        if self.specs[building_id].max_workers > 0 and any(kind == "workers" for kind, _field, _key in self.terms):
+            return False
+        
+        return all(self.values[term][building_id] == 0 for term in self.terms)
+    
+    
+    #* Bounds
+    def _bound_additions(self, ranked: list[tuple[int, int]], node: _SearchNode) -> int:
+        # The sum of the best values of buildings that can be added to the node, taking the best ones first.
+        
+        total: int = 0
+        building_spots: int = node.building_spots
+        empty_spots: int = node.empty_spots
+        has_guild: bool = node.has_guild
+        
+        for value, index in ranked:
+            
+            if building_spots <= 0:
+                break
+            
+            choice: _CityConfigurationChoice = self.choices[index]
+            
+            if index < node.start or (choice.is_guild and has_guild):
+                continue
+            
+            qty: int = min(
+                choice.allowed_count,
+                building_spots,
+                empty_spots if choice.takes_empty_spot else building_spots,
+            )
+            if choice.is_guild:
+                qty = min(qty, 1)
+            if qty <= 0:
+                continue
+            
+            total += value * qty
+            building_spots -= qty
+            if choice.takes_empty_spot:
+                empty_spots -= qty
+            has_guild = has_guild or choice.is_guild
+        
+        return total
+    
+    def _get_staffed_slots(self, node: _SearchNode) -> tuple[list[tuple[int, str, int]], list[tuple[int, str, int]]]:
+        # The (rank, ID, workers) slots of the staffed buildings of the node, in staffing order, and of as many
+        # buildings of each type as could be added to it. Added buildings come after the buildings of the node in the
+        # count, so they are staffed after the ones with the same rank.
+        
+        fixed: list[tuple[int, str, int]] = []
+        for building_id, count in node.counts.items():
+            rank: int | None = self.ranks[building_id]
+            if rank is not None and self.specs[building_id].max_workers > 0:
+                fixed.append((rank, building_id, count * self.specs[building_id].max_workers))
+        fixed.sort(key = itemgetter(0))  # Stable, so ties keep their order in the count.
+        
+        additions: list[tuple[int, str, int]] = []
+        if node.building_spots > 0:
+            for choice in self.choices[node.start:]:
+                rank = self.ranks[choice.building_id]
+                if rank is None or self.specs[choice.building_id].max_workers <= 0:
+                    continue
+                qty: int = min(
+                    choice.allowed_count,
+                    node.building_spots,
+                    node.empty_spots if choice.takes_empty_spot else node.building_spots,
+                )
+                additions.append((rank, choice.building_id, qty * self.specs[choice.building_id].max_workers))
+        
+        return fixed, additions
+    
+    def _bound_workers(self, values: dict[str, int], node: _SearchNode, sign: int) -> int:
+        # The best sum of `sign` times the values of the workers of the city. Each building of the node gets the workers
+        # it must get (see `_CitySearch`), and the other workers are assigned to the best slots left, without leaving
+        # unassigned the workers that the buildings of the node can take.
+        
+        fixed, additions = self._get_staffed_slots(node = node)
+        
+        total: int = 0
+        workers: int = self.workers
+        required_workers: int = min(self.workers, sum(qty for _rank, _building_id, qty in fixed))
+        slots: list[tuple[int, int]] = [(sign * values[building_id], qty) for _rank, building_id, qty in additions]
+        fixed_before: int = 0
+        
+        for rank, building_id, qty in fixed:
+            added_before: int = sum(added_qty for added_rank, _added_id, added_qty in additions if added_rank < rank)
+            lowest: int = min(qty, max(0, self.workers - fixed_before - added_before))
+            highest: int = min(qty, max(0, self.workers - fixed_before))
+            total += sign * values[building_id] * lowest
+            workers -= lowest
+            required_workers -= lowest
+            slots.append((sign * values[building_id], highest - lowest))
+            fixed_before += qty
+        
+        for value, qty in sorted(slots, reverse = True):
+            if workers <= 0 or (value <= 0 and required_workers <= 0):
+                break
+            assigned: int = min(qty, workers) if value > 0 else min(qty, workers, required_workers)
+            total += value * assigned
+            workers -= assigned
+            required_workers -= assigned
+        
+        return sign * total
+    
+    def _bound_term(self, term: _Term, node: _SearchNode) -> tuple[int, int]:
+        
+        values: dict[str, int] = self.values[term]
+        
+        if term == _SQUADRONS:
+            if self.base.is_fort:
+                return 3, 3
+            current: int = max([1, *(values[building_id] for building_id in node.counts)])
+            if node.building_spots <= 0:
+                return current, current
+            return current, max([current, *(values[choice.building_id] for choice in self.choices[node.start:])])
+        
+        if term[0] == "workers":
+            return (
+                self._bound_workers(values = values, node = node, sign = -1),
+                self._bound_workers(values = values, node = node, sign = 1),
+            )
+        
+        fixed: int = sum(values[building_id] * count for building_id, count in node.counts.items())
+        
+        return (
+            fixed + self._bound_additions(ranked = self.lowest[term], node = node),
+            fixed + self._bound_additions(ranked = self.highest[term], node = node),
+        )
+    
+    def _bound_metric(self, metric: str, bounds: dict[_Term, tuple[int, int]]) -> tuple[int, int]:
+        # The lowest and highest values of the metric in a branch, from the bounds of its terms.
+        
+        match metric.split("."):
+            case ["production", "total", key]:
+                lowest_base, highest_base = bounds["workers", "production", key]
+                lowest_bonus, highest_bonus = bounds["buildings", "productivity_bonuses", key]
+                # The same formula as `City`. It is bilinear, so its extremes are at the corners.
+                totals: list[int] = [
+                    floor(base * (1 + bonus / 100))
+                    for base in (lowest_base, highest_base)
+                    for bonus in (lowest_bonus, highest_bonus)
+                ]
+                return min(totals), max(totals)
+            case ["production", "balance", key]:
+                lowest_total, highest_total = self._bound_metric(metric = f"production.total.{key}", bounds = bounds)
+                lowest_costs, highest_costs = bounds["buildings", "maintenance_cost", key]
+                return lowest_total - highest_costs, highest_total - lowest_costs
+            case ["effects", "city", key]:
+                value: int = self.base.effects.city.get(key)
+                return value, value
+            case ["effects", "total", key]:
+                lowest_buildings, highest_buildings = bounds["buildings", "effect_bonuses", key]
+                lowest_workers, highest_workers = bounds["workers", "effect_bonuses_per_worker", key]
+                city_value: int = self.base.effects.city.get(key)
+                return city_value + lowest_buildings + lowest_workers, city_value + highest_buildings + highest_workers
+            case _:
+                return bounds[_get_metric_terms(metric = metric)[0]]
+    
+    def _is_promising(self, node: _SearchNode) -> bool:
+        # Whether some configuration of the branch could satisfy the constraints and improve the result.
+        
+        bounds: dict[_Term, tuple[int, int]] = {term: self._bound_term(term = term, node = node) for term in self.terms}
+        
+        for constraint in self.constraints:
+            if not constraint.allows(*self._bound_metric(metric = constraint.metric, bounds = bounds)):
+                return False
+        
+        return self._can_improve(bounds = bounds)
+    
+    @abstractmethod
+    def _can_improve(self, bounds: dict[_Term, tuple[int, int]]) -> bool:
+        """
+        Whether a branch could improve the result.
+        
+        Args:
+            bounds (dict[_Term, tuple[int, int]]): The lowest and highest values of the terms in the branch.
+        
+        Returns:
+            bool: False if no configuration of the branch can improve the result.
+        """
+    
+    @abstractmethod
+    def _record(self, buildings: BuildingsCount, city: City) -> None:
+        """
+        Keep a configuration that satisfies the constraints, if it improves the result.
+        
+        Args:
+            buildings (BuildingsCount): The count of buildings of the configuration.
+            city (City): The city built from it.
+        """
+    
+    
+    #* Search
+    def _evaluate(self, counts: BuildingsCount) -> None:
+        
+        city: City = City.from_buildings_count(
+            campaign = self.campaign,
+            name = self.name,
+            buildings = counts,
+            staffing_strategy = self.staffing_strategy,
+        )
+        self.evaluated += 1
+        
+        for constraint in self.constraints:
+            value: int = attrgetter(constraint.metric)(city)
+            if not constraint.allows(value, value):
+                return
+        
+        self._record(buildings = counts, city = city)
+    
+    def run(self) -> None:
+        """Search every configuration of the space."""
+        
+        self.search(
+            chosen = [],
+            start = 0,
+            building_spots = self.space.building_spots,
+            empty_spots = self.space.empty_spots,
+            has_guild = False,
+        )
+    
+    def search(
+            self,
+            chosen: list[tuple[str, int]],
+            start: int,
+            building_spots: int,
+            empty_spots: int,
+            has_guild: bool,
+        ) -> None:
+        """
+        Search the branch of the configurations that add some buildings of the types in `self.choices[start:]` (by
+        descending number of buildings) to the base of the space and the `chosen` buildings.
+        """
+        
+        counts: BuildingsCount = dict(self.space.base)
+        counts.update(chosen)
+        node: _SearchNode = _SearchNode(
+            counts = counts,
+            start = start,
+            building_spots = building_spots,
+            empty_spots = empty_spots,
+            has_guild = has_guild,
+        )
+        
+        if not self._is_promising(node = node):
+            return
+        
+        self._evaluate(counts = counts)
+        
+        if building_spots <= 0:
+            return
+        
+        for index in range(start, len(self.choices)):
+            
+            choice: _CityConfigurationChoice = self.choices[index]
+            
+            if choice.is_guild and has_guild:
+                continue
+            
+            max_qty: int = min(choice.allowed_count, building_spots)
+            if choice.takes_empty_spot:
+                max_qty = min(max_qty, empty_spots)
+            if choice.is_guild:
+                max_qty = min(max_qty, 1)
+            
+            for qty in range(max_qty, 0, -1):
+                chosen.append((choice.building_id, qty))
+                self.search(
+                    chosen = chosen,
+                    start = index + 1,
+                    building_spots = building_spots - qty,
+                    empty_spots = empty_spots - qty if choice.takes_empty_spot else empty_spots,
+                    has_guild = has_guild or choice.is_guild,
+                )
+                chosen.pop()
+
+
+class _OptimumSearch(_CitySearch):
+    """Keeps the best configuration for a single metric (see `optimize_city`)."""
+    
+    def __init__(
+            self,
+            campaign: str,
+            name: str,
+            space: _CityConfigurationSpace,
+            objective: str,
+            minimize: bool,
+            constraints: tuple[CityConstraint, ...],
+            staffing_strategy: str,
+        ) -> None:
+        
+        super().__init__(
+            campaign = campaign,
+            name = name,
+            space = space,
+            metrics = (objective,),
+            constraints = constraints,
+            staffing_strategy = staffing_strategy,
+        )
+        self.objective: str = objective
+        self.minimize: bool = minimize
+        self.best: CityOptimum | None = None
+    
+    def _can_improve(self, bounds: dict[_Term, tuple[int, int]]) -> bool:
+        
+        if self.best is None:
+            return True
+        
+        lowest, highest = self._bound_metric(metric = self.objective, bounds = bounds)
+        
+        if self.minimize:
+            return lowest < self.best.value
+        
+        return highest > self.best.value
+    
+    def _record(self, buildings: BuildingsCount, city: City) -> None:
+        
+        value: int = attrgetter(self.objective)(city)
+        
+        if self.best is not None and (value >= self.best.value if self.minimize else value <= self.best.value):
+            return
+        
+        self.best = CityOptimum(buildings = buildings, city = city, value = value, evaluated = 0)
+
+
+def _weakly_dominates(point: tuple[int, ...], other: tuple[int, ...]) -> bool:
+    # Whether `point` is at least as good as `other` in every metric. Points are oriented so that larger is better.
+    return all(value >= other_value for value, other_value in zip(point, other, strict = True))
+
+
+class _FrontierSearch(_CitySearch):
+    """Keeps the configurations whose metrics are not dominated by another configuration (see `find_city_frontier`)."""
+    
+    def __init__(
+            self,
+            campaign: str,
+            name: str,
+            space: _CityConfigurationSpace,
+            metrics: tuple[str, ...],
+            minimize: frozenset[str],
+            constraints: tuple[CityConstraint, ...],
+            staffing_strategy: str,
+        ) -> None:
+        
+        super().__init__(
+            campaign = campaign,
+            name = name,
+            space = space,
+            metrics = metrics,
+            constraints = constraints,
+            staffing_strategy = staffing_strategy,
+        )
+        self.signs: tuple[int, ...] = tuple(-1 if metric in minimize else 1 for metric in metrics)
+        
+        # The configurations of the frontier, as (point, buildings). The point has the values of the metrics, negated
+        # for the metrics that are minimized, so that larger is always better.
+        self.frontier: list[tuple[tuple[int, ...], BuildingsCount]] = []
+    
+    def _can_improve(self, bounds: dict[_Term, tuple[int, int]]) -> bool:
+        # The best point of the branch takes the best bound of every metric. If a configuration of the frontier is at
+        # least as good, every configuration of the branch is dominated by it (or has the same values).
+        
+        best_point: tuple[int, ...] = tuple(
+            highest if sign > 0 else -lowest
+            for sign, (lowest, highest) in zip(
+                self.signs,
+                (self._bound_metric(metric = metric, bounds = bounds) for metric in self.metrics),
+                strict = True,
+            )
+        )
+        
+        return not any(_weakly_dominates(point = point, other = best_point) for point, _buildings in self.frontier)
+    
+    def _record(self, buildings: BuildingsCount, city: City) -> None:
+        
+        new_point: tuple[int, ...] = tuple(
+            sign * attrgetter(metric)(city) for sign, metric in zip(self.signs, self.metrics, strict = True)
+        )
+        
+        if any(_weakly_dominates(point = point, other = new_point) for point, _buildings in self.frontier):
+            return
+        
+        self.frontier = [
+            (point, frontier_buildings)
+            for point, frontier_buildings in self.frontier
+            if not _weakly_dominates(point = new_point, other = point)
+        ]
+        self.frontier.append((new_point, buildings))
+
+
+def _find_unknown_metric(metrics: Iterable[str]) -> str | None:
+    
+    for metric in metrics:
+        if metric not in CITY_METRICS:
+            return metric
+    
+    return None
+
+
+def optimize_city(
+        campaign: str,
+        name: str,
+        objective: str,
+        constraints: Iterable[CityConstraint] = (),
+        hall_id: str = "city_hall",
+        minimize: bool = False,
+        staffing_strategy: str = "production_first",
+    ) -> CityOptimum | None:
+    """
+    Find the configuration of buildings of a city that maximizes (or minimizes) a metric, subject to constraints.
+    
+    The search is exact: the result is the best of all the configurations that `iter_city_configurations` yields for the
+    city and hall, but most of them are pruned without being evaluated (see the module docstring). When several
+    configurations are equally good, the first one found is returned. An unknown city or hall raises
+    `CityNotFoundError`.
+    
+    Args:
+        campaign (str): The campaign of the city.
+        name (str): The name of the city.
+        objective (str): The metric to optimize (see `CITY_METRICS`).
+        constraints (Iterable[CityConstraint]): The limits that the metrics of the city must respect. Defaults to no
+            limits.
+        hall_id (str): The ID of the hall of the city. Defaults to "city_hall".
+        minimize (bool): Whether to minimize the objective instead of maximizing it. Defaults to False.
+        staffing_strategy (str): The staffing strategy of the cities (see `City`). Defaults to "production_first".
+    
+    Returns:
+        CityOptimum | None: The best configuration, or None if no configuration satisfies the constraints.
+    
+    Raises:
+        ValueError: If the objective or a constraint uses an unknown metric.
+    """
+    
+    constraints = tuple(constraints)
+    unknown_metric: str | None = _find_unknown_metric(
+        metrics = (objective, *(constraint.metric for constraint in constraints)),
+    )
+    
+    if unknown_metric is not None:
+        raise ValueError(f"Unknown city metric \"{unknown_metric}\". Possible metrics: {", ".join(CITY_METRICS)}.")
+    
+    space: _CityConfigurationSpace | None = _get_city_configuration_space(
+        campaign = campaign,
+        name = name,
+        hall_id = hall_id,
+    )
+    
+    if space is None:
+        return None
+    
+    search: _OptimumSearch = _OptimumSearch(
+        campaign = campaign,
+        name = name,
+        space = space,
+        objective = objective,
+        minimize = minimize,
+        constraints = constraints,
+        staffing_strategy = staffing_strategy,
+    )
+    search.run()
+    
+    if search.best is None:
+        return None
+    
+    return replace(search.best, evaluated = search.evaluated)
+
+
+def find_city_frontier(
+        campaign: str,
+        name: str,
+        metrics: Iterable[str],
+        constraints: Iterable[CityConstraint] = (),
+        hall_id: str = "city_hall",
+        minimize: Iterable[str] = (),
+        staffing_strategy: str = "production_first",
+    ) -> CityFrontier:
+    """
+    Find the Pareto-optimal configurations of buildings of a city for some metrics, subject to constraints.
+    
+    The search is the same as in `optimize_city`, but it keeps every configuration that is not dominated by another one
+    found so far, and it skips a branch when a configuration of the frontier is at least as good as the bounds of the
+    branch in every metric. The frontier is therefore exact, and most configurations are never evaluated.
+    
+    The metrics and the constraints are validated first: an unknown metric also raises `ValueError`. An unknown city or
+    hall raises `CityNotFoundError`.
+    
+    Args:
+        campaign (str): The campaign of the city.
+        name (str): The name of the city.
+        metrics (Iterable[str]): The metrics to trade off (see `CITY_METRICS`). They are maximized, unless they are in
+            `minimize`.
+        constraints (Iterable[CityConstraint]): The limits that the metrics of the city must respect. Defaults to no
+            limits.
+        hall_id (str): The ID of the hall of the city. Defaults to "city_hall".
+        minimize (Iterable[str]): The metrics to minimize. Defaults to none.
+        staffing_strategy (str): The staffing strategy of the cities (see `City`). Defaults to "production_first".
+    
+    Returns:
+        CityFrontier: The frontier. It has no rows if no configuration satisfies the constraints.
+    
+    Raises:
+        ValueError: If a metric or a constraint uses an unknown metric, if there are no metrics, or if a metric to
+            minimize is not one of them.
+    """
+    
+    metrics = tuple(metrics)
+    minimize = frozenset(minimize)
+    constraints = tuple(constraints)
+    unknown_metric: str | None = _find_unknown_metric(
+        metrics = (*metrics, *(constraint.metric for constraint in constraints)),
+    )
+    
+    if unknown_metric is not None:
+        raise ValueError(f"Unknown city metric \"{unknown_metric}\". Possible metrics: {", ".join(CITY_METRICS)}.")
+    
+    if not metrics:
+        raise ValueError("At least one metric is needed.")
+    
+    if not minimize <= set(metrics):
+        raise ValueError(f"Only the metrics of the frontier can be minimized. Found {", ".join(sorted(minimize))}.")
+    
+    space: _CityConfigurationSpace | None = _get_city_configuration_space(
+        campaign = campaign,
+        name = name,
+        hall_id = hall_id,
+    )
+    
+    if space is None:
+        return CityFrontier(
+            campaign = campaign,
+            name = name,
+            staffing_strategy = staffing_strategy,
+            metrics = metrics,
+            buildings = (),
+            values = (),
+            evaluated = 0,
+        )
+    
+    search: _FrontierSearch = _FrontierSearch(
+        campaign = campaign,
+        name = name,
+        space = space,
+        metrics = metrics,
+        minimize = minimize,
+        constraints = constraints,
+        staffing_strategy = staffing_strategy,
+    )
+    search.run()
+    
+    frontier: list[tuple[tuple[int, ...], BuildingsCount]] = sorted(
+        search.frontier,
+        key = lambda item: item[0],
+        reverse = True,
+    )
+    
+    return CityFrontier(
+        campaign = search.base.campaign,
+        name = search.base.name,
+        staffing_strategy = staffing_strategy,
+        metrics = metrics,
+        buildings = tuple(buildings for _point, buildings in frontier),
+        values = tuple(
+            tuple(sign * value for sign, value in zip(search.signs, point, strict = True))
+            for point, _buildings in frontier
+        ),
+        evaluated = search.evaluated,
+    )
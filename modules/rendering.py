@@ -0,0 +1,1307 @@
+"""
+Module for rendering buildings, cities, kingdoms, and scenarios to the terminal using the Rich library.
+
+All Rich-dependent code of the package lives in this module. The calculation modules (`building`, `city`, `kingdom`,
+and `scenario`) only import it when something is actually displayed, so they can be imported and used for calculations
+without loading Rich.
+
+Internal objects (not part of the public API):
+- _BuildingDisplay: Display functionality for a `Building`.
+- _CityDisplay: Display functionality for a `City`.
+- _KingdomDisplay: Display functionality for a `Kingdom`.
+- _ScenarioDisplay: Display functionality for a `Scenario`.
+
+End-users should not use these classes directly. Use the `display_*` methods of the corresponding objects instead.
+"""
+
+from __future__ import annotations
+
+from math import ceil
+from typing import TYPE_CHECKING
+
+from rich import box
+from rich.align import Align
+from rich.console import Console
+from rich.layout import Layout
+from rich.panel import Panel
+from rich.style import Style
+from rich.table import Table
+from rich.text import Text
+
+from .display import DEFAULT_SECTION_COLORS, DisplaySection, calculate_indentations
+from .resources import Resource
+
+
+if TYPE_CHECKING:
+    from .building import Building
+    from .city import City
+    from .display import DisplayConfiguration, DisplaySectionConfiguration
+    from .effects import EffectBonuses, FrozenEffectBonuses
+    from .kingdom import Kingdom
+    from .resources import FrozenResourceCollection, ResourceCollection
+    from .scenario import Scenario
+
+
+__all__: list[str] = []
+
+
+# * **************** * #
+# * BUILDING DISPLAY * #
+# * **************** * #
+
+class _BuildingDisplay:
+    """
+    Handles the rendering and display of a `Building` object in the terminal using the Rich library.
+    
+    Public API:
+        build_building_display() -> Panel
+            Constructs a Rich Panel with the building's information.
+        display_building() -> None
+            Prints the building display to the console.
+    """
+    
+    def __init__(self, building: Building) -> None:
+        self.building: Building = building
+    
+    
+    #* Formatters
+    @staticmethod
+    def _format_building(text: str) -> str:
+        return (
+            f"[italic bold bright_cyan]Building[/italic bold bright_cyan]("
+            f"[italic dim]id = [/italic dim][yellow]\"{text}\"[/yellow])"
+        )
+    
+    @staticmethod
+    def _format_string(text: str) -> str:
+        return f"[yellow]{text}[/yellow]"
+    
+    @staticmethod
+    def _format_rss(text: str) -> str:
+        return f"[italic bold bright_cyan]Resource[/italic bold bright_cyan].{text}"
+    
+    @staticmethod
+    def _format_geo(text: str) -> str:
+        return f"[italic bold bright_cyan]GeoFeature[/italic bold bright_cyan].{text}"
+    
+    @staticmethod
+    def _format_resource_collection(collection: ResourceCollection | FrozenResourceCollection) -> str:
+        return (
+            f"[italic bold bright_cyan]ResourceCollection[/italic bold bright_cyan]("
+            f"[italic dim]food = [/italic dim]{collection.food}, "
+            f"[italic dim]ore = [/italic dim]{collection.ore}, "
+            f"[italic dim]wood = [/italic dim]{collection.wood}"
+            f")"
+        )
+    
+    @staticmethod
+    def _format_effect_bonuses(bonuses: EffectBonuses | FrozenEffectBonuses) -> str:
+        return (
+            f"[italic bold bright_cyan]EffectBonuses[/italic bold bright_cyan]("
+            f"[italic dim]troop_training = [/italic dim]{bonuses.troop_training}, "
+            f"[italic dim]population_growth = [/italic dim]{bonuses.population_growth}, "
+            f"[italic dim]intelligence = [/italic dim]{bonuses.intelligence}"
+            f")"
+        )
+    
+    @staticmethod
+    def _format_scalar(scalar: float | bool) -> str:
+        return f"[dark_magenta]{scalar}[/dark_magenta]"
+    
+    @staticmethod
+    def _format_none() -> str:
+        return f"[italic dim dark_magenta]None[/italic dim dark_magenta]"
+    
+    
+    #* Display building
+    def _building_information(self) -> Text:
+        text: Text = Text(
+            text = f" Building(id = \"{self.building.id}\") ",
+            style = "bold black on white",
+            justify = "center",
+        )
+        return text
+    
+    def _building_name(self) -> str:
+        return f"[bold]Name:[/bold] {_BuildingDisplay._format_string(text = self.building.name)}"
+    
+    def _building_building_costs(self) -> str:
+        return (
+            f"[bold]Building costs:[/bold] "
+            f"{_BuildingDisplay._format_resource_collection(collection = self.building.building_cost)}"
+        )
+    
+    def _building_maintenance_costs(self) -> str:
+        return (
+            f"[bold]Maintenance costs:[/bold] "
+            f"{_BuildingDisplay._format_resource_collection(collection = self.building.maintenance_cost)}"
+        )
+    
+    def _building_productivity_bonuses(self) -> str:
+        return (
+            f"[bold]Productivity bonuses:[/bold] "
+            f"{_BuildingDisplay._format_resource_collection(collection = self.building.productivity_bonuses)}"
+        )
+    
+    def _building_productivity_per_worker(self) -> str:
+        return (
+            f"[bold]Productivity per worker:[/bold] "
+            f"{_BuildingDisplay._format_resource_collection(collection = self.building.productivity_per_worker)}"
+        )
+    
+    def _building_effect_bonuses(self) -> str:
+        return (
+            f"[bold]Effect bonuses:[/bold] "
+            f"{_BuildingDisplay._format_effect_bonuses(self.building.effect_bonuses)}"
+        )
+    
+    def _building_effect_bonuses_per_worker(self) -> str:
+        return (
+            f"[bold]Effect bonuses per worker:[/bold] "
+            f"{_BuildingDisplay._format_effect_bonuses(self.building.effect_bonuses_per_worker)}"
+        )
+    
+    def _building_storage_capacity(self) -> str:
+        return (
+            f"[bold]Storage capacity:[/bold] "
+            f"{_BuildingDisplay._format_resource_collection(collection = self.building.storage_capacity)}"
+        )
+    
+    def _building_max_workers(self) -> str:
+        return f"[bold]Max. workers:[/bold] {_BuildingDisplay._format_scalar(scalar = self.building.max_workers)}"
+    
+    def _building_current_workers(self) -> str:
+        return f"[bold]Current workers:[/bold] {_BuildingDisplay._format_scalar(scalar = self.building.workers)}"
+    
+    def _building_is_buildable(self) -> str:
+        return f"[bold]Is buildable:[/bold] {_BuildingDisplay._format_scalar(scalar = self.building.is_buildable)}"
+    
+    def _building_is_deletable(self) -> str:
+        return f"[bold]Is deletable:[/bold] {_BuildingDisplay._format_scalar(scalar = self.building.is_deletable)}"
+    
+    def _building_is_upgradeable(self) -> str:
+        return f"[bold]Is upgradeable:[/bold] {_BuildingDisplay._format_scalar(scalar = self.building.is_upgradeable)}"
+    
+    def _building_required_geo(self) -> str:
+        text: str = f"[bold]Required geo. feature:[/bold] "
+        
+        if self.building.required_geo:
+            text += f"{_BuildingDisplay._format_geo(text = self.building.required_geo.name)}"
+        else:
+            text += _BuildingDisplay._format_none()
+        
+        return text
+    
+    def _building_required_rss(self) -> str:
+        text: str = f"[bold]Required resource:[/bold] "
+        
+        if len(self.building.required_rss) == 0:
+            return text + _BuildingDisplay._format_none()
+        
+        lines: list[str] = []
+        
+        for idx, rss in enumerate(self.building.required_rss):
+            transformed: str = _BuildingDisplay._format_rss(text = rss.name)
+            line: str = transformed if idx == 0 else f"[italic dim]AND[/italic dim] {transformed}"
+            lines.append(line)
+        
+        text += " ".join(lines)
+        
+        return text
+    
+    def _building_required_hall(self) -> str:
+        text: str = f"[bold]Required hall:[/bold] "
+        
+        if self.building.required_hall:
+            text += f"{_BuildingDisplay._format_building(text = self.building.required_hall)}"
+        else:
+            text += _BuildingDisplay._format_none()
+        return text
+    
+    def _building_required_building(self) -> str:
+        text: str = f"[bold]Required building:[/bold] "
+        
+        if len(self.building.required_building) == 0:
+            return text + _BuildingDisplay._format_none()
+        
+        lines: list[str] = []
+        
+        for index, building in enumerate(self.building.required_building):
+            formatted: str = _BuildingDisplay._format_building(text = building)
+            conjunction: str = "" if index == 0 else "                [italic dim]OR[/italic dim] "
+            line: str = conjunction + formatted
+            lines.append(line)
+        
+        text += "\n".join(lines)
+        
+        return text
+    
+    def _building_blocked_by_building(self) -> str:
+        text: str = f"[bold]Blocked by building:[/bold] "
+        
+        if len(self.building.blocked_by_building) == 0:
+            return text + _BuildingDisplay._format_none()
+        
+        lines: list[str] = []
+        
+        for index, building in enumerate(self.building.blocked_by_building):
+            formatted: str = _BuildingDisplay._format_building(text = building)
+            conjunction: str = "" if index == 0 else " [italic dim]OR[/italic dim] "
+            line: str = conjunction + formatted
+            lines.append(line)
+        
+        text += "".join(lines)
+        
+        return text
+    
+    def _building_replaces(self) -> str:
+        text: str = f"[bold]Replaces:[/bold] "
+        if self.building.replaces:
+            return text + _BuildingDisplay._format_building(text = self.building.replaces)
+        return text + _BuildingDisplay._format_none()
+    
+    def _build_building_display(self) -> Panel:
+        #* Heights
+        padding: int = 2
+        title_height: int = 2
+        
+        required_building_height: int = max(len(self.building.required_building), 1)
+        number_of_other_properties_to_print: int = 18
+        main_height: int = number_of_other_properties_to_print + required_building_height
+        
+        total_height: int = title_height + main_height
+        
+        #* Layout building
+        layout: Layout = Layout()
+        
+        layout.split(
+            Layout(
+                name = "header",
+                size = title_height,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "main",
+                size = main_height,
+                ratio = 0,
+                visible = True,
+            ),
+        )
+        
+        layout["header"].update(
+            renderable = Align(renderable = self._building_information(), align = "center"),
+        )
+        
+        layout["main"].split(
+            Layout(
+                name = "building_name",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "building_costs",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "maintenance_cost",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "productivity_bonuses",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "productivity_per_worker",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "effect_bonuses",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "effect_bonuses_per_worker",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "storage_capacity",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "max_workers",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "current_workers",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "is_buildable",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "is_deletable",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "is_upgradeable",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "required_geo",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "required_rss",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "required_hall",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "required_building",
+                size = required_building_height,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "blocked_by_building",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+            Layout(
+                name = "replaces",
+                size = 1,
+                ratio = 0,
+                visible = True,
+            ),
+        )
+        
+        layout["building_name"].update(
+            renderable = Align(renderable = self._building_name(), align = "left"),
+        )
+        
+        layout["building_costs"].update(
+            renderable = Align(renderable = self._building_building_costs(), align = "left"),
+        )
+        
+        layout["maintenance_cost"].update(
+            renderable = Align(renderable = self._building_maintenance_costs(), align = "left"),
+        )
+        
+        layout["productivity_bonuses"].update(
+            renderable = Align(renderable = self._building_productivity_bonuses(), align = "left"),
+        )
+        
+        layout["productivity_per_worker"].update(
+            renderable = Align(renderable = self._building_productivity_per_worker(), align = "left"),
+        )
+        
+        layout["effect_bonuses"].update(
+            renderable = Align(renderable = self._building_effect_bonuses(), align = "left"),
+        )
+        
+        layout["effect_bonuses_per_worker"].update(
+            renderable = Align(renderable = self._building_effect_bonuses_per_worker(), align = "left"),
+        )
+        
+        layout["storage_capacity"].update(
+            renderable = Align(renderable = self._building_storage_capacity(), align = "left"),
+        )
+        
+        layout["max_workers"].update(
+            renderable = Align(renderable = self._building_max_workers(), align = "left"),
+        )
+        
+        layout["current_workers"].update(
+            renderable = Align(renderable = self._building_current_workers(), align = "left"),
+        )
+        
+        layout["is_buildable"].update(
+            renderable = Align(renderable = self._building_is_buildable(), align = "left"),
+        )
+        
+        layout["is_deletable"].update(
+            renderable = Align(renderable = self._building_is_deletable(), align = "left"),
+        )
+        
+        layout["is_upgradeable"].update(
+            renderable = Align(renderable = self._building_is_upgradeable(), align = "left"),
+        )
+        
+        layout["required_geo"].update(
+            renderable = Align(renderable = self._building_required_geo(), align = "left"),
+        )
+        
+        layout["required_rss"].update(
+            renderable = Align(renderable = self._building_required_rss(), align = "left"),
+        )
+        
+        layout["required_hall"].update(
+            renderable = Align(renderable = self._building_required_hall(), align = "left"),
+        )
+        
+        layout["required_building"].update(
+            renderable = Align(renderable = self._building_required_building(), align = "left"),
+        )
+        
+        layout["blocked_by_building"].update(
+            renderable = Align(renderable = self._building_blocked_by_building(), align = "left"),
+        )
+        
+        layout["replaces"].update(
+            renderable = Align(renderable = self._building_replaces(), align = "left"),
+        )
+        
+        return Panel(
+            renderable = layout,
+            height = total_height + padding,
+            width = 105,
+        )
+    
+    def build_building_display(self) -> Panel:
+        """
+        Constructs a Rich Panel with the building's information and current state.
+        
+        Returns:
+            Panel: A `rich.panel.Panel` object ready for printing.
+        """
+        
+        return self._build_building_display()
+    
+    def display_building(self) -> None:
+        """
+        Render the building's information and current state to the console using the Rich library.
+        """
+        
+        console: Console = Console()
+        console.print(self._build_building_display())
+
+
+# * ************ * #
+# * CITY DISPLAY * #
+# * ************ * #
+
+class _CityDisplay:
+    """
+    Handles the rendering and display of a `City` object in a structured, styled terminal layout using the Rich library.
+    
+    Each `_CityDisplay` instance takes a `City` object and an optional `DisplayConfiguration` that allows
+    customizing which sections are shown, their heights, and colors.
+    
+    Sections displayed:
+        
+        - City information (campaign and name)
+        - Buildings list
+        - Effect bonuses (city, buildings, workers, total)
+        - Production (resource potentials, base production, bonuses, total, maintenance, balance)
+        - Storage capacity (city, buildings, warehouse, supply dump, total)
+        - Defenses (garrison, number of squadrons, squadron size)
+    
+    Public API:
+        build_city_display() -> Panel
+            Constructs a Rich Panel representing the city display layout.
+        display_city() -> None
+            Prints the city display to the console.
+    """
+    
+    def __init__(
+            self,
+            city: City,
+            configuration: DisplayConfiguration | None = None,
+        ) -> None:
+        
+        self.city: City = city
+        self._user_configuration: DisplayConfiguration = configuration or {}
+        self.configuration: DisplayConfiguration = self._build_configuration()
+    
+    #* Display configuration
+    def _build_default_configuration(self) -> DisplayConfiguration:
+        
+        sections: list[str] = [
+            "city",
+            "buildings",
+            "effects",
+            "production",
+            "storage",
+            "defenses",
+        ]
+        
+        default_configuration: DisplayConfiguration = {}
+        for section in sections:
+            default_configuration[section] = {
+                "include": True,
+                "height": self._calculate_default_section_height(section = section),
+                "color": DEFAULT_SECTION_COLORS.get(section, "white"),
+            }
+        
+        return default_configuration
+    
+    def _calculate_default_section_height(self, section: str) -> int:
+        
+        match section:
+            case "city":
+                return 2
+            case "buildings":
+                return len(self.city.get_buildings_count(by = "id")) + 2
+            case "effects":
+                return 8
+            case "production":
+                return 8
+            case "storage":
+                return 8
+            case "defenses":
+                return 6
+        
+        return 0
+    
+    def _build_configuration(self) -> DisplayConfiguration:
+        
+        display_configuration: DisplayConfiguration = self._build_default_configuration()
+        
+        for section in display_configuration:
+            section_config: DisplaySectionConfiguration = display_configuration[section]
+            if section in self._user_configuration:
+                display_configuration[section] = {**section_config, **self._user_configuration[section]}
+        
+        return display_configuration
+    
+    
+    #* Display results
+    def _build_city_information(self) -> Text:
+        
+        fort: str = f" (Fort)" if self.city.is_fort else ""
+        
+        city_information: Text = Text(
+            text = f" {self.city.campaign} --- {self.city.name}{fort} ",
+            style = "bold black on white",
+            justify = "center",
+        )
+        
+        return city_information
+    
+    def _build_city_buildings_list(self) -> Table:
+        
+        city_buildings_text: Text = Text()
+        
+        for building, qty in self.city.get_buildings_count(by = "name").items():
+            city_buildings_text.append(text = f"  - {building} ({qty})\n")
+        
+        city_buildings_table: Table = Table(title = "Buildings", show_header = False, box = None, padding = (0, 1))
+        city_buildings_table.add_column()
+        city_buildings_table.add_row()
+        city_buildings_table.add_row(city_buildings_text)
+        
+        return city_buildings_table
+    
+    def _build_city_effects_table(self) -> Table:
+        
+        table_style: Style = Style(color = self.configuration.get("effects", {}).get("color", "#5f5fff"))
+        
+        table: Table = Table(
+            title = Text(text = "Effects", style = table_style + Style(italic = True)),
+            style = table_style,
+            box = box.HEAVY,
+        )
+        
+        table.add_column(header = "Effect", header_style = "bold", justify = "center")
+        table.add_column(header = "City", header_style = "bold", justify = "right")
+        table.add_column(header = "Buildings", header_style = "bold", justify = "right")
+        table.add_column(header = "Workers", header_style = "bold", justify = "right")
+        table.add_column(header = "Total", header_style = "bold", justify = "right")
+        
+        table.add_row(
+            "Troop training",
+            f"{self.city.effects.city.troop_training}",
+            f"{self.city.effects.buildings.troop_training}",
+            f"{self.city.effects.workers.troop_training}",
+            Text(text = f"{self.city.effects.total.troop_training}", style = table_style + Style(bold = True)),
+        )
+        table.add_row(
+            "Pop. growth",
+            f"{self.city.effects.city.population_growth}",
+            f"{self.city.effects.buildings.population_growth}",
+            f"{self.city.effects.workers.population_growth}",
+            Text(text = f"{self.city.effects.total.population_growth}", style = table_style + Style(bold = True)),
+        )
+        table.add_row(
+            "Intelligence",
+            f"{self.city.effects.city.intelligence}",
+            f"{self.city.effects.buildings.intelligence}",
+            f"{self.city.effects.workers.intelligence}",
+            Text(text = f"{self.city.effects.total.intelligence}", style = table_style + Style(bold = True)),
+        )
+        
+        return table
+    
+    def _build_city_production_table(self) -> Table:
+        
+        table_style: Style = Style(color = self.configuration.get("production", {}).get("color", "#228b22"))
+        
+        table: Table = Table(
+            title = Text(text = "Production", style = table_style + Style(italic = True)),
+            style = table_style,
+            box = box.HEAVY,
+        )
+        
+        table.add_column(header = "Resource", header_style = "bold", justify = "left")
+        table.add_column(header = "Rss. pot.", header_style = "bold", justify = "right")
+        table.add_column(header = "Base prod.", header_style = "bold", justify = "right")
+        table.add_column(header = "Prod. bonus", header_style = "bold", justify = "right")
+        table.add_column(header = "Total prod", header_style = "bold", justify = "right")
+        table.add_column(header = "Maintenance", header_style = "bold", justify = "right")
+        table.add_column(header = "Balance", header_style = "bold", justify = "right")
+        
+        table.add_row(
+            f"Food",
+            f"{self.city.resource_potentials.food}",
+            f"{self.city.production.base.food}",
+            f"{self.city.production.productivity_bonuses.food}",
+            f"{self.city.production.total.food}",
+            f"{-1 * self.city.production.maintenance_costs.food}",
+            Text(text = f"{self.city.production.balance.food}", style = table_style + Style(bold = True)),
+        )
+        table.add_row(
+            f"Ore",
+            f"{self.city.resource_potentials.ore}",
+            f"{self.city.production.base.ore}",
+            f"{self.city.production.productivity_bonuses.ore}",
+            f"{self.city.production.total.ore}",
+            f"{-1 * self.city.production.maintenance_costs.ore}",
+            Text(text = f"{self.city.production.balance.ore}", style = table_style + Style(bold = True)),
+        )
+        table.add_row(
+            f"Wood",
+            f"{self.city.resource_potentials.wood}",
+            f"{self.city.production.base.wood}",
+            f"{self.city.production.productivity_bonuses.wood}",
+            f"{self.city.production.total.wood}",
+            f"{-1 * self.city.production.maintenance_costs.wood}",
+            Text(text = f"{self.city.production.balance.wood}", style = table_style + Style(bold = True)),
+        )
+        
+        return table
+    
+    def _build_city_storage_table(self) -> Table:
+        
+        table_style: Style = Style(color = self.configuration.get("storage", {}).get("color", "purple"))
+        
+        table: Table = Table(
+            title = Text(text = "Storage capacity", style = table_style + Style(italic = True)),
+            style = table_style,
+            box = box.HEAVY,
+        )
+        
+        table.add_column(header = "Resource", header_style = "bold", justify = "left")
+        table.add_column(header = "City", header_style = "bold", justify = "right")
+        table.add_column(header = "Buildings", header_style = "bold", justify = "right")
+        table.add_column(header = "Warehouse", header_style = "bold", justify = "right")
+        table.add_column(header = "Supply dump", header_style = "bold", justify = "right")
+        table.add_column(header = "Total", header_style = "bold", justify = "right")
+        
+        table.add_row(
+            "Food",
+            f"{self.city.storage.city.food}",
+            f"{self.city.storage.buildings.food}",
+            f"{self.city.storage.warehouse.food}",
+            f"{self.city.storage.supply_dump.food}",
+            Text(text = f"{self.city.storage.total.food}", style = table_style + Style(bold = True)),
+        )
+        table.add_row(
+            "Ore",
+            f"{self.city.storage.city.ore}",
+            f"{self.city.storage.buildings.ore}",
+            f"{self.city.storage.warehouse.ore}",
+            f"{self.city.storage.supply_dump.ore}",
+            Text(text = f"{self.city.storage.total.ore}", style = table_style + Style(bold = True)),
+        )
+        table.add_row(
+            "Wood",
+            f"{self.city.storage.city.wood}",
+            f"{self.city.storage.buildings.wood}",
+            f"{self.city.storage.warehouse.wood}",
+            f"{self.city.storage.supply_dump.wood}",
+            Text(text = f"{self.city.storage.total.wood}", style = table_style + Style(bold = True)),
+        )
+        
+        return table
+    
+    def _build_defenses_table(self) -> Table:
+        
+        table_style: Style = Style(color = self.configuration.get("defenses", {}).get("color", "red"))
+        table: Table = Table(
+            title = Text(text = "Defenses", style = table_style + Style(italic = True)),
+            style = table_style,
+            box = box.HEAVY,
+        )
+        
+        table.add_column(header = "Garrison", header_style = "bold", justify = "center")
+        table.add_column(header = "Squadrons", header_style = "bold", justify = "center")
+        table.add_column(header = "Squadron size", header_style = "bold", justify = "center")
+        
+        table.add_row(
+            f"{self.city.defenses.garrison}",
+            f"{self.city.defenses.squadrons}",
+            f"{self.city.defenses.squadron_size}",
+        )
+        
+        return table
+    
+    def build_city_display(self) -> Panel:
+        """
+        Constructs a Rich Panel representing the city display layout.
+        
+        This method assembles the various display components (tables, lists, etc.) into a single Rich Panel object,
+        which can then be rendered.
+        
+        Returns:
+            Panel: A `rich.panel.Panel` object ready for printing.
+        """
+        # Expected Layout
+        # |---------------------------|
+        # |      Campaign - City      |
+        # |- - - - - - - - - - - - - -|
+        # | List  |   Effects table   |
+        # | of                        |
+        # | build |                   |
+        # | ings                      |
+        # |- - - - - - - - - - - - - -|
+        # |     Production table      |
+        # |- - - - - - - - - - - - - -|
+        # |  Storage capacity table   |
+        # |- - - - - - - - - - - - - -|
+        # |      Defenses table       |
+        # |---------------------------|
+        
+        #* Include booleans
+        include_city: bool = self.configuration.get("city", {}).get("include", True)
+        include_buildings: bool = self.configuration.get("buildings", {}).get("include", True)
+        include_effects: bool = self.configuration.get("effects", {}).get("include", True)
+        include_production: bool = self.configuration.get("production", {}).get("include", True)
+        include_storage: bool = self.configuration.get("storage", {}).get("include", True)
+        include_defenses: bool = self.configuration.get("defenses", {}).get("include", True)
+        
+        #* Heights
+        city_height: int = self.configuration.get("city", {}).get("height", 0) if include_city else 0
+        buildings_height: int = self.configuration.get("buildings", {}).get("height", 0) if include_buildings else 0
+        effects_height: int = self.configuration.get("effects", {}).get("height", 0) if include_effects else 0
+        production_height: int = self.configuration.get("production", {}).get("height", 0) if include_production else 0
+        storage_height: int = self.configuration.get("storage", {}).get("height", 0) if include_storage else 0
+        defenses_height: int = self.configuration.get("defenses", {}).get("height", 0) if include_defenses else 0
+        
+        buildings_and_effects_height: int = max(buildings_height, effects_height)
+        main_height: int = buildings_and_effects_height + production_height + storage_height + defenses_height
+        
+        total_layout_height: int = city_height + main_height + 2
+        total_layout_width: int = 92
+        
+        #* Layout
+        layout: Layout = Layout()
+        
+        layout.split(
+            Layout(
+                name = "header",
+                size = city_height,
+                ratio = 0,
+                visible = include_city,
+            ),
+            Layout(
+                name = "main",
+                size = main_height,
+                ratio = 0,
+                visible = any([
+                    include_buildings,
+                    include_effects,
+                    include_production,
+                    include_storage,
+                    include_defenses,
+                ]),
+            ),
+        )
+        
+        layout["header"].update(
+            renderable = Align(renderable = self._build_city_information(), align = "center"),
+        )
+        
+        layout["main"].split(
+            Layout(
+                name = "buildings_and_effects",
+                size = buildings_and_effects_height,
+                ratio = 0,
+                visible = any([include_buildings, include_effects]),
+            ),
+            Layout(
+                name = "production",
+                size = production_height,
+                ratio = 0,
+                visible = include_production,
+            ),
+            Layout(
+                name = "storage_capacity",
+                size = storage_height,
+                ratio = 0,
+                visible = include_storage,
+            ),
+            Layout(
+                name = "defenses",
+                size = defenses_height,
+                ratio = 0,
+                visible = include_defenses,
+            ),
+        )
+        
+        layout["buildings_and_effects"].split_row(
+            Layout(name = "buildings", ratio = 1),
+            Layout(name = "effects", ratio = 2),
+        )
+        
+        if include_buildings:
+            layout["buildings"].update(
+                renderable = Align(renderable = self._build_city_buildings_list(), align = "center"),
+            )
+        else:
+            layout["buildings"].update(
+                renderable = Align(renderable = "", align = "center"),
+            )
+        
+        if include_effects:
+            layout["effects"].update(
+                renderable = Align(renderable = self._build_city_effects_table(), align = "center"),
+            )
+        else:
+            layout["effects"].update(
+                renderable = Align(renderable = "", align = "center"),
+            )
+        
+        layout["production"].update(
+            renderable = Align(renderable = self._build_city_production_table(), align = "center"),
+        )
+        
+        layout["storage_capacity"].update(
+            renderable = Align(renderable = self._build_city_storage_table(), align = "center"),
+        )
+        
+        layout["defenses"].update(
+            renderable = Align(renderable = self._build_defenses_table(), align = "center"),
+        )
+        
+        return Panel(
+            renderable = layout,
+            width = total_layout_width,
+            height = total_layout_height,
+        )
+    
+    def display_city(self) -> None:
+        """
+        Prints the city display to the console.
+        
+        This method uses the `build_city_display` method to create the panel and then prints it to the terminal via a
+        `rich.console.Console` instance.
+        """
+        
+        console: Console = Console()
+        console.print(self.build_city_display())
+
+
+# * *************** * #
+# * KINGDOM DISPLAY * #
+# * *************** * #
+
+class _KingdomDisplay:
+    """
+    Handles the rendering and display of a `Kingdom` object in the terminal using the Rich library.
+    
+    Public API:
+        build_kingdom_display() -> Panel
+            Constructs a Rich Panel with the campaign, production, and storage tables of the kingdom.
+        display_kingdom() -> None
+            Prints the kingdom display to the console.
+    """
+    
+    def __init__(self, kingdom: Kingdom) -> None:
+        self.kingdom: Kingdom = kingdom
+    
+    def _build_kingdom_information(self) -> Text:
+        
+        city_information: Text = Text(
+            text = f" {self.kingdom.campaign} ",
+            style = "bold black on white",
+            justify = "center",
+        )
+        return city_information
+    
+    def _build_campaign_table(self) -> Table:
+        
+        percentage_conquered: float = round(
+            number = len(self.kingdom.cities) / self.kingdom.number_of_cities_in_campaign * 100,
+            ndigits = 2,
+        )
+        
+        table_style: Style = Style(color = "cyan")
+        table: Table = Table(
+            title = Text(text = "Campaign", style = table_style + Style(italic = True)),
+            style = table_style,
+            box = box.HEAVY,
+        )
+        
+        table.add_column(header = "Total cities", header_style = "bold", justify = "center")
+        table.add_column(header = "Player cities", header_style = "bold", justify = "center")
+        
+        table.add_row(
+            f"{self.kingdom.number_of_cities_in_campaign}",
+            f"{len(self.kingdom.cities)} [dim]({percentage_conquered}%)[/dim]",
+        )
+        
+        return table
+    
+    def _build_kingdom_production_table(self) -> Table:
+        
+        production_color: str = "#228b22"
+        table_style: Style = Style(color = production_color)
+        
+        table: Table = Table(
+            title = Text(text = "Production", style = table_style + Style(italic = True)),
+            style = table_style,
+            box = box.HEAVY,
+        )
+        
+        city_column_header: str = "City"
+        city_name_lengths: list[int] = [len(city.name) for city in self.kingdom.cities]
+        max_city_name_length: int = max(city_name_lengths)
+        cell_length: int = max_city_name_length - len(city_column_header)
+        left_side_justification: int = cell_length // 2
+        
+        table.add_column(header = f"{" " * left_side_justification}{city_column_header}", header_style = "bold")
+        table.add_column(header = f"{" " * 3}Food", header_style = "bold", justify = "left")
+        table.add_column(header = f"{" " * 3}Ore", header_style = "bold", justify = "left")
+        table.add_column(header = f"{" " * 3}Wood", header_style = "bold", justify = "left")
+        
+        for city in self.kingdom.cities:
+            
+            row_elements: list[str] = [f"{city.name}"]
+            
+            for rss in ["food", "ore", "wood"]:
+                
+                rss_potential: int = city.resource_potentials.get(key = rss)
+                indentation_rss_potential: int = calculate_indentations(cell_value = rss_potential, width = 3)
+                rss_potential_cell_value: str = f"{" " * indentation_rss_potential}[dim]({rss_potential})[/dim]"
+                
+                rss_balance: int = city.production.balance.get(key = rss)
+                rss_balance_indentation: int = calculate_indentations(cell_value = rss_balance, width = 3)
+                rss_balance_color: str = production_color if Resource(value = rss) == city.focus else "white"
+                rss_balance_cell_value: str = (
+                    f"{" " * (rss_balance_indentation)}"
+                    f"[{rss_balance_color}]"
+                    f"{rss_balance:_}"
+                    f"[/{rss_balance_color}]"
+                )
+                
+                row_element: str = f"{rss_potential_cell_value}{" " * 2}{rss_balance_cell_value}"
+                row_elements.append(row_element)
+            
+            table.add_row(*row_elements)
+        
+        table.add_section()
+        
+        i_t_food: int = calculate_indentations(cell_value = self.kingdom.kingdom_total_production.food, width = 10)
+        i_t_ore: int = calculate_indentations(cell_value = self.kingdom.kingdom_total_production.ore, width = 10)
+        i_t_wood: int = calculate_indentations(cell_value = self.kingdom.kingdom_total_production.wood, width = 10)
+        
+        table.add_row(
+            f"Total",
+            f"{" " * i_t_food}{self.kingdom.kingdom_total_production.food:_}",
+            f"{" " * i_t_ore}{self.kingdom.kingdom_total_production.ore:_}",
+            f"{" " * i_t_wood}{self.kingdom.kingdom_total_production.wood:_}",
+            style = table_style + Style(bold = True),
+        )
+        
+        return table
+    
+    def _build_kingdom_storage_table(self) -> Table:
+        
+        storage_color: str = "purple"
+        table_style: Style = Style(color = storage_color)
+        
+        table: Table = Table(
+            title = Text(text = "Storage", style = table_style + Style(italic = True)),
+            style = table_style,
+            box = box.HEAVY,
+        )
+        
+        city_column_header: str = "City"
+        city_name_lengths: list[int] = [len(city.name) for city in self.kingdom.cities]
+        max_city_name_length: int = max(city_name_lengths)
+        cell_length: int = max_city_name_length - len(city_column_header)
+        left_side_justification: int = cell_length // 2
+        
+        table.add_column(header = f"{" " * left_side_justification}{city_column_header}", header_style = "bold")
+        table.add_column(header = f"{" " * 1}Food", header_style = "bold", justify = "left")
+        table.add_column(header = f"{" " * 2}Ore", header_style = "bold", justify = "left")
+        table.add_column(header = f"{" " * 1}Wood", header_style = "bold", justify = "left")
+        
+        for city in self.kingdom.cities:
+            
+            row_elements: list[str] = [f"{city.name}"]
+            
+            for rss in ["food", "ore", "wood"]:
+                
+                rss_storage: int = city.storage.total.get(key = rss)
+                rss_storage_indentation: int = calculate_indentations(cell_value = rss_storage, width = 6)
+                rss_storage_color: str = storage_color if Resource(value = rss) == city.focus else "white"
+                rss_storage_cell_value: str = (
+                    f"{" " * (rss_storage_indentation)}"
+                    f"[{rss_storage_color}]"
+                    f"{rss_storage:_}"
+                    f"[/{rss_storage_color}]"
+                )
+                
+                row_element: str = f"{rss_storage_cell_value}"
+                row_elements.append(row_element)
+            
+            table.add_row(*row_elements)
+        
+        table.add_section()
+        
+        i_t_food: int = calculate_indentations(cell_value = self.kingdom.kingdom_total_storage.food, width = 6)
+        i_t_ore: int = calculate_indentations(cell_value = self.kingdom.kingdom_total_storage.ore, width = 6)
+        i_t_wood: int = calculate_indentations(cell_value = self.kingdom.kingdom_total_storage.wood, width = 6)
+        
+        table.add_row(
+            f"Total",
+            f"{" " * i_t_food}{self.kingdom.kingdom_total_storage.food:_}",
+            f"{" " * i_t_ore}{self.kingdom.kingdom_total_storage.ore:_}",
+            f"{" " * i_t_wood}{self.kingdom.kingdom_total_storage.wood:_}",
+            style = table_style + Style(bold = True),
+        )
+        
+        return table
+    
+    def _build_kingdom_display(self) -> Panel:
+        
+        header_height: int = 2
+        campaign_height: int = 7
+        production_and_storage_height: int = len(self.kingdom.cities) + 9
+        main_height: int = campaign_height + production_and_storage_height
+        total_height: int = header_height + main_height
+        
+        layout: Layout = Layout()
+        
+        layout.split(
+            Layout(
+                name = "header",
+                size = header_height,
+                ratio = 0,
+            ),
+            Layout(
+                name = "main",
+                size = main_height,
+                ratio = 0,
+            ),
+        )
+        
+        layout["header"].update(
+            renderable = Align(renderable = self._build_kingdom_information(), align = "center"),
+        )
+        
+        layout["main"].split(
+            Layout(
+                name = "campaign",
+                size = campaign_height,
+                ratio = 0,
+            ),
+            Layout(
+                name = "production_and_storage",
+                size = production_and_storage_height,
+                ratio = 0,
+            ),
+        )
+        
+        layout["campaign"].update(
+            renderable = Align(renderable = self._build_campaign_table(), align = "center"),
+        )
+        
+        layout["production_and_storage"].split_row(
+            Layout(name = "production", ratio = 4),
+            Layout(name = "storage_capacity", ratio = 3),
+        )
+        
+        layout["production"].update(
+            renderable = Align(renderable = self._build_kingdom_production_table(), align = "center"),
+        )
+        
+        layout["storage_capacity"].update(
+            renderable = Align(renderable = self._build_kingdom_storage_table(), align = "center"),
+        )
+        
+        return Panel(
+            renderable = layout,
+            width = 110,
+            height = total_height,
+        )
+    
+    def build_kingdom_display(self) -> Panel:
+        """
+        Constructs a Rich Panel with the campaign, production, and storage tables of the kingdom.
+        
+        Returns:
+            Panel: A `rich.panel.Panel` object ready for printing.
+        """
+        
+        return self._build_kingdom_display()
+    
+    def display_kingdom(self) -> None:
+        """
+        Print a formatted table-based representation of the kingdom to the terminal.
+        
+        The display includes:
+        
+        1. Campaign name.
+        2. Campaign summary (total cities in campaign, 40% threshold, cities owned).
+        3. Production table (per city resource balance and potential).
+        4. Storage table (per city resource storage capacity).
+        
+        Resource values for a city's primary focus are highlighted for quick reference. Production tables also include
+        resource potential values in parentheses.
+        """
+        
+        console: Console = Console()
+        console.print(self._build_kingdom_display())
+
+
+# * **************** * #
+# * SCENARIO DISPLAY * #
+# * **************** * #
+
+class _ScenarioDisplay:
+    """
+    Handles the rendering and display of a `Scenario` object in the terminal using the Rich library. Cities are
+    displayed side by side, two per row.
+    
+    Public API:
+        build_scenario_display() -> Layout
+            Constructs a Rich Layout with the displays of all the cities in the scenario.
+        display_scenario() -> None
+            Prints the scenario display to the console.
+    """
+    
+    def __init__(self, scenario: Scenario) -> None:
+        self.scenario: Scenario = scenario
+    
+    def _build_scenario_display(self) -> Layout:
+        
+        main_layout: Layout = Layout()
+        row_layouts: list[Layout] = []
+        
+        for i in range(0, len(self.scenario.cities), 2):
+            row: Layout = Layout(name = f"row_{i // 2}")
+            
+            row.split_row(
+                Layout(name = f"left_{i // 2}", ratio = 1),
+                Layout(name = f"right_{i // 2}", ratio = 1),
+            )
+            
+            row[f"left_{i // 2}"].update(
+                renderable = Align(
+                    renderable = self.scenario.cities[i]
+                        .build_city_displayer(configuration = self.scenario.configuration)
+                        .build_city_display(),
+                ),
+            )
+            
+            if i + 1 < len(self.scenario.cities):
+                row[f"right_{i // 2}"].update(
+                    renderable = Align(
+                        renderable = self.scenario.cities[i + 1]
+                            .build_city_displayer(configuration = self.scenario.configuration)
+                            .build_city_display(),
+                    ),
+                )
+            else:
+                row[f"right_{i // 2}"].update(
+                    renderable = Align(renderable = ""),
+                )
+            
+            row_layouts.append(row)
+        
+        main_layout.split(*row_layouts)
+        
+        return main_layout
+    
+    def _calculate_console_height(self) -> int:
+        
+        qty_cities: int = len(self.scenario.cities)
+        qty_display_rows: int = ceil(qty_cities / 2)
+        
+        # Height starts at 2 because of some strange thing rich does. There's always 2 lines missing otherwise.
+        console_height: int = 2
+        
+        for section in self.scenario.configuration:
+            if section not in {DisplaySection.EFFECTS.value, DisplaySection.BUILDINGS.value}:
+                section_config: DisplaySectionConfiguration = self.scenario.configuration[section]
+                console_height += section_config.get("height", 0) if section_config.get("include", False) else 0
+        
+        buildings: DisplaySectionConfiguration = self.scenario.configuration.get("buildings", {})
+        include_buildings: bool = buildings.get("include", False)
+        buildings_height: int = buildings.get("height", 0) if include_buildings else 0
+        
+        effects: DisplaySectionConfiguration = self.scenario.configuration.get("effects", {})
+        include_effects: bool = effects.get("include", False)
+        effects_height: int = effects.get("height", 0) if include_effects else 0
+        
+        buildings_and_effects_height: int = max(buildings_height, effects_height)
+        
+        return (console_height + buildings_and_effects_height) * qty_display_rows
+    
+    def build_scenario_display(self) -> Layout:
+        """
+        Constructs a Rich Layout with the displays of all the cities in the scenario.
+        
+        Returns:
+            Layout: A `rich.layout.Layout` object ready for printing.
+        """
+        
+        return self._build_scenario_display()
+    
+    def display_scenario(self) -> None:
+        """
+        Render all cities in the scenario to the console using the Rich library.
+        
+        The cities are displayed side by side in a grid layout, with the layout automatically calculated based on the
+        number of cities and the configuration provided.
+        """
+        
+        console: Console = Console(width = 192, height = self._calculate_console_height())
+        console.print(self._build_scenario_display())
@@ -14,16 +14,17 @@ Public API:
 
 - Resource (Enum): Named constants for the resource types.
 - ResourceCollectionData (TypedDict): Helper for type hints when reading YAML/JSON.
-- ResourceCollection (dataclass): Stores resource counts and provides dict-like access.
+- ResourceCollection (dataclass): Stores resource counts and provides dict-like access and vector arithmetic.
+- FrozenResourceCollection (dataclass): Immutable, hashable version of ResourceCollection.
 
 This classes and types are meant to be used only in other modules. End-users should have no use for them.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, replace
 from enum import Enum
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, ClassVar, Self, TypedDict
 
 
 if TYPE_CHECKING:
@@ -59,27 +60,32 @@ class ResourceCollectionData(TypedDict):
     wood: int
 
 
-@dataclass
-class ResourceCollection:
+class _ResourceCollectionBase:
     """
-    Stores resource values and provides dictionary-like access.
+    Behaviour shared by `ResourceCollection` and `FrozenResourceCollection`. Should not be used outside this module.
     
-    Each instance tracks the resources: food, ore, and wood. Supports iteration and retrieval like a dictionary.
-    
-    Public methods:
-        __iter__(): Iterate over resource names.
-        items(): Return (resource_name, value) pairs.
-        values(): Return counts of all resources.
-        get(key): Get the count for a given resource name. Raises KeyError if the key is not found.
-        find_fields_by_value(value): Returns a list of all the resources that have a given value.
+    Equality compares values, so a mutable and a frozen collection with the same resources are equal (like `set` and
+    `frozenset`). Arithmetic accepts either variant and returns the type of the left operand.
     """
     
-    food: int = 0
-    ore: int = 0
-    wood: int = 0
+    __slots__ = ()
+    
+    # Only the frozen variant is hashable.
+    __hash__: ClassVar[None] = None  # type: ignore[assignment]
+    
+    FIELDS: ClassVar[tuple[str, ...]] = ("food", "ore", "wood")
+    
+    food: int
+    ore: int
+    wood: int
     
     def __iter__(self) -> Iterator[str]:
-        return (field.name for field in fields(class_or_instance = self))
+        return iter(_ResourceCollectionBase.FIELDS)
+    
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _ResourceCollectionBase):
+            return NotImplemented
+        return self.food == other.food and self.ore == other.ore and self.wood == other.wood
     
     def items(self) -> Iterator[tuple[str, int]]:
         """
@@ -89,7 +95,7 @@ class ResourceCollection:
             Iterator[tuple[str, int]]: An iterator of (key, value) pairs
         """
         
-        return ((field.name, getattr(self, field.name)) for field in fields(class_or_instance = self))
+        return iter((("food", self.food), ("ore", self.ore), ("wood", self.wood)))
     
     def values(self) -> Iterator[int]:
         """
@@ -99,7 +105,7 @@ class ResourceCollection:
             Iterator[int]: An iterator of values.
         """
         
-        return (getattr(self, field.name) for field in fields(class_or_instance = self))
+        return iter((self.food, self.ore, self.wood))
     
     def get(self, key: str) -> int:
         """
@@ -115,7 +121,7 @@ class ResourceCollection:
             int: The value for that key.
         """
         
-        if key not in (f.name for f in fields(class_or_instance = self)):
+        if key not in _ResourceCollectionBase.FIELDS:
             raise KeyError(f"Invalid resource name: {key}")
         
         return getattr(self, key)
@@ -131,4 +137,157 @@ class ResourceCollection:
             list[str]: A list of resources that have that value.
         """
         
-        return [field.name for field in fields(class_or_instance = self) if getattr(self, field.name) == value]
+        return [name for name, field_value in self.items() if field_value == value]
+    
+    def with_(self, **changes: int) -> Self:
+        """
+        Return a copy of the collection with some resources changed, like `dataclasses.replace()`.
+        
+        Args:
+            **changes (int): The new values, by resource name.
+        
+        Returns:
+            Self: A new collection of the same type. The original is not modified.
+        """
+        
+        return replace(self, **changes)  # type: ignore[type-var]
+    
+    def freeze(self) -> FrozenResourceCollection:
+        """
+        Return an immutable, hashable version of the collection.
+        
+        Returns:
+            FrozenResourceCollection: The collection itself if it is already frozen, otherwise a frozen copy.
+        """
+        
+        if isinstance(self, FrozenResourceCollection):
+            return self
+        
+        return FrozenResourceCollection(food = self.food, ore = self.ore, wood = self.wood)
+    
+    def thaw(self) -> ResourceCollection:
+        """
+        Return a mutable copy of the collection.
+        
+        Returns:
+            ResourceCollection: A new mutable collection with the same values.
+        """
+        
+        return ResourceCollection(food = self.food, ore = self.ore, wood = self.wood)
+    
+    
+    #* Arithmetic
+    def __add__(self, other: object) -> Self:
+        if not isinstance(other, _ResourceCollectionBase):
+            return NotImplemented
+        return type(self)(
+            food = self.food + other.food,
+            ore = self.ore + other.ore,
+            wood = self.wood + other.wood,
+        )
+    
+    def __radd__(self, other: object) -> Self:
+        # `sum()` starts from the integer zero.
+        if isinstance(other, int) and other == 0:
+            return type(self)(food = self.food, ore = self.ore, wood = self.wood)
+        return NotImplemented
+    
+    def __sub__(self, other: object) -> Self:
+        if not isinstance(other, _ResourceCollectionBase):
+            return NotImplemented
+        return type(self)(
+            food = self.food - other.food,
+            ore = self.ore - other.ore,
+            wood = self.wood - other.wood,
+        )
+    
+    def __mul__(self, other: object) -> Self:
+        if not isinstance(other, int):
+            return NotImplemented
+        return type(self)(food = self.food * other, ore = self.ore * other, wood = self.wood * other)
+    
+    def __rmul__(self, other: object) -> Self:
+        return self.__mul__(other)
+
+
+@dataclass(slots = True, eq = False)
+class ResourceCollection(_ResourceCollectionBase):
+    """
+    Stores resource values and provides dictionary-like access and vector arithmetic.
+    
+    Each instance tracks the resources: food, ore, and wood. Supports iteration and retrieval like a dictionary, and
+    element-wise arithmetic like a vector:
+    
+    - `a + b` and `a - b` add or subtract two collections.
+    - `a * n` and `n * a` multiply all resources by an integer.
+    - `+=`, `-=`, and `*=` do the same in place (mutating the left operand).
+    - `sum(collections)` adds a list of collections (it starts from `0`, which is treated as an empty collection).
+    
+    Collections are mutable and therefore unhashable. Use `freeze()` to get a `FrozenResourceCollection` that can be
+    used as a dictionary key or shared without copying.
+    
+    Public methods:
+        __iter__(): Iterate over resource names.
+        items(): Return (resource_name, value) pairs.
+        values(): Return counts of all resources.
+        get(key): Get the count for a given resource name. Raises KeyError if the key is not found.
+        find_fields_by_value(value): Returns a list of all the resources that have a given value.
+        with_(**changes): Return a copy with some resources changed.
+        freeze(): Return a frozen copy.
+        thaw(): Return a mutable copy.
+    
+    Attributes:
+        FIELDS (tuple[str, ...]): Names of the resources, in declaration order.
+    """
+    
+    food: int = 0
+    ore: int = 0
+    wood: int = 0
+    
+    def __iadd__(self, other: object) -> Self:
+        if not isinstance(other, _ResourceCollectionBase):
+            return NotImplemented
+        self.food += other.food
+        self.ore += other.ore
+        self.wood += other.wood
+        return self
+    
+    def __isub__(self, other: object) -> Self:
+        if not isinstance(other, _ResourceCollectionBase):
+            return NotImplemented
+        self.food -= other.food
+        self.ore -= other.ore
+        self.wood -= other.wood
+        return self
+    
+    def __imul__(self, other: object) -> Self:
+        if not isinstance(other, int):
+            return NotImplemented
+        self.food *= other
+        self.ore *= other
+        self.wood *= other
+        return self
+
+
+@dataclass(frozen = True, slots = True, eq = False)
+class FrozenResourceCollection(_ResourceCollectionBase):
+    """
+    Immutable, hashable version of `ResourceCollection`.
+    
+    It has the same dictionary-like access and arithmetic, but its resources cannot be changed. The in-place operators
+    rebind the name to a new frozen collection instead of mutating it, and `with_()` returns an updated copy. Frozen
+    collections can be used as dictionary keys, stored in sets, and shared between cities and threads without copying.
+    
+    Public methods:
+        See `ResourceCollection`. `freeze()` returns the collection itself.
+    
+    Attributes:
+        FIELDS (tuple[str, ...]): Names of the resources, in declaration order.
+    """
+    
+    food: int = 0
+    ore: int = 0
+    wood: int = 0
+    
+    def __hash__(self) -> int:
+        return hash((self.food, self.ore, self.wood))
@@ -11,15 +11,10 @@ Public API:
 
 from __future__ import annotations
 
-from math import ceil
 from typing import TYPE_CHECKING
 
-from rich.align import Align
-from rich.console import Console
-from rich.layout import Layout
-
 from .city import City
-from .display import DEFAULT_SECTION_COLORS, DisplaySection
+from .display import DEFAULT_SECTION_COLORS
 
 
 if TYPE_CHECKING:
@@ -72,6 +67,7 @@ class Scenario:
             cls,
             data: list[CityDict],
             configuration: DisplayConfiguration | None = None,
+            cached: bool = False,
         ) -> Scenario:
         """
         Create a Scenario instance from a list of city dictionaries.
@@ -81,13 +77,15 @@ class Scenario:
         Args:
             data (list[CityDict]): List of dictionaries defining cities.
             configuration (DisplayConfiguration | None): Optional display configuration for the scenario.
+            cached (bool): Whether to reuse the evaluations of identical cities (see `City.from_buildings_count`).
+                Defaults to False.
         
         Returns:
             Scenario: A new Scenario instance with City objects created from the given data.
         """
         
         return cls(
-            cities = [City.from_buildings_count(**city) for city in data],
+            cities = [City.from_buildings_count(**city, cached = cached) for city in data],
             configuration = configuration,
         )
     
@@ -150,72 +148,7 @@ class Scenario:
         return display_configuration
     
     
-    #* City displays
-    def _build_scenario_display(self) -> Layout:
-        
-        main_layout: Layout = Layout()
-        row_layouts: list[Layout] = []
-        
-        for i in range(0, len(self.cities), 2):
-            row: Layout = Layout(name = f"row_{i // 2}")
-            
-            row.split_row(
-                Layout(name = f"left_{i // 2}", ratio = 1),
-                Layout(name = f"right_{i // 2}", ratio = 1),
-            )
-            
-            row[f"left_{i // 2}"].update(
-                renderable = Align(
-                    renderable = self.cities[i]
-                        .build_city_displayer(configuration = self.configuration)
-                        .build_city_display(),
-                ),
-            )
-            
-            if i + 1 < len(self.cities):
-                row[f"right_{i // 2}"].update(
-                    renderable = Align(
-                        renderable = self.cities[i + 1]
-                            .build_city_displayer(configuration = self.configuration)
-                            .build_city_display(),
-                    ),
-                )
-            else:
-                row[f"right_{i // 2}"].update(
-                    renderable = Align(renderable = ""),
-                )
-            
-            row_layouts.append(row)
-        
-        main_layout.split(*row_layouts)
-        
-        return main_layout
-    
-    def _calculate_console_height(self) -> int:
-        
-        qty_cities: int = len(self.cities)
-        qty_display_rows: int = ceil(qty_cities / 2)
-        
-        # Height starts at 2 because of some strange thing rich does. There's always 2 lines missing otherwise.
-        console_height: int = 2
-        
-        for section in self.configuration:
-            if section not in {DisplaySection.EFFECTS.value, DisplaySection.BUILDINGS.value}:
-                section_config: DisplaySectionConfiguration = self.configuration[section]
-                console_height += section_config.get("height", 0) if section_config.get("include", False) else 0
-        
-        buildings: DisplaySectionConfiguration = self.configuration.get("buildings", {})
-        include_buildings: bool = buildings.get("include", False)
-        buildings_height: int = buildings.get("height", 0) if include_buildings else 0
-        
-        effects: DisplaySectionConfiguration = self.configuration.get("effects", {})
-        include_effects: bool = effects.get("include", False)
-        effects_height: int = effects.get("height", 0) if include_effects else 0
-        
-        buildings_and_effects_height: int = max(buildings_height, effects_height)
-        
-        return (console_height + buildings_and_effects_height) * qty_display_rows
-    
+    #* Display
     def display_scenario(self) -> None:
         """
         Render all cities in the scenario to the console using the Rich library.
@@ -224,5 +157,7 @@ class Scenario:
         number of cities and the configuration provided.
         """
         
-        console: Console = Console(width = 192, height = self._calculate_console_height())
-        console.print(self._build_scenario_display())
+        # Rendering is imported lazily so that the calculation API can be used without loading Rich.
+        from .rendering import _ScenarioDisplay  # noqa: PLC0415
+        
+        _ScenarioDisplay(scenario = self).display_scenario()
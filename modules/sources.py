@@ -0,0 +1,450 @@
+"""
+Module for the data sources of the game data catalog.
+
+A data source knows where the building and city definitions are stored and how to read them. The catalog (see
+`modules.catalog`) reads all its data through a data source, so the storage format can be changed without touching the
+rest of the package.
+
+Two data sources are available:
+
+- YAML files (the default). The files shipped with the package live in `DATA_DIRECTORY`, which is resolved relative to
+    the package, so the package can be imported from any working directory.
+- A SQLite database. Cities are stored in an indexed table, so lookups by campaign and name (and the campaign, fort, and
+    supply dump filters) run as indexed queries without reading all the cities into memory. This is meant for large
+    custom (e.g. modded) sets of cities. A database can be built from any other data source with
+    `SqliteDataSource.create`, or from the command line with:
+
+```shell
+python -m modules.sources ./data/catalog.sqlite
+```
+
+Public API:
+
+- DataSource (class): Base class of all data sources.
+- YamlDataSource (class): Reads the data from YAML files.
+- SqliteDataSource (class): Reads the data from a SQLite database.
+- DATA_DIRECTORY (Path): Directory with the data files shipped with the package.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+from abc import ABC, abstractmethod
+from contextlib import closing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+
+import yaml
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    
+    from .building import _BuildingData
+    from .city import _CityData
+
+
+__all__: list[str] = ["DATA_DIRECTORY", "DataSource", "SqliteDataSource", "YamlDataSource"]
+
+
+DATA_DIRECTORY: Path = Path(__file__).resolve().parent.parent / "data"
+
+
+# * *********** * #
+# * DATA SOURCE * #
+# * *********** * #
+
+class DataSource(ABC):
+    """
+    Base class of all data sources.
+    
+    Subclasses must implement `paths`, `load_buildings`, and `load_cities`. The city queries have default
+    implementations that scan the output of `load_cities`. Sources that can answer them without loading all the cities
+    should override them and set `is_indexed` to True, so that the catalog delegates the queries to them until the
+    cities are loaded.
+    
+    Attributes:
+        is_indexed (bool): Whether the city queries are answered without loading all the cities.
+    
+    Public methods:
+        paths: Files that back the data source. Used to detect changes and to key the catalog snapshot.
+        load_buildings(): Read all building definitions.
+        load_cities(): Read all city definitions.
+        find_city(campaign, name): Look up a city by campaign and name.
+        get_cities(campaign, is_fort, has_supply_dump): List the cities that match all the given filters.
+        count_cities(campaign): Number of cities in a campaign.
+        get_campaigns(): Names of all campaigns.
+    """
+    
+    is_indexed: ClassVar[bool] = False
+    
+    @property
+    @abstractmethod
+    def paths(self) -> tuple[Path, ...]:
+        """Files that back the data source."""
+    
+    @abstractmethod
+    def load_buildings(self) -> dict[str, _BuildingData]:
+        """
+        Read all building definitions.
+        
+        Returns:
+            dict[str, _BuildingData]: The building definitions, keyed by building ID, in file order.
+        """
+    
+    @abstractmethod
+    def load_cities(self) -> list[_CityData]:
+        """
+        Read all city definitions.
+        
+        Returns:
+            list[_CityData]: The city definitions, in file order.
+        """
+    
+    def find_city(self, campaign: str, name: str) -> _CityData | None:
+        """
+        Look up a city by campaign and name.
+        
+        Args:
+            campaign (str): The campaign the city belongs to.
+            name (str): The name of the city.
+        
+        Returns:
+            _CityData | None: The city definition, or None if there is no such city.
+        """
+        
+        for city in self.load_cities():
+            if city["campaign"] == campaign and city["name"] == name:
+                return city
+        
+        return None
+    
+    def get_cities(
+            self,
+            campaign: str | None = None,
+            is_fort: bool | None = None,
+            has_supply_dump: bool | None = None,
+        ) -> list[_CityData]:
+        """
+        List the cities that match all the given filters. Filters that are None are ignored.
+        
+        Args:
+            campaign (str | None): Only return cities of this campaign. Defaults to None.
+            is_fort (bool | None): Only return forts (True) or non-forts (False). Defaults to None.
+            has_supply_dump (bool | None): Only return cities with (True) or without (False) a supply dump. Defaults to
+                None.
+        
+        Returns:
+            list[_CityData]: The matching cities, in file order.
+        """
+        
+        return [
+            city
+            for city in self.load_cities()
+            if (campaign is None or city["campaign"] == campaign)
+            and (is_fort is None or city["is_fort"] == is_fort)
+            and (has_supply_dump is None or city["has_supply_dump"] == has_supply_dump)
+        ]
+    
+    def count_cities(self, campaign: str) -> int:
+        """
+        Number of cities in a campaign.
+        
+        Args:
+            campaign (str): The name of the campaign.
+        
+        Returns:
+            int: The number of cities in the campaign (zero if the campaign does not exist).
+        """
+        
+        return len(self.get_cities(campaign = campaign))
+    
+    def get_campaigns(self) -> list[str]:
+        """
+        Names of all campaigns, in the order in which they first appear in the data.
+        
+        Returns:
+            list[str]: The names of the campaigns.
+        """
+        
+        return list(dict.fromkeys(city["campaign"] for city in self.load_cities()))
+
+
+# * **** * #
+# * YAML * #
+# * **** * #
+
+class YamlDataSource(DataSource):
+    """
+    Reads the building and city definitions from YAML files.
+    
+    Args:
+        buildings_path (Path): Path to the YAML file with the building definitions. Defaults to the file shipped with
+            the package.
+        cities_path (Path): Path to the YAML file with the city definitions. Defaults to the file shipped with the
+            package.
+    """
+    
+    def __init__(
+            self,
+            buildings_path: Path = DATA_DIRECTORY / "buildings.yaml",
+            cities_path: Path = DATA_DIRECTORY / "cities.yaml",
+        ) -> None:
+        self.buildings_path: Path = buildings_path
+        self.cities_path: Path = cities_path
+    
+    def __repr__(self) -> str:
+        return f"YamlDataSource(buildings_path = \"{self.buildings_path}\", cities_path = \"{self.cities_path}\")"
+    
+    @staticmethod
+    def _read_yaml(path: Path) -> Any:
+        with path.open(mode = "r", encoding = "utf-8") as file:
+            return yaml.safe_load(stream = file)
+    
+    @property
+    def paths(self) -> tuple[Path, ...]:
+        """The buildings and cities files."""
+        return self.buildings_path, self.cities_path
+    
+    def load_buildings(self) -> dict[str, _BuildingData]:
+        """
+        Parse the buildings file.
+        
+        Returns:
+            dict[str, _BuildingData]: The building definitions, keyed by building ID, in file order.
+        """
+        
+        buildings_data: dict[Literal["buildings"], list[_BuildingData]] = YamlDataSource._read_yaml(
+            path = self.buildings_path,
+        )
+        return {building["id"]: building for building in buildings_data["buildings"]}
+    
+    def load_cities(self) -> list[_CityData]:
+        """
+        Parse the cities file.
+        
+        Returns:
+            list[_CityData]: The city definitions, in file order.
+        """
+        
+        cities_data: dict[Literal["cities"], list[_CityData]] = YamlDataSource._read_yaml(path = self.cities_path)
+        return cities_data["cities"]
+
+
+# * ****** * #
+# * SQLITE * #
+# * ****** * #
+
+_SQLITE_SCHEMA: str = """
+CREATE TABLE buildings (
+    position INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    data TEXT NOT NULL
+);
+CREATE TABLE cities (
+    position INTEGER PRIMARY KEY,
+    campaign TEXT NOT NULL,
+    name TEXT NOT NULL,
+    is_fort INTEGER NOT NULL,
+    has_supply_dump INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE UNIQUE INDEX cities_campaign_name ON cities (campaign, name);
+CREATE INDEX cities_name ON cities (name);
+"""
+
+
+class SqliteDataSource(DataSource):
+    """
+    Reads the building and city definitions from a SQLite database.
+    
+    Each city is stored as one row with its campaign, name, and flags in indexed columns, and the full definition as
+    JSON. City queries are answered with indexed SQL queries, so the catalog does not need to load all the cities to
+    look one of them up. The database is opened in read-only mode.
+    
+    Args:
+        path (Path): Path to the database file.
+    
+    Public methods:
+        create(path, source): Build a database from the data of another source.
+        iter_cities(campaign): Iterate over the cities without loading all of them at once.
+    """
+    
+    is_indexed: ClassVar[bool] = True
+    
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+    
+    def __repr__(self) -> str:
+        return f"SqliteDataSource(path = \"{self.path}\")"
+    
+    @classmethod
+    def create(cls, path: Path, source: DataSource) -> SqliteDataSource:
+        """
+        Build a database from the data of another source. An existing file at `path` is replaced.
+        
+        Args:
+            path (Path): Path of the database file to create.
+            source (DataSource): The source to read the data from.
+        
+        Returns:
+            SqliteDataSource: A data source that reads from the new database.
+        """
+        
+        buildings: dict[str, _BuildingData] = source.load_buildings()
+        cities: list[_CityData] = source.load_cities()
+        
+        path.unlink(missing_ok = True)
+        
+        with closing(sqlite3.connect(path)) as connection, connection:
+            connection.executescript(_SQLITE_SCHEMA)
+            connection.executemany(
+                "INSERT INTO buildings (id, data) VALUES (?, ?)",
+                ((building_id, json.dumps(building)) for building_id, building in buildings.items()),
+            )
+            connection.executemany(
+                "INSERT INTO cities (campaign, name, is_fort, has_supply_dump, data) VALUES (?, ?, ?, ?, ?)",
+                (
+                    (city["campaign"], city["name"], city["is_fort"], city["has_supply_dump"], json.dumps(city))
+                    for city in cities
+                ),
+            )
+        
+        return cls(path = path)
+    
+    def _connect(self) -> sqlite3.Connection:
+        # Opening in read-only mode fails (instead of creating an empty database) if the file does not exist.
+        return sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri = True)
+    
+    def _query(self, sql: str, parameters: tuple[Any, ...] = ()) -> list[Any]:
+        with closing(self._connect()) as connection:
+            return connection.execute(sql, parameters).fetchall()
+    
+    @property
+    def paths(self) -> tuple[Path, ...]:
+        """The database file."""
+        return (self.path,)
+    
+    def load_buildings(self) -> dict[str, _BuildingData]:
+        """
+        Read all building definitions.
+        
+        Returns:
+            dict[str, _BuildingData]: The building definitions, keyed by building ID, in insertion order.
+        """
+        
+        rows: list[tuple[str, str]] = self._query("SELECT id, data FROM buildings ORDER BY position")
+        return {building_id: json.loads(data) for building_id, data in rows}
+    
+    def load_cities(self) -> list[_CityData]:
+        """
+        Read all city definitions.
+        
+        Returns:
+            list[_CityData]: The city definitions, in insertion order.
+        """
+        
+        return list(self.iter_cities())
+    
+    def iter_cities(self, campaign: str | None = None) -> Iterator[_CityData]:
+        """
+        Iterate over the cities (optionally only those of one campaign) reading them from the database in batches, so
+        that the whole set is never held in memory at once.
+        
+        Args:
+            campaign (str | None): Only iterate over the cities of this campaign. Defaults to None.
+        
+        Yields:
+            _CityData: The city definitions, in insertion order.
+        """
+        
+        with closing(self._connect()) as connection:
+            cursor: sqlite3.Cursor = (
+                connection.execute("SELECT data FROM cities ORDER BY position")
+                if campaign is None
+                else connection.execute("SELECT data FROM cities WHERE campaign = ? ORDER BY position", (campaign,))
+            )
+            while rows := cursor.fetchmany(256):
+                for (data,) in rows:
+                    yield json.loads(data)
+    
+    def find_city(self, campaign: str, name: str) -> _CityData | None:
+        """
+        Look up a city by campaign and name with an indexed query.
+        
+        Args:
+            campaign (str): The campaign the city belongs to.
+            name (str): The name of the city.
+        
+        Returns:
+            _CityData | None: The city definition, or None if there is no such city.
+        """
+        
+        rows: list[tuple[str]] = self._query(
+            "SELECT data FROM cities WHERE campaign = ? AND name = ?",
+            (campaign, name),
+        )
+        return json.loads(rows[0][0]) if rows else None
+    
+    def get_cities(
+            self,
+            campaign: str | None = None,
+            is_fort: bool | None = None,
+            has_supply_dump: bool | None = None,
+        ) -> list[_CityData]:
+        """
+        List the cities that match all the given filters with a single query. Filters that are None are ignored.
+        
+        Args:
+            campaign (str | None): Only return cities of this campaign. Defaults to None.
+            is_fort (bool | None): Only return forts (True) or non-forts (False). Defaults to None.
+            has_supply_dump (bool | None): Only return cities with (True) or without (False) a supply dump. Defaults to
+                None.
+        
+        Returns:
+            list[_CityData]: The matching cities, in insertion order.
+        """
+        
+        conditions: list[str] = []
+        parameters: list[Any] = []
+        
+        for column, value in (("campaign", campaign), ("is_fort", is_fort), ("has_supply_dump", has_supply_dump)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+        
+        where: str = f" WHERE {" AND ".join(conditions)}" if conditions else ""
+        rows: list[tuple[str]] = self._query(f"SELECT data FROM cities{where} ORDER BY position", tuple(parameters))
+        
+        return [json.loads(data) for (data,) in rows]
+    
+    def count_cities(self, campaign: str) -> int:
+        """
+        Number of cities in a campaign, counted with an indexed query.
+        
+        Args:
+            campaign (str): The name of the campaign.
+        
+        Returns:
+            int: The number of cities in the campaign (zero if the campaign does not exist).
+        """
+        
+        return self._query("SELECT COUNT(*) FROM cities WHERE campaign = ?", (campaign,))[0][0]
+    
+    def get_campaigns(self) -> list[str]:
+        """
+        Names of all campaigns, in the order in which they first appear in the data.
+        
+        Returns:
+            list[str]: The names of the campaigns.
+        """
+        
+        rows: list[tuple[str]] = self._query("SELECT campaign FROM cities GROUP BY campaign ORDER BY MIN(position)")
+        return [campaign for (campaign,) in rows]
+
+
+if __name__ == "__main__":
+    database_path: Path = Path(sys.argv[1]) if len(sys.argv) > 1 else DATA_DIRECTORY / "catalog.sqlite"
+    print(f"Database written to {SqliteDataSource.create(path = database_path, source = YamlDataSource()).path}")
@@ -0,0 +1,919 @@
+"""
+Module for columnar (struct-of-arrays) views of the game data.
+
+The building definitions are stored as one dictionary per building, which is convenient for reading a single building
+but slow for aggregating many of them, since every number sits behind a few attribute or key lookups. This module
+provides a columnar view of the same data: every building gets a stable integer index, and every numeric field is stored
+in a contiguous `array`. Aggregates over a city (or over many cities) then become a gather and a sum over the arrays.
+
+Fields that hold a resource collection or a set of effect bonuses are stored as packed N x 3 arrays, in row-major order.
+The value of the k-th key of the field for the building with index i is at position `3 * i + k`. The order of the keys
+is given by `RESOURCE_KEYS` and `EFFECT_KEYS`. `PackedCollection` wraps such an array (for the buildings, or for any
+other list of records, like the production of all the cities of a kingdom) and reduces it in a single call.
+
+Public API:
+
+- PackedCollection (dataclass): Packed N x 3 array of resource collections or effect bonuses, with batch reductions.
+- BuildingTable (dataclass): Columnar view of the building definitions.
+- get_building_table(): Get the columnar view of the building definitions of the catalog.
+- CityKey (NamedTuple): Campaign and name of a city, ready to be passed to `City.from_buildings_count`.
+- CityTable (dataclass): Columnar view of the city definitions.
+- CityQuery (dataclass): Immutable filter/sort/top-k query over a `CityTable`.
+- get_city_table(): Get the columnar view of the city definitions of the catalog.
+- RESOURCE_KEYS (tuple[str, ...]): Order of the resources in the packed resource fields.
+- EFFECT_KEYS (tuple[str, ...]): Order of the effects in the packed effect fields.
+- GEO_FEATURE_KEYS (tuple[str, ...]): Order of the geographic features in the packed geographic features field.
+
+City queries select cities with bit masks: bit i of a mask is set when the city with index i matches. Campaign, fort,
+and supply dump masks are precomputed when the table is built, so combining filters is a handful of integer operations.
+
+```python
+query: CityQuery = get_city_table().query().where(campaign = "Hispania")
+query.at_least(field = "resource_potentials", key = "ore", minimum = 100).keys()
+```
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field, replace
+from heapq import nsmallest
+from itertools import cycle
+from typing import TYPE_CHECKING, Literal, NamedTuple, overload
+
+from .catalog import CATALOG
+from .effects import EffectBonuses, FrozenEffectBonuses
+from .exceptions import UnknownBuildingError
+from .geo_features import GeoFeatures
+from .resources import FrozenResourceCollection, ResourceCollection
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    
+    from .building import _BuildingData
+    from .catalog import Catalog
+    from .city import _CityData
+
+
+__all__: list[str] = [
+    "EFFECT_KEYS",
+    "GEO_FEATURE_KEYS",
+    "RESOURCE_KEYS",
+    "BuildingTable",
+    "CityKey",
+    "CityQuery",
+    "CityTable",
+    "PackedCollection",
+    "get_building_table",
+    "get_city_table",
+]
+
+
+RESOURCE_KEYS: tuple[str, ...] = ResourceCollection.FIELDS
+EFFECT_KEYS: tuple[str, ...] = EffectBonuses.FIELDS
+GEO_FEATURE_KEYS: tuple[str, ...] = GeoFeatures.FIELDS
+
+# Width of the packed fields. Both resource collections and effect bonuses have three keys.
+_WIDTH: int = 3
+
+type ResourceField = Literal[
+    "building_cost",
+    "maintenance_cost",
+    "productivity_bonuses",
+    "productivity_per_worker",
+    "storage_capacity",
+]
+type EffectField = Literal["effect_bonuses", "effect_bonuses_per_worker"]
+type PackedField = ResourceField | EffectField
+
+_RESOURCE_FIELDS: tuple[ResourceField, ...] = (
+    "building_cost",
+    "maintenance_cost",
+    "productivity_bonuses",
+    "productivity_per_worker",
+    "storage_capacity",
+)
+_EFFECT_FIELDS: tuple[EffectField, ...] = (
+    "effect_bonuses",
+    "effect_bonuses_per_worker",
+)
+
+
+# * ***************** * #
+# * PACKED COLLECTION * #
+# * ***************** * #
+
+type Record = ResourceCollection | FrozenResourceCollection | EffectBonuses | FrozenEffectBonuses
+
+
+def _gather_sum(column: array[int], counts: Iterable[tuple[int, int]]) -> tuple[int, int, int]:
+    
+    first: int = 0
+    second: int = 0
+    third: int = 0
+    
+    for row_index, count in counts:
+        if not count:
+            continue
+        start: int = _WIDTH * row_index
+        first += count * column[start]
+        second += count * column[start + 1]
+        third += count * column[start + 2]
+    
+    return first, second, third
+
+
+@dataclass(frozen = True, slots = True)
+class PackedCollection[T: (FrozenResourceCollection, FrozenEffectBonuses)]:
+    """
+    Packed N x 3 array of resource collections (or effect bonuses), with batch reductions.
+    
+    Row i holds the three values of the i-th record, in the order of `RESOURCE_KEYS` (or `EFFECT_KEYS`). Reductions work
+    on the whole array at once instead of adding the records one attribute at a time, and they return a record of type
+    `kind`. Reducing an empty collection with `min()`, `max()`, or `argmax()` raises a ValueError, like the builtins.
+    
+    ```python
+    balances = PackedCollection.from_records(
+        kind = FrozenResourceCollection,
+        records = [city.production.balance for city in cities],
+    )
+    balances.sum()     # Total production.
+    balances.argmax()  # Index of the best city for food, ore, and wood.
+    ```
+    
+    Attributes:
+        kind (type[T]): The frozen record type returned by the reductions.
+        values (array[int]): The packed values. Shared with the owner of the array (e.g. a `BuildingTable`), so it must
+            not be modified.
+    
+    Public methods:
+        from_records(kind, records): Pack a list of records.
+        sum(): Add all the records.
+        min(): Smallest value of each key.
+        max(): Largest value of each key.
+        argmax(): Row with the largest value of each key.
+        floor_scale(factors, divisor): Multiply every row by some factors and divide, rounding down.
+        weighted_sum(weights): Add all the records, multiplying each one by its weight.
+        gather_sum(counts): Add a sparse set of records, multiplying each one by its count.
+    """
+    
+    kind: type[T]
+    values: array[int]
+    
+    def __len__(self) -> int:
+        return len(self.values) // _WIDTH
+    
+    def __getitem__(self, index: int) -> T:
+        
+        if index < 0:
+            index += len(self)
+        
+        if not 0 <= index < len(self):
+            raise IndexError(f"Row {index} is out of range.")
+        
+        start: int = _WIDTH * index
+        
+        return self.kind(*self.values[start:start + _WIDTH])
+    
+    def __iter__(self) -> Iterator[T]:
+        return (self[index] for index in range(len(self)))
+    
+    @classmethod
+    def from_records(cls, kind: type[T], records: Iterable[Record]) -> PackedCollection[T]:
+        """
+        Pack a list of records. Mutable and frozen records can be mixed.
+        
+        Args:
+            kind (type[T]): The frozen record type (`FrozenResourceCollection` or `FrozenEffectBonuses`).
+            records (Iterable[Record]): The records to pack, in row order.
+        
+        Returns:
+            PackedCollection[T]: The packed records.
+        """
+        
+        values: array[int] = array("q")
+        
+        for record in records:
+            values.extend(record.values())
+        
+        return cls(kind, values)
+    
+    def _columns(self) -> tuple[array[int], array[int], array[int]]:
+        return self.values[0::_WIDTH], self.values[1::_WIDTH], self.values[2::_WIDTH]
+    
+    def sum(self) -> T:
+        """
+        Add all the records.
+        
+        Returns:
+            T: The total of each key. All zeros if the collection is empty.
+        """
+        
+        first, second, third = self._columns()
+        
+        return self.kind(sum(first), sum(second), sum(third))
+    
+    def min(self) -> T:
+        """
+        Get the smallest value of each key. The values may come from different rows.
+        
+        Returns:
+            T: The minimum of each key.
+        """
+        
+        first, second, third = self._columns()
+        
+        return self.kind(min(first), min(second), min(third))
+    
+    def max(self) -> T:
+        """
+        Get the largest value of each key. The values may come from different rows.
+        
+        Returns:
+            T: The maximum of each key.
+        """
+        
+        first, second, third = self._columns()
+        
+        return self.kind(max(first), max(second), max(third))
+    
+    def argmax(self) -> tuple[int, int, int]:
+        """
+        Get the row with the largest value of each key. Ties go to the first row.
+        
+        Returns:
+            tuple[int, int, int]: The row index of the maximum of each key.
+        """
+        
+        first, second, third = self._columns()
+        
+        return first.index(max(first)), second.index(max(second)), third.index(max(third))
+    
+    def floor_scale(self, factors: Record, divisor: int = 100) -> PackedCollection[T]:
+        """
+        Multiply each key of every row by a factor and divide by a common divisor, rounding down. With the resource
+        potentials of a city as factors this turns productivities per worker into production per worker.
+        
+        The arithmetic is exact (integer floor division), so it matches `floor(value * factor / divisor)`.
+        
+        Args:
+            factors (Record): One factor per key.
+            divisor (int): The common divisor. Defaults to 100 (factors given as percentages).
+        
+        Returns:
+            PackedCollection[T]: A new collection with the scaled values.
+        """
+        
+        return PackedCollection(
+            self.kind,
+            array("q", [value * factor // divisor for value, factor in zip(self.values, cycle(factors.values()))]),
+        )
+    
+    def weighted_sum(self, weights: Iterable[int]) -> T:
+        """
+        Add all the records, multiplying each one by its weight.
+        
+        Args:
+            weights (Iterable[int]): One weight per row.
+        
+        Returns:
+            T: The weighted totals.
+        """
+        
+        return self.kind(*_gather_sum(column = self.values, counts = enumerate(weights)))
+    
+    def gather_sum(self, counts: Iterable[tuple[int, int]]) -> T:
+        """
+        Add a sparse set of records, multiplying each one by its count.
+        
+        Args:
+            counts (Iterable[tuple[int, int]]): Pairs of (row index, count).
+        
+        Returns:
+            T: The totals.
+        """
+        
+        return self.kind(*_gather_sum(column = self.values, counts = counts))
+
+
+type AnyPackedCollection = PackedCollection[FrozenResourceCollection] | PackedCollection[FrozenEffectBonuses]
+
+
+# * ************** * #
+# * BUILDING TABLE * #
+# * ************** * #
+
+@dataclass(frozen = True, slots = True, kw_only = True)
+class BuildingTable:
+    """
+    Columnar view of the building definitions.
+    
+    Buildings are indexed in the order in which they appear in the buildings data, so the index of a building is stable
+    for a given version of the data. The table is built once per load of the catalog and must not be modified.
+    
+    Attributes:
+        ids (tuple[str, ...]): Building IDs, by index.
+        index (dict[str, int]): Index of each building ID.
+        max_workers (array[int]): Maximum number of workers of each building.
+        building_cost (array[int]): Packed N x 3 building costs (see `RESOURCE_KEYS`).
+        maintenance_cost (array[int]): Packed N x 3 maintenance costs.
+        productivity_bonuses (array[int]): Packed N x 3 productivity bonuses.
+        productivity_per_worker (array[int]): Packed N x 3 productivity per worker.
+        storage_capacity (array[int]): Packed N x 3 storage capacities.
+        effect_bonuses (array[int]): Packed N x 3 effect bonuses (see `EFFECT_KEYS`).
+        effect_bonuses_per_worker (array[int]): Packed N x 3 effect bonuses per worker.
+    
+    Public methods:
+        from_data(buildings): Build the table from the raw building definitions.
+        index_of(building_id): Get the index of a building.
+        row(field, building_index): Get the values of a packed field for one building.
+        packed(field): Get a packed field as a `PackedCollection`.
+        encode(buildings): Convert a mapping of building IDs to counts into a dense vector of counts.
+        weighted_sum(field, weights): Sum a packed field over all buildings, weighting each building.
+        gather_sum(field, counts): Sum a packed field over a sparse set of buildings.
+    """
+    
+    ids: tuple[str, ...]
+    index: dict[str, int]
+    max_workers: array[int]
+    building_cost: array[int]
+    maintenance_cost: array[int]
+    productivity_bonuses: array[int]
+    productivity_per_worker: array[int]
+    storage_capacity: array[int]
+    effect_bonuses: array[int]
+    effect_bonuses_per_worker: array[int]
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    @classmethod
+    def from_data(cls, buildings: Mapping[str, _BuildingData]) -> BuildingTable:
+        """
+        Build the table from the raw building definitions.
+        
+        Args:
+            buildings (Mapping[str, _BuildingData]): The definitions of all buildings, keyed by building ID, in index
+                order.
+        
+        Returns:
+            BuildingTable: The columnar view of the definitions.
+        """
+        
+        packed: dict[PackedField, array[int]] = {name: array("q") for name in (*_RESOURCE_FIELDS, *_EFFECT_FIELDS)}
+        max_workers: array[int] = array("q")
+        
+        for building_data in buildings.values():
+            max_workers.append(building_data["max_workers"])
+            
+            for name in _RESOURCE_FIELDS:
+                packed[name].extend(building_data[name][key] for key in RESOURCE_KEYS)
+            
+            for name in _EFFECT_FIELDS:
+                packed[name].extend(building_data[name][key] for key in EFFECT_KEYS)
+        
+        ids: tuple[str, ...] = tuple(buildings)
+        
+        return cls(
+            ids = ids,
+            index = {building_id: index for index, building_id in enumerate(ids)},
+            max_workers = max_workers,
+            **packed,
+        )
+    
+    def index_of(self, building_id: str) -> int:
+        """
+        Get the index of a building.
+        
+        Args:
+            building_id (str): The ID of the building.
+        
+        Raises:
+            UnknownBuildingError: If the building does not exist.
+        
+        Returns:
+            int: The index of the building.
+        """
+        
+        index: int | None = self.index.get(building_id)
+        
+        if index is None:
+            raise UnknownBuildingError(f"Building {building_id} does not exist.")
+        
+        return index
+    
+    def row(self, field: PackedField, building_index: int) -> tuple[int, int, int]:
+        """
+        Get the values of a packed field for one building.
+        
+        Args:
+            field (PackedField): The name of the packed field.
+            building_index (int): The index of the building.
+        
+        Returns:
+            tuple[int, int, int]: The values of the field, in the order of `RESOURCE_KEYS` (or `EFFECT_KEYS`).
+        """
+        
+        column: array[int] = getattr(self, field)
+        start: int = _WIDTH * building_index
+        
+        return column[start], column[start + 1], column[start + 2]
+    
+    @overload
+    def packed(self, field: ResourceField) -> PackedCollection[FrozenResourceCollection]: ...
+    
+    @overload
+    def packed(self, field: EffectField) -> PackedCollection[FrozenEffectBonuses]: ...
+    
+    def packed(self, field: PackedField) -> AnyPackedCollection:
+        """
+        Get a packed field as a `PackedCollection`, to reduce it over many buildings in a single call. The collection
+        shares the array of the table.
+        
+        Args:
+            field (PackedField): The name of the packed field.
+        
+        Returns:
+            AnyPackedCollection: The field, with `FrozenResourceCollection` or `FrozenEffectBonuses` records.
+        """
+        
+        if field in _EFFECT_FIELDS:
+            return PackedCollection(FrozenEffectBonuses, getattr(self, field))
+        
+        return PackedCollection(FrozenResourceCollection, getattr(self, field))
+    
+    def encode(self, buildings: Mapping[str, int]) -> array[int]:
+        """
+        Convert a mapping of building IDs to counts (e.g. a `BuildingsCount`) into a dense vector of counts.
+        
+        Args:
+            buildings (Mapping[str, int]): Number of buildings of each ID.
+        
+        Raises:
+            UnknownBuildingError: If any of the buildings does not exist.
+        
+        Returns:
+            array[int]: A vector with the count of each building, by index.
+        """
+        
+        vector: array[int] = array("q", bytes(8 * len(self.ids)))
+        
+        for building_id, count in buildings.items():
+            index: int | None = self.index.get(building_id)
+            
+            if index is None:
+                raise UnknownBuildingError(f"Building {building_id} does not exist.")
+            
+            vector[index] += count
+        
+        return vector
+    
+    def weighted_sum(self, field: PackedField, weights: Iterable[int]) -> tuple[int, int, int]:
+        """
+        Sum a packed field over all buildings, multiplying the values of each building by its weight. With a vector of
+        building counts as weights this is the total of the field over a city.
+        
+        Args:
+            field (PackedField): The name of the packed field.
+            weights (Iterable[int]): One weight per building, by index (e.g. the output of `encode`).
+        
+        Returns:
+            tuple[int, int, int]: The weighted sums, in the order of `RESOURCE_KEYS` (or `EFFECT_KEYS`).
+        """
+        
+        return self.gather_sum(field = field, counts = enumerate(weights))
+    
+    def gather_sum(self, field: PackedField, counts: Iterable[tuple[int, int]]) -> tuple[int, int, int]:
+        """
+        Sum a packed field over a sparse set of buildings.
+        
+        Args:
+            field (PackedField): The name of the packed field.
+            counts (Iterable[tuple[int, int]]): Pairs of (building index, count).
+        
+        Returns:
+            tuple[int, int, int]: The sums, in the order of `RESOURCE_KEYS` (or `EFFECT_KEYS`).
+        """
+        
+        return _gather_sum(column = getattr(self, field), counts = counts)
+
+
+def _build_building_table(catalog: Catalog) -> BuildingTable:
+    return BuildingTable.from_data(buildings = catalog.buildings)
+
+
+def get_building_table() -> BuildingTable:
+    """
+    Get the columnar view of the building definitions. The table is built once per load of the catalog.
+    
+    Returns:
+        BuildingTable: The columnar view of the building definitions. It is shared and must not be modified.
+    """
+    
+    return CATALOG.get_derived(name = "building_table", factory = _build_building_table)
+
+
+# * ********** * #
+# * CITY TABLE * #
+# * ********** * #
+
+type CityField = Literal["resource_potentials", "geo_features", "effects"]
+
+_CITY_FIELD_KEYS: dict[CityField, tuple[str, ...]] = {
+    "resource_potentials": RESOURCE_KEYS,
+    "geo_features": GEO_FEATURE_KEYS,
+    "effects": EFFECT_KEYS,
+}
+
+
+class CityKey(NamedTuple):
+    """
+    Campaign and name of a city. Can be unpacked into `City.from_buildings_count` with `**key._asdict()`.
+    """
+    
+    campaign: str
+    name: str
+
+
+@dataclass(frozen = True, slots = True, kw_only = True)
+class CityTable:
+    """
+    Columnar view of the city definitions.
+    
+    Cities are indexed in the order in which they appear in the cities data. The table is built once per load of the
+    catalog and must not be modified.
+    
+    Attributes:
+        keys (tuple[CityKey, ...]): Campaign and name of each city, by index.
+        campaigns (tuple[str, ...]): Names of all campaigns, in file order.
+        campaign (array[int]): Index (in `campaigns`) of the campaign of each city.
+        resource_potentials (array[int]): Packed N x 3 resource potentials (see `RESOURCE_KEYS`).
+        geo_features (array[int]): Packed N x 4 geographic features (see `GEO_FEATURE_KEYS`).
+        effects (array[int]): Packed N x 3 effect bonuses (see `EFFECT_KEYS`).
+        has_supply_dump (array[int]): 1 if the city has a supply dump, 0 otherwise.
+        is_fort (array[int]): 1 if the city is a fort, 0 otherwise.
+    
+    Public methods:
+        from_data(cities): Build the table from the raw city definitions.
+        column(field, key): Get the values of one key of a packed field for all cities.
+        query(): Start a query that matches all cities.
+    """
+    
+    keys: tuple[CityKey, ...]
+    campaigns: tuple[str, ...]
+    campaign: array[int]
+    resource_potentials: array[int]
+    geo_features: array[int]
+    effects: array[int]
+    has_supply_dump: array[int]
+    is_fort: array[int]
+    _campaign_masks: dict[str, int] = field(repr = False)
+    _supply_dump_mask: int = field(repr = False)
+    _fort_mask: int = field(repr = False)
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    @classmethod
+    def from_data(cls, cities: list[_CityData]) -> CityTable:
+        """
+        Build the table from the raw city definitions.
+        
+        Args:
+            cities (list[_CityData]): The definitions of all cities, in index order.
+        
+        Returns:
+            CityTable: The columnar view of the definitions.
+        """
+        
+        campaign_masks: dict[str, int] = {}
+        campaign_indices: dict[str, int] = {}
+        packed: dict[CityField, array[int]] = {name: array("q") for name in _CITY_FIELD_KEYS}
+        campaign: array[int] = array("q")
+        has_supply_dump: array[int] = array("b")
+        is_fort: array[int] = array("b")
+        supply_dump_mask: int = 0
+        fort_mask: int = 0
+        
+        for index, city in enumerate(cities):
+            bit: int = 1 << index
+            campaign_masks[city["campaign"]] = campaign_masks.get(city["campaign"], 0) | bit
+            campaign.append(campaign_indices.setdefault(city["campaign"], len(campaign_indices)))
+            
+            for name, keys in _CITY_FIELD_KEYS.items():
+                packed[name].extend(city[name][key] for key in keys)
+            
+            has_supply_dump.append(city["has_supply_dump"])
+            is_fort.append(city["is_fort"])
+            supply_dump_mask |= bit if city["has_supply_dump"] else 0
+            fort_mask |= bit if city["is_fort"] else 0
+        
+        return cls(
+            keys = tuple(CityKey(campaign = city["campaign"], name = city["name"]) for city in cities),
+            campaigns = tuple(campaign_masks),
+            campaign = campaign,
+            has_supply_dump = has_supply_dump,
+            is_fort = is_fort,
+            _campaign_masks = campaign_masks,
+            _supply_dump_mask = supply_dump_mask,
+            _fort_mask = fort_mask,
+            **packed,
+        )
+    
+    @property
+    def all_mask(self) -> int:
+        """Mask that matches all cities."""
+        return (1 << len(self.keys)) - 1
+    
+    def column(self, field: CityField, key: str) -> array[int]:
+        """
+        Get the values of one key of a packed field for all cities.
+        
+        Args:
+            field (CityField): The name of the packed field.
+            key (str): The key within the field (e.g. "ore" for "resource_potentials").
+        
+        Raises:
+            KeyError: If the field or the key does not exist.
+        
+        Returns:
+            array[int]: The values, by city index.
+        """
+        
+        if field not in _CITY_FIELD_KEYS or key not in _CITY_FIELD_KEYS[field]:
+            raise KeyError(f"Invalid city column: {field}.{key}")
+        
+        keys: tuple[str, ...] = _CITY_FIELD_KEYS[field]
+        packed: array[int] = getattr(self, field)
+        
+        return packed[keys.index(key)::len(keys)]
+    
+    def mask(
+            self,
+            campaign: str | None = None,
+            is_fort: bool | None = None,
+            has_supply_dump: bool | None = None,
+        ) -> int:
+        """
+        Get the mask of the cities that match all the given filters. Filters that are None are ignored. Uses only the
+        precomputed masks of the table.
+        
+        Args:
+            campaign (str | None): Only match cities of this campaign. Defaults to None.
+            is_fort (bool | None): Only match forts (True) or non-forts (False). Defaults to None.
+            has_supply_dump (bool | None): Only match cities with (True) or without (False) a supply dump. Defaults to
+                None.
+        
+        Returns:
+            int: The mask of the matching cities.
+        """
+        
+        mask: int = self.all_mask
+        
+        if campaign is not None:
+            mask &= self._campaign_masks.get(campaign, 0)
+        
+        if is_fort is not None:
+            mask &= self._fort_mask if is_fort else ~self._fort_mask
+        
+        if has_supply_dump is not None:
+            mask &= self._supply_dump_mask if has_supply_dump else ~self._supply_dump_mask
+        
+        return mask
+    
+    def compare(self, field: CityField, key: str, minimum: int | None = None, maximum: int | None = None) -> int:
+        """
+        Get the mask of the cities whose value of a packed field lies between `minimum` and `maximum` (both inclusive).
+        Bounds that are None are ignored.
+        
+        Args:
+            field (CityField): The name of the packed field.
+            key (str): The key within the field.
+            minimum (int | None): Smallest accepted value. Defaults to None.
+            maximum (int | None): Largest accepted value. Defaults to None.
+        
+        Returns:
+            int: The mask of the matching cities.
+        """
+        
+        column: array[int] = self.column(field = field, key = key)
+        low: float = float("-inf") if minimum is None else minimum
+        high: float = float("inf") if maximum is None else maximum
+        mask: int = 0
+        
+        for index, value in enumerate(column):
+            if low <= value <= high:
+                mask |= 1 << index
+        
+        return mask
+    
+    def query(self) -> CityQuery:
+        """
+        Start a query that matches all cities.
+        
+        Returns:
+            CityQuery: A query over this table.
+        """
+        
+        return CityQuery(table = self, mask = self.all_mask)
+
+
+@dataclass(frozen = True, slots = True, kw_only = True)
+class CityQuery:
+    """
+    Immutable filter/sort/top-k query over a `CityTable`. Every method returns a new query, so partial queries can be
+    reused. Nothing is sorted until the results are requested.
+    
+    Attributes:
+        table (CityTable): The table being queried.
+        mask (int): The mask of the cities that pass all the filters so far.
+        order (tuple[tuple[CityField, str, bool], ...]): Sort keys as (field, key, descending), most significant first.
+            Ties are broken by file order.
+        limit (int | None): Maximum number of results. None means no limit.
+    
+    Public methods:
+        where(campaign, is_fort, has_supply_dump): Keep the cities that match the given flags.
+        between(field, key, minimum, maximum): Keep the cities with a value within the given bounds.
+        at_least(field, key, minimum): Keep the cities with a value of at least `minimum`.
+        at_most(field, key, maximum): Keep the cities with a value of at most `maximum`.
+        sort_by(field, key, descending): Add a sort key.
+        top(k): Keep only the first `k` results.
+        count(): Number of cities that pass the filters (ignoring the limit).
+        indices(): Indices of the resulting cities.
+        keys(): Keys of the resulting cities.
+    """
+    
+    table: CityTable
+    mask: int
+    order: tuple[tuple[CityField, str, bool], ...] = ()
+    limit: int | None = None
+    
+    def where(
+            self,
+            campaign: str | None = None,
+            is_fort: bool | None = None,
+            has_supply_dump: bool | None = None,
+        ) -> CityQuery:
+        """
+        Keep the cities that match all the given flags. Flags that are None are ignored.
+        
+        Args:
+            campaign (str | None): Only keep cities of this campaign. Defaults to None.
+            is_fort (bool | None): Only keep forts (True) or non-forts (False). Defaults to None.
+            has_supply_dump (bool | None): Only keep cities with (True) or without (False) a supply dump. Defaults to
+                None.
+        
+        Returns:
+            CityQuery: The filtered query.
+        """
+        
+        mask: int = self.table.mask(campaign = campaign, is_fort = is_fort, has_supply_dump = has_supply_dump)
+        return replace(self, mask = self.mask & mask)
+    
+    def between(self, field: CityField, key: str, minimum: int | None = None, maximum: int | None = None) -> CityQuery:
+        """
+        Keep the cities whose value of a packed field lies between `minimum` and `maximum` (both inclusive).
+        
+        Args:
+            field (CityField): The name of the packed field (e.g. "resource_potentials").
+            key (str): The key within the field (e.g. "ore").
+            minimum (int | None): Smallest accepted value. Defaults to None.
+            maximum (int | None): Largest accepted value. Defaults to None.
+        
+        Returns:
+            CityQuery: The filtered query.
+        """
+        
+        mask: int = self.table.compare(field = field, key = key, minimum = minimum, maximum = maximum)
+        return replace(self, mask = self.mask & mask)
+    
+    def at_least(self, field: CityField, key: str, minimum: int) -> CityQuery:
+        """
+        Keep the cities whose value of a packed field is at least `minimum`. For example,
+        `at_least("geo_features", "mountains", 1)` keeps the cities with a mountain.
+        
+        Args:
+            field (CityField): The name of the packed field.
+            key (str): The key within the field.
+            minimum (int): Smallest accepted value.
+        
+        Returns:
+            CityQuery: The filtered query.
+        """
+        
+        return self.between(field = field, key = key, minimum = minimum)
+    
+    def at_most(self, field: CityField, key: str, maximum: int) -> CityQuery:
+        """
+        Keep the cities whose value of a packed field is at most `maximum`.
+        
+        Args:
+            field (CityField): The name of the packed field.
+            key (str): The key within the field.
+            maximum (int): Largest accepted value.
+        
+        Returns:
+            CityQuery: The filtered query.
+        """
+        
+        return self.between(field = field, key = key, maximum = maximum)
+    
+    def sort_by(self, field: CityField, key: str, descending: bool = False) -> CityQuery:
+        """
+        Add a sort key. Sort keys added earlier take precedence over the ones added later.
+        
+        Args:
+            field (CityField): The name of the packed field.
+            key (str): The key within the field.
+            descending (bool): Whether to sort from the largest to the smallest value. Defaults to False.
+        
+        Returns:
+            CityQuery: The sorted query.
+        """
+        
+        # Validate the column now, rather than when the results are requested.
+        self.table.column(field = field, key = key)
+        return replace(self, order = (*self.order, (field, key, descending)))
+    
+    def top(self, k: int) -> CityQuery:
+        """
+        Keep only the first `k` results (after sorting).
+        
+        Args:
+            k (int): Maximum number of results.
+        
+        Raises:
+            ValueError: If `k` is negative.
+        
+        Returns:
+            CityQuery: The limited query.
+        """
+        
+        if k < 0:
+            raise ValueError("The number of results cannot be negative.")
+        
+        return replace(self, limit = k if self.limit is None else min(k, self.limit))
+    
+    def count(self) -> int:
+        """
+        Number of cities that pass all the filters, ignoring the limit.
+        
+        Returns:
+            int: The number of matching cities.
+        """
+        
+        return self.mask.bit_count()
+    
+    def indices(self) -> list[int]:
+        """
+        Indices of the cities that pass all the filters, sorted and limited.
+        
+        Returns:
+            list[int]: The city indices.
+        """
+        
+        mask: int = self.mask
+        indices: list[int] = [index for index in range(mask.bit_length()) if mask >> index & 1]
+        
+        if not self.order:
+            return indices if self.limit is None else indices[:self.limit]
+        
+        columns: list[tuple[array[int], int]] = [
+            (self.table.column(field = field, key = key), -1 if descending else 1)
+            for field, key, descending in self.order
+        ]
+        
+        def sort_key(index: int) -> tuple[int, ...]:
+            return tuple(sign * column[index] for column, sign in columns)
+        
+        # Both `sorted` and `nsmallest` are stable, so ties keep the file order.
+        if self.limit is None:
+            return sorted(indices, key = sort_key)
+        
+        return nsmallest(self.limit, indices, key = sort_key)
+    
+    def keys(self) -> list[CityKey]:
+        """
+        Keys of the cities that pass all the filters, sorted and limited.
+        
+        Returns:
+            list[CityKey]: The keys of the cities, ready to be used with `City.from_buildings_count`.
+        """
+        
+        return [self.table.keys[index] for index in self.indices()]
+
+
+def _build_city_table(catalog: Catalog) -> CityTable:
+    return CityTable.from_data(cities = catalog.cities)
+
+
+def get_city_table() -> CityTable:
+    """
+    Get the columnar view of the city definitions. The table is built once per load of the catalog.
+    
+    Returns:
+        CityTable: The columnar view of the city definitions. It is shared and must not be modified.
+    """
+    
+    return CATALOG.get_derived(name = "city_table", factory = _build_city_table)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from collections import Counter
-from typing import Any
+from dataclasses import FrozenInstanceError
+from typing import TYPE_CHECKING, Any
 
-from modules.building import Building
-from modules.effects import EffectBonuses
+from modules.building import Building, get_building_spec, get_building_specs
+from modules.effects import EffectBonuses, FrozenEffectBonuses
 from modules.exceptions import (
     InsufficientNumberOfWorkersError,
     NegativeNumberOfWorkersError,
@@ -12,11 +13,15 @@ from modules.exceptions import (
     UnknownBuildingError,
 )
 from modules.geo_features import GeoFeature
-from modules.resources import Resource, ResourceCollection
+from modules.resources import FrozenResourceCollection, Resource, ResourceCollection
 
 from pytest import mark, raises
 
 
+if TYPE_CHECKING:
+    from modules.building import BuildingSpec
+
+
 @mark.building
 @mark.buildings_data
 class TestBuildingsData:
@@ -343,19 +348,19 @@ class TestBuilding:
         
         assert city_hall.id == "city_hall"
         assert city_hall.name == "City hall"
-        assert isinstance(city_hall.building_cost, ResourceCollection)
+        assert isinstance(city_hall.building_cost, FrozenResourceCollection)
         assert city_hall.building_cost == ResourceCollection(food = 350, ore = 100, wood = 350)
-        assert isinstance(city_hall.maintenance_cost, ResourceCollection)
+        assert isinstance(city_hall.maintenance_cost, FrozenResourceCollection)
         assert city_hall.maintenance_cost == ResourceCollection(food = 1, ore = 1, wood = 1)
-        assert isinstance(city_hall.productivity_bonuses, ResourceCollection)
+        assert isinstance(city_hall.productivity_bonuses, FrozenResourceCollection)
         assert city_hall.productivity_bonuses == ResourceCollection(food = 25, ore = 25, wood = 25)
-        assert isinstance(city_hall.productivity_per_worker, ResourceCollection)
+        assert isinstance(city_hall.productivity_per_worker, FrozenResourceCollection)
         assert city_hall.productivity_per_worker == ResourceCollection()
-        assert isinstance(city_hall.effect_bonuses, EffectBonuses)
+        assert isinstance(city_hall.effect_bonuses, FrozenEffectBonuses)
         assert city_hall.effect_bonuses == EffectBonuses()
-        assert isinstance(city_hall.effect_bonuses_per_worker, EffectBonuses)
+        assert isinstance(city_hall.effect_bonuses_per_worker, FrozenEffectBonuses)
         assert city_hall.effect_bonuses_per_worker == EffectBonuses()
-        assert isinstance(city_hall.storage_capacity, ResourceCollection)
+        assert isinstance(city_hall.storage_capacity, FrozenResourceCollection)
         assert city_hall.storage_capacity == ResourceCollection(food = 100, ore = 100, wood = 100)
         assert city_hall.max_workers == 0
         assert city_hall.is_buildable is True
@@ -420,6 +425,63 @@ class TestBuilding:
             large_mine.set_workers(qty = -1)
 
 
+@mark.building
+class TestBuildingSpec:
+    
+    def test_there_is_one_spec_per_building(self, _buildings: list[dict[str, Any]]) -> None:
+        specs: dict[str, BuildingSpec] = get_building_specs()
+        
+        assert list(specs) == [building["id"] for building in _buildings]
+        assert all(spec.id == building_id for building_id, spec in specs.items())
+    
+    def test_buildings_share_their_spec(self) -> None:
+        farm: Building = Building(id = "farm")
+        other_farm: Building = Building(id = "farm", workers = 2)
+        
+        assert farm.spec is other_farm.spec
+        assert farm.spec is get_building_spec(building_id = "farm")
+        assert farm.productivity_per_worker is other_farm.productivity_per_worker
+        assert farm.workers == 0
+        assert other_farm.workers == 2
+    
+    def test_spec_is_immutable(self) -> None:
+        spec: BuildingSpec = get_building_spec(building_id = "farm")
+        
+        with raises(expected_exception = FrozenInstanceError):
+            spec.max_workers = 10 # pyright: ignore[reportAttributeAccessIssue]
+    
+    def test_spec_collections_are_immutable(self) -> None:
+        spec: BuildingSpec = get_building_spec(building_id = "farm")
+        
+        with raises(expected_exception = FrozenInstanceError):
+            spec.productivity_per_worker.food = 0 # pyright: ignore[reportAttributeAccessIssue]
+        with raises(expected_exception = FrozenInstanceError):
+            spec.effect_bonuses.intelligence = 0 # pyright: ignore[reportAttributeAccessIssue]
+    
+    def test_unknown_spec_raises_error(self) -> None:
+        with raises(expected_exception = UnknownBuildingError):
+            get_building_spec(building_id = "nonexistent_building")
+    
+    def test_building_only_holds_spec_and_workers(self) -> None:
+        farm: Building = Building(id = "farm")
+        
+        assert not hasattr(farm, "__dict__")
+        
+        with raises(expected_exception = AttributeError):
+            farm.color = "red" # pyright: ignore[reportAttributeAccessIssue]
+    
+    def test_buildings_compare_by_id(self) -> None:
+        assert Building(id = "farm") == Building(id = "farm", workers = 3)
+        assert Building(id = "farm") != Building(id = "large_farm")
+        assert repr(Building(id = "farm")) == "Building(id='farm')"
+    
+    def test_list_attributes_are_copies(self) -> None:
+        stables: Building = Building(id = "stables")
+        stables.required_building.append("mine")
+        
+        assert stables.required_building == ["farm", "large_farm", "vineyard", "fishing_village"]
+
+
 @mark.building
 @mark.building_scenarios
 class TestBuildingScenarios:
@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import shutil
+import time
+from typing import TYPE_CHECKING, Any
+
+import yaml
+
+from modules import building, city
+from modules.catalog import CATALOG, Catalog, CatalogWatcher, attach_shared_catalog
+from modules.sources import YamlDataSource
+
+from pytest import fixture, mark, raises
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    
+    from modules.building import _BuildingData
+    from modules.catalog import SharedCatalog
+    from modules.city import _CityData
+
+
+@mark.catalog
+class TestCatalog:
+    
+    def test_catalog_is_not_loaded_until_accessed(self) -> None:
+        catalog: Catalog = Catalog(
+            source = YamlDataSource(),
+        )
+        
+        assert catalog.is_loaded(name = "buildings") is False
+        assert catalog.is_loaded(name = "cities") is False
+        assert catalog.load_times == {}
+        
+        _ = catalog.buildings
+        
+        assert catalog.is_loaded(name = "buildings") is True
+        assert catalog.is_loaded(name = "cities") is False
+        assert "buildings" in catalog.load_times
+        assert "cities" not in catalog.load_times
+    
+    def test_load_loads_all_data_sets(self) -> None:
+        catalog: Catalog = Catalog(
+            source = YamlDataSource(),
+        )
+        catalog.load()
+        
+        assert catalog.is_loaded(name = "buildings") is True
+        assert catalog.is_loaded(name = "cities") is True
+        assert set(catalog.load_times) == {"buildings", "cities"}
+    
+    def test_data_is_only_loaded_once(self) -> None:
+        catalog: Catalog = Catalog(
+            source = YamlDataSource(),
+        )
+        
+        assert catalog.buildings is catalog.buildings
+        assert catalog.cities is catalog.cities
+    
+    def test_is_loaded_with_unknown_name_raises_error(self) -> None:
+        with raises(expected_exception = ValueError, match = "Possible values for `name`"):
+            CATALOG.is_loaded(name = "troops") # pyright: ignore[reportArgumentType]
+    
+    def test_catalog_exposes_the_same_data_as_the_yaml_files(
+            self,
+            _buildings: list[_BuildingData],
+            _cities: list[_CityData],
+        ) -> None:
+        
+        assert CATALOG.buildings == {building["id"]: building for building in _buildings}
+        assert CATALOG.cities == _cities
+    
+    def test_module_attributes_resolve_through_the_catalog(self) -> None:
+        legacy_buildings: Any = building._BUILDINGS
+        legacy_cities: Any = city.CITIES
+        
+        assert legacy_buildings is CATALOG.buildings
+        assert legacy_cities is CATALOG.cities
+    
+    def test_unknown_module_attributes_raise_error(self) -> None:
+        with raises(expected_exception = AttributeError):
+            _ = building._NOT_A_BUILDING # pyright: ignore[reportAttributeAccessIssue]
+        
+        with raises(expected_exception = AttributeError):
+            _ = city.NOT_A_CITY # pyright: ignore[reportAttributeAccessIssue]
+
+
+@mark.catalog
+class TestCatalogSnapshot:
+    
+    @fixture
+    def _data_dir(self, tmp_path: Path) -> Path:
+        shutil.copy(src = "./data/buildings.yaml", dst = tmp_path / "buildings.yaml")
+        shutil.copy(src = "./data/cities.yaml", dst = tmp_path / "cities.yaml")
+        return tmp_path
+    
+    @staticmethod
+    def _build_catalog(data_dir: Path) -> Catalog:
+        return Catalog(
+            source = YamlDataSource(
+                buildings_path = data_dir / "buildings.yaml",
+                cities_path = data_dir / "cities.yaml",
+            ),
+            snapshot_path = data_dir / "catalog.snapshot",
+        )
+    
+    def test_missing_snapshot_is_built_on_first_load(self, _data_dir: Path) -> None:
+        catalog: Catalog = TestCatalogSnapshot._build_catalog(data_dir = _data_dir)
+        _ = catalog.buildings
+        
+        assert catalog.loaded_from == "source"
+        assert catalog.is_loaded(name = "cities") is True
+        assert (_data_dir / "catalog.snapshot").is_file()
+    
+    def test_valid_snapshot_is_used(self, _data_dir: Path) -> None:
+        TestCatalogSnapshot._build_catalog(data_dir = _data_dir).build_snapshot()
+        
+        catalog: Catalog = TestCatalogSnapshot._build_catalog(data_dir = _data_dir)
+        
+        assert catalog.buildings == CATALOG.buildings
+        assert catalog.cities == CATALOG.cities
+        assert catalog.loaded_from == "snapshot"
+        assert "snapshot" in catalog.load_times
+    
+    def test_stale_snapshot_is_rebuilt(self, _data_dir: Path) -> None:
+        TestCatalogSnapshot._build_catalog(data_dir = _data_dir).build_snapshot()
+        
+        buildings_path: Path = _data_dir / "buildings.yaml"
+        buildings_yaml: str = buildings_path.read_text(encoding = "utf-8")
+        buildings_path.write_text(
+            data = buildings_yaml.replace("name: Village hall", "name: Small village hall", 1),
+            encoding = "utf-8",
+        )
+        
+        catalog: Catalog = TestCatalogSnapshot._build_catalog(data_dir = _data_dir)
+        
+        assert catalog.buildings["village_hall"]["name"] == "Small village hall"
+        assert catalog.loaded_from == "source"
+        
+        rebuilt_catalog: Catalog = TestCatalogSnapshot._build_catalog(data_dir = _data_dir)
+        
+        assert rebuilt_catalog.buildings["village_hall"]["name"] == "Small village hall"
+        assert rebuilt_catalog.loaded_from == "snapshot"
+    
+    @mark.parametrize(
+        argnames = "payload",
+        argvalues = [
+            b"not a snapshot",
+            b"cmissing_module\nmissing\n.",  # Unpickles to a ModuleNotFoundError.
+            pickle.dumps(obj = ["foreign", "snapshot"]),
+        ],
+    )
+    def test_corrupt_snapshot_falls_back_to_yaml(self, _data_dir: Path, payload: bytes) -> None:
+        (_data_dir / "catalog.snapshot").write_bytes(data = payload)
+        
+        catalog: Catalog = TestCatalogSnapshot._build_catalog(data_dir = _data_dir)
+        
+        assert catalog.cities == CATALOG.cities
+        assert catalog.loaded_from == "source"
+    
+    def test_build_snapshot_without_path_raises_error(self) -> None:
+        catalog: Catalog = Catalog(
+            source = YamlDataSource(),
+        )
+        
+        with raises(expected_exception = ValueError, match = "no snapshot path"):
+            catalog.build_snapshot()
+
+
+@mark.catalog
+class TestCatalogCityIndex:
+    
+    def test_find_city(self) -> None:
+        roma: _CityData | None = CATALOG.find_city(campaign = "Unification of Italy", name = "Roma")
+        
+        assert roma is not None
+        assert roma["campaign"] == "Unification of Italy"
+        assert roma["name"] == "Roma"
+    
+    def test_find_city_returns_none_for_unknown_city(self) -> None:
+        assert CATALOG.find_city(campaign = "Unification of Italy", name = "Londinium") is None
+        assert CATALOG.find_city(campaign = "Unknown campaign", name = "Roma") is None
+    
+    def test_campaigns(self, _cities: list[_CityData]) -> None:
+        expected_campaigns: list[str] = list(dict.fromkeys(city["campaign"] for city in _cities))
+        assert CATALOG.campaigns == expected_campaigns
+    
+    @mark.parametrize(
+        argnames = ["campaign", "expected_count"],
+        argvalues = [
+            ("Unification of Italy", 45),
+            ("Conquest of Britain", 50),
+            ("Germania", 58),
+            ("Hispania", 63),
+            ("Pacifying the North", 42),
+            ("The Gallic Wars", 53),
+            ("Unknown campaign", 0),
+        ],
+    )
+    def test_count_cities(self, campaign: str, expected_count: int) -> None:
+        assert CATALOG.count_cities(campaign = campaign) == expected_count
+    
+    @mark.parametrize(
+        argnames = ["campaign", "is_fort", "has_supply_dump"],
+        argvalues = [
+            (None, None, None),
+            ("Hispania", None, None),
+            (None, True, None),
+            (None, False, None),
+            (None, None, True),
+            ("Conquest of Britain", False, True),
+            ("Unification of Italy", True, False),
+            ("Unknown campaign", None, None),
+        ],
+    )
+    def test_get_cities_matches_linear_scan(
+            self,
+            campaign: str | None,
+            is_fort: bool | None,
+            has_supply_dump: bool | None,
+            _cities: list[_CityData],
+        ) -> None:
+        expected_cities: list[_CityData] = [
+            city for city in _cities
+            if (campaign is None or city["campaign"] == campaign)
+            and (is_fort is None or city["is_fort"] == is_fort)
+            and (has_supply_dump is None or city["has_supply_dump"] == has_supply_dump)
+        ]
+        
+        cities: list[_CityData] = CATALOG.get_cities(
+            campaign = campaign,
+            is_fort = is_fort,
+            has_supply_dump = has_supply_dump,
+        )
+        
+        assert cities == expected_cities
+
+
+def _describe_worker_catalog(_: int) -> tuple[str | None, int, int]:
+    return CATALOG.loaded_from, len(CATALOG.buildings), len(CATALOG.cities)
+
+
+@mark.catalog
+class TestCatalogSharedMemory:
+    
+    @staticmethod
+    def _build_empty_catalog(tmp_path: Path) -> Catalog:
+        # The files do not exist, so any attempt to read them would fail.
+        return Catalog(
+            source = YamlDataSource(
+                buildings_path = tmp_path / "buildings.yaml",
+                cities_path = tmp_path / "cities.yaml",
+            ),
+            snapshot_path = tmp_path / "catalog.snapshot",
+        )
+    
+    def test_attached_catalog_has_the_same_data(self, tmp_path: Path) -> None:
+        catalog: Catalog = self._build_empty_catalog(tmp_path = tmp_path)
+        
+        with CATALOG.share() as shared:
+            catalog.attach(handle = shared.handle)
+        
+        assert catalog.buildings == CATALOG.buildings
+        assert catalog.cities == CATALOG.cities
+        assert catalog.loaded_from == "shared_memory"
+        assert "shared_memory" in catalog.load_times
+        assert catalog.count_cities(campaign = "Unification of Italy") == 45
+    
+    def test_attached_catalog_outlives_the_shared_block(self, tmp_path: Path) -> None:
+        catalog: Catalog = self._build_empty_catalog(tmp_path = tmp_path)
+        shared: SharedCatalog = CATALOG.share()
+        catalog.attach(handle = shared.handle)
+        shared.close()
+        
+        assert len(catalog.buildings) == len(CATALOG.buildings)
+    
+    def test_attach_after_close_raises_error(self, tmp_path: Path) -> None:
+        catalog: Catalog = self._build_empty_catalog(tmp_path = tmp_path)
+        shared: SharedCatalog = CATALOG.share()
+        shared.close()
+        shared.close()
+        
+        with raises(FileNotFoundError):
+            catalog.attach(handle = shared.handle)
+    
+    def test_pool_workers_attach_to_the_shared_block(self) -> None:
+        context = multiprocessing.get_context(method = "spawn")
+        
+        with CATALOG.share() as shared, context.Pool(
+            processes = 2,
+            initializer = attach_shared_catalog,
+            initargs = (shared.handle,),
+        ) as pool:
+            results: list[tuple[str | None, int, int]] = pool.map(_describe_worker_catalog, range(4))
+        
+        assert set(results) == {("shared_memory", len(CATALOG.buildings), len(CATALOG.cities))}
+
+
+@mark.catalog
+class TestCatalogReload:
+    
+    @fixture
+    def _catalog(self, tmp_path: Path) -> Catalog:
+        shutil.copy(src = "./data/buildings.yaml", dst = tmp_path / "buildings.yaml")
+        shutil.copy(src = "./data/cities.yaml", dst = tmp_path / "cities.yaml")
+        return Catalog(
+            source = YamlDataSource(
+                buildings_path = tmp_path / "buildings.yaml",
+                cities_path = tmp_path / "cities.yaml",
+            ),
+            snapshot_path = tmp_path / "catalog.snapshot",
+        )
+    
+    @staticmethod
+    def _set_farm_max_workers(catalog: Catalog, max_workers: int) -> None:
+        buildings_path: Path = catalog.source.paths[0]
+        content: str = buildings_path.read_text(encoding = "utf-8")
+        farm_start: int = content.index("- id: farm\n")
+        old: str = f"max_workers: {catalog.buildings["farm"]["max_workers"]}"
+        position: int = content.index(old, farm_start)
+        content = content[:position] + f"max_workers: {max_workers}" + content[position + len(old):]
+        buildings_path.write_text(content, encoding = "utf-8")
+        
+        # Make sure that the change is visible to the watcher even on file systems with a coarse modification time.
+        stat: os.stat_result = buildings_path.stat()
+        os.utime(buildings_path, ns = (stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    def test_reload_picks_up_changes(self, _catalog: Catalog) -> None:
+        _catalog.load()
+        
+        self._set_farm_max_workers(catalog = _catalog, max_workers = 10)
+        version: int = _catalog.reload()
+        
+        assert version == _catalog.version == 1
+        assert _catalog.buildings["farm"]["max_workers"] == 10
+        assert "reload" in _catalog.load_times
+    
+    def test_reload_keeps_old_data_for_existing_references(self, _catalog: Catalog) -> None:
+        old_buildings: dict[str, Any] = _catalog.buildings
+        old_max_workers: int = old_buildings["farm"]["max_workers"]
+        
+        self._set_farm_max_workers(catalog = _catalog, max_workers = old_max_workers + 1)
+        _catalog.reload()
+        
+        assert old_buildings["farm"]["max_workers"] == old_max_workers
+        assert _catalog.buildings is not old_buildings
+    
+    def test_reload_discards_derived_values_and_indexes(self, _catalog: Catalog) -> None:
+        old_value: object = _catalog.get_derived(name = "value", factory = lambda _: object())
+        italy_count: int = _catalog.count_cities(campaign = "Unification of Italy")
+        
+        _catalog.reload()
+        
+        assert _catalog.get_derived(name = "value", factory = lambda _: object()) is not old_value
+        assert _catalog.count_cities(campaign = "Unification of Italy") == italy_count
+    
+    def test_reload_calls_callbacks(self, _catalog: Catalog) -> None:
+        versions: list[int] = []
+        _catalog.on_reload(callback = lambda catalog: versions.append(catalog.version))
+        
+        _catalog.reload()
+        _catalog.reload()
+        
+        assert versions == [1, 2]
+    
+    def test_failed_reload_keeps_current_data(self, _catalog: Catalog) -> None:
+        buildings: dict[str, Any] = _catalog.buildings
+        _catalog.source.paths[0].write_text("buildings: [", encoding = "utf-8")
+        
+        with raises(yaml.YAMLError):
+            _catalog.reload()
+        
+        assert _catalog.buildings is buildings
+        assert _catalog.version == 0
+    
+    def test_watcher_check_reloads_on_change(self, _catalog: Catalog) -> None:
+        watcher: CatalogWatcher = CatalogWatcher(catalog = _catalog)
+        
+        assert watcher.check() is False
+        
+        self._set_farm_max_workers(catalog = _catalog, max_workers = 9)
+        
+        assert watcher.check() is True
+        assert watcher.check() is False
+        assert watcher.reload_count == 1
+        assert _catalog.buildings["farm"]["max_workers"] == 9
+    
+    def test_watcher_keeps_data_when_the_file_is_invalid(self, _catalog: Catalog) -> None:
+        watcher: CatalogWatcher = CatalogWatcher(catalog = _catalog)
+        content: str = _catalog.source.paths[0].read_text(encoding = "utf-8")
+        buildings: dict[str, Any] = _catalog.buildings
+        
+        _catalog.source.paths[0].write_text("buildings: [", encoding = "utf-8")
+        
+        assert watcher.check() is False
+        assert isinstance(watcher.last_error, yaml.YAMLError)
+        assert _catalog.buildings is buildings
+        
+        _catalog.source.paths[0].write_text(content, encoding = "utf-8")
+        
+        assert watcher.check() is True
+        assert watcher.last_error is None
+    
+    def test_watcher_thread_reloads_in_the_background(self, _catalog: Catalog) -> None:
+        _catalog.load()
+        
+        with CatalogWatcher(catalog = _catalog, interval = 0.01) as watcher:
+            self._set_farm_max_workers(catalog = _catalog, max_workers = 8)
+            deadline: float = time.monotonic() + 10
+            while watcher.reload_count == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        
+        assert watcher.reload_count == 1
+        assert _catalog.buildings["farm"]["max_workers"] == 8
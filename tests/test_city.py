@@ -1,31 +1,57 @@
 from __future__ import annotations
 
+import re
 from collections import Counter
+from dataclasses import FrozenInstanceError
+from itertools import combinations_with_replacement, islice
 from typing import TYPE_CHECKING
 
 from modules.building import Building
-from modules.city import City, _CityDisplay
+from modules.catalog import CATALOG
+from modules.city import (
+    City,
+    _CityDisplay,
+    clear_city_evaluations,
+    evaluate_city,
+    get_allowed_buildings,
+    get_city_evaluation_stats,
+    iter_city_configurations,
+)
 from modules.display import DEFAULT_SECTION_COLORS
+from modules.effects import FrozenEffectBonuses
 from modules.exceptions import (
     CityNotFoundError,
     FortsCannotHaveBuildingsError,
     InvalidBuidlingConfigurationError,
     MoreThanOneGuildTypeError,
     MoreThanOneHallTypeError,
+    NegativeNumberOfWorkersError,
     NoCityHallError,
     TooManyBuildingsError,
     TooManyHallsError,
+    TooManyWorkersError,
+    UnknownBuildingError,
     UnknownBuildingStaffingStrategyError,
 )
-from modules.resources import Resource
+from modules.resources import FrozenResourceCollection, Resource, ResourceCollection
+from modules.tables import get_building_table
 
 from pytest import fixture, mark, raises
 
 
 if TYPE_CHECKING:
     from modules.building import BuildingsCount
-    from modules.city import _CityData
+    from modules.city import (
+        AllowedBuildings,
+        CityEvaluation,
+        CityVerdict,
+        CityViolation,
+        _CityData,
+        _CityEffectBonuses,
+        _CityProduction,
+    )
     from modules.display import DisplayConfiguration, DisplaySectionConfiguration
+    from modules.tables import BuildingTable
     
     from pytest import FixtureRequest
 
@@ -384,6 +410,29 @@ class TestCity:
         
         assert counts == expected_result
     
+    def test_building_index_returns_first_building_of_each_id(self, _roman_food_producer_city: City) -> None:
+        city: City = _roman_food_producer_city
+        large_farms: list[Building] = [building for building in city.buildings if building.id == "large_farm"]
+        
+        assert len(large_farms) == 5
+        assert city.get_building(building_id = "large_farm") is large_farms[0]
+        assert "large_farm" in city
+        assert "quartermaster" not in city
+    
+    def test_building_index_includes_buildings_added_by_the_city(self, _roman_fort: City) -> None:
+        assert "fort" in _roman_fort
+        assert _roman_fort.get_building(building_id = "fort") is _roman_fort.hall
+        assert _roman_fort.get_buildings_count(by = "id") == {"fort": 1}
+    
+    def test_get_buildings_count_by_id_is_a_copy(self, _roman_military_city: City) -> None:
+        city: City = _roman_military_city
+        counts: BuildingsCount = city.get_buildings_count(by = "id")
+        
+        counts["basilica"] = 99
+        
+        assert city.get_buildings_count(by = "id")["basilica"] == 1
+        assert len(city.buildings) == 9
+    
     def test_get_buildings_count_by_name(self, _roman_military_city: City) -> None:
         counts: BuildingsCount = _roman_military_city.get_buildings_count(by = "name")
         expected_result: BuildingsCount = {
@@ -429,6 +478,122 @@ class TestCity:
                     Building(id = "village_hall"),
                 ],
             )
+    
+    def test_city_results_are_frozen_and_hashable(self, _roman_food_producer_city: City) -> None:
+        city: City = _roman_food_producer_city
+        
+        assert isinstance(city.production.balance, FrozenResourceCollection)
+        assert isinstance(city.effects.total, FrozenEffectBonuses)
+        assert len({city.storage.total, city.storage.total.thaw().freeze()}) == 1
+        
+        with raises(expected_exception = FrozenInstanceError):
+            city.production.balance.food = 0 # pyright: ignore[reportAttributeAccessIssue]
+    
+    def test_city_storage_shares_the_hall_storage(self, _roman_food_producer_city: City) -> None:
+        city: City = _roman_food_producer_city
+        
+        assert city.storage.city is city.hall.storage_capacity
+        assert city.storage.total is not city.hall.storage_capacity
+    
+    def test_sections_are_calculated_on_first_use(self, _roman_food_producer_city: City) -> None:
+        city: City = _roman_food_producer_city
+        
+        assert city._production is None
+        assert city._storage is None
+        
+        production: _CityProduction = city.production
+        
+        assert city.production is production
+        assert city._effects is None
+        assert city._storage is None
+        assert city._defenses is None
+    
+    def test_invalidate_recalculates_sections(self, _roman_food_producer_city: City) -> None:
+        city: City = _roman_food_producer_city
+        production: _CityProduction = city.production
+        workers: int = city.assigned_workers
+        
+        city.get_building(building_id = "large_farm").set_workers(qty = 0)
+        city.invalidate()
+        
+        assert city.assigned_workers == workers - 3
+        assert city.production is not production
+        assert city.production.base.food < production.base.food
+        assert city.effects.workers == city._calculate_worker_effects()
+    
+    @mark.parametrize(argnames = "from_list", argvalues = [False, True])
+    def test_changing_building_workers_updates_the_city(
+            self,
+            _roman_food_producer_buildings: BuildingsCount,
+            from_list: bool,
+        ) -> None:
+        city: City = City.from_buildings_count(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = _roman_food_producer_buildings,
+        )
+        if from_list:
+            city = City(campaign = "Unification of Italy", name = "Roma", buildings = city.buildings)
+        production: _CityProduction = city.production
+        effects: _CityEffectBonuses = city.effects
+        workers: int = city.assigned_workers
+        
+        city.buildings[-1].set_workers(qty = 0)
+        city.get_building(building_id = "basilica").workers = 1
+        
+        assert city.assigned_workers == workers - 2
+        assert city.get_workers_count()["large_farm"] == 12
+        assert city.production.base.food < production.base.food
+        assert city.effects.workers.population_growth > effects.workers.population_growth
+        
+        changed_production: _CityProduction = city.production
+        changed_effects: _CityEffectBonuses = city.effects
+        city.invalidate()
+        
+        assert city.production == changed_production
+        assert city.effects == changed_effects
+    
+    def test_removed_buildings_do_not_update_the_city(self, _roman_food_producer_city: City) -> None:
+        city: City = _roman_food_producer_city
+        building: Building = city.buildings[-1]
+        
+        city.remove_building(building_id = "large_farm")
+        production: _CityProduction = city.production
+        building.set_workers(qty = 0)
+        
+        assert city.production is production
+    
+    @mark.parametrize(
+        argnames = "city",
+        argvalues = [
+            "_roman_military_city",
+            "_roman_food_producer_city",
+            "_roman_ore_producer_city",
+            "_roman_wood_producer_city",
+            "_roman_city_with_fishing_village_and_outcrop_mine",
+            "_roman_city_with_outcrop_and_mountain_mine",
+            "_roman_fort",
+        ],
+    )
+    def test_aggregates_match_a_walk_over_the_buildings(self, city: str, request: FixtureRequest) -> None:
+        test_city: City = request.getfixturevalue(argname = city)
+        buildings: list[Building] = test_city.buildings
+        
+        assert test_city.effects.buildings == sum(building.effect_bonuses for building in buildings)
+        assert test_city.effects.workers == sum(
+            building.effect_bonuses_per_worker * building.workers for building in buildings
+        )
+        assert test_city.production.productivity_bonuses == sum(building.productivity_bonuses for building in buildings)
+        assert test_city.production.maintenance_costs == sum(building.maintenance_cost for building in buildings)
+        assert test_city.storage.buildings == sum(
+            (
+                building.storage_capacity
+                for building in buildings
+                if building.id not in City.POSSIBLE_HALLS and building.id not in {"warehouse", "supply_dump"}
+            ),
+            start = ResourceCollection(),
+        )
+        assert test_city.assigned_workers == sum(building.workers for building in buildings)
 
 
 @mark.city
@@ -438,6 +603,42 @@ class TestCityAllowedBuildingCounts:
     thorughly.
     """
     
+    def test_allowed_buildings_are_precomputed_for_every_hall(self) -> None:
+        table: BuildingTable = get_building_table()
+        
+        for hall_id in City.POSSIBLE_HALLS:
+            allowed_buildings: AllowedBuildings = get_allowed_buildings(
+                campaign = "Unification of Italy",
+                name = "Roma",
+                hall_id = hall_id,
+            )
+            
+            assert allowed_buildings is get_allowed_buildings(
+                campaign = "Unification of Italy",
+                name = "Roma",
+                hall_id = hall_id,
+            )
+            assert list(allowed_buildings.vector) == [allowed_buildings.counts[id_] for id_ in table.ids]
+            assert allowed_buildings.geo_spots + allowed_buildings.empty_spots == City.MAX_BUILDINGS[hall_id]
+            assert hall_id not in allowed_buildings.empty_spot_buildings
+        
+        assert get_allowed_buildings(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            hall_id = "town_hall",
+        ).counts["basilica"] == 0
+    
+    def test_city_reads_the_precomputed_allowed_buildings(self, _roman_food_producer_city: City) -> None:
+        assert _roman_food_producer_city._calculate_allowed_building_counts() is get_allowed_buildings(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            hall_id = "city_hall",
+        ).counts
+    
+    def test_allowed_buildings_for_unknown_city_raises_error(self) -> None:
+        with raises(expected_exception = CityNotFoundError):
+            get_allowed_buildings(campaign = "Conquer the World", name = "Atlantis", hall_id = "city_hall")
+    
     def test_village_with_excess_buildings_raises_error(self) -> None:
         with raises(expected_exception = TooManyBuildingsError, match = "Too many buildings"):
             city: City = City(
@@ -1663,6 +1864,559 @@ class TestWorkersDistribution:
                 ],
                 staffing_strategy = "military_first",
             )
+    
+    @mark.parametrize(
+        argnames = ["name", "buildings", "staffing_strategy"],
+        argvalues = [
+            (name, buildings, staffing_strategy)
+            for name, buildings in [
+                ("Roma", "_roman_military_buildings"),
+                ("Roma", "_roman_food_producer_buildings"),
+                ("Roma", "_roman_food_producer_with_warehouse_buildings"),
+                ("Pentri", "_roman_ore_producer_buildings"),
+            ]
+            for staffing_strategy in [
+                "none", "zero", "production_first", "production_only", "effects_first", "effects_only",
+            ]
+        ],
+    )
+    def test_buildings_count_matches_list_of_buildings(
+            self,
+            name: str,
+            buildings: str,
+            staffing_strategy: str,
+            request: FixtureRequest,
+        ) -> None:
+        
+        buildings_count: BuildingsCount = request.getfixturevalue(buildings)
+        
+        from_count: City = City.from_buildings_count(
+            campaign = "Unification of Italy",
+            name = name,
+            buildings = buildings_count,
+            staffing_strategy = staffing_strategy,
+        )
+        from_list: City = City(
+            campaign = "Unification of Italy",
+            name = name,
+            buildings = [
+                Building(id = building_id) for building_id, qty in buildings_count.items() for _ in range(qty)
+            ],
+            staffing_strategy = staffing_strategy,
+        )
+        
+        assert from_count.assigned_workers == from_list.assigned_workers
+        assert from_count.effects == from_list.effects
+        assert from_count.production == from_list.production
+        assert from_count.storage == from_list.storage
+        assert from_count.defenses == from_list.defenses
+        
+        assert [(building.id, building.workers) for building in from_count.buildings] == [
+            (building.id, building.workers) for building in from_list.buildings
+        ]
+    
+    def test_staffing_tops_up_and_keeps_the_order_of_the_city(self) -> None:
+        farm: Building = Building(id = "farm", workers = 1)
+        last_farm: Building = Building(id = "farm")
+        basilica: Building = Building(id = "basilica")
+        large_farm: Building = Building(id = "large_farm")
+        
+        city: City = City(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = [Building(id = "city_hall"), basilica, farm, large_farm, last_farm],
+            staffing_strategy = "production_first",
+        )
+        
+        assert city.available_workers == 18
+        assert city.assigned_workers == 10
+        assert large_farm.workers == 3
+        assert farm.workers == 3
+        assert last_farm.workers == 3
+        assert basilica.workers == 1
+    
+    def test_buildings_count_does_not_create_buildings_until_needed(
+            self,
+            _roman_food_producer_buildings: BuildingsCount,
+        ) -> None:
+        
+        city: City = City.from_buildings_count(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = _roman_food_producer_buildings,
+        )
+        
+        assert city._buildings is None
+        assert city.get_buildings_count(by = "id")["large_farm"] == 5
+        assert city._buildings is None
+        
+        assert city.buildings[0] is city.hall
+        assert city.buildings is city.buildings
+    
+    def test_buildings_count_with_unknown_building_raises_error(self) -> None:
+        with raises(expected_exception = UnknownBuildingError):
+            City.from_buildings_count(
+                campaign = "Unification of Italy",
+                name = "Roma",
+                buildings = {"city_hall": 1, "space_elevator": 1},
+            )
+
+
+@mark.city
+class TestCityChanges:
+    
+    @staticmethod
+    def _create_city(buildings: BuildingsCount, from_count: bool) -> City:
+        
+        if from_count:
+            return City.from_buildings_count(campaign = "Unification of Italy", name = "Roma", buildings = buildings)
+        
+        return City(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = [Building(id = building_id) for building_id, qty in buildings.items() for _ in range(qty)],
+        )
+    
+    @staticmethod
+    def _assert_matches_a_new_city(city: City) -> None:
+        
+        new_city: City = City(
+            campaign = city.campaign,
+            name = city.name,
+            buildings = [Building(id = building.id, workers = building.workers) for building in city.buildings],
+            staffing_strategy = "none",
+        )
+        
+        assert city.get_buildings_count(by = "id") == new_city.get_buildings_count(by = "id")
+        assert city.assigned_workers == new_city.assigned_workers
+        assert city.effects == new_city.effects
+        assert city.production == new_city.production
+        assert city.storage == new_city.storage
+        assert city.defenses == new_city.defenses
+        assert city.focus == new_city.focus
+    
+    @mark.parametrize(
+        argnames = ["from_count", "calculated"],
+        argvalues = [(True, True), (True, False), (False, True), (False, False)],
+    )
+    def test_changes_match_a_new_city(
+            self,
+            from_count: bool,
+            calculated: bool,
+            _roman_food_producer_buildings: BuildingsCount,
+        ) -> None:
+        
+        city: City = self._create_city(buildings = _roman_food_producer_buildings, from_count = from_count)
+        
+        if calculated:
+            self._assert_matches_a_new_city(city = city)
+        
+        city.remove_building(building_id = "large_farm")
+        if calculated:
+            self._assert_matches_a_new_city(city = city)
+        
+        city.add_building(building_id = "warehouse")
+        if calculated:
+            self._assert_matches_a_new_city(city = city)
+        
+        city.replace_building(building_id = "basilica", new_building_id = "barracks")
+        if calculated:
+            self._assert_matches_a_new_city(city = city)
+        
+        city.set_workers(building_id = "vineyard", qty = 1)
+        city.set_workers(building_id = "large_farm", qty = 10)
+        
+        self._assert_matches_a_new_city(city = city)
+        assert [building.workers for building in city.buildings if building.id == "large_farm"] == [3, 3, 3, 1]
+    
+    def test_removing_a_building_removes_its_workers(self, _roman_food_producer_city: City) -> None:
+        city: City = _roman_food_producer_city
+        workers: int = city.assigned_workers
+        
+        city.remove_building(building_id = "vineyard")
+        
+        assert "vineyard" not in city
+        assert city.assigned_workers == workers - 3
+        assert city.production.base == city._calculate_base_production()
+    
+    def test_invalid_changes_do_not_change_the_city(self, _roman_food_producer_city: City) -> None:
+        city: City = _roman_food_producer_city
+        counts: BuildingsCount = dict(city.get_buildings_count(by = "id"))
+        production: _CityProduction = city.production
+        
+        with raises(expected_exception = TooManyBuildingsError):
+            city.add_building(building_id = "warehouse")
+        
+        with raises(expected_exception = MoreThanOneGuildTypeError):
+            city.replace_building(building_id = "large_farm", new_building_id = "carpenters_guild")
+        
+        with raises(expected_exception = MoreThanOneHallTypeError):
+            city.replace_building(building_id = "large_farm", new_building_id = "town_hall")
+        
+        assert city.get_buildings_count(by = "id") == counts
+        assert city.production is production
+    
+    def test_invalid_removals_raise_errors(self, _roman_food_producer_city: City) -> None:
+        
+        with raises(expected_exception = NoCityHallError):
+            _roman_food_producer_city.remove_building(building_id = "city_hall")
+        
+        with raises(expected_exception = KeyError):
+            _roman_food_producer_city.remove_building(building_id = "warehouse")
+    
+    def test_invalid_workers_raise_errors(self, _roman_food_producer_city: City) -> None:
+        
+        with raises(expected_exception = NegativeNumberOfWorkersError):
+            _roman_food_producer_city.set_workers(building_id = "basilica", qty = -1)
+        
+        with raises(expected_exception = TooManyWorkersError, match = "Max is 1"):
+            _roman_food_producer_city.set_workers(building_id = "basilica", qty = 2)
+        
+        with raises(expected_exception = TooManyWorkersError, match = "Not enough workers"):
+            _roman_food_producer_city.set_workers(building_id = "basilica", qty = 1)
+
+
+@mark.city
+class TestCityEvaluation:
+    
+    @fixture(autouse = True)
+    def _empty_cache(self) -> None:
+        clear_city_evaluations()
+    
+    def test_evaluation_matches_the_city(self, _roman_food_producer_buildings: BuildingsCount) -> None:
+        city: City = City.from_buildings_count(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = _roman_food_producer_buildings,
+        )
+        evaluation: CityEvaluation = evaluate_city(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = _roman_food_producer_buildings,
+        )
+        
+        assert dict(evaluation.buildings) == {
+            building_id: qty for building_id, qty in _roman_food_producer_buildings.items() if qty > 0
+        }
+        assert dict(evaluation.workers) == city.get_workers_count()
+        assert evaluation.assigned_workers == city.assigned_workers
+        assert evaluation.effects == city.effects
+        assert evaluation.production == city.production
+        assert evaluation.storage == city.storage
+        assert evaluation.defenses == city.defenses
+        assert evaluation.focus == city.focus
+    
+    def test_evaluation_is_immutable_and_hashable(self) -> None:
+        evaluation: CityEvaluation = evaluate_city(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = {"city_hall": 1, "large_farm": 2},
+        )
+        
+        assert len({evaluation}) == 1
+        
+        with raises(expected_exception = FrozenInstanceError):
+            evaluation.production.balance = evaluation.production.total # pyright: ignore[reportAttributeAccessIssue]
+    
+    def test_equivalent_counts_share_the_evaluation(self) -> None:
+        evaluation: CityEvaluation = evaluate_city(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = {"city_hall": 1, "large_farm": 2, "warehouse": 0},
+        )
+        
+        assert evaluate_city(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = {"large_farm": 2, "city_hall": 1},
+        ) is evaluation
+        assert evaluate_city(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = {"city_hall": 1, "large_farm": 2},
+            staffing_strategy = "zero",
+        ) is not evaluation
+        
+        assert get_city_evaluation_stats().hits == 1
+        assert get_city_evaluation_stats().misses == 2
+    
+    def test_errors_are_not_cached(self) -> None:
+        
+        for _ in range(2):
+            with raises(expected_exception = NoCityHallError):
+                evaluate_city(campaign = "Unification of Italy", name = "Roma", buildings = {"large_farm": 1})
+        
+        assert get_city_evaluation_stats().currsize == 0
+    
+    def test_catalog_reload_clears_the_cache(self) -> None:
+        evaluate_city(campaign = "Unification of Italy", name = "Roma", buildings = {"city_hall": 1})
+        
+        CATALOG.reload()
+        
+        assert get_city_evaluation_stats().currsize == 0
+    
+    def test_cached_city_matches_a_new_city(self, _roman_food_producer_buildings: BuildingsCount) -> None:
+        city: City = City.from_buildings_count(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = _roman_food_producer_buildings,
+        )
+        
+        for _ in range(2):
+            cached_city: City = City.from_buildings_count(
+                campaign = "Unification of Italy",
+                name = "Roma",
+                buildings = _roman_food_producer_buildings,
+                cached = True,
+            )
+            
+            assert cached_city.assigned_workers == city.assigned_workers
+            assert cached_city.production == city.production
+            assert cached_city.storage == city.storage
+            assert [(building.id, building.workers) for building in cached_city.buildings] == [
+                (building.id, building.workers) for building in city.buildings
+            ]
+            
+            # Changing a cached city does not change the evaluation it was created from.
+            cached_city.remove_building(building_id = "vineyard")
+        
+        assert get_city_evaluation_stats().hits == 1
+    
+    def test_get_workers_count_is_a_copy(self, _roman_food_producer_buildings: BuildingsCount) -> None:
+        city: City = City.from_buildings_count(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = _roman_food_producer_buildings,
+            cached = True,
+        )
+        workers: BuildingsCount = city.get_workers_count()
+        
+        workers["vineyard"] = 99
+        
+        assert city.get_workers_count() != workers
+        assert sum(city.get_workers_count().values()) == city.assigned_workers
+    
+    @mark.parametrize(
+        argnames = "staffing_strategy",
+        argvalues = ["production_first", "production_only", "effects_first"],
+    )
+    def test_cached_city_keeps_the_staffing_order_of_ties(self, staffing_strategy: str) -> None:
+        # The large production buildings have the same staffing rank, so they are staffed in the order of the count.
+        orders: list[BuildingsCount] = [
+            {"city_hall": 1, "large_mine": 3, "large_farm": 3, "large_lumber_mill": 2},
+            {"large_lumber_mill": 2, "large_farm": 3, "city_hall": 1, "large_mine": 3},
+        ]
+        
+        for buildings in orders:
+            city: City = City.from_buildings_count(
+                campaign = "Unification of Italy",
+                name = "Boii",
+                buildings = buildings,
+                staffing_strategy = staffing_strategy,
+            )
+            cached_city: City = City.from_buildings_count(
+                campaign = "Unification of Italy",
+                name = "Boii",
+                buildings = buildings,
+                staffing_strategy = staffing_strategy,
+                cached = True,
+            )
+            
+            assert cached_city.get_workers_count() == city.get_workers_count()
+            assert cached_city.production == city.production
+            assert cached_city.effects == city.effects
+        
+        assert get_city_evaluation_stats().misses == 2
+
+
+
+@mark.city
+class TestCityCheck:
+    
+    @mark.parametrize(
+        argnames = ["campaign", "name", "buildings"],
+        argvalues = [
+            ("Unification of Italy", "Roma", {"city_hall": 1, "large_farm": 5, "warehouse": 0}),
+            ("Germania", "Vetera", {}),
+            ("Conquest of Britain", "Anderitum", {"city_hall": 1, "large_mine": 2}),
+        ],
+    )
+    def test_valid_counts_share_the_valid_verdict(self, campaign: str, name: str, buildings: BuildingsCount) -> None:
+        verdict: CityVerdict = City.check(campaign = campaign, name = name, buildings = buildings)
+        
+        assert verdict
+        assert verdict.is_valid
+        assert verdict.rules == ()
+        assert verdict is City.check(campaign = campaign, name = name, buildings = buildings, all_violations = True)
+        
+        verdict.raise_first_violation()
+        City.from_buildings_count(campaign = campaign, name = name, buildings = buildings)
+    
+    def test_check_does_not_change_the_count(self, _roman_food_producer_buildings: BuildingsCount) -> None:
+        buildings: BuildingsCount = dict(_roman_food_producer_buildings)
+        
+        City.check(campaign = "Unification of Italy", name = "Roma", buildings = buildings)
+        
+        assert buildings == _roman_food_producer_buildings
+    
+    @mark.parametrize(
+        argnames = ["campaign", "name", "buildings", "rule", "expected_exception"],
+        argvalues = [
+            ("Unification of Italy", "Roma", {"city_hall": 1, "castle": 1}, "buildings", UnknownBuildingError),
+            ("Unification of Italy", "Atlantis", {"city_hall": 1}, "city", CityNotFoundError),
+            ("Unification of Italy", "Roma", {"large_farm": 1}, "halls", NoCityHallError),
+            ("Unification of Italy", "Roma", {"town_hall": 1, "city_hall": 1}, "halls", MoreThanOneHallTypeError),
+            ("Unification of Italy", "Roma", {"city_hall": 2}, "halls", TooManyHallsError),
+            ("Germania", "Vetera", {"large_farm": 1}, "forts", FortsCannotHaveBuildingsError),
+            (
+                "Unification of Italy",
+                "Roma",
+                {"city_hall": 1, "large_farm": 9},
+                "total_buildings",
+                TooManyBuildingsError,
+            ),
+            (
+                "Unification of Italy",
+                "Roma",
+                {"village_hall": 1, "basilica": 1},
+                "building_counts",
+                TooManyBuildingsError,
+            ),
+            (
+                "Unification of Italy",
+                "Roma",
+                {"city_hall": 1, "farmers_guild": 1, "carpenters_guild": 1},
+                "guilds",
+                MoreThanOneGuildTypeError,
+            ),
+            (
+                "Conquest of Britain",
+                "Moridun",
+                {"city_hall": 1, "basilica": 1, "miners_guild": 1, "large_mine": 6},
+                "empty_building_spots",
+                InvalidBuidlingConfigurationError,
+            ),
+        ],
+    )
+    def test_first_violation_is_the_error_of_a_new_city(
+            self,
+            campaign: str,
+            name: str,
+            buildings: BuildingsCount,
+            rule: str,
+            expected_exception: type[Exception],
+        ) -> None:
+        verdict: CityVerdict = City.check(campaign = campaign, name = name, buildings = buildings)
+        
+        assert not verdict
+        assert verdict.rules == (rule,)
+        assert rule in City.RULES
+        
+        violation: CityViolation = verdict.violations[0]
+        assert isinstance(violation.error, expected_exception)
+        
+        with raises(expected_exception = expected_exception, match = re.escape(str(violation.error))):
+            City.from_buildings_count(campaign = campaign, name = name, buildings = buildings)
+        
+        with raises(expected_exception = expected_exception, match = re.escape(str(violation.error))):
+            verdict.raise_first_violation()
+    
+    def test_all_violations_are_listed_in_order(self) -> None:
+        verdict: CityVerdict = City.check(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = {"city_hall": 2, "large_farm": 9, "farmers_guild": 1, "miners_guild": 1},
+            all_violations = True,
+        )
+        
+        assert verdict.rules == ("halls", "total_buildings", "building_counts", "guilds", "empty_building_spots")
+        assert City.check(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = {"city_hall": 2, "large_farm": 9, "farmers_guild": 1, "miners_guild": 1},
+        ).rules == ("halls",)
+    
+    def test_unknown_buildings_and_cities_end_the_check(self) -> None:
+        verdict: CityVerdict = City.check(
+            campaign = "Unification of Italy",
+            name = "Atlantis",
+            buildings = {"castle": 1, "tower": 1, "large_farm": 9},
+            all_violations = True,
+        )
+        
+        assert verdict.rules == ("buildings", "buildings", "city")
+    
+    def test_rules_that_depend_on_the_hall_need_a_hall(self) -> None:
+        verdict: CityVerdict = City.check(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = {"large_farm": 9},
+            all_violations = True,
+        )
+        
+        assert verdict.rules == ("halls",)
+
+
+@mark.city
+class TestCityConfigurations:
+    
+    def test_configurations_match_every_valid_count(self) -> None:
+        # Every count of up to 4 buildings (the most a village hall allows) of the types the city can have.
+        building_ids: list[str] = [
+            building_id
+            for building_id, allowed_count in get_allowed_buildings(
+                campaign = "Unification of Italy",
+                name = "Roma",
+                hall_id = "village_hall",
+            ).counts.items()
+            if allowed_count > 0 and building_id not in City.POSSIBLE_HALLS
+        ]
+        valid_counts: set[frozenset[tuple[str, int]]] = set()
+        
+        for qty in range(City.MAX_BUILDINGS["village_hall"] + 1):
+            for combination in combinations_with_replacement(building_ids, qty):
+                buildings: BuildingsCount = {"village_hall": 1, **Counter(combination)}
+                if City.check(campaign = "Unification of Italy", name = "Roma", buildings = buildings):
+                    valid_counts.add(frozenset(buildings.items()))
+        
+        configurations: list[BuildingsCount] = list(
+            iter_city_configurations(campaign = "Unification of Italy", name = "Roma", hall_id = "village_hall"),
+        )
+        
+        assert len(configurations) == len(valid_counts)
+        assert {frozenset(configuration.items()) for configuration in configurations} == valid_counts
+    
+    @mark.parametrize(
+        argnames = ["campaign", "name", "hall_id"],
+        argvalues = [
+            ("Unification of Italy", "Roma", "city_hall"),
+            ("Conquest of Britain", "Anderitum", "town_hall"),
+            ("Conquest of Britain", "Moridun", "city_hall"),
+        ],
+    )
+    def test_configurations_are_valid_and_unique(self, campaign: str, name: str, hall_id: str) -> None:
+        configurations: list[BuildingsCount] = list(
+            islice(iter_city_configurations(campaign = campaign, name = name, hall_id = hall_id), 5000),
+        )
+        
+        assert configurations[0] == City.from_buildings_count(
+            campaign = campaign,
+            name = name,
+            buildings = {hall_id: 1},
+        ).get_buildings_count(by = "id")
+        assert len({frozenset(configuration.items()) for configuration in configurations}) == len(configurations)
+        
+        for configuration in configurations:
+            assert 0 not in configuration.values()
+            assert City.check(campaign = campaign, name = name, buildings = configuration)
+    
+    def test_fort_configurations(self) -> None:
+        assert list(iter_city_configurations(campaign = "Germania", name = "Vetera", hall_id = "fort")) == [{"fort": 1}]
+        assert list(iter_city_configurations(campaign = "Germania", name = "Vetera", hall_id = "city_hall")) == []
+    
+    def test_configurations_for_unknown_city_raise_error(self) -> None:
+        with raises(expected_exception = CityNotFoundError):
+            iter_city_configurations(campaign = "Unification of Italy", name = "Atlantis", hall_id = "city_hall")
 
 
 @mark.city
@@ -1,8 +1,8 @@
 from collections import Counter
-from dataclasses import fields
+from dataclasses import FrozenInstanceError, fields
 from typing import Literal
 
-from modules.effects import EffectBonuses
+from modules.effects import EffectBonuses, FrozenEffectBonuses
 
 from pytest import mark, raises
 
@@ -89,3 +89,63 @@ class TestEffectBonuses:
         
         with raises(expected_exception = KeyError, match = "Invalid effect name: spy"):
             effects.get(key = "spy")
+    
+    def test_add_and_sub(self) -> None:
+        left: EffectBonuses = EffectBonuses(troop_training = 5, population_growth = 10, intelligence = 15)
+        right: EffectBonuses = EffectBonuses(troop_training = 1, population_growth = 2, intelligence = 3)
+        
+        assert left + right == EffectBonuses(troop_training = 6, population_growth = 12, intelligence = 18)
+        assert left - right == EffectBonuses(troop_training = 4, population_growth = 8, intelligence = 12)
+    
+    def test_mul_and_sum(self) -> None:
+        effects: EffectBonuses = EffectBonuses(troop_training = 1, population_growth = 2, intelligence = 3)
+        
+        assert effects * 2 == EffectBonuses(troop_training = 2, population_growth = 4, intelligence = 6)
+        assert sum([effects, 2 * effects]) == EffectBonuses(troop_training = 3, population_growth = 6, intelligence = 9)
+    
+    def test_in_place_add_mutates_left_operand(self) -> None:
+        effects: EffectBonuses = EffectBonuses()
+        same: EffectBonuses = effects
+        
+        effects += EffectBonuses(troop_training = 1, population_growth = 2, intelligence = 3)
+        
+        assert effects is same
+        assert effects == EffectBonuses(troop_training = 1, population_growth = 2, intelligence = 3)
+    
+    def test_arithmetic_with_unsupported_type_raises_type_error(self) -> None:
+        effects: EffectBonuses = EffectBonuses()
+        
+        with raises(expected_exception = TypeError):
+            effects + 1
+        with raises(expected_exception = TypeError):
+            effects * 1.5
+    
+    def test_uses_slots(self) -> None:
+        assert not hasattr(EffectBonuses(), "__dict__")
+
+
+@mark.effect_bonuses
+class TestFrozenEffectBonuses:
+    
+    def test_freeze_and_thaw(self) -> None:
+        effects: EffectBonuses = EffectBonuses(troop_training = 1, population_growth = 2, intelligence = 3)
+        frozen: FrozenEffectBonuses = effects.freeze()
+        
+        assert frozen == effects
+        assert frozen.freeze() is frozen
+        assert isinstance(frozen.thaw(), EffectBonuses)
+    
+    def test_is_immutable_and_hashable(self) -> None:
+        frozen: FrozenEffectBonuses = FrozenEffectBonuses(troop_training = 1)
+        
+        assert len({frozen, FrozenEffectBonuses(troop_training = 1)}) == 1
+        with raises(expected_exception = FrozenInstanceError):
+            frozen.troop_training = 10  # type: ignore[misc]
+        with raises(expected_exception = TypeError, match = "unhashable"):
+            hash(EffectBonuses())
+    
+    def test_with_returns_updated_copy(self) -> None:
+        frozen: FrozenEffectBonuses = FrozenEffectBonuses(troop_training = 1)
+        
+        assert frozen.with_(intelligence = 5) == FrozenEffectBonuses(troop_training = 1, intelligence = 5)
+        assert frozen.intelligence == 0
@@ -1,8 +1,8 @@
 from collections import Counter
-from dataclasses import fields
+from dataclasses import FrozenInstanceError, fields
 from typing import Literal
 
-from modules.geo_features import GeoFeatures
+from modules.geo_features import FrozenGeoFeatures, GeoFeatures
 
 from pytest import mark, raises
 
@@ -98,3 +98,30 @@ class TestGeoFeatures:
         
         with raises(expected_exception = KeyError, match = "Invalid geo feature name: gold_deposit"):
             geo_features.get(key = "gold_deposit")
+
+
+@mark.geo_features
+class TestFrozenGeoFeatures:
+    
+    def test_freeze_and_thaw(self) -> None:
+        geo_features: GeoFeatures = GeoFeatures(lakes = 1, forests = 2)
+        frozen: FrozenGeoFeatures = geo_features.freeze()
+        
+        assert frozen == geo_features
+        assert frozen.freeze() is frozen
+        assert isinstance(frozen.thaw(), GeoFeatures)
+    
+    def test_is_immutable_and_hashable(self) -> None:
+        frozen: FrozenGeoFeatures = FrozenGeoFeatures(lakes = 1)
+        
+        assert len({frozen, FrozenGeoFeatures(lakes = 1)}) == 1
+        with raises(expected_exception = FrozenInstanceError):
+            frozen.lakes = 10  # type: ignore[misc]
+        with raises(expected_exception = TypeError, match = "unhashable"):
+            hash(GeoFeatures())
+    
+    def test_with_returns_updated_copy(self) -> None:
+        frozen: FrozenGeoFeatures = FrozenGeoFeatures(lakes = 1)
+        
+        assert frozen.with_(mountains = 2) == FrozenGeoFeatures(lakes = 1, mountains = 2)
+        assert frozen.mountains == 0
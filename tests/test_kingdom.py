@@ -11,6 +11,7 @@ from pytest import mark, raises
 
 if TYPE_CHECKING:
     from modules.building import BuildingsCount
+    from modules.city import CityDict
 
 
 @mark.kingdom
@@ -38,6 +39,23 @@ class TestKingdom:
         assert kingdom.kingdom_total_storage.ore == 350
         assert kingdom.kingdom_total_storage.wood == 350
     
+    def test_cached_kingdom_matches_kingdom(
+            self,
+            _roman_military_buildings: BuildingsCount,
+            _roman_food_producer_buildings: BuildingsCount,
+        ) -> None:
+        data: list[CityDict] = [
+            {"campaign": "Unification of Italy", "name": "Roma", "buildings": _roman_military_buildings},
+            {"campaign": "Unification of Italy", "name": "Caere", "buildings": _roman_food_producer_buildings},
+        ]
+        
+        kingdom: Kingdom = Kingdom.from_list(data = data)
+        cached_kingdom: Kingdom = Kingdom.from_list(data = data, cached = True)
+        
+        assert cached_kingdom.kingdom_total_production == kingdom.kingdom_total_production
+        assert cached_kingdom.kingdom_total_storage == kingdom.kingdom_total_storage
+        assert [city.focus for city in cached_kingdom.cities] == [city.focus for city in kingdom.cities]
+    
     def test_kingdom_from_list(
             self,
             _roman_military_buildings: BuildingsCount,
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import TYPE_CHECKING
+
+from modules.city import City, iter_city_configurations
+from modules.optimization import CITY_METRICS, CityConstraint, find_city_frontier, optimize_city
+
+from pytest import mark, raises
+
+
+if TYPE_CHECKING:
+    from modules.optimization import CityFrontier, CityOptimum
+    from modules.scenario import Scenario
+
+
+def _create_valid_cities(
+        campaign: str,
+        name: str,
+        hall_id: str,
+        constraints: list[CityConstraint],
+        staffing_strategy: str = "production_first",
+    ) -> list[City]:
+    # Evaluates every configuration of the city, and keeps the ones that satisfy the constraints.
+    
+    cities: list[City] = []
+    
+    for buildings in iter_city_configurations(campaign = campaign, name = name, hall_id = hall_id):
+        city: City = City.from_buildings_count(
+            campaign = campaign,
+            name = name,
+            buildings = buildings,
+            staffing_strategy = staffing_strategy,
+        )
+        if all(
+            constraint.allows(attrgetter(constraint.metric)(city), attrgetter(constraint.metric)(city))
+            for constraint in constraints
+        ):
+            cities.append(city)
+    
+    return cities
+
+
+def _find_best_value(
+        campaign: str,
+        name: str,
+        hall_id: str,
+        objective: str,
+        constraints: list[CityConstraint],
+        minimize: bool,
+        staffing_strategy: str = "production_first",
+    ) -> int | None:
+    
+    values: list[int] = [
+        attrgetter(objective)(city)
+        for city in _create_valid_cities(
+            campaign = campaign,
+            name = name,
+            hall_id = hall_id,
+            constraints = constraints,
+            staffing_strategy = staffing_strategy,
+        )
+    ]
+    
+    if not values:
+        return None
+    
+    return min(values) if minimize else max(values)
+
+
+def _find_frontier_values(
+        campaign: str,
+        name: str,
+        hall_id: str,
+        metrics: list[str],
+        constraints: list[CityConstraint],
+        minimize: list[str],
+    ) -> set[tuple[int, ...]]:
+    
+    signs: list[int] = [-1 if metric in minimize else 1 for metric in metrics]
+    points: set[tuple[int, ...]] = {
+        tuple(sign * attrgetter(metric)(city) for sign, metric in zip(signs, metrics, strict = True))
+        for city in _create_valid_cities(campaign = campaign, name = name, hall_id = hall_id, constraints = constraints)
+    }
+    
+    return {
+        tuple(sign * value for sign, value in zip(signs, point, strict = True))
+        for point in points
+        if not any(
+            other != point and all(value >= other_value for value, other_value in zip(other, point, strict = True))
+            for other in points
+        )
+    }
+
+
+@mark.optimization
+class TestOptimizeCity:
+    
+    @mark.parametrize(
+        argnames = ["name", "objective", "constraints", "minimize"],
+        argvalues = [
+            ("Reate", "production.balance.ore", [], False),
+            (
+                "Reate",
+                "production.balance.ore",
+                [CityConstraint(metric = "production.balance.food", minimum = 0)],
+                False,
+            ),
+            ("Roma", "production.total.food", [CityConstraint(metric = "production.balance.wood", minimum = 0)], False),
+            ("Roma", "storage.total.wood", [CityConstraint(metric = "production.balance.food", maximum = 100)], False),
+            (
+                "Roma",
+                "effects.total.population_growth",
+                [CityConstraint(metric = "defenses.squadrons", minimum = 2)],
+                False,
+            ),
+            (
+                "Roma",
+                "production.maintenance_costs.food",
+                [CityConstraint(metric = "effects.workers.intelligence", minimum = 5)],
+                True,
+            ),
+            ("Roma", "production.balance.food", [], True),
+        ],
+    )
+    def test_optimum_matches_every_configuration(
+            self,
+            name: str,
+            objective: str,
+            constraints: list[CityConstraint],
+            minimize: bool,
+        ) -> None:
+        optimum: CityOptimum | None = optimize_city(
+            campaign = "Unification of Italy",
+            name = name,
+            objective = objective,
+            constraints = constraints,
+            hall_id = "village_hall",
+            minimize = minimize,
+        )
+        
+        assert optimum is not None
+        assert optimum.value == _find_best_value(
+            campaign = "Unification of Italy",
+            name = name,
+            hall_id = "village_hall",
+            objective = objective,
+            constraints = constraints,
+            minimize = minimize,
+        )
+    
+    @mark.parametrize(
+        argnames = "staffing_strategy",
+        argvalues = ["production_first", "production_only", "effects_first", "effects_only", "zero"],
+    )
+    def test_optimum_follows_the_staffing_strategy(self, staffing_strategy: str) -> None:
+        
+        for objective, minimize in [("production.balance.food", True), ("effects.total.intelligence", False)]:
+            optimum: CityOptimum | None = optimize_city(
+                campaign = "Unification of Italy",
+                name = "Roma",
+                objective = objective,
+                hall_id = "village_hall",
+                minimize = minimize,
+                staffing_strategy = staffing_strategy,
+            )
+            
+            assert optimum is not None
+            assert optimum.value == _find_best_value(
+                campaign = "Unification of Italy",
+                name = "Roma",
+                hall_id = "village_hall",
+                objective = objective,
+                constraints = [],
+                minimize = minimize,
+                staffing_strategy = staffing_strategy,
+            )
+    
+    def test_minimized_production_is_pruned(self) -> None:
+        # Every staffed slot gets workers until they run out, so a city can not avoid producing food.
+        optimum: CityOptimum | None = optimize_city(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            objective = "production.balance.food",
+            minimize = True,
+        )
+        
+        assert optimum is not None
+        assert optimum.value == -82
+        assert optimum.evaluated < 10_000
+    
+    def test_optimum_builds_its_city(self) -> None:
+        constraint: CityConstraint = CityConstraint(metric = "effects.total.troop_training", minimum = 50)
+        optimum: CityOptimum | None = optimize_city(
+            campaign = "Unification of Italy",
+            name = "Reate",
+            objective = "production.balance.ore",
+            constraints = [constraint],
+        )
+        
+        assert optimum is not None
+        assert City.check(campaign = "Unification of Italy", name = "Reate", buildings = optimum.buildings)
+        assert optimum.city.get_buildings_count(by = "id") == optimum.buildings
+        assert optimum.value == optimum.city.production.balance.ore
+        assert optimum.city.effects.total.troop_training >= 50
+        assert optimum.evaluated < 10_000
+    
+    def test_impossible_constraints_return_none(self) -> None:
+        assert optimize_city(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            objective = "production.balance.food",
+            constraints = [CityConstraint(metric = "defenses.squadrons", minimum = 5)],
+        ) is None
+        assert optimize_city(
+            campaign = "Germania",
+            name = "Vetera",
+            objective = "production.balance.food",
+        ) is None
+    
+    def test_fort_has_a_single_configuration(self) -> None:
+        optimum: CityOptimum | None = optimize_city(
+            campaign = "Germania",
+            name = "Vetera",
+            objective = "defenses.squadrons",
+            hall_id = "fort",
+        )
+        
+        assert optimum is not None
+        assert optimum.buildings == {"fort": 1}
+        assert optimum.value == 3
+    
+    def test_unknown_metric_raises_error(self) -> None:
+        assert "production.balance.ore" in CITY_METRICS
+        
+        with raises(expected_exception = ValueError, match = "Unknown city metric"):
+            optimize_city(campaign = "Unification of Italy", name = "Roma", objective = "production.ore")
+        
+        with raises(expected_exception = ValueError, match = "Unknown city metric"):
+            optimize_city(
+                campaign = "Unification of Italy",
+                name = "Roma",
+                objective = "production.balance.ore",
+                constraints = [CityConstraint(metric = "focus")],
+            )
+
+
+@mark.optimization
+class TestFindCityFrontier:
+    
+    @mark.parametrize(
+        argnames = ["name", "metrics", "constraints", "minimize"],
+        argvalues = [
+            ("Reate", ["production.balance.ore", "production.balance.food"], [], []),
+            (
+                "Roma",
+                ["production.balance.food", "storage.total.food", "effects.total.intelligence"],
+                [CityConstraint(metric = "production.balance.wood", minimum = 0)],
+                [],
+            ),
+            (
+                "Roma",
+                ["production.balance.wood", "production.maintenance_costs.food"],
+                [],
+                ["production.maintenance_costs.food"],
+            ),
+            ("Roma", ["defenses.squadrons"], [], []),
+        ],
+    )
+    def test_frontier_matches_every_configuration(
+            self,
+            name: str,
+            metrics: list[str],
+            constraints: list[CityConstraint],
+            minimize: list[str],
+        ) -> None:
+        frontier: CityFrontier = find_city_frontier(
+            campaign = "Unification of Italy",
+            name = name,
+            metrics = metrics,
+            constraints = constraints,
+            hall_id = "village_hall",
+            minimize = minimize,
+        )
+        
+        assert len(frontier) == len(set(frontier.values))
+        assert set(frontier.values) == _find_frontier_values(
+            campaign = "Unification of Italy",
+            name = name,
+            hall_id = "village_hall",
+            metrics = metrics,
+            constraints = constraints,
+            minimize = minimize,
+        )
+    
+    def test_frontier_rows_build_their_cities(self) -> None:
+        frontier: CityFrontier = find_city_frontier(
+            campaign = "Unification of Italy",
+            name = "Reate",
+            metrics = ["production.balance.ore", "effects.total.troop_training"],
+        )
+        
+        assert len(frontier) > 1
+        assert list(frontier.values) == sorted(frontier.values, reverse = True)
+        assert frontier.values[0][0] == optimize_city(
+            campaign = "Unification of Italy",
+            name = "Reate",
+            objective = "production.balance.ore",
+        ).value  # pyright: ignore[reportOptionalMemberAccess]
+        
+        scenario: Scenario = frontier.to_scenario()
+        
+        for buildings, values, city_dict, city in zip(
+            frontier.buildings,
+            frontier.values,
+            frontier.to_city_dicts(),
+            scenario.cities,
+            strict = True,
+        ):
+            assert city_dict == {"campaign": "Unification of Italy", "name": "Reate", "buildings": buildings}
+            assert city.get_buildings_count(by = "id") == buildings
+            assert (city.production.balance.ore, city.effects.total.troop_training) == values
+    
+    def test_impossible_frontiers_have_no_rows(self) -> None:
+        assert len(find_city_frontier(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            metrics = ["production.balance.food"],
+            constraints = [CityConstraint(metric = "defenses.squadrons", minimum = 5)],
+        )) == 0
+        assert len(find_city_frontier(
+            campaign = "Germania",
+            name = "Vetera",
+            metrics = ["production.balance.food"],
+        )) == 0
+    
+    @mark.parametrize(
+        argnames = ["metrics", "minimize"],
+        argvalues = [
+            ([], []),
+            (["production.ore"], []),
+            (["production.balance.ore"], ["production.balance.food"]),
+        ],
+    )
+    def test_invalid_metrics_raise_error(self, metrics: list[str], minimize: list[str]) -> None:
+        with raises(expected_exception = ValueError, match = "metric"):
+            find_city_frontier(campaign = "Unification of Italy", name = "Roma", metrics = metrics, minimize = minimize)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+from rich.console import Console
+
+from modules.building import Building
+from modules.city import City
+from modules.kingdom import Kingdom
+from modules.rendering import _BuildingDisplay, _CityDisplay, _KingdomDisplay, _ScenarioDisplay
+from modules.scenario import Scenario
+
+from pytest import mark
+
+
+if TYPE_CHECKING:
+    from rich.layout import Layout
+    from rich.panel import Panel
+
+
+@mark.rendering
+class TestImportPath:
+    
+    @mark.parametrize(
+        argnames = "module",
+        argvalues = [
+            "modules.building",
+            "modules.city",
+            "modules.kingdom",
+            "modules.scenario",
+        ],
+    )
+    def test_calculation_modules_do_not_import_rich(self, module: str) -> None:
+        script: str = f"import sys; import {module}; print('rich' in sys.modules)"
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            args = [sys.executable, "-c", script],
+            capture_output = True,
+            check = True,
+            text = True,
+        )
+        
+        assert result.stdout.strip() == "False"
+    
+    def test_city_display_is_available_from_city_module(self) -> None:
+        from modules.city import _CityDisplay as CityDisplay  # noqa: PLC0415
+        
+        assert CityDisplay is _CityDisplay
+
+
+@mark.rendering
+class TestRendering:
+    
+    @staticmethod
+    def _render(renderable: Panel | Layout, height: int | None = None) -> str:
+        console: Console = Console(width = 192, height = height, record = True)
+        with console.capture() as capture:
+            console.print(renderable)
+        return capture.get()
+    
+    def test_building_display(self) -> None:
+        building: Building = Building(id = "farm", workers = 2)
+        output: str = self._render(renderable = _BuildingDisplay(building = building).build_building_display())
+        
+        assert "Farm" in output
+    
+    def test_city_display(self) -> None:
+        city: City = City.from_buildings_count(
+            campaign = "Unification of Italy",
+            name = "Roma",
+            buildings = {"village_hall": 1, "farm": 2},
+        )
+        output: str = self._render(renderable = city.build_city_displayer().build_city_display())
+        
+        assert "Roma" in output
+    
+    def test_kingdom_display(self) -> None:
+        kingdom: Kingdom = Kingdom.from_list(
+            data = [
+                {"campaign": "Unification of Italy", "name": "Roma", "buildings": {"village_hall": 1}},
+            ],
+        )
+        output: str = self._render(renderable = _KingdomDisplay(kingdom = kingdom).build_kingdom_display())
+        
+        assert "Unification of Italy" in output
+        assert "Roma" in output
+    
+    def test_scenario_display(self) -> None:
+        scenario: Scenario = Scenario.from_list(
+            data = [
+                {"campaign": "Unification of Italy", "name": "Roma", "buildings": {"village_hall": 1}},
+                {"campaign": "Unification of Italy", "name": "Anxur", "buildings": {"village_hall": 1}},
+            ],
+        )
+        displayer: _ScenarioDisplay = _ScenarioDisplay(scenario = scenario)
+        output: str = self._render(
+            renderable = displayer.build_scenario_display(),
+            height = displayer._calculate_console_height(),
+        )
+        
+        assert "Roma" in output
+        assert "Anxur" in output
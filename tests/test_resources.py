@@ -1,8 +1,8 @@
 from collections import Counter
-from dataclasses import fields
+from dataclasses import FrozenInstanceError, fields
 from typing import Literal
 
-from modules.resources import ResourceCollection
+from modules.resources import FrozenResourceCollection, ResourceCollection
 
 from pytest import mark, raises
 
@@ -122,3 +122,119 @@ class TestResourceCollection:
         rss_matches: list[str] = rss_collection.find_fields_by_value(value = 3)
         
         assert Counter(rss_matches) == Counter(["food", "ore"])
+    
+    def test_add_returns_new_collection(self) -> None:
+        left: ResourceCollection = ResourceCollection(food = 1, ore = 2, wood = 3)
+        right: ResourceCollection = ResourceCollection(food = 10, ore = 20, wood = 30)
+        
+        result: ResourceCollection = left + right
+        
+        assert result == ResourceCollection(food = 11, ore = 22, wood = 33)
+        assert left == ResourceCollection(food = 1, ore = 2, wood = 3)
+    
+    def test_sub_returns_new_collection(self) -> None:
+        left: ResourceCollection = ResourceCollection(food = 10, ore = 20, wood = 30)
+        right: ResourceCollection = ResourceCollection(food = 1, ore = 25, wood = 3)
+        
+        assert left - right == ResourceCollection(food = 9, ore = -5, wood = 27)
+    
+    def test_mul_by_integer(self) -> None:
+        rss_collection: ResourceCollection = ResourceCollection(food = 1, ore = 2, wood = 3)
+        
+        assert rss_collection * 3 == ResourceCollection(food = 3, ore = 6, wood = 9)
+        assert 3 * rss_collection == ResourceCollection(food = 3, ore = 6, wood = 9)
+    
+    def test_sum_of_collections(self) -> None:
+        collections: list[ResourceCollection] = [
+            ResourceCollection(food = 1, ore = 2, wood = 3),
+            ResourceCollection(food = 4, ore = 5, wood = 6),
+        ]
+        
+        assert sum(collections) == ResourceCollection(food = 5, ore = 7, wood = 9)
+    
+    def test_in_place_operators_mutate_left_operand(self) -> None:
+        rss_collection: ResourceCollection = ResourceCollection(food = 1, ore = 2, wood = 3)
+        same: ResourceCollection = rss_collection
+        
+        rss_collection += ResourceCollection(food = 1, ore = 1, wood = 1)
+        rss_collection *= 2
+        rss_collection -= ResourceCollection(food = 4, ore = 0, wood = 0)
+        
+        assert rss_collection is same
+        assert rss_collection == ResourceCollection(food = 0, ore = 6, wood = 8)
+    
+    @mark.parametrize(argnames = "other", argvalues = [1.5, "food", None])
+    def test_arithmetic_with_unsupported_type_raises_type_error(self, other: object) -> None:
+        rss_collection: ResourceCollection = ResourceCollection(food = 1, ore = 2, wood = 3)
+        
+        with raises(expected_exception = TypeError):
+            rss_collection + other
+        with raises(expected_exception = TypeError):
+            rss_collection * other
+    
+    def test_uses_slots(self) -> None:
+        rss_collection: ResourceCollection = ResourceCollection()
+        
+        assert not hasattr(rss_collection, "__dict__")
+        with raises(expected_exception = AttributeError):
+            rss_collection.gold = 1  # type: ignore[attr-defined]
+
+
+@mark.resources
+class TestFrozenResourceCollection:
+    
+    def test_freeze_returns_equal_frozen_copy(self) -> None:
+        rss_collection: ResourceCollection = ResourceCollection(food = 1, ore = 2, wood = 3)
+        frozen: FrozenResourceCollection = rss_collection.freeze()
+        
+        assert isinstance(frozen, FrozenResourceCollection)
+        assert frozen == rss_collection
+        assert frozen.freeze() is frozen
+    
+    def test_thaw_returns_mutable_copy(self) -> None:
+        frozen: FrozenResourceCollection = FrozenResourceCollection(food = 1, ore = 2, wood = 3)
+        thawed: ResourceCollection = frozen.thaw()
+        
+        thawed.food = 10
+        
+        assert isinstance(thawed, ResourceCollection)
+        assert frozen.food == 1
+    
+    def test_is_immutable(self) -> None:
+        frozen: FrozenResourceCollection = FrozenResourceCollection(food = 1, ore = 2, wood = 3)
+        
+        with raises(expected_exception = FrozenInstanceError):
+            frozen.food = 10  # type: ignore[misc]
+    
+    def test_only_frozen_collections_are_hashable(self) -> None:
+        frozen: FrozenResourceCollection = FrozenResourceCollection(food = 1, ore = 2, wood = 3)
+        
+        assert len({frozen, FrozenResourceCollection(food = 1, ore = 2, wood = 3)}) == 1
+        with raises(expected_exception = TypeError, match = "unhashable"):
+            hash(ResourceCollection())
+    
+    def test_with_returns_updated_copy(self) -> None:
+        frozen: FrozenResourceCollection = FrozenResourceCollection(food = 1, ore = 2, wood = 3)
+        updated: FrozenResourceCollection = frozen.with_(ore = 20)
+        
+        assert updated == FrozenResourceCollection(food = 1, ore = 20, wood = 3)
+        assert frozen.ore == 2
+        assert ResourceCollection(food = 1).with_(wood = 5) == ResourceCollection(food = 1, wood = 5)
+    
+    def test_arithmetic_keeps_the_type_of_the_left_operand(self) -> None:
+        frozen: FrozenResourceCollection = FrozenResourceCollection(food = 1, ore = 2, wood = 3)
+        mutable: ResourceCollection = ResourceCollection(food = 1, ore = 1, wood = 1)
+        
+        assert isinstance(frozen + mutable, FrozenResourceCollection)
+        assert isinstance(mutable + frozen, ResourceCollection)
+        assert isinstance(frozen * 2, FrozenResourceCollection)
+        assert isinstance(sum([frozen, mutable]), FrozenResourceCollection)
+    
+    def test_in_place_operators_rebind_instead_of_mutating(self) -> None:
+        frozen: FrozenResourceCollection = FrozenResourceCollection(food = 1, ore = 2, wood = 3)
+        original: FrozenResourceCollection = frozen
+        
+        frozen += ResourceCollection(food = 1, ore = 1, wood = 1)
+        
+        assert frozen == FrozenResourceCollection(food = 2, ore = 3, wood = 4)
+        assert original == FrozenResourceCollection(food = 1, ore = 2, wood = 3)
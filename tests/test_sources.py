@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from modules.catalog import Catalog
+from modules.sources import DATA_DIRECTORY, SqliteDataSource, YamlDataSource
+
+from pytest import fixture, mark
+
+
+if TYPE_CHECKING:
+    from _pytest.tmpdir import TempPathFactory
+    
+    from modules.building import _BuildingData
+    from modules.city import _CityData
+
+
+@mark.sources
+class TestYamlDataSource:
+    
+    def test_default_files_are_package_relative(self) -> None:
+        source: YamlDataSource = YamlDataSource()
+        
+        assert source.paths == (DATA_DIRECTORY / "buildings.yaml", DATA_DIRECTORY / "cities.yaml")
+        assert all(path.is_absolute() and path.is_file() for path in source.paths)
+    
+    def test_loads_the_yaml_files(self, _buildings: list[_BuildingData], _cities: list[_CityData]) -> None:
+        source: YamlDataSource = YamlDataSource()
+        
+        assert list(source.load_buildings().values()) == _buildings
+        assert source.load_cities() == _cities
+    
+    def test_package_can_be_used_from_another_working_directory(self, tmp_path: Path) -> None:
+        script: str = (
+            "from modules.city import City; "
+            "city = City.from_buildings_count(campaign = 'Unification of Italy', name = 'Roma', "
+            "buildings = {'village_hall': 1}); "
+            "print(city.name)"
+        )
+        environment: dict[str, str] = {**os.environ, "PYTHONPATH": str(Path.cwd())}
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            args = [sys.executable, "-c", script],
+            capture_output = True,
+            check = True,
+            cwd = tmp_path,
+            env = environment,
+            text = True,
+        )
+        
+        assert result.stdout.strip() == "Roma"
+
+
+@mark.sources
+class TestSqliteDataSource:
+    
+    @fixture(scope = "class")
+    def _source(self, tmp_path_factory: TempPathFactory) -> SqliteDataSource:
+        path: Path = tmp_path_factory.mktemp(basename = "sqlite") / "catalog.sqlite"
+        return SqliteDataSource.create(path = path, source = YamlDataSource())
+    
+    def test_loads_the_same_data_as_yaml(
+            self,
+            _source: SqliteDataSource,
+            _buildings: list[_BuildingData],
+            _cities: list[_CityData],
+        ) -> None:
+        assert list(_source.load_buildings().values()) == _buildings
+        assert _source.load_cities() == _cities
+        assert list(_source.iter_cities(campaign = "Hispania")) == [
+            city for city in _cities if city["campaign"] == "Hispania"
+        ]
+    
+    def test_queries_match_linear_scan(self, _source: SqliteDataSource, _cities: list[_CityData]) -> None:
+        campaigns: list[str] = list(dict.fromkeys(city["campaign"] for city in _cities))
+        
+        assert _source.get_campaigns() == campaigns
+        assert _source.find_city(campaign = "Hispania", name = "Uxama") == next(
+            city for city in _cities if (city["campaign"], city["name"]) == ("Hispania", "Uxama")
+        )
+        assert _source.find_city(campaign = "Hispania", name = "Roma") is None
+        
+        for campaign in campaigns:
+            assert _source.count_cities(campaign = campaign) == sum(city["campaign"] == campaign for city in _cities)
+        
+        for is_fort in (None, True, False):
+            for has_supply_dump in (None, True, False):
+                assert _source.get_cities(
+                    campaign = "Germania",
+                    is_fort = is_fort,
+                    has_supply_dump = has_supply_dump,
+                ) == [
+                    city
+                    for city in _cities
+                    if city["campaign"] == "Germania"
+                    and (is_fort is None or city["is_fort"] == is_fort)
+                    and (has_supply_dump is None or city["has_supply_dump"] == has_supply_dump)
+                ]
+    
+    def test_create_replaces_existing_database(self, _source: SqliteDataSource, tmp_path: Path) -> None:
+        path: Path = tmp_path / "catalog.sqlite"
+        path.write_bytes(b"not a database")
+        source: SqliteDataSource = SqliteDataSource.create(path = path, source = _source)
+        
+        assert source.load_cities() == _source.load_cities()
+    
+    def test_catalog_delegates_city_lookups_to_the_database(self, _source: SqliteDataSource) -> None:
+        catalog: Catalog = Catalog(source = _source)
+        
+        assert catalog.find_city(campaign = "Hispania", name = "Uxama") is not None
+        assert catalog.count_cities(campaign = "Unification of Italy") == 45
+        assert len(catalog.get_cities(campaign = "Germania", is_fort = False)) > 0
+        assert catalog.campaigns[0] == "Unification of Italy"
+        assert catalog.is_loaded(name = "cities") is False
+        
+        assert len(catalog.cities) == 311
+        assert catalog.find_city(campaign = "Hispania", name = "Uxama") is not None
+    
+    def test_cities_are_built_without_loading_every_city(self, _source: SqliteDataSource) -> None:
+        # A new process, so that the shared catalog of the tests keeps its source.
+        script: str = (
+            "from pathlib import Path; "
+            "from modules.catalog import CATALOG; "
+            "from modules.city import City; "
+            "from modules.sources import SqliteDataSource; "
+            f"CATALOG.use_source(source = SqliteDataSource(path = Path({str(_source.path)!r}))); "
+            "City.from_buildings_count(campaign = 'Hispania', name = 'Uxama', buildings = {'village_hall': 1}); "
+            "print(CATALOG.is_loaded(name = 'cities'))"
+        )
+        environment: dict[str, str] = {**os.environ, "PYTHONPATH": str(Path.cwd())}
+        result: subprocess.CompletedProcess[str] = subprocess.run(
+            args = [sys.executable, "-c", script],
+            capture_output = True,
+            check = True,
+            env = environment,
+            text = True,
+        )
+        
+        assert result.stdout.strip() == "False"
+    
+    def test_catalog_can_switch_sources(self, _source: SqliteDataSource, _buildings: list[_BuildingData]) -> None:
+        catalog: Catalog = Catalog(source = _source)
+        versions: list[int] = []
+        catalog.on_reload(callback = lambda catalog: versions.append(catalog.version))
+        _ = catalog.buildings
+        
+        other_source: SqliteDataSource = SqliteDataSource.create(
+            path = _source.path.with_name("other.sqlite"),
+            source = _source,
+        )
+        catalog.use_source(source = other_source)
+        
+        assert versions == [1]
+        assert catalog.is_loaded(name = "buildings") is False
+        assert list(catalog.buildings.values()) == _buildings
+        assert catalog.loaded_from == "source"
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+from math import floor
+from typing import TYPE_CHECKING
+
+from modules.building import Building
+from modules.city import City
+from modules.effects import FrozenEffectBonuses
+from modules.exceptions import UnknownBuildingError
+from modules.resources import FrozenResourceCollection, ResourceCollection
+from modules.tables import (
+    EFFECT_KEYS,
+    GEO_FEATURE_KEYS,
+    RESOURCE_KEYS,
+    CityKey,
+    PackedCollection,
+    get_building_table,
+    get_city_table,
+)
+
+from pytest import fixture, mark, raises
+
+
+if TYPE_CHECKING:
+    from array import array
+    
+    from modules.building import _BuildingData
+    from modules.city import _CityData
+    from modules.tables import BuildingTable, CityQuery, CityTable
+
+
+@mark.tables
+class TestBuildingTable:
+    
+    def test_table_is_shared(self) -> None:
+        assert get_building_table() is get_building_table()
+    
+    def test_buildings_are_indexed_in_file_order(self, _buildings: list[_BuildingData]) -> None:
+        table: BuildingTable = get_building_table()
+        
+        assert table.ids == tuple(building["id"] for building in _buildings)
+        assert len(table) == len(_buildings)
+        assert all(table.index_of(building_id = building_id) == index for index, building_id in enumerate(table.ids))
+    
+    def test_index_of_unknown_building_raises_error(self) -> None:
+        with raises(UnknownBuildingError):
+            get_building_table().index_of(building_id = "unknown")
+    
+    def test_columns_match_the_building_data(self, _buildings: list[_BuildingData]) -> None:
+        table: BuildingTable = get_building_table()
+        
+        for index, building in enumerate(_buildings):
+            assert table.max_workers[index] == building["max_workers"]
+            
+            for field in (
+                "building_cost",
+                "maintenance_cost",
+                "productivity_bonuses",
+                "productivity_per_worker",
+                "storage_capacity",
+            ):
+                assert table.row(field = field, building_index = index) == tuple(
+                    building[field][key] for key in RESOURCE_KEYS
+                )
+            
+            for field in ("effect_bonuses", "effect_bonuses_per_worker"):
+                assert table.row(field = field, building_index = index) == tuple(
+                    building[field][key] for key in EFFECT_KEYS
+                )
+    
+    def test_encode(self) -> None:
+        table: BuildingTable = get_building_table()
+        vector: array[int] = table.encode(buildings = {"farm": 2, "village_hall": 1})
+        
+        assert len(vector) == len(table)
+        assert sum(vector) == 3
+        assert vector[table.index_of(building_id = "farm")] == 2
+        assert vector[table.index_of(building_id = "village_hall")] == 1
+    
+    def test_encode_unknown_building_raises_error(self) -> None:
+        with raises(UnknownBuildingError):
+            get_building_table().encode(buildings = {"unknown": 1})
+    
+    def test_weighted_sum_matches_attribute_walk(self) -> None:
+        table: BuildingTable = get_building_table()
+        counts: dict[str, int] = {"village_hall": 1, "farm": 2, "mine": 1, "warehouse": 1}
+        buildings: list[Building] = [
+            Building(id = building_id)
+            for building_id, count in counts.items()
+            for _ in range(count)
+        ]
+        
+        storage: tuple[int, int, int] = table.weighted_sum(field = "storage_capacity", weights = table.encode(counts))
+        maintenance: tuple[int, int, int] = table.gather_sum(
+            field = "maintenance_cost",
+            counts = [(table.index_of(building_id = building_id), count) for building_id, count in counts.items()],
+        )
+        
+        assert storage == tuple(sum(b.storage_capacity.get(key = key) for b in buildings) for key in RESOURCE_KEYS)
+        assert maintenance == tuple(sum(b.maintenance_cost.get(key = key) for b in buildings) for key in RESOURCE_KEYS)
+    
+    def test_packed_shares_the_column(self) -> None:
+        table: BuildingTable = get_building_table()
+        farm: int = table.index_of(building_id = "farm")
+        
+        resources: PackedCollection[FrozenResourceCollection] = table.packed(field = "storage_capacity")
+        effects: PackedCollection[FrozenEffectBonuses] = table.packed(field = "effect_bonuses")
+        
+        assert resources.values is table.storage_capacity
+        assert len(resources) == len(table)
+        assert resources[farm] == Building(id = "farm").storage_capacity
+        assert effects[farm] == Building(id = "farm").effect_bonuses
+        assert isinstance(effects[farm], FrozenEffectBonuses)
+
+
+@mark.tables
+class TestPackedCollection:
+    
+    @fixture
+    def _packed(self) -> PackedCollection[FrozenResourceCollection]:
+        return PackedCollection.from_records(
+            kind = FrozenResourceCollection,
+            records = [
+                ResourceCollection(food = 5, ore = -2, wood = 7),
+                FrozenResourceCollection(food = 9, ore = 4, wood = 7),
+                ResourceCollection(food = 1, ore = 4, wood = -3),
+            ],
+        )
+    
+    def test_from_records_packs_rows(self, _packed: PackedCollection[FrozenResourceCollection]) -> None:
+        assert list(_packed.values) == [5, -2, 7, 9, 4, 7, 1, 4, -3]
+        assert len(_packed) == 3
+        assert _packed[-1] == FrozenResourceCollection(food = 1, ore = 4, wood = -3)
+        assert list(_packed)[1] == FrozenResourceCollection(food = 9, ore = 4, wood = 7)
+    
+    def test_row_out_of_range_raises_index_error(self, _packed: PackedCollection[FrozenResourceCollection]) -> None:
+        with raises(expected_exception = IndexError):
+            _packed[3]
+    
+    def test_reductions(self, _packed: PackedCollection[FrozenResourceCollection]) -> None:
+        assert _packed.sum() == FrozenResourceCollection(food = 15, ore = 6, wood = 11)
+        assert _packed.min() == FrozenResourceCollection(food = 1, ore = -2, wood = -3)
+        assert _packed.max() == FrozenResourceCollection(food = 9, ore = 4, wood = 7)
+        assert isinstance(_packed.sum(), FrozenResourceCollection)
+    
+    def test_argmax_prefers_the_first_row_on_ties(self, _packed: PackedCollection[FrozenResourceCollection]) -> None:
+        assert _packed.argmax() == (1, 1, 0)
+    
+    def test_empty_collection(self) -> None:
+        empty: PackedCollection[FrozenEffectBonuses] = PackedCollection.from_records(
+            kind = FrozenEffectBonuses,
+            records = [],
+        )
+        
+        assert empty.sum() == FrozenEffectBonuses()
+        with raises(expected_exception = ValueError, match = "empty"):
+            empty.max()
+    
+    def test_floor_scale_matches_float_floor(self) -> None:
+        table: BuildingTable = get_building_table()
+        potentials: FrozenResourceCollection = FrozenResourceCollection(food = 125, ore = 35, wood = 80)
+        
+        productivities: PackedCollection[FrozenResourceCollection] = table.packed(field = "productivity_per_worker")
+        scaled: PackedCollection[FrozenResourceCollection] = productivities.floor_scale(factors = potentials)
+        
+        for index, building_id in enumerate(table.ids):
+            productivity: FrozenResourceCollection = Building(id = building_id).productivity_per_worker
+            assert scaled[index] == FrozenResourceCollection(
+                food = floor(productivity.food * potentials.food / 100.0),
+                ore = floor(productivity.ore * potentials.ore / 100.0),
+                wood = floor(productivity.wood * potentials.wood / 100.0),
+            )
+    
+    def test_weighted_and_gather_sums(self, _packed: PackedCollection[FrozenResourceCollection]) -> None:
+        assert _packed.weighted_sum(weights = [1, 0, 2]) == FrozenResourceCollection(food = 7, ore = 6, wood = 1)
+        assert _packed.gather_sum(counts = [(2, 2), (0, 1)]) == FrozenResourceCollection(food = 7, ore = 6, wood = 1)
+
+
+@mark.tables
+class TestCityTable:
+    
+    def test_table_is_shared(self) -> None:
+        assert get_city_table() is get_city_table()
+    
+    def test_columns_match_the_city_data(self, _cities: list[_CityData]) -> None:
+        table: CityTable = get_city_table()
+        
+        assert len(table) == len(_cities)
+        assert table.keys == tuple(CityKey(campaign = city["campaign"], name = city["name"]) for city in _cities)
+        assert list(table.has_supply_dump) == [city["has_supply_dump"] for city in _cities]
+        assert list(table.is_fort) == [city["is_fort"] for city in _cities]
+        assert [table.campaigns[index] for index in table.campaign] == [city["campaign"] for city in _cities]
+        
+        for field, keys in (
+            ("resource_potentials", RESOURCE_KEYS),
+            ("geo_features", GEO_FEATURE_KEYS),
+            ("effects", EFFECT_KEYS),
+        ):
+            for key in keys:
+                assert list(table.column(field = field, key = key)) == [city[field][key] for city in _cities]
+    
+    def test_unknown_column_raises_error(self) -> None:
+        with raises(KeyError):
+            get_city_table().column(field = "resource_potentials", key = "gold")
+        
+        with raises(KeyError):
+            get_city_table().query().sort_by(field = "geo_features", key = "ore")
+    
+    def test_empty_query_matches_all_cities(self) -> None:
+        table: CityTable = get_city_table()
+        
+        assert table.query().keys() == list(table.keys)
+    
+    @mark.parametrize(
+        argnames = ["campaign", "is_fort", "has_supply_dump"],
+        argvalues = [
+            ("Hispania", None, None),
+            (None, True, None),
+            (None, False, True),
+            ("Germania", False, False),
+            ("Unknown", None, None),
+        ],
+    )
+    def test_where_matches_linear_scan(
+            self,
+            _cities: list[_CityData],
+            campaign: str | None,
+            is_fort: bool | None,
+            has_supply_dump: bool | None,
+        ) -> None:
+        query: CityQuery = get_city_table().query().where(
+            campaign = campaign,
+            is_fort = is_fort,
+            has_supply_dump = has_supply_dump,
+        )
+        expected: list[CityKey] = [
+            CityKey(campaign = city["campaign"], name = city["name"])
+            for city in _cities
+            if (campaign is None or city["campaign"] == campaign)
+            and (is_fort is None or city["is_fort"] == is_fort)
+            and (has_supply_dump is None or city["has_supply_dump"] == has_supply_dump)
+        ]
+        
+        assert query.keys() == expected
+        assert query.count() == len(expected)
+    
+    def test_range_filters_match_linear_scan(self, _cities: list[_CityData]) -> None:
+        query: CityQuery = (
+            get_city_table().query()
+            .where(campaign = "Hispania")
+            .at_least(field = "geo_features", key = "mountains", minimum = 1)
+            .at_least(field = "resource_potentials", key = "ore", minimum = 100)
+            .at_most(field = "resource_potentials", key = "food", maximum = 100)
+        )
+        expected: list[CityKey] = [
+            CityKey(campaign = city["campaign"], name = city["name"])
+            for city in _cities
+            if city["campaign"] == "Hispania"
+            and city["geo_features"]["mountains"] >= 1
+            and city["resource_potentials"]["ore"] >= 100
+            and city["resource_potentials"]["food"] <= 100
+        ]
+        
+        assert expected
+        assert query.keys() == expected
+    
+    def test_sort_and_top_match_sorted(self, _cities: list[_CityData]) -> None:
+        query: CityQuery = (
+            get_city_table().query()
+            .where(campaign = "Germania")
+            .sort_by(field = "resource_potentials", key = "wood", descending = True)
+            .sort_by(field = "resource_potentials", key = "food")
+        )
+        germania: list[_CityData] = [city for city in _cities if city["campaign"] == "Germania"]
+        expected: list[CityKey] = [
+            CityKey(campaign = city["campaign"], name = city["name"])
+            for city in sorted(
+                germania,
+                key = lambda city: (-city["resource_potentials"]["wood"], city["resource_potentials"]["food"]),
+            )
+        ]
+        
+        assert query.keys() == expected
+        assert query.top(k = 5).keys() == expected[:5]
+        assert query.top(k = 5).top(k = 10).keys() == expected[:5]
+    
+    def test_negative_top_raises_error(self) -> None:
+        with raises(ValueError, match = "cannot be negative"):
+            get_city_table().query().top(k = -1)
+    
+    def test_keys_can_be_used_to_create_cities(self) -> None:
+        query: CityQuery = get_city_table().query().where(campaign = "Unification of Italy", is_fort = False)
+        key: CityKey = query.top(k = 1).keys()[0]
+        city: City = City.from_buildings_count(**key._asdict(), buildings = {"village_hall": 1})
+        
+        assert (city.campaign, city.name) == key